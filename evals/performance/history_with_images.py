@@ -0,0 +1,42 @@
+"""Run `pip install agno` to install dependencies."""
+
+from copy import deepcopy
+
+from agno.agent import Agent
+from agno.eval.perf import PerfEval
+from agno.media import Image
+from agno.models.stub import StubModel
+
+# An agent with 20 runs in its history, each with a 512 KB image
+agent = Agent(
+    model=StubModel(responses=["It is a chart of the NVDA stock price."]),
+    add_history_to_messages=True,
+    num_history_runs=20,
+    telemetry=False,
+)
+for i in range(20):
+    agent.run(f"What is in chart {i}?", images=[Image(content=bytes(512 * 1024))])
+
+history = agent.memory.get_messages_from_last_n_runs(last_n=20, skip_role="system")
+
+def deep_copy_history():
+    # What get_run_messages used to do on every run
+    history_copy = [deepcopy(msg) for msg in history]
+    for msg in history_copy:
+        msg.from_history = True
+    return history_copy
+
+def history_views():
+    return [msg.history_view() for msg in history]
+
+def get_run_messages_with_history():
+    return agent.get_run_messages(message="Compare the charts")
+
+deep_copy_perf = PerfEval(func=deep_copy_history, num_iterations=20)
+history_view_perf = PerfEval(func=history_views, num_iterations=1000)
+run_messages_perf = PerfEval(func=get_run_messages_with_history, num_iterations=1000)
+
+if __name__ == "__main__":
+    deep_copy_perf.run(print_results=True)
+    history_view_perf.run(print_results=True)
+    run_messages_perf.run(print_results=True)
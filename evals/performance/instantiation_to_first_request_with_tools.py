@@ -0,0 +1,19 @@
+"""Run `pip install agno openai yfinance` to install dependencies."""
+
+from agno.agent import Agent
+from agno.eval.perf import PerfEval
+from agno.models.openai import OpenAIChat
+from agno.tools.yfinance import YFinanceTools
+
+agent = Agent(model=OpenAIChat(id='gpt-4o'), tools=[YFinanceTools(enable_all=True)])
+
+def instantiate_agent_to_first_request():
+    # Mirrors the playground: copy the agent for the session, then prepare the model and tools for the request
+    session_agent = agent.deep_copy(update={"session_id": "perf-session"})
+    session_agent.update_model()
+    return session_agent
+
+instantiation_perf = PerfEval(func=instantiate_agent_to_first_request, num_iterations=1000)
+
+if __name__ == "__main__":
+    instantiation_perf.run(print_results=True)
@@ -0,0 +1,31 @@
+"""Run `pip install agno` to install dependencies."""
+
+from agno.agent import Agent
+from agno.eval.perf import PerfEval
+from agno.models.message import Message
+from agno.models.stub import StubModel
+
+# A conversation like the one sent to the model on every run of an agent with history
+messages = [Message(role="system", content="You are a helpful assistant. " * 50)]
+for _ in range(10):
+    messages.append(Message(role="user", content="What is the weather in Tokyo? " * 20))
+    messages.append(Message(role="assistant", content="It is sunny in Tokyo. " * 100))
+
+model = StubModel()
+agent = Agent(model=StubModel(), add_history_to_messages=True, num_history_runs=10, telemetry=False)
+for _ in range(10):
+    agent.run("What is the weather in Tokyo? " * 20)
+
+def log_messages_at_info_level():
+    # Model.response logs every message it sends, this is skipped entirely unless debug logging is on
+    model._log_messages(messages)
+
+def run_agent_with_history_at_info_level():
+    return agent.run("What is the weather in Tokyo?")
+
+log_messages_perf = PerfEval(func=log_messages_at_info_level, num_iterations=1000)
+agent_run_perf = PerfEval(func=run_agent_with_history_at_info_level, num_iterations=200)
+
+if __name__ == "__main__":
+    log_messages_perf.run(print_results=True)
+    agent_run_perf.run(print_results=True)
@@ -0,0 +1,108 @@
+"""Compare offline benchmark results against a stored baseline.
+
+Exits with status 1 if any benchmark regressed by more than the threshold.
+
+Usage:
+    python -m evals.performance.offline.compare evals/performance/offline/baseline.json perf_results.json --threshold 0.2
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: Optional[float]
+    current: Optional[float]
+    # Relative change, (current - baseline) / baseline
+    change: Optional[float] = None
+    regressed: bool = False
+
+
+def load_results(path: str) -> Dict[str, Dict[str, float]]:
+    return json.loads(Path(path).read_text())["results"]
+
+
+def compare_results(
+    baseline: Dict[str, Dict[str, float]],
+    current: Dict[str, Dict[str, float]],
+    metric: str = "median_run_time",
+    threshold: float = 0.2,
+    min_delta: float = 0.0,
+) -> List[Comparison]:
+    """Compare `metric` for every benchmark in either result set.
+
+    A benchmark regresses if it is slower than the baseline by more than `threshold` (relative)
+    and by more than `min_delta` (absolute, in the unit of the metric), which filters out noise on very fast benchmarks.
+    """
+    comparisons: List[Comparison] = []
+    for name in sorted(set(baseline) | set(current)):
+        baseline_value = baseline.get(name, {}).get(metric)
+        current_value = current.get(name, {}).get(metric)
+        comparison = Comparison(name=name, baseline=baseline_value, current=current_value)
+        if baseline_value is not None and current_value is not None and baseline_value > 0:
+            comparison.change = (current_value - baseline_value) / baseline_value
+            comparison.regressed = comparison.change > threshold and current_value - baseline_value > min_delta
+        comparisons.append(comparison)
+    return comparisons
+
+
+def print_comparisons(comparisons: List[Comparison], metric: str) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title=f"Benchmark comparison ({metric})", show_header=True, header_style="bold magenta")
+    table.add_column("Benchmark", style="cyan")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+
+    def format_value(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.6f}"
+
+    for comparison in comparisons:
+        if comparison.change is None:
+            change = "[yellow]missing[/yellow]"
+        else:
+            style = "red" if comparison.regressed else "green" if comparison.change < 0 else "white"
+            change = f"[{style}]{comparison.change:+.1%}[/{style}]"
+        table.add_row(comparison.name, format_value(comparison.baseline), format_value(comparison.current), change)
+
+    Console().print(table)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare offline benchmark results against a baseline.")
+    parser.add_argument("baseline", help="Baseline results JSON.")
+    parser.add_argument("current", help="Current results JSON.")
+    parser.add_argument("--metric", default="median_run_time", help="Metric to compare. Defaults to median_run_time.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative slowdown. Defaults to 0.2.")
+    parser.add_argument(
+        "--min-delta", type=float, default=0.0, help="Ignore slowdowns smaller than this, in the unit of the metric."
+    )
+    parser.add_argument("--strict", action="store_true", help="Also fail if a baseline benchmark is missing.")
+    args = parser.parse_args(argv)
+
+    baseline = load_results(args.baseline)
+    current = load_results(args.current)
+    comparisons = compare_results(
+        baseline, current, metric=args.metric, threshold=args.threshold, min_delta=args.min_delta
+    )
+    print_comparisons(comparisons, args.metric)
+
+    regressions = [c.name for c in comparisons if c.regressed]
+    missing = [c.name for c in comparisons if c.current is None]
+    if regressions:
+        print(f"Regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+    if missing and args.strict:
+        print(f"Missing from the current results: {', '.join(missing)}")
+    return 1 if regressions or (missing and args.strict) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,25 @@
+"""Offline embedder used by the benchmark suite."""
+
+from dataclasses import dataclass
+from hashlib import blake2b
+from typing import Dict, List, Optional, Tuple
+
+from agno.embedder.base import Embedder
+
+
+@dataclass
+class HashEmbedder(Embedder):
+    """Deterministic embeddings derived from a hash of the text."""
+
+    dimensions: int = 256
+
+    def get_embedding(self, text: str) -> List[float]:
+        digest = b""
+        counter = 0
+        while len(digest) < self.dimensions:
+            digest += blake2b(f"{counter}:{text}".encode(), digest_size=64).digest()
+            counter += 1
+        return [(byte - 127.5) / 127.5 for byte in digest[: self.dimensions]]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
@@ -0,0 +1,313 @@
+"""Run `pip install agno qdrant-client sqlalchemy` to install dependencies.
+
+Offline benchmark suite: no API keys or network needed. Results are written as JSON and can be compared against the
+stored baseline with `python -m evals.performance.offline.compare evals/performance/offline/baseline.json results.json`.
+Regenerate baseline.json on the machine that runs the comparison, timings are not portable across machines.
+
+Usage:
+    python -m evals.performance.offline.suite --output results.json
+    python -m evals.performance.offline.suite --only agent_run --only storage --iterations 20
+"""
+
+import argparse
+import json
+import logging
+import platform
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from agno.agent import Agent
+from agno.document import Document
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.recursive import RecursiveChunking
+from agno.eval.perf import PerfEval
+from agno.knowledge.document import DocumentKnowledgeBase
+from agno.memory.agent import AgentMemory, AgentRun
+from agno.models.message import Message
+from agno.models.stub import StubModel, StubResponse, StubToolCall
+from agno.run.response import RunResponse
+from agno.storage.session.agent import AgentSession
+from agno.storage.sqlite import SqliteStorage
+from agno.team.team import Team
+from agno.vectordb.qdrant import Qdrant
+
+from evals.performance.offline.stubs import HashEmbedder
+
+RESULT_METRICS = ("avg_run_time", "median_run_time", "p95_run_time", "min_run_time", "avg_memory_usage")
+
+
+@dataclass
+class Benchmark:
+    name: str
+    # Builds the function to measure; setup cost is not measured
+    setup: Callable[[], Callable[[], Any]]
+    num_iterations: int = 50
+    warmup_runs: int = 3
+
+
+def make_tools(num_tools: int) -> List[Callable]:
+    tools = []
+    for i in range(num_tools):
+
+        def tool(city: str, days: int = 1) -> str:
+            return f"It is sunny in {city} for the next {days} days"
+
+        tool.__name__ = f"get_forecast_{i}"
+        tool.__doc__ = f"Get the weather forecast #{i} for a city."
+        tools.append(tool)
+    return tools
+
+
+def get_weather(city: str) -> str:
+    """Get the current weather for a city."""
+    return f"It is sunny in {city}"
+
+
+def make_corpus(num_paragraphs: int) -> str:
+    sentences = [
+        "Agents combine a model with tools, memory and knowledge.",
+        "Knowledge bases are chunked, embedded and stored in a vector database.",
+        "Sessions are persisted to storage after every run.",
+        "Streaming responses yield one event per model delta.",
+    ]
+    return "\n\n".join(" ".join(sentences[(i + j) % len(sentences)] for j in range(6)) for i in range(num_paragraphs))
+
+
+# -*- Agent and Team construction
+
+
+def agent_construction(num_tools: int) -> Callable[[], Callable[[], Any]]:
+    def setup():
+        tools = make_tools(num_tools)
+        return lambda: Agent(model=StubModel(), tools=tools, telemetry=False)
+
+    return setup
+
+
+def team_construction(num_members: int, num_tools: int) -> Callable[[], Callable[[], Any]]:
+    def setup():
+        tools = make_tools(num_tools)
+
+        def construct():
+            members = [
+                Agent(name=f"Member {i}", model=StubModel(), tools=tools, telemetry=False) for i in range(num_members)
+            ]
+            return Team(name="Team", mode="coordinate", members=members, model=StubModel(), telemetry=False)
+
+        return construct
+
+    return setup
+
+
+# -*- Agent runs
+
+
+def make_tool_calling_model(tool_name: str) -> StubModel:
+    return StubModel(
+        responses=[
+            StubResponse(tool_calls=[StubToolCall(name=tool_name, arguments={"city": "Tokyo"})]),
+            "It is sunny in Tokyo.",
+        ]
+    )
+
+
+def agent_run():
+    agent = Agent(model=StubModel(), telemetry=False)
+    return lambda: agent.run("What is the weather in Tokyo?")
+
+
+def agent_run_with_tool_call():
+    model = make_tool_calling_model("get_weather")
+    agent = Agent(model=model, tools=[get_weather], telemetry=False)
+    return lambda: agent.run("What is the weather in Tokyo?")
+
+
+def tool_call_dispatch(num_tools: int) -> Callable[[], Callable[[], Any]]:
+    def setup():
+        # The model calls the last tool, after every tool has been processed for the model
+        tools = make_tools(num_tools)
+        model = make_tool_calling_model(f"get_forecast_{num_tools - 1}")
+        agent = Agent(model=model, tools=tools, telemetry=False)
+        return lambda: agent.run("What is the weather in Tokyo?")
+
+    return setup
+
+
+def streaming(stream_chunks: int) -> Callable[[], Callable[[], Any]]:
+    def setup():
+        # One 4 character token per delta
+        model = StubModel(responses=["tok " * stream_chunks], chars_per_token=4, tokens_per_chunk=1)
+        agent = Agent(model=model, telemetry=False)
+
+        def consume():
+            for _ in agent.run("Tell me a story", stream=True):
+                pass
+
+        return consume
+
+    return setup
+
+
+# -*- Storage
+
+
+def make_session(session_id: str, num_runs: int) -> AgentSession:
+    memory = AgentMemory()
+    for i in range(num_runs):
+        messages = [
+            Message(role="user", content=f"Question {i}: what is the weather in Tokyo?"),
+            Message(role="assistant", content="It is sunny in Tokyo. " * 10),
+        ]
+        memory.add_run(
+            AgentRun(message=messages[0], response=RunResponse(content=messages[1].content, messages=messages))
+        )
+    return AgentSession(
+        session_id=session_id,
+        agent_id="benchmark-agent",
+        memory=memory.to_dict(),
+        session_data={"session_state": {"turns": num_runs}},
+    )
+
+
+def storage_write(num_runs: int) -> Callable[[], Callable[[], Any]]:
+    def setup():
+        db_file = Path(tempfile.mkdtemp()) / "sessions.db"
+        storage = SqliteStorage(table_name="agent_sessions", db_file=str(db_file))
+        storage.create()
+        session = make_session("benchmark-session", num_runs)
+        return lambda: storage.upsert(session)
+
+    return setup
+
+
+def storage_read(num_runs: int) -> Callable[[], Callable[[], Any]]:
+    def setup():
+        db_file = Path(tempfile.mkdtemp()) / "sessions.db"
+        storage = SqliteStorage(table_name="agent_sessions", db_file=str(db_file))
+        storage.create()
+        storage.upsert(make_session("benchmark-session", num_runs))
+        return lambda: storage.read("benchmark-session")
+
+    return setup
+
+
+# -*- Knowledge
+
+
+def chunking(strategy_name: str) -> Callable[[], Callable[[], Any]]:
+    def setup():
+        document = Document(name="corpus", content=make_corpus(2000))
+        strategy = (
+            FixedSizeChunking(chunk_size=1000) if strategy_name == "fixed" else RecursiveChunking(chunk_size=1000)
+        )
+        return lambda: strategy.chunk(document)
+
+    return setup
+
+
+def ingestion(num_chunks: int) -> Callable[[], Callable[[], Any]]:
+    def setup():
+        chunks = RecursiveChunking(chunk_size=500).chunk(Document(name="corpus", content=make_corpus(num_chunks)))
+        vector_db = Qdrant(collection="ingestion", embedder=HashEmbedder(), location=":memory:")
+        knowledge_base = DocumentKnowledgeBase(documents=chunks[:num_chunks], vector_db=vector_db)
+        return lambda: knowledge_base.load(recreate=True, skip_existing=False)
+
+    return setup
+
+
+def retrieval(num_documents: int) -> Callable[[], Callable[[], Any]]:
+    def setup():
+        vector_db = Qdrant(collection="retrieval", embedder=HashEmbedder(), location=":memory:")
+        vector_db.create()
+        documents = [Document(name=f"doc_{i}", content=f"Document {i}. {make_corpus(1)}") for i in range(num_documents)]
+        vector_db.insert(documents, batch_size=256)
+        return lambda: vector_db.search("How are sessions persisted?", limit=5)
+
+    return setup
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("agent_construction_1_tool", agent_construction(1), num_iterations=200),
+    Benchmark("agent_construction_10_tools", agent_construction(10), num_iterations=200),
+    Benchmark("agent_construction_50_tools", agent_construction(50), num_iterations=200),
+    Benchmark("team_construction_5_members_10_tools", team_construction(5, 10), num_iterations=100),
+    Benchmark("agent_run", agent_run, num_iterations=100),
+    Benchmark("agent_run_with_tool_call", agent_run_with_tool_call, num_iterations=100),
+    Benchmark("tool_call_dispatch_1_tool", tool_call_dispatch(1), num_iterations=100),
+    Benchmark("tool_call_dispatch_50_tools", tool_call_dispatch(50), num_iterations=100),
+    Benchmark("streaming_100_chunks", streaming(100), num_iterations=50),
+    Benchmark("streaming_1000_chunks", streaming(1000), num_iterations=20),
+    Benchmark("storage_write_10_runs", storage_write(10), num_iterations=50),
+    Benchmark("storage_write_200_runs", storage_write(200), num_iterations=20),
+    Benchmark("storage_read_10_runs", storage_read(10), num_iterations=50),
+    Benchmark("storage_read_200_runs", storage_read(200), num_iterations=20),
+    Benchmark("chunking_fixed", chunking("fixed"), num_iterations=20),
+    Benchmark("chunking_recursive", chunking("recursive"), num_iterations=20),
+    Benchmark("ingestion_200_chunks", ingestion(200), num_iterations=5, warmup_runs=1),
+    Benchmark("retrieval_2000_documents", retrieval(2000), num_iterations=50),
+]
+
+
+def run_benchmark(
+    benchmark: Benchmark,
+    num_iterations: Optional[int] = None,
+    measure_memory: bool = False,
+) -> Dict[str, float]:
+    perf_eval = PerfEval(
+        func=benchmark.setup(),
+        name=benchmark.name,
+        num_iterations=num_iterations or benchmark.num_iterations,
+        warmup_runs=benchmark.warmup_runs,
+        measure_memory=measure_memory,
+    )
+    result = perf_eval.run()
+    return {metric: getattr(result, metric) for metric in RESULT_METRICS}
+
+
+def run_suite(
+    only: Optional[List[str]] = None, num_iterations: Optional[int] = None, measure_memory: bool = False
+) -> Dict[str, Any]:
+    """Run the benchmarks whose name contains one of `only` (all if None) and return the results document."""
+    from importlib.metadata import version
+
+    results: Dict[str, Dict[str, float]] = {}
+    # Keep the output readable, the knowledge base logs every document it loads
+    logging.disable(logging.INFO)
+    try:
+        for benchmark in BENCHMARKS:
+            if only and not any(pattern in benchmark.name for pattern in only):
+                continue
+            results[benchmark.name] = run_benchmark(
+                benchmark, num_iterations=num_iterations, measure_memory=measure_memory
+            )
+            print(f"{benchmark.name:<40} median {results[benchmark.name]['median_run_time'] * 1000:10.3f} ms")
+    finally:
+        logging.disable(logging.NOTSET)
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "agno_version": version("agno"),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the offline agno benchmark suite.")
+    parser.add_argument("--output", "-o", default="perf_results.json", help="Where to write the results JSON.")
+    parser.add_argument("--only", action="append", help="Only run benchmarks whose name contains this string.")
+    parser.add_argument("--iterations", type=int, help="Override the number of measured iterations.")
+    parser.add_argument("--memory", action="store_true", help="Also measure peak memory usage.")
+    args = parser.parse_args(argv)
+
+    suite_results = run_suite(only=args.only, num_iterations=args.iterations, measure_memory=args.memory)
+    Path(args.output).write_text(json.dumps(suite_results, indent=2))
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Run `pip install agno pypdf pillow rapidocr_onnxruntime` to install dependencies."""
+
+import tempfile
+from io import BytesIO
+from pathlib import Path
+
+from agno.document.reader.pdf_reader import PDFImageReader, PDFReader
+from agno.eval.perf import PerfEval
+
+NUM_PAGES = 500
+LINES_PER_PAGE = 45
+
+
+def make_chart_image(page_number: int) -> bytes:
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGB", (480, 160), "white")
+    ImageDraw.Draw(image).text((20, 60), f"Figure {page_number}: Revenue by segment", fill="black")
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def make_annual_report(num_pages: int, with_images: bool) -> bytes:
+    """Build a synthetic annual report: dense text on every page and optionally one chart image per page."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", b"", b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for page_number in range(1, num_pages + 1):
+        lines = [
+            f"({page_number}.{line} Net revenue increased 12% year over year driven by growth in all segments.) Tj T*"
+            for line in range(LINES_PER_PAGE)
+        ]
+        stream = ("BT /F1 9 Tf 11 TL 40 760 Td " + " ".join(lines) + " ET").encode()
+        resources = b"/Font << /F1 3 0 R >>"
+        if with_images:
+            image = make_chart_image(page_number)
+            objects.append(
+                b"<< /Type /XObject /Subtype /Image /Width 480 /Height 160 /ColorSpace /DeviceRGB "
+                b"/BitsPerComponent 8 /Filter /DCTDecode /Length %d >>\nstream\n%s\nendstream" % (len(image), image)
+            )
+            resources += b" /XObject << /Im1 %d 0 R >>" % len(objects)
+            stream += b" q 480 0 0 160 60 40 cm /Im1 Do Q"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << %s >> /Contents %d 0 R >>"
+            % (resources, len(objects))
+        )
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, num_pages)
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for object_id, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (object_id, body)
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return pdf
+
+
+report_dir = Path(tempfile.mkdtemp())
+text_report = report_dir / "annual_report.pdf"
+text_report.write_bytes(make_annual_report(NUM_PAGES, with_images=False))
+
+def read_serial():
+    return PDFReader(chunk=False).read(str(text_report))
+
+def read_parallel():
+    return PDFReader(chunk=False, parallel=True, pages_per_task=16).read(str(text_report))
+
+serial_perf = PerfEval(func=read_serial, num_iterations=3, warmup_runs=1)
+parallel_perf = PerfEval(func=read_parallel, num_iterations=3, warmup_runs=1)
+
+if __name__ == "__main__":
+    serial_perf.run(print_results=True)
+    parallel_perf.run(print_results=True)
+
+    # Image OCR: every page carries a chart that is run through OCR
+    image_report = report_dir / "annual_report_with_images.pdf"
+    image_report.write_bytes(make_annual_report(NUM_PAGES, with_images=True))
+
+    def read_images_serial():
+        return PDFImageReader(chunk=False).read(str(image_report))
+
+    def read_images_parallel():
+        return PDFImageReader(chunk=False, parallel=True, pages_per_task=16).read(str(image_report))
+
+    PerfEval(func=read_images_serial, num_iterations=1, warmup_runs=0).run(print_results=True)
+    PerfEval(func=read_images_parallel, num_iterations=1, warmup_runs=0).run(print_results=True)
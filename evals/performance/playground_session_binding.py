@@ -0,0 +1,35 @@
+"""Run `pip install agno openai yfinance` to install dependencies."""
+
+from agno.agent import Agent
+from agno.eval.perf import PerfEval
+from agno.models.openai import OpenAIChat
+from agno.playground.instance_pool import InstancePool
+from agno.tools.yfinance import YFinanceTools
+
+agent = Agent(model=OpenAIChat(id="gpt-4o"), tools=[YFinanceTools(enable_all=True)])
+instance_pool = InstancePool()
+
+
+def deep_copy_per_request():
+    # What the playground did before: copy everything, then prepare the model and tools for the request
+    session_agent = agent.deep_copy(update={"session_id": "perf-session"})
+    session_agent.update_model()
+    return session_agent
+
+
+def bind_from_pool_per_request():
+    session_agent, _ = instance_pool.acquire_agent(
+        agent, update={"session_id": "perf-session"}
+    )
+    session_agent.update_model()
+    instance_pool.release_agent(session_agent)
+    return session_agent
+
+
+deep_copy_perf = PerfEval(func=deep_copy_per_request, num_iterations=1000)
+instance_pool_perf = PerfEval(func=bind_from_pool_per_request, num_iterations=1000)
+
+if __name__ == "__main__":
+    deep_copy_perf.run(print_results=True)
+    instance_pool_perf.run(print_results=True)
+    print(instance_pool.metrics.to_dict())
@@ -0,0 +1,69 @@
+"""Run `pip install agno qdrant-client` to install dependencies.
+
+Start a local Qdrant with `docker run -p 6333:6333 -p 6334:6334 qdrant/qdrant`.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.eval.perf import PerfEval
+from agno.vectordb.qdrant import Qdrant
+
+NUM_DOCUMENTS = 2000
+
+@dataclass
+class SlowEmbedder(Embedder):
+    """Returns a fixed vector after a delay, like a remote embedding API"""
+
+    dimensions: Optional[int] = 384
+    latency: float = 0.02
+
+    def get_embedding(self, text: str) -> List[float]:
+        time.sleep(self.latency)
+        return [float(len(text) % 7)] * self.dimensions  # type: ignore
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+documents = [
+    Document(name=f"filing_{i}", content=f"Chunk {i} of the annual report. Net revenue increased 12% year over year. " * 8)
+    for i in range(NUM_DOCUMENTS)
+]
+
+def make_db(**kwargs) -> Qdrant:
+    db = Qdrant(collection="insert_benchmark", url="http://localhost:6333", embedder=SlowEmbedder(), **kwargs)
+    db.drop()
+    db.create()
+    return db
+
+# One document embedded at a time and a single upsert, as insert used to do
+sequential_db = make_db(batch_size=NUM_DOCUMENTS, embedding_parallelism=1, upload_parallelism=1)
+batched_db = make_db()
+batched_grpc_db = make_db(prefer_grpc=True)
+
+def insert_sequential():
+    sequential_db.insert(documents)
+
+def insert_batched():
+    batched_db.insert(documents)
+
+def insert_batched_grpc():
+    batched_grpc_db.insert(documents)
+
+def async_insert_batched_grpc():
+    asyncio.run(batched_grpc_db.async_insert(documents))
+
+sequential_perf = PerfEval(func=insert_sequential, num_iterations=1, warmup_runs=0)
+batched_perf = PerfEval(func=insert_batched, num_iterations=3, warmup_runs=0)
+batched_grpc_perf = PerfEval(func=insert_batched_grpc, num_iterations=3, warmup_runs=0)
+async_batched_grpc_perf = PerfEval(func=async_insert_batched_grpc, num_iterations=3, warmup_runs=0)
+
+if __name__ == "__main__":
+    sequential_perf.run(print_results=True)
+    batched_perf.run(print_results=True)
+    batched_grpc_perf.run(print_results=True)
+    async_batched_grpc_perf.run(print_results=True)
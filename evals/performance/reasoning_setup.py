@@ -0,0 +1,69 @@
+"""Run `pip install agno` to install dependencies."""
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from agno.agent import Agent
+from agno.eval.perf import PerfEval
+from agno.models.message import Message
+from agno.models.stub import StubModel, StubResponse
+
+REASONING_STEPS = json.dumps(
+    {
+        "reasoning_steps": [
+            {
+                "title": "Compare the stocks",
+                "action": "I will compare the prices",
+                "result": "NVDA is up more than AMD",
+                "reasoning": "The prices are known",
+                "next_action": "final_answer",
+                "confidence": 0.9,
+            }
+        ]
+    }
+)
+
+@dataclass
+class ReasoningStubModel(StubModel):
+    """Returns reasoning steps when a response format is requested, and pays a connection setup on its first request"""
+
+    client: Optional[Any] = None
+    connect_latency: float = 0.05
+
+    def _build_completion(self, messages: List[Message], response: StubResponse) -> Dict[str, Any]:
+        if self.client is None:
+            # TLS handshake of a new connection pool
+            time.sleep(self.connect_latency)
+            self.client = object()
+        content = REASONING_STEPS if self.response_format is not None else "NVDA is up more than AMD."
+        return super()._build_completion(messages, StubResponse(content=content))
+
+def make_tool(name: str):
+    def tool(symbol: str, period: str = "1mo") -> str:
+        return f"{name} for {symbol} over {period}"
+
+    tool.__name__ = name
+    tool.__doc__ = f"Get the {name.replace('_', ' ')} of a stock.\n\nArgs:\n    symbol: The stock symbol.\n    period: The period."
+    return tool
+
+tools = [make_tool(f"get_{metric}") for metric in ["price", "volume", "pe_ratio", "eps", "dividend", "beta", "news", "analyst_ratings"]]
+
+agent = Agent(model=ReasoningStubModel(), reasoning=True, tools=tools, telemetry=False)
+
+def reasoning_run_with_setup():
+    # What every run used to do: derive a new reasoning model and build a new reasoning agent
+    agent._reasoning_model_cache = (agent.model, agent.model.__class__(id=agent.model.id))
+    agent._reasoning_agents.clear()
+    agent.run("Compare NVDA and AMD")
+
+def reasoning_run_reused():
+    agent.run("Compare NVDA and AMD")
+
+setup_perf = PerfEval(func=reasoning_run_with_setup, num_iterations=50)
+reused_perf = PerfEval(func=reasoning_run_reused, num_iterations=50)
+
+if __name__ == "__main__":
+    setup_perf.run(print_results=True)
+    reused_perf.run(print_results=True)
@@ -0,0 +1,26 @@
+"""Run `pip install agno numpy pandas` to install dependencies."""
+
+import numpy as np
+import pandas as pd
+
+from agno.eval.perf import PerfEval
+from agno.utils.technical_indicators import compute_technical_indicators, summarize_technical_indicators
+
+# 500 symbols x 5 years of synthetic daily bars
+num_symbols, num_days = 500, 1260
+rng = np.random.default_rng(0)
+index = pd.bdate_range("2020-01-01", periods=num_days)
+symbols = [f"SYM{i:03d}" for i in range(num_symbols)]
+close = pd.DataFrame(
+    100 * np.exp(np.cumsum(rng.normal(0, 0.015, (num_days, num_symbols)), axis=0)), index=index, columns=symbols
+)
+high = close * (1 + rng.uniform(0, 0.02, close.shape))
+low = close * (1 - rng.uniform(0, 0.02, close.shape))
+
+def compute_indicators():
+    return summarize_technical_indicators(compute_technical_indicators(close=close, high=high, low=low))
+
+technical_indicators_perf = PerfEval(func=compute_indicators, num_iterations=10)
+
+if __name__ == "__main__":
+    technical_indicators_perf.run(print_results=True)
@@ -0,0 +1,40 @@
+"""Run `pip install agno` to install dependencies."""
+
+from agno.agent import Agent
+from agno.eval.perf import PerfEval
+from agno.models.stub import StubModel, StubResponse, StubToolCall
+from agno.tracing import InMemorySpanExporter, disable_tracing, enable_tracing
+
+def get_weather(city: str) -> str:
+    """Get the weather for a city."""
+    return f"It is sunny in {city}"
+
+agent = Agent(
+    model=StubModel(
+        responses=[StubResponse(tool_calls=[StubToolCall(name="get_weather", arguments={"city": "Tokyo"})]), "Sunny."]
+    ),
+    tools=[get_weather],
+    telemetry=False,
+)
+exporter = InMemorySpanExporter()
+
+def run_agent():
+    response = agent.run("What is the weather in Tokyo?")
+    # Keep the session history from growing between iterations
+    agent.memory.clear()
+    return response
+
+def run_agent_traced():
+    response = run_agent()
+    exporter.clear()
+    return response
+
+untraced_perf = PerfEval(func=run_agent, num_iterations=200, warmup_runs=10)
+traced_perf = PerfEval(func=run_agent_traced, num_iterations=200, warmup_runs=10)
+
+if __name__ == "__main__":
+    disable_tracing()
+    untraced_perf.run(print_results=True)
+    enable_tracing(exporter)
+    traced_perf.run(print_results=True)
+    disable_tracing()
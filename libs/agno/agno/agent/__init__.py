@@ -3,6 +3,7 @@ from agno.agent.agent import (
     AgentKnowledge,
     AgentMemory,
     AgentSession,
+    ContextWindow,
     Function,
     Message,
     RunEvent,
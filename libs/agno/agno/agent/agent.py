@@ -16,6 +16,7 @@ from typing import (
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -25,6 +26,7 @@ from uuid import uuid4
 
 from pydantic import BaseModel
 
+from agno.agent.context_window import ContextWindow
 from agno.agent.metrics import SessionMetrics
 from agno.exceptions import ModelProviderError, StopAgentRun
 from agno.knowledge.agent import AgentKnowledge
@@ -40,6 +42,7 @@ from agno.storage.base import Storage
 from agno.storage.session.agent import AgentSession
 from agno.tools.function import Function
 from agno.tools.toolkit import Toolkit
+from agno.tracing import NoopSpan, Span, get_current_span, start_span, traced
 from agno.utils.log import (
     log_debug,
     log_error,
@@ -56,6 +59,10 @@ from agno.utils.string import parse_response_model_str
 from agno.utils.timer import Timer
 
 
+def _get_agent_span_attributes(agent: "Agent", *args, **kwargs) -> Dict[str, Any]:
+    return {"agent_name": agent.name, "team_id": agent.team_id}
+
+
 @dataclass(init=False)
 class Agent:
     # --- Agent settings ---
@@ -96,6 +103,8 @@ class Agent:
     num_history_responses: Optional[int] = None
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
+    # Token budget for the messages sent to the Model. History is limited to the runs that fit in the budget.
+    context_window: Optional[ContextWindow] = None
 
     # --- Agent Knowledge ---
     knowledge: Optional[AgentKnowledge] = None
@@ -268,6 +277,7 @@ class Agent:
         add_history_to_messages: bool = False,
         num_history_responses: Optional[int] = None,
         num_history_runs: int = 3,
+        context_window: Optional[ContextWindow] = None,
         knowledge: Optional[AgentKnowledge] = None,
         add_references: bool = False,
         retriever: Optional[Callable[..., Optional[List[Dict]]]] = None,
@@ -344,6 +354,7 @@ class Agent:
         self.num_history_runs = num_history_runs
         if num_history_responses is not None:
             self.num_history_runs = num_history_responses
+        self.context_window = context_window
 
         self.knowledge = knowledge
         self.add_references = add_references
@@ -443,16 +454,25 @@ class Agent:
 
         self._formatter: Optional[SafeFormatter] = None
 
+        # Static segments of the default system message, with the config they were built from
+        self._system_message_segments: Optional[Tuple[Tuple[Any, ...], Tuple[str, str]]] = None
+        # JSON output prompt, with the response_model it was built from
+        self._json_output_prompt: Optional[Tuple[Any, str]] = None
+        # Reasoning model derived from self.model, with the model it was derived from
+        self._reasoning_model_cache: Optional[Tuple[Model, Model]] = None
+        # Reasoning agents built by this Agent, by kind, with the config they were built from
+        self._reasoning_agents: Dict[str, Tuple[Model, Any, Tuple[Any, ...], Agent]] = {}
+
     def set_agent_id(self) -> str:
         if self.agent_id is None:
             self.agent_id = str(uuid4())
-        log_debug(f"Agent ID: {self.agent_id}", center=True)
+        log_debug("Agent ID: %s", self.agent_id, center=True)
         return self.agent_id
 
     def set_session_id(self) -> str:
         if self.session_id is None or self.session_id == "":
             self.session_id = str(uuid4())
-        log_debug(f"Session ID: {self.session_id}", center=True)
+        log_debug("Session ID: %s", self.session_id, center=True)
         return self.session_id
 
     def set_debug(self) -> None:
@@ -499,6 +519,7 @@ class Agent:
     def has_team(self) -> bool:
         return self.team is not None and len(self.team) > 0
 
+    @traced("agent.run", attributes=_get_agent_span_attributes)
     def _run(
         self,
         message: Optional[Union[str, List, Dict, Message]] = None,
@@ -539,8 +560,12 @@ class Agent:
         # 1.3 Create a run_id and RunResponse
         self.run_id = str(uuid4())
         self.run_response = RunResponse(run_id=self.run_id, session_id=self.session_id, agent_id=self.agent_id)
+        run_span = get_current_span()
+        run_span.set_attributes(
+            run_id=self.run_id, agent_id=self.agent_id, session_id=self.session_id, stream=self.stream
+        )
 
-        log_debug(f"Agent Run Start: {self.run_response.run_id}", center=True)
+        log_debug("Agent Run Start: %s", self.run_response.run_id, center=True)
 
         # 2. Update the Model and resolve context
         self.update_model()
@@ -550,6 +575,9 @@ class Agent:
 
         # 3. Read existing session from storage
         self.read_from_storage()
+        # Without storage, load the user memories here, waiting for the memory_pipeline to process the previous runs
+        if self.storage is None and self.memory.memory_pipeline is not None:
+            self.load_user_memories()
 
         # 4. Prepare run messages
         run_messages: RunMessages = self.get_run_messages(
@@ -794,13 +822,11 @@ class Agent:
         agent_run = AgentRun(response=self.run_response)
         agent_run.message = run_messages.user_message
 
-        # Update the memories with the user message if needed
-        if (
-            self.memory.create_user_memories
-            and self.memory.update_user_memories_after_run
-            and run_messages.user_message is not None
-        ):
-            self.memory.update_memory(input=run_messages.user_message.get_content_string())
+        # Collect the messages to update the user memories with
+        update_user_memories = self.memory.create_user_memories and self.memory.update_user_memories_after_run
+        memory_inputs: List[str] = []
+        if update_user_memories and run_messages.user_message is not None:
+            memory_inputs.append(run_messages.user_message.get_content_string())
 
         if messages is not None and len(messages) > 0:
             for _im in messages:
@@ -822,15 +848,18 @@ class Agent:
                     if agent_run.messages is None:
                         agent_run.messages = []
                     agent_run.messages.append(mp)
-                    if self.memory.create_user_memories and self.memory.update_user_memories_after_run:
-                        self.memory.update_memory(input=mp.get_content_string())
+                    if update_user_memories:
+                        memory_inputs.append(mp.get_content_string())
                 else:
                     log_warning("Unable to add message to memory")
+        # Update the user memories, in the background if the memory has a memory_pipeline
+        if len(memory_inputs) > 0:
+            self.memory.update_memories(inputs=memory_inputs)
         # Add AgentRun to memory
         self.memory.add_run(agent_run)
         # Update the session summary if needed
         if self.memory.create_session_summary and self.memory.update_session_summary_after_run:
-            self.memory.update_summary()
+            self.memory.update_summary(on_update=self._get_summary_saver())
 
         # 10. Calculate session metrics
         self.session_metrics = self.calculate_session_metrics(self.memory.messages)
@@ -855,7 +884,11 @@ class Agent:
         # Log Agent Run
         self._log_agent_run()
 
-        log_debug(f"Agent Run End: {self.run_response.run_id}", center=True, symbol="*")
+        # End the run span before the final yield, run() does not exhaust the generator
+        self._add_run_metrics_to_span(run_span)
+        run_span.end()
+
+        log_debug("Agent Run End: %s", self.run_response.run_id, center=True, symbol="*")
         if self.stream_intermediate_steps:
             yield self.create_run_response(
                 content=self.run_response.content,
@@ -1028,6 +1061,7 @@ class Agent:
         else:
             raise Exception(f"Failed after {num_attempts} attempts.")
 
+    @traced("agent.run", attributes=_get_agent_span_attributes)
     async def _arun(
         self,
         message: Optional[Union[str, List, Dict, Message]] = None,
@@ -1068,8 +1102,12 @@ class Agent:
         # 1.3 Create a run_id and RunResponse
         self.run_id = str(uuid4())
         self.run_response = RunResponse(run_id=self.run_id, session_id=self.session_id, agent_id=self.agent_id)
+        run_span = get_current_span()
+        run_span.set_attributes(
+            run_id=self.run_id, agent_id=self.agent_id, session_id=self.session_id, stream=self.stream
+        )
 
-        log_debug(f"Async Agent Run Start: {self.run_response.run_id}", center=True, symbol="*")
+        log_debug("Async Agent Run Start: %s", self.run_response.run_id, center=True, symbol="*")
 
         # 2. Update the Model and resolve context
         self.update_model(async_mode=True)  # use async search for vector db
@@ -1079,6 +1117,9 @@ class Agent:
 
         # 3. Read existing session from storage
         self.read_from_storage()
+        # Without storage, load the user memories here, waiting for the memory_pipeline to process the previous runs
+        if self.storage is None and self.memory.memory_pipeline is not None:
+            self.load_user_memories()
 
         # 4. Prepare run messages
         run_messages: RunMessages = self.get_run_messages(
@@ -1322,13 +1363,11 @@ class Agent:
         # Create an AgentRun object to add to memory
         agent_run = AgentRun(response=self.run_response)
         agent_run.message = run_messages.user_message
-        # Update the memories with the user message if needed
-        if (
-            self.memory.create_user_memories
-            and self.memory.update_user_memories_after_run
-            and run_messages.user_message is not None
-        ):
-            await self.memory.aupdate_memory(input=run_messages.user_message.get_content_string())
+        # Collect the messages to update the user memories with
+        update_user_memories = self.memory.create_user_memories and self.memory.update_user_memories_after_run
+        memory_inputs: List[str] = []
+        if update_user_memories and run_messages.user_message is not None:
+            memory_inputs.append(run_messages.user_message.get_content_string())
         if messages is not None and len(messages) > 0:
             for _im in messages:
                 # Parse the message and convert to a Message object if possible
@@ -1349,15 +1388,18 @@ class Agent:
                     if agent_run.messages is None:
                         agent_run.messages = []
                     agent_run.messages.append(mp)
-                    if self.memory.create_user_memories and self.memory.update_user_memories_after_run:
-                        await self.memory.aupdate_memory(input=mp.get_content_string())
+                    if update_user_memories:
+                        memory_inputs.append(mp.get_content_string())
                 else:
                     log_warning("Unable to add message to memory")
+        # Update the user memories, in the background if the memory has a memory_pipeline
+        if len(memory_inputs) > 0:
+            await self.memory.aupdate_memories(inputs=memory_inputs)
         # Add AgentRun to memory
         self.memory.add_run(agent_run)
         # Update the session summary if needed
         if self.memory.create_session_summary and self.memory.update_session_summary_after_run:
-            await self.memory.aupdate_summary()
+            await self.memory.aupdate_summary(on_update=self._get_summary_saver())
 
         # 10. Calculate session metrics
         self.session_metrics = self.calculate_session_metrics(self.memory.messages)
@@ -1382,7 +1424,11 @@ class Agent:
         # Log Agent Run
         await self._alog_agent_run()
 
-        log_debug(f"Agent Run End: {self.run_response.run_id}", center=True, symbol="*")
+        # End the run span before the final yield, arun() does not exhaust the generator
+        self._add_run_metrics_to_span(run_span)
+        run_span.end()
+
+        log_debug("Agent Run End: %s", self.run_response.run_id, center=True, symbol="*")
         if self.stream_intermediate_steps:
             yield self.create_run_response(
                 content=self.run_response.content,
@@ -1912,6 +1958,8 @@ class Agent:
                         self.memory.summary = SessionSummary.model_validate(session.memory["summary"])
                     except Exception as e:
                         log_warning(f"Failed to load session summary from memory: {e}")
+                if "summarized_runs" in session.memory:
+                    self.memory.summarized_runs = session.memory["summarized_runs"]
                 if "memories" in session.memory:
                     try:
                         self.memory.memories = [Memory.model_validate(m) for m in session.memory["memories"]]
@@ -1921,6 +1969,7 @@ class Agent:
                 log_warning(f"Failed to load AgentMemory: {e}")
         log_debug(f"-*- AgentSession loaded: {session.session_id}")
 
+    @traced("agent.storage.read")
     def read_from_storage(self) -> Optional[AgentSession]:
         """Load the AgentSession from storage
 
@@ -1934,6 +1983,7 @@ class Agent:
             self.load_user_memories()
         return self.agent_session
 
+    @traced("agent.storage.write")
     def write_to_storage(self) -> Optional[AgentSession]:
         """Save the AgentSession to storage
 
@@ -1944,6 +1994,27 @@ class Agent:
             self.agent_session = cast(AgentSession, self.storage.upsert(session=self.get_agent_session()))
         return self.agent_session
 
+    def _get_summary_saver(self) -> Optional[Callable[[AgentMemory], None]]:
+        """Returns a callback that saves a background session summary to the session it was created for"""
+        if self.storage is None or self.session_id is None:
+            return None
+        storage, session_id, user_id = self.storage, self.session_id, self.user_id
+
+        def save_summary(memory: AgentMemory) -> None:
+            # The session was saved before the summary was done, and the agent may be running another session by now
+            session = storage.read(session_id=session_id, user_id=user_id)
+            if session is None:
+                return
+            session_memory = session.memory or {}
+            if memory.summary is not None:
+                session_memory["summary"] = memory.summary.to_dict()
+            session_memory["summarized_runs"] = memory.summarized_runs
+            session.memory = session_memory
+            storage.upsert(session=session)
+            log_debug(f"Saved session summary of {session_id}")
+
+        return save_summary
+
     def add_introduction(self, introduction: str) -> None:
         """Add an introduction to the chat history"""
 
@@ -2021,6 +2092,13 @@ class Agent:
         """
         import json
 
+        # The prompt only depends on the response_model, reuse it while the response_model does not change
+        response_model_key = (
+            tuple(self.response_model) if isinstance(self.response_model, list) else self.response_model
+        )
+        if self._json_output_prompt is not None and self._json_output_prompt[0] == response_model_key:
+            return self._json_output_prompt[1]
+
         json_output_prompt = "Provide your output as a JSON containing the following fields:"
         if self.response_model is not None:
             if isinstance(self.response_model, str):
@@ -2097,6 +2175,7 @@ class Agent:
         json_output_prompt += "\nStart your response with `{` and end it with `}`."
         json_output_prompt += "\nYour output will be passed to json.loads() to convert it to a Python object."
         json_output_prompt += "\nMake sure it only contains valid JSON."
+        self._json_output_prompt = (response_model_key, json_output_prompt)
         return json_output_prompt
 
     def format_message_with_state_variables(self, msg: Any) -> Any:
@@ -2112,6 +2191,95 @@ class Agent:
         )
         return self._formatter.format(msg, **format_variables)  # type: ignore
 
+    def get_static_system_message_segments(
+        self, instructions: List[str], system_message_from_model: Optional[str]
+    ) -> Tuple[str, str]:
+        """Return the segments of the default system message that only depend on the Agent config.
+
+        The segments are cached and rebuilt when the config they are built from changes.
+
+        Returns:
+            Tuple[str, str]: The segment formatted with the session state variables
+                and the segment added after the state is formatted.
+        """
+        cache_key = (
+            self.description,
+            self.goal,
+            self.role,
+            self.has_team and self.add_transfer_instructions,
+            tuple(instructions),
+            self.markdown and self.response_model is None,
+            self.name if self.add_name_to_instructions else None,
+            system_message_from_model,
+            self.expected_output,
+            self.additional_context,
+        )
+        if self._system_message_segments is not None and self._system_message_segments[0] == cache_key:
+            return self._system_message_segments[1]
+
+        # Build a list of additional information for the system message
+        additional_information: List[str] = []
+        # Add instructions for using markdown
+        if self.markdown and self.response_model is None:
+            additional_information.append("Use markdown to format your answers.")
+        # Add agent name if provided
+        if self.name is not None and self.add_name_to_instructions:
+            additional_information.append(f"Your name is: {self.name}.")
+
+        head: str = ""
+        # 1. First add the Agent description if provided
+        if self.description is not None:
+            head += f"{self.description}\n\n"
+        # 2. Then add the Agent goal if provided
+        if self.goal is not None:
+            head += f"<your_goal>\n{self.goal}\n</your_goal>\n\n"
+        # 3. Then add the Agent role if provided
+        if self.role is not None:
+            head += f"<your_role>\n{self.role}\n</your_role>\n\n"
+        # 4. Then add instructions for transferring tasks to team members
+        if self.has_team and self.add_transfer_instructions:
+            head += (
+                "<agent_team>\n"
+                "You are the leader of a team of AI Agents:\n"
+                "- You can either respond directly or transfer tasks to other Agents in your team depending on the tools available to them.\n"
+                "- If you transfer a task to another Agent, make sure to include:\n"
+                "  - task_description (str): A clear description of the task.\n"
+                "  - expected_output (str): The expected output.\n"
+                "  - additional_information (str): Additional information that will help the Agent complete the task.\n"
+                "- You must always validate the output of the other Agents before responding to the user.\n"
+                "- You can re-assign the task if you are not satisfied with the result.\n"
+                "</agent_team>\n\n"
+            )
+        # 5. Then add instructions for the Agent
+        if len(instructions) > 0:
+            head += "<instructions>"
+            if len(instructions) > 1:
+                for _upi in instructions:
+                    head += f"\n- {_upi}"
+            else:
+                head += "\n" + instructions[0]
+            head += "\n</instructions>\n\n"
+        # 6. Add additional information
+        if len(additional_information) > 0:
+            head += "<additional_information>"
+            for _ai in additional_information:
+                head += f"\n- {_ai}"
+            head += "\n</additional_information>\n\n"
+
+        body: str = ""
+        # 7. Then add the system message from the Model
+        if system_message_from_model is not None:
+            body += system_message_from_model
+        # 8. Then add the expected output
+        if self.expected_output is not None:
+            body += f"<expected_output>\n{self.expected_output.strip()}\n</expected_output>\n\n"
+        # 9. Then add additional context
+        if self.additional_context is not None:
+            body += f"{self.additional_context.strip()}\n"
+
+        self._system_message_segments = (cache_key, (head, body))
+        return head, body
+
     def get_system_message(self) -> Optional[Message]:
         """Return the system message for the Agent.
 
@@ -2176,81 +2344,26 @@ class Agent:
         if _model_instructions is not None:
             instructions.extend(_model_instructions)
 
-        # 3.2 Build a list of additional information for the system message
-        additional_information: List[str] = []
-        # 3.2.1 Add instructions for using markdown
-        if self.markdown and self.response_model is None:
-            additional_information.append("Use markdown to format your answers.")
-        # 3.2.2 Add the current datetime
-        if self.add_datetime_to_instructions:
-            from datetime import datetime
-
-            additional_information.append(f"The current time is {datetime.now()}")
-        # 3.2.3 Add agent name if provided
-        if self.name is not None and self.add_name_to_instructions:
-            additional_information.append(f"Your name is: {self.name}.")
+        # 3.2 Get the system message from the Model
+        system_message_from_model = self.model.get_system_message_for_model()
 
         # 3.3 Build the default system message for the Agent.
-        system_message_content: str = ""
-        # 3.3.1 First add the Agent description if provided
-        if self.description is not None:
-            system_message_content += f"{self.description}\n\n"
-        # 3.3.2 Then add the Agent goal if provided
-        if self.goal is not None:
-            system_message_content += f"<your_goal>\n{self.goal}\n</your_goal>\n\n"
-        # 3.3.3 Then add the Agent role if provided
-        if self.role is not None:
-            system_message_content += f"<your_role>\n{self.role}\n</your_role>\n\n"
-        # 3.3.4 Then add instructions for transferring tasks to team members
-        if self.has_team and self.add_transfer_instructions:
-            system_message_content += (
-                "<agent_team>\n"
-                "You are the leader of a team of AI Agents:\n"
-                "- You can either respond directly or transfer tasks to other Agents in your team depending on the tools available to them.\n"
-                "- If you transfer a task to another Agent, make sure to include:\n"
-                "  - task_description (str): A clear description of the task.\n"
-                "  - expected_output (str): The expected output.\n"
-                "  - additional_information (str): Additional information that will help the Agent complete the task.\n"
-                "- You must always validate the output of the other Agents before responding to the user.\n"
-                "- You can re-assign the task if you are not satisfied with the result.\n"
-                "</agent_team>\n\n"
-            )
-        # 3.3.5 Then add instructions for the Agent
-        if len(instructions) > 0:
-            system_message_content += "<instructions>"
-            if len(instructions) > 1:
-                for _upi in instructions:
-                    system_message_content += f"\n- {_upi}"
-            else:
-                system_message_content += "\n" + instructions[0]
-            system_message_content += "\n</instructions>\n\n"
-        # 3.3.6 Add additional information
-        if len(additional_information) > 0:
-            system_message_content += "<additional_information>"
-            for _ai in additional_information:
-                system_message_content += f"\n- {_ai}"
-            system_message_content += "\n</additional_information>\n\n"
+        # The static segments are reused until the Agent config changes, the rest is built on every run.
+        head, body = self.get_static_system_message_segments(instructions, system_message_from_model)
+        system_message_content: str = head
 
         # Format the system message with the session state variables
         if self.add_state_in_messages:
             system_message_content = self.format_message_with_state_variables(system_message_content)
 
-        # 3.3.7 Then add the system message from the Model
-        system_message_from_model = self.model.get_system_message_for_model()
-        if system_message_from_model is not None:
-            system_message_content += system_message_from_model
-        # 3.3.8 Then add the expected output
-        if self.expected_output is not None:
-            system_message_content += f"<expected_output>\n{self.expected_output.strip()}\n</expected_output>\n\n"
-        # 3.3.9 Then add additional context
-        if self.additional_context is not None:
-            system_message_content += f"{self.additional_context.strip()}\n"
-        # 3.3.10 Then add information about the team members
+        system_message_content += body
+
+        # 3.4 Then add information about the team members
         if self.has_team and self.add_transfer_instructions:
             system_message_content += (
                 f"<transfer_instructions>\n{self.get_transfer_instructions().strip()}\n</transfer_instructions>\n\n"
             )
-        # 3.3.11 Then add memories to the system prompt
+        # 3.5 Then add memories to the system prompt
         if self.memory:
             if self.memory.create_user_memories:
                 if self.memory.memories and len(self.memory.memories) > 0:
@@ -2275,7 +2388,7 @@ class Agent:
                     "You can add new memories using the `update_memory` tool.\n"
                     "If you use the `update_memory` tool, remember to pass on the response to the user.\n\n"
                 )
-            # 3.3.12 Then add a summary of the interaction to the system prompt
+            # 3.6 Then add a summary of the interaction to the system prompt
             if self.memory.create_session_summary:
                 if self.memory.summary is not None:
                     system_message_content += "Here is a brief summary of your previous interactions if it helps:\n\n"
@@ -2294,6 +2407,12 @@ class Agent:
         ):
             system_message_content += f"{self.get_json_output_prompt()}"
 
+        # Add the current datetime last, so the rest of the system message is a stable prefix for prompt caching
+        if self.add_datetime_to_instructions:
+            from datetime import datetime
+
+            system_message_content += f"\n\nThe current time is {datetime.now()}"
+
         # Return the system message
         return (
             Message(role=self.system_message_role, content=system_message_content.strip())  # type: ignore
@@ -2332,6 +2451,10 @@ class Agent:
             retrieval_timer = Timer()
             retrieval_timer.start()
             docs_from_knowledge = self.get_relevant_docs_from_knowledge(query=message_str, **kwargs)
+            if docs_from_knowledge is not None and self.context_window is not None:
+                docs_from_knowledge = self.context_window.fit_references(
+                    docs_from_knowledge, self.context_window.get_tokenizer(self.model)
+                )
             if docs_from_knowledge is not None:
                 references = MessageReferences(
                     query=message_str, references=docs_from_knowledge, time=round(retrieval_timer.elapsed, 4)
@@ -2496,19 +2619,20 @@ class Agent:
                         self.run_response.extra_data.add_messages.extend(messages_to_add_to_run_response)
 
         # 3. Add history to run_messages
-        if self.add_history_to_messages:
-            from copy import deepcopy
-
+        history_runs: List[List[Message]] = []
+        history_index = len(run_messages.messages)
+        if self.add_history_to_messages and self.context_window is not None:
+            # Added in step 6, once the tokens left for history are known
+            history_runs = self.memory.get_messages_by_run(
+                last_n=self.num_history_runs, skip_role=self.system_message_role
+            )
+        elif self.add_history_to_messages:
             history: List[Message] = self.memory.get_messages_from_last_n_runs(
                 last_n=self.num_history_runs, skip_role=self.system_message_role
             )
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
-
-                # Tag each message as coming from history
-                for _msg in history_copy:
-                    _msg.from_history = True
+                # Tag each message as coming from history, using copies that share the payload of the original messages
+                history_copy = [msg.history_view() for msg in history]
 
                 log_debug(f"Adding {len(history_copy)} messages from history")
 
@@ -2552,8 +2676,46 @@ class Agent:
                     except Exception as e:
                         log_warning(f"Failed to validate message: {e}")
 
+        # 6. Fit the history in the context window and count the tokens of the prompt
+        if self.context_window is not None:
+            self.fit_history_to_context_window(run_messages, history_runs, history_index)
+
         return run_messages
 
+    def fit_history_to_context_window(
+        self, run_messages: RunMessages, history_runs: List[List[Message]], history_index: int
+    ) -> None:
+        """Adds the most recent history runs that fit in the context window and sets run_messages.prompt_tokens"""
+        context_window = cast(ContextWindow, self.context_window)
+        tokenizer = context_window.get_tokenizer(self.model)
+
+        # The system, user and extra messages are always sent, history gets the tokens that are left
+        required_tokens = context_window.count_tokens(run_messages.messages, tokenizer)
+        fitted_runs = context_window.fit_history(
+            history_runs, context_window.prompt_budget - required_tokens, tokenizer
+        )
+        history = [message for run in fitted_runs for message in run]
+        history_tokens = context_window.count_tokens(history, tokenizer)
+        if len(history) > 0:
+            log_debug(
+                "Adding %d messages from %d of %d history runs", len(history), len(fitted_runs), len(history_runs)
+            )
+            run_messages.messages[history_index:history_index] = [message.history_view() for message in history]
+
+        run_messages.prompt_tokens = required_tokens + history_tokens
+        log_debug(
+            "Prompt size: %d tokens (%d from history), budget: %d tokens",
+            run_messages.prompt_tokens,
+            history_tokens,
+            context_window.prompt_budget,
+        )
+        if required_tokens > context_window.prompt_budget:
+            log_warning(
+                f"The prompt needs {required_tokens} tokens without history, "
+                f"more than the context window budget of {context_window.prompt_budget} tokens"
+            )
+        get_current_span().set_attributes(prompt_tokens=run_messages.prompt_tokens, history_tokens=history_tokens)
+
     def deep_copy(self, *, update: Optional[Dict[str, Any]] = None) -> Agent:
         """Create and return a deep copy of this Agent, optionally updating fields.
 
@@ -2636,6 +2798,118 @@ class Agent:
             # If copy fails, return as is
             return field_value
 
+    def copy_for_session(self, *, update: Optional[Dict[str, Any]] = None) -> Agent:
+        """Create a copy of this Agent to serve a single session, optionally updating fields.
+
+        Unlike deep_copy, configuration and shared resources (knowledge, storage, model clients, tool entrypoints)
+        are shared with this Agent. Only the state a session mutates (memory, session state, model and tool bindings)
+        is copied.
+
+        Args:
+            update (Optional[Dict[str, Any]]): Optional dictionary of fields for the new Agent.
+
+        Returns:
+            Agent: A new Agent instance.
+        """
+        from dataclasses import fields
+
+        # Do not copy agent_session and session_name to the new agent
+        excluded_fields = ["agent_session", "session_name"]
+        fields_for_new_agent: Dict[str, Any] = {}
+
+        for f in fields(self):
+            if f.name in excluded_fields:
+                continue
+            field_value = getattr(self, f.name)
+            if field_value is not None:
+                fields_for_new_agent[f.name] = self._copy_field_for_session(f.name, field_value)
+
+        if update:
+            fields_for_new_agent.update(update)
+        return self.__class__(**fields_for_new_agent)
+
+    def rebind_session(self, agent: Agent, *, update: Optional[Dict[str, Any]] = None) -> None:
+        """Reset an Agent created with agent.copy_for_session() so it can serve a new session.
+
+        The model and tools, already processed for this Agent, are kept. Every other field is copied again from
+        `agent` and the run state is cleared.
+
+        As the tools are kept, so are the processed tools (_tools_for_model and _functions_for_model) and the
+        Toolkit copies they call. State a Toolkit stores on itself during a run carries over to the next session
+        served by this instance.
+
+        Args:
+            agent (Agent): The Agent this Agent was copied from.
+            update (Optional[Dict[str, Any]]): Optional dictionary of fields to update.
+        """
+        from dataclasses import fields
+
+        for f in fields(agent):
+            if f.name in ("model", "tools", "agent_session", "session_name"):
+                continue
+            field_value = getattr(agent, f.name)
+            setattr(
+                self, f.name, self._copy_field_for_session(f.name, field_value) if field_value is not None else None
+            )
+
+        self.session_name = None
+        self.agent_session = None
+        self.session_metrics = None
+        self.run_id = None
+        self.run_input = None
+        self.run_messages = None
+        self.run_response = None
+        self.images = None
+        self.audio = None
+        self.videos = None
+        if self.model is not None:
+            self.model._function_call_stack = None
+            self.model.tool_choice = agent.model.tool_choice if agent.model is not None else None
+        # Transfer functions close over the team members, which were just replaced
+        if self.team is not None:
+            self._functions_for_model = None
+            self._tools_for_model = None
+
+        if update:
+            for key, value in update.items():
+                setattr(self, key, value)
+
+    def _copy_field_for_session(self, field_name: str, field_value: Any) -> Any:
+        """Helper method to copy a field for a new session, sharing everything a session does not mutate."""
+        from copy import copy, deepcopy
+
+        if field_name in ("memory", "reasoning_agent"):
+            return field_value.deep_copy()
+
+        elif field_name in ("model", "reasoning_model"):
+            return field_value.copy_for_session()
+
+        elif field_name == "tools":
+            return [
+                tool.copy_for_session()
+                if isinstance(tool, Toolkit)
+                else tool.model_copy()
+                if isinstance(tool, Function)
+                else tool
+                for tool in field_value
+            ]
+
+        elif field_name == "team":
+            return [member.copy_for_session() for member in field_value]
+
+        elif isinstance(field_value, (list, dict, set)):
+            try:
+                return deepcopy(field_value)
+            except Exception:
+                try:
+                    return copy(field_value)
+                except Exception as e:
+                    log_warning(f"Failed to copy field: {field_name} - {e}")
+                    return field_value
+
+        # Storage, knowledge and any other object are shared
+        return field_value
+
     def get_transfer_function(self, member_agent: Agent, index: int) -> Function:
         def _transfer_task_to_agent(
             task_description: str, expected_output: str, additional_information: Optional[str] = None
@@ -2776,7 +3050,9 @@ class Agent:
         if self.knowledge is None:
             return None
 
-        relevant_docs: List[Document] = self.knowledge.search(query=query, num_documents=num_documents, **kwargs)
+        with start_span("knowledge.search", {"query_length": len(query), "num_documents": num_documents}) as span:
+            relevant_docs: List[Document] = self.knowledge.search(query=query, num_documents=num_documents, **kwargs)
+            span.set_attribute("num_results", len(relevant_docs))
         if len(relevant_docs) == 0:
             return None
         return [doc.to_dict() for doc in relevant_docs]
@@ -2804,9 +3080,11 @@ class Agent:
         if self.knowledge is None or self.knowledge.vector_db is None:
             return None
 
-        relevant_docs: List[Document] = await self.knowledge.async_search(
-            query=query, num_documents=num_documents, **kwargs
-        )
+        with start_span("knowledge.search", {"query_length": len(query), "num_documents": num_documents}) as span:
+            relevant_docs: List[Document] = await self.knowledge.async_search(
+                query=query, num_documents=num_documents, **kwargs
+            )
+            span.set_attribute("num_results", len(relevant_docs))
         if len(relevant_docs) == 0:
             return None
         return [doc.to_dict() for doc in relevant_docs]
@@ -2910,6 +3188,17 @@ class Agent:
         else:
             extra_data.reasoning_messages.extend(reasoning_agent_messages)
 
+    def _add_run_metrics_to_span(self, span: Union[Span, NoopSpan]) -> None:
+        if not span.is_recording or self.run_response is None or not self.run_response.metrics:
+            return
+        metrics = self.run_response.metrics
+        span.set_attributes(
+            input_tokens=sum(metrics.get("input_tokens", [])),
+            output_tokens=sum(metrics.get("output_tokens", [])),
+            total_tokens=sum(metrics.get("total_tokens", [])),
+            num_model_requests=len(metrics.get("total_tokens", [])),
+        )
+
     def aggregate_metrics_from_messages(self, messages: List[Message]) -> Dict[str, Any]:
         aggregated_metrics: Dict[str, Any] = defaultdict(list)
         assistant_message_role = self.model.assistant_message_role if self.model is not None else "assistant"
@@ -3061,6 +3350,70 @@ class Agent:
     # Reasoning
     ###########################################################################
 
+    def _get_reasoning_model(self) -> Optional[Model]:
+        """Return the reasoning_model, or a copy of the model cached on this Agent.
+
+        The copy shares configuration and clients with the model, so reasoning requests reuse its connections.
+        """
+        if self.reasoning_model is not None:
+            return self.reasoning_model
+        if self.model is None:
+            return None
+        if self._reasoning_model_cache is not None:
+            source_model, reasoning_model = self._reasoning_model_cache
+            if source_model is self.model and reasoning_model.id == self.model.id:
+                return reasoning_model
+
+        reasoning_model = self.model.copy_for_session()
+        # Tool settings of this Agent do not apply to the reasoning agent
+        reasoning_model.tool_choice = None
+        reasoning_model.tool_call_limit = None
+        self._reasoning_model_cache = (self.model, reasoning_model)
+        return reasoning_model
+
+    def _get_reasoning_agent(
+        self, kind: str, reasoning_model: Model, build: Callable[[], Optional[Agent]]
+    ) -> Optional[Agent]:
+        """Return the reasoning_agent, or the reasoning agent of this kind built with `build`.
+
+        Built agents are cached on this Agent and reused across runs, keeping their model clients and processed
+        tools. They are rebuilt when the reasoning model, tools or reasoning settings change. Only their run state
+        is reset before each run.
+        """
+        if self.reasoning_agent is not None:
+            return self.reasoning_agent
+
+        settings = (
+            self.reasoning_min_steps,
+            self.reasoning_max_steps,
+            self.use_json_mode,
+            self.monitoring,
+            self.telemetry,
+            self.debug_mode,
+        )
+        cached = self._reasoning_agents.get(kind)
+        if cached is not None:
+            cached_model, cached_tools, cached_settings, reasoning_agent = cached
+            if cached_model is reasoning_model and cached_tools is self.tools and cached_settings == settings:
+                log_debug(f"Reusing {kind} reasoning agent")
+                if reasoning_agent.memory is not None:
+                    reasoning_agent.memory.clear()
+                reasoning_agent.session_metrics = None
+                reasoning_agent.run_messages = None
+                reasoning_agent.run_response = None
+                reasoning_agent.images = None
+                reasoning_agent.audio = None
+                reasoning_agent.videos = None
+                if reasoning_agent.model is not None:
+                    reasoning_agent.model._function_call_stack = None
+                return reasoning_agent
+
+        new_reasoning_agent = build()
+        if new_reasoning_agent is not None:
+            self._reasoning_agents[kind] = (reasoning_model, self.tools, settings, new_reasoning_agent)
+        return new_reasoning_agent
+
+    @traced("agent.reasoning")
     def reason(self, run_messages: RunMessages) -> Iterator[RunResponse]:
         # Yield a reasoning started event
         if self.stream_intermediate_steps:
@@ -3069,10 +3422,8 @@ class Agent:
         use_default_reasoning = False
 
         # Get the reasoning model
-        reasoning_model: Optional[Model] = self.reasoning_model
-        reasoning_model_provided = reasoning_model is not None
-        if reasoning_model is None and self.model is not None:
-            reasoning_model = self.model.__class__(id=self.model.id)
+        reasoning_model_provided = self.reasoning_model is not None
+        reasoning_model: Optional[Model] = self._get_reasoning_model()
         if reasoning_model is None:
             log_warning("Reasoning error. Reasoning model is None, continuing regular session...")
             return
@@ -3085,8 +3436,10 @@ class Agent:
             if reasoning_model.__class__.__name__ == "DeepSeek" and reasoning_model.id.lower() == "deepseek-reasoner":
                 from agno.reasoning.deepseek import get_deepseek_reasoning, get_deepseek_reasoning_agent
 
-                ds_reasoning_agent = self.reasoning_agent or get_deepseek_reasoning_agent(
-                    reasoning_model=reasoning_model, monitoring=self.monitoring
+                ds_reasoning_agent = self._get_reasoning_agent(
+                    "deepseek",
+                    reasoning_model,
+                    lambda: get_deepseek_reasoning_agent(reasoning_model=reasoning_model, monitoring=self.monitoring),
                 )
                 log_debug("Starting DeepSeek Reasoning", center=True, symbol="=")
                 ds_reasoning_message: Optional[Message] = get_deepseek_reasoning(
@@ -3110,8 +3463,10 @@ class Agent:
             elif reasoning_model.__class__.__name__ == "Groq" and "deepseek" in reasoning_model.id.lower():
                 from agno.reasoning.groq import get_groq_reasoning, get_groq_reasoning_agent
 
-                groq_reasoning_agent = self.reasoning_agent or get_groq_reasoning_agent(
-                    reasoning_model=reasoning_model, monitoring=self.monitoring
+                groq_reasoning_agent = self._get_reasoning_agent(
+                    "groq",
+                    reasoning_model,
+                    lambda: get_groq_reasoning_agent(reasoning_model=reasoning_model, monitoring=self.monitoring),
                 )
                 log_debug("Starting Groq Reasoning", center=True, symbol="=")
                 groq_reasoning_message: Optional[Message] = get_groq_reasoning(
@@ -3137,8 +3492,10 @@ class Agent:
             ):
                 from agno.reasoning.openai import get_openai_reasoning, get_openai_reasoning_agent
 
-                openai_reasoning_agent = self.reasoning_agent or get_openai_reasoning_agent(
-                    reasoning_model=reasoning_model, monitoring=self.monitoring
+                openai_reasoning_agent = self._get_reasoning_agent(
+                    "openai",
+                    reasoning_model,
+                    lambda: get_openai_reasoning_agent(reasoning_model=reasoning_model, monitoring=self.monitoring),
                 )
                 log_debug("Starting OpenAI Reasoning", center=True, symbol="=")
                 openai_reasoning_message: Optional[Message] = get_openai_reasoning(
@@ -3174,9 +3531,10 @@ class Agent:
             from agno.reasoning.helpers import get_next_action, update_messages_with_reasoning
 
             # Get default reasoning agent
-            reasoning_agent: Optional[Agent] = self.reasoning_agent
-            if reasoning_agent is None:
-                reasoning_agent = get_default_reasoning_agent(
+            reasoning_agent: Optional[Agent] = self._get_reasoning_agent(
+                "default",
+                reasoning_model,
+                lambda: get_default_reasoning_agent(
                     reasoning_model=reasoning_model,
                     min_steps=self.reasoning_min_steps,
                     max_steps=self.reasoning_max_steps,
@@ -3185,7 +3543,8 @@ class Agent:
                     monitoring=self.monitoring,
                     telemetry=self.telemetry,
                     debug_mode=self.debug_mode,
-                )
+                ),
+            )
 
             # Validate reasoning agent
             if reasoning_agent is None:
@@ -3272,6 +3631,7 @@ class Agent:
                     event=RunEvent.reasoning_completed,
                 )
 
+    @traced("agent.reasoning")
     async def areason(self, run_messages: RunMessages) -> Any:
         # Yield a reasoning started event
         if self.stream_intermediate_steps:
@@ -3280,10 +3640,8 @@ class Agent:
         use_default_reasoning = False
 
         # Get the reasoning model
-        reasoning_model: Optional[Model] = self.reasoning_model
-        reasoning_model_provided = reasoning_model is not None
-        if reasoning_model is None and self.model is not None:
-            reasoning_model = self.model.__class__(id=self.model.id)
+        reasoning_model_provided = self.reasoning_model is not None
+        reasoning_model: Optional[Model] = self._get_reasoning_model()
         if reasoning_model is None:
             log_warning("Reasoning error. Reasoning model is None, continuing regular session...")
             return
@@ -3296,8 +3654,10 @@ class Agent:
             if reasoning_model.__class__.__name__ == "DeepSeek" and reasoning_model.id == "deepseek-reasoner":
                 from agno.reasoning.deepseek import aget_deepseek_reasoning, get_deepseek_reasoning_agent
 
-                ds_reasoning_agent = self.reasoning_agent or get_deepseek_reasoning_agent(
-                    reasoning_model=reasoning_model, monitoring=self.monitoring
+                ds_reasoning_agent = self._get_reasoning_agent(
+                    "deepseek",
+                    reasoning_model,
+                    lambda: get_deepseek_reasoning_agent(reasoning_model=reasoning_model, monitoring=self.monitoring),
                 )
                 log_debug("Starting DeepSeek Reasoning", center=True, symbol="=")
                 ds_reasoning_message: Optional[Message] = await aget_deepseek_reasoning(
@@ -3321,8 +3681,10 @@ class Agent:
             elif reasoning_model.__class__.__name__ == "Groq" and "deepseek" in reasoning_model.id:
                 from agno.reasoning.groq import aget_groq_reasoning, get_groq_reasoning_agent
 
-                groq_reasoning_agent = self.reasoning_agent or get_groq_reasoning_agent(
-                    reasoning_model=reasoning_model, monitoring=self.monitoring
+                groq_reasoning_agent = self._get_reasoning_agent(
+                    "groq",
+                    reasoning_model,
+                    lambda: get_groq_reasoning_agent(reasoning_model=reasoning_model, monitoring=self.monitoring),
                 )
                 log_debug("Starting Groq Reasoning", center=True, symbol="=")
                 groq_reasoning_message: Optional[Message] = await aget_groq_reasoning(
@@ -3349,8 +3711,10 @@ class Agent:
                 # elif reasoning_model.__class__.__name__ == "OpenAIChat" and reasoning_model.id.startswith("o"):
                 from agno.reasoning.openai import aget_openai_reasoning, get_openai_reasoning_agent
 
-                openai_reasoning_agent = self.reasoning_agent or get_openai_reasoning_agent(
-                    reasoning_model=reasoning_model, monitoring=self.monitoring
+                openai_reasoning_agent = self._get_reasoning_agent(
+                    "openai",
+                    reasoning_model,
+                    lambda: get_openai_reasoning_agent(reasoning_model=reasoning_model, monitoring=self.monitoring),
                 )
                 log_debug("Starting OpenAI Reasoning", center=True, symbol="=")
                 openai_reasoning_message: Optional[Message] = await aget_openai_reasoning(
@@ -3386,9 +3750,10 @@ class Agent:
             from agno.reasoning.helpers import get_next_action, update_messages_with_reasoning
 
             # Get default reasoning agent
-            reasoning_agent: Optional[Agent] = self.reasoning_agent
-            if reasoning_agent is None:
-                reasoning_agent = get_default_reasoning_agent(
+            reasoning_agent: Optional[Agent] = self._get_reasoning_agent(
+                "default",
+                reasoning_model,
+                lambda: get_default_reasoning_agent(
                     reasoning_model=reasoning_model,
                     min_steps=self.reasoning_min_steps,
                     max_steps=self.reasoning_max_steps,
@@ -3397,7 +3762,8 @@ class Agent:
                     monitoring=self.monitoring,
                     telemetry=self.telemetry,
                     debug_mode=self.debug_mode,
-                )
+                ),
+            )
 
             # Validate reasoning agent
             if reasoning_agent is None:
@@ -3542,7 +3908,7 @@ class Agent:
         tool_calls = self.memory.get_tool_calls(num_calls)
         if len(tool_calls) == 0:
             return ""
-        log_debug(f"tool_calls: {tool_calls}")
+        log_debug("tool_calls: %s", tool_calls)
         return json.dumps(tool_calls)
 
     def search_knowledge_base(self, query: str) -> str:
@@ -3703,6 +4069,7 @@ class Agent:
 
         return run_data
 
+    @traced("agent.telemetry")
     def _log_agent_run(self) -> None:
         self.set_monitoring()
 
@@ -3728,6 +4095,7 @@ class Agent:
         except Exception as e:
             log_debug(f"Could not create agent event: {e}")
 
+    @traced("agent.telemetry")
     async def _alog_agent_run(self) -> None:
         self.set_monitoring()
 
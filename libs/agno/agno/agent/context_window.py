@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.utils.tokens import Tokenizer, count_tokens, get_tokenizer
+
+
+@dataclass
+class ContextWindow:
+    """Token budget for the messages an Agent sends to the model in a run.
+
+    Messages are packed by priority:
+      1. The system message, the user message and extra messages are always sent.
+      2. References from the knowledge base are limited to max_reference_tokens, keeping the best ranked documents.
+      3. History fills the remaining budget with whole runs, newest first, up to num_history_runs.
+
+    Token counts are cached on each Message, so history messages are counted once and not on every run.
+
+    Args:
+        max_tokens: Token budget for the prompt, including the tokens kept free for the response.
+        reserve_tokens: Tokens of max_tokens kept free for the response.
+        max_reference_tokens: Token budget for the references added to the user message.
+        tokenizer: Counts tokens. Defaults to a local tokenizer for the provider family of the model.
+    """
+
+    max_tokens: int
+    reserve_tokens: int = 0
+    max_reference_tokens: Optional[int] = None
+    tokenizer: Optional[Tokenizer] = None
+
+    @property
+    def prompt_budget(self) -> int:
+        return self.max_tokens - self.reserve_tokens
+
+    def get_tokenizer(self, model: Optional[Model] = None) -> Tokenizer:
+        return self.tokenizer if self.tokenizer is not None else get_tokenizer(model)
+
+    def count_tokens(self, messages: List[Message], tokenizer: Tokenizer) -> int:
+        return sum(message.count_tokens(tokenizer) for message in messages)
+
+    def fit_references(self, references: List[Dict[str, Any]], tokenizer: Tokenizer) -> List[Dict[str, Any]]:
+        """Returns the references that fit in max_reference_tokens, in their ranked order."""
+        if self.max_reference_tokens is None:
+            return references
+
+        fitted: List[Dict[str, Any]] = []
+        num_tokens = 0
+        for reference in references:
+            num_tokens += count_tokens(reference, tokenizer)
+            if num_tokens > self.max_reference_tokens:
+                break
+            fitted.append(reference)
+        return fitted
+
+    def fit_history(self, runs: List[List[Message]], max_tokens: int, tokenizer: Tokenizer) -> List[List[Message]]:
+        """Returns the most recent runs that fit in max_tokens, oldest first.
+
+        Runs are kept whole so tool calls are not separated from their results.
+        """
+        fitted: List[List[Message]] = []
+        num_tokens = 0
+        for run_messages in reversed(runs):
+            num_tokens += self.count_tokens(run_messages, tokenizer)
+            if num_tokens > max_tokens:
+                break
+            fitted.append(run_messages)
+        fitted.reverse()
+        return fitted
@@ -13,6 +13,9 @@ class SessionMetrics:
 
     prompt_tokens: int = 0
     completion_tokens: int = 0
+    # Input tokens read from and written to the provider's prompt cache
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
     prompt_tokens_details: Optional[dict] = None
     completion_tokens_details: Optional[dict] = None
 
@@ -46,6 +49,8 @@ class SessionMetrics:
             total_tokens=self.total_tokens + other.total_tokens,
             prompt_tokens=self.prompt_tokens + other.prompt_tokens,
             completion_tokens=self.completion_tokens + other.completion_tokens,
+            cache_read_tokens=self.cache_read_tokens + other.cache_read_tokens,
+            cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
         )
 
         # Handle prompt_tokens_details
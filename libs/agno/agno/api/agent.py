@@ -1,4 +1,5 @@
 from agno.api.api import api
+from agno.api.exporter import export_in_background
 from agno.api.routes import ApiRoutes
 from agno.api.schemas.agent import AgentRunCreate, AgentSessionCreate
 from agno.cli.settings import agno_cli_settings
@@ -10,12 +11,14 @@ def create_agent_session(session: AgentSessionCreate, monitor: bool = False) ->
         return
 
     log_debug("Logging Agent Session")
+    route = ApiRoutes.AGENT_SESSION_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_SESSION_CREATE
+    payload = {"session": session.model_dump(exclude_none=True)}
+    if export_in_background(route, payload):
+        return
+
     with api.AuthenticatedClient() as api_client:
         try:
-            api_client.post(
-                ApiRoutes.AGENT_SESSION_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_SESSION_CREATE,
-                json={"session": session.model_dump(exclude_none=True)},
-            )
+            api_client.post(route, json=payload)
         except Exception as e:
             log_debug(f"Could not create Agent session: {e}")
     return
@@ -26,12 +29,14 @@ def create_agent_run(run: AgentRunCreate, monitor: bool = False) -> None:
         return
 
     log_debug("Logging Agent Run")
+    route = ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE
+    payload = {"run": run.model_dump(exclude_none=True)}
+    if export_in_background(route, payload):
+        return
+
     with api.AuthenticatedClient() as api_client:
         try:
-            api_client.post(
-                ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
+            api_client.post(route, json=payload)
         except Exception as e:
             log_debug(f"Could not create Agent run: {e}")
     return
@@ -42,11 +47,13 @@ async def acreate_agent_run(run: AgentRunCreate, monitor: bool = False) -> None:
         return
 
     log_debug("Logging Agent Run (Async)")
+    route = ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE
+    payload = {"run": run.model_dump(exclude_none=True)}
+    if export_in_background(route, payload):
+        return
+
     async with api.AuthenticatedAsyncClient() as api_client:
         try:
-            await api_client.post(
-                ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
+            await api_client.post(route, json=payload)
         except Exception as e:
             log_debug(f"Could not create Agent run: {e}")
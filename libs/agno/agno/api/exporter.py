@@ -0,0 +1,242 @@
+import atexit
+import gzip
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
+from time import time
+from typing import Any, Dict, List, Optional, Union
+
+import httpx
+
+from agno.cli.settings import agno_cli_settings
+from agno.utils.log import log_debug
+
+
+@dataclass
+class TelemetryEvent:
+    """A request to the Agno API that is sent in the background"""
+
+    route: str
+    payload: Dict[str, Any]
+    created_at: float = 0.0
+
+
+class TelemetrySink:
+    """Where the TelemetryExporter sends batches of events"""
+
+    def send(self, events: List[TelemetryEvent]) -> Optional[int]:
+        """Send a batch of events. Returns the number of events sent, or None if all of them were sent."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class ApiTelemetrySink(TelemetrySink):
+    """Posts events to the Agno API, reusing one connection for every batch.
+
+    Args:
+        compress: Send gzip compressed request bodies.
+    """
+
+    def __init__(self, compress: bool = False):
+        self.compress = compress
+        self._client: Optional[httpx.Client] = None
+
+    def send(self, events: List[TelemetryEvent]) -> Optional[int]:
+        from agno.api.api import api
+
+        if self._client is None:
+            self._client = api.AuthenticatedClient()
+
+        headers = {"Content-Encoding": "gzip"} if self.compress else None
+        sent = 0
+        for event in events:
+            content = json.dumps(event.payload, default=str).encode("utf-8")
+            if self.compress:
+                content = gzip.compress(content)
+            try:
+                response = self._client.post(event.route, content=content, headers=headers)
+                response.raise_for_status()
+                sent += 1
+            except Exception as e:
+                log_debug(f"Could not send telemetry to {event.route}: {e}")
+        return sent
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+class FileTelemetrySink(TelemetrySink):
+    """Appends events to a local JSON lines file instead of sending them to the API.
+
+    Each batch is written as one gzip member if the path ends with .gz, gzip readers read the file as a whole.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.compress = self.path.suffix == ".gz"
+
+    def send(self, events: List[TelemetryEvent]) -> Optional[int]:
+        lines = "".join(
+            json.dumps({"route": e.route, "created_at": e.created_at, **e.payload}, default=str) + "\n" for e in events
+        )
+        if self.compress:
+            with self.path.open("ab") as f:
+                f.write(gzip.compress(lines.encode("utf-8")))
+        else:
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(lines)
+        return len(events)
+
+
+class TelemetryExporter:
+    """Sends telemetry and monitoring events from a background thread, so runs do not wait on the API.
+
+    Events are queued and sent in batches when `max_batch_size` events are waiting, every `flush_interval` seconds
+    and at shutdown. When the queue is full new events are dropped instead of blocking the run.
+
+    Args:
+        sink: Where batches are sent. Defaults to the Agno API.
+        max_queue_size: Maximum number of events waiting to be sent.
+        max_batch_size: Maximum number of events sent in one batch.
+        flush_interval: Seconds between flushes.
+    """
+
+    def __init__(
+        self,
+        sink: Optional[TelemetrySink] = None,
+        max_queue_size: int = 1000,
+        max_batch_size: int = 50,
+        flush_interval: float = 5.0,
+    ):
+        self.sink = sink or ApiTelemetrySink()
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+
+        # Number of events dropped because the queue was full
+        self.dropped = 0
+        # Number of events the sink sent
+        self.exported = 0
+        # Number of events the sink failed to send
+        self.failed = 0
+
+        self._queue: Queue = Queue(maxsize=max_queue_size)
+        self._wake = Event()
+        self._stopped = Event()
+        # Serializes calls to the sink between the worker and flush()
+        self._send_lock = Lock()
+        self._start_lock = Lock()
+        self._thread: Optional[Thread] = None
+
+    def submit(self, route: str, payload: Dict[str, Any]) -> bool:
+        """Queue an event without blocking. Returns False if the event was dropped."""
+        if self._stopped.is_set():
+            return False
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(TelemetryEvent(route=route, payload=payload, created_at=time()))
+        except Full:
+            self.dropped += 1
+            log_debug(f"Telemetry queue is full, dropped event for {route}")
+            return False
+        if self._queue.qsize() >= self.max_batch_size:
+            self._wake.set()
+        return True
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="agno-telemetry-exporter", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Send all queued events, in the calling thread."""
+        with self._send_lock:
+            while True:
+                batch: List[TelemetryEvent] = []
+                while len(batch) < self.max_batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except Empty:
+                        break
+                if not batch:
+                    return
+                try:
+                    sent = self.sink.send(batch)
+                    sent = len(batch) if sent is None else sent
+                except Exception as e:
+                    log_debug(f"Could not export {len(batch)} telemetry events: {e}")
+                    sent = 0
+                self.exported += sent
+                self.failed += len(batch) - sent
+
+    def shutdown(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the background thread, send the queued events and close the sink."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.flush()
+        self.sink.close()
+
+
+_exporter: Optional[TelemetryExporter] = None
+_exporter_lock = Lock()
+
+
+def get_telemetry_exporter() -> Optional[TelemetryExporter]:
+    """The process wide exporter, None if background telemetry is disabled using AGNO_BACKGROUND_TELEMETRY=false."""
+    global _exporter
+
+    if _exporter is not None or not agno_cli_settings.background_telemetry:
+        return _exporter
+    with _exporter_lock:
+        if _exporter is None:
+            sink: TelemetrySink = (
+                FileTelemetrySink(agno_cli_settings.telemetry_file)
+                if agno_cli_settings.telemetry_file
+                else ApiTelemetrySink()
+            )
+            _exporter = TelemetryExporter(sink=sink)
+    return _exporter
+
+
+def set_telemetry_exporter(exporter: Optional[TelemetryExporter]) -> None:
+    """Replace the process wide exporter, shutting down the previous one."""
+    global _exporter
+
+    with _exporter_lock:
+        previous, _exporter = _exporter, exporter
+    if previous is not None and previous is not exporter:
+        previous.shutdown()
+
+
+def export_in_background(route: str, payload: Dict[str, Any]) -> bool:
+    """Queue an API request on the background exporter. Returns False if background telemetry is disabled."""
+    exporter = get_telemetry_exporter()
+    if exporter is None:
+        return False
+    exporter.submit(route, payload)
+    return True
+
+
+@atexit.register
+def _shutdown_exporter() -> None:
+    if _exporter is not None:
+        _exporter.shutdown()
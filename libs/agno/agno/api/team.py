@@ -1,4 +1,5 @@
 from agno.api.api import api
+from agno.api.exporter import export_in_background
 from agno.api.routes import ApiRoutes
 from agno.api.schemas.team import TeamRunCreate, TeamSessionCreate
 from agno.cli.settings import agno_cli_settings
@@ -10,12 +11,14 @@ def create_team_run(run: TeamRunCreate, monitor: bool = False) -> None:
         return
 
     log_debug("--**-- Logging Team Run")
+    route = ApiRoutes.TEAM_RUN_CREATE if monitor else ApiRoutes.TEAM_TELEMETRY_RUN_CREATE
+    payload = {"run": run.model_dump(exclude_none=True)}
+    if export_in_background(route, payload):
+        return
+
     with api.AuthenticatedClient() as api_client:
         try:
-            response = api_client.post(
-                ApiRoutes.TEAM_RUN_CREATE if monitor else ApiRoutes.TEAM_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
+            response = api_client.post(route, json=payload)
             response.raise_for_status()
         except Exception as e:
             log_debug(f"Could not create Team run: {e}")
@@ -27,12 +30,14 @@ async def acreate_team_run(run: TeamRunCreate, monitor: bool = False) -> None:
         return
 
     log_debug("--**-- Logging Team Run")
+    route = ApiRoutes.TEAM_RUN_CREATE if monitor else ApiRoutes.TEAM_TELEMETRY_RUN_CREATE
+    payload = {"run": run.model_dump(exclude_none=True)}
+    if export_in_background(route, payload):
+        return
+
     async with api.AuthenticatedAsyncClient() as api_client:
         try:
-            response = await api_client.post(
-                ApiRoutes.TEAM_RUN_CREATE if monitor else ApiRoutes.TEAM_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
+            response = await api_client.post(route, json=payload)
             response.raise_for_status()
         except Exception as e:
             log_debug(f"Could not create Team run: {e}")
@@ -43,13 +48,15 @@ def upsert_team_session(session: TeamSessionCreate, monitor: bool = False) -> No
         return
 
     log_debug("--**-- Logging Team Session")
+    if not monitor:
+        return
+    payload = {"session": session.model_dump(exclude_none=True)}
+    if export_in_background(ApiRoutes.TEAM_SESSION_CREATE, payload):
+        return
+
     with api.AuthenticatedClient() as api_client:
         try:
-            if monitor:
-                api_client.post(
-                    ApiRoutes.TEAM_SESSION_CREATE,
-                    json={"session": session.model_dump(exclude_none=True)},
-                )
+            api_client.post(ApiRoutes.TEAM_SESSION_CREATE, json=payload)
         except Exception as e:
             log_debug(f"Could not create Agent session: {e}")
     return
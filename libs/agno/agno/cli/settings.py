@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from importlib import metadata
 from pathlib import Path
+from typing import Optional
 
 from pydantic import Field, field_validator
 from pydantic_core.core_schema import ValidationInfo
@@ -25,6 +26,10 @@ class AgnoCliSettings(BaseSettings):
 
     api_runtime: str = "prd"
     api_enabled: bool = True
+    # Send telemetry and monitoring data from a background thread, in batches
+    background_telemetry: bool = True
+    # Write telemetry and monitoring data to this file instead of sending it to the API, e.g. telemetry.jsonl.gz
+    telemetry_file: Optional[str] = None
     alpha_features: bool = False
     api_url: str = Field("https://api.agno.com", validate_default=True)
     signin_url: str = Field("https://app.agno.com/login", validate_default=True)
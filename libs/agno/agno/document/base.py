@@ -2,6 +2,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from agno.embedder import Embedder
+from agno.tracing import start_span
 
 
 @dataclass
@@ -24,7 +25,8 @@ class Document:
         if _embedder is None:
             raise ValueError("No embedder provided")
 
-        self.embedding, self.usage = _embedder.get_embedding_and_usage(self.content)
+        with start_span("embedder.embed", {"embedder": _embedder.__class__.__name__, "chars": len(self.content)}):
+            self.embedding, self.usage = _embedder.get_embedding_and_usage(self.content)
 
     def to_dict(self) -> Dict[str, Any]:
         """Returns a dictionary representation of the document"""
@@ -1,11 +1,18 @@
 import asyncio
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
+from threading import Lock
 from time import sleep
-from typing import IO, Any, List, Union
+from typing import IO, Any, Deque, Iterator, List, Optional, Tuple, Union
 
 from agno.document.base import Document
 from agno.document.reader.base import Reader
-from agno.utils.log import log_info, logger
+from agno.utils.log import log_info, log_warning, logger
 
 try:
     from pypdf import PdfReader as DocumentReader  # noqa: F401
@@ -13,59 +20,80 @@ try:
 except ImportError:
     raise ImportError("`pypdf` not installed. Please install it via `pip install pypdf`.")
 
+# One OCR engine per process: created on first use and reused for every page, including in pool workers
+_ocr_engine: Optional[Any] = None
+_ocr_engine_lock = Lock()
 
-def process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
-    try:
-        import rapidocr_onnxruntime as rapidocr
-    except ImportError:
-        raise ImportError(
-            "`rapidocr_onnxruntime` not installed. Please install it via `pip install rapidocr_onnxruntime`."
-        )
-    ocr = rapidocr.RapidOCR()
+# The PDF opened by a page worker process, set by _init_page_worker
+_worker_pdf: Optional[Any] = None
+
+
+def _get_ocr_engine() -> Any:
+    global _ocr_engine
+    with _ocr_engine_lock:
+        if _ocr_engine is None:
+            try:
+                import rapidocr_onnxruntime as rapidocr
+            except ImportError:
+                raise ImportError(
+                    "`rapidocr_onnxruntime` not installed. Please install it via `pip install rapidocr_onnxruntime`."
+                )
+            _ocr_engine = rapidocr.RapidOCR()
+        return _ocr_engine
+
+
+def _ocr_image(ocr: Any, image_data: bytes) -> List[str]:
+    ocr_result, _ = ocr(image_data)
+    return [item[1] for item in ocr_result] if ocr_result else []
+
+
+def _extract_page_content(page: Any, read_images: bool) -> str:
     page_text = page.extract_text() or ""
-    images_text_list = []
+    if not read_images:
+        return page_text
 
-    # Extract and process images
+    ocr = _get_ocr_engine()
+    images_text_list: List[str] = []
     for image_object in page.images:
-        image_data = image_object.data
+        images_text_list += _ocr_image(ocr, image_object.data)
+    return page_text + "\n" + "\n".join(images_text_list)
 
-        # Perform OCR on the image
-        ocr_result, elapse = ocr(image_data)
 
-        # Extract text from OCR result
-        if ocr_result:
-            images_text_list += [item[1] for item in ocr_result]
+def _init_page_worker(source: Union[str, bytes], max_memory_per_worker_mb: Optional[int]) -> None:
+    global _worker_pdf
+    if max_memory_per_worker_mb is not None:
+        try:
+            import resource
 
-    images_text = "\n".join(images_text_list)
-    content = page_text + "\n" + images_text
+            limit = max_memory_per_worker_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError) as e:
+            log_warning(f"Could not limit PDF worker memory: {e}")
+    _worker_pdf = DocumentReader(BytesIO(source) if isinstance(source, bytes) else source)
 
-    # Append the document
+
+def _read_page_range(start: int, end: int, read_images: bool) -> List[str]:
+    """Extract the content of pages [start, end) from the PDF opened by the worker."""
+    return [_extract_page_content(_worker_pdf.pages[index], read_images) for index in range(start, end)]  # type: ignore
+
+
+def process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
     return Document(
         name=doc_name,
         id=f"{doc_name}_{page_number}",
         meta_data={"page": page_number},
-        content=content,
+        content=_extract_page_content(page, read_images=True),
     )
 
 
 async def async_process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
-    try:
-        import rapidocr_onnxruntime as rapidocr
-    except ImportError:
-        raise ImportError(
-            "`rapidocr_onnxruntime` not installed. Please install it via `pip install rapidocr_onnxruntime`."
-        )
-    ocr = rapidocr.RapidOCR()
+    ocr = _get_ocr_engine()
 
     page_text = page.extract_text() or ""
     images_text_list: List = []
 
-    # Process images in parallel
-    async def process_image(image_data: bytes) -> List[str]:
-        ocr_result, _ = ocr(image_data)
-        return [item[1] for item in ocr_result] if ocr_result else []
-
-    image_tasks = [process_image(image.data) for image in page.images]
+    # OCR is blocking, so run each image in a thread to process them in parallel
+    image_tasks = [asyncio.to_thread(_ocr_image, ocr, image.data) for image in page.images]
     images_results = await asyncio.gather(*image_tasks)
 
     for result in images_results:
@@ -82,18 +110,141 @@ async def async_process_image_page(doc_name: str, page_number: int, page: Any) -
     )
 
 
+@dataclass
 class BasePDFReader(Reader):
+    """Base class for PDF readers.
+
+    Args:
+        parallel: Read pages in a process pool instead of serially in the calling process.
+        max_workers: Number of worker processes used when parallel is set. Defaults to the number of CPUs.
+        pages_per_task: Number of consecutive pages each worker task extracts.
+        max_memory_per_worker_mb: Address space limit for each worker process (POSIX only).
+            A worker that exceeds it fails and its pages are read in the calling process instead.
+    """
+
+    parallel: bool = False
+    max_workers: Optional[int] = None
+    pages_per_task: int = 8
+    max_memory_per_worker_mb: Optional[int] = None
+
     def _build_chunked_documents(self, documents: List[Document]) -> List[Document]:
         chunked_documents: List[Document] = []
         for document in documents:
             chunked_documents.extend(self.chunk_document(document))
         return chunked_documents
 
+    def _get_pdf_name(self, pdf: Union[str, Path, IO[Any]]) -> str:
+        try:
+            if isinstance(pdf, str):
+                return pdf.split("/")[-1].split(".")[0].replace(" ", "_")
+            return pdf.name.split(".")[0]
+        except Exception:
+            return "pdf"
+
+    def _stream_documents(
+        self, pdf: Union[str, Path, bytes, IO[Any]], doc_name: str, read_images: bool = False
+    ) -> Iterator[Document]:
+        """Yield one Document per page, in page order, chunked if enabled.
+
+        When parallel is set, page ranges are extracted in a process pool. Each worker opens the PDF once and keeps
+        a single OCR engine, and at most two tasks per worker are in flight so results stream back as pages are read.
+        """
+        source: Union[str, bytes]
+        if isinstance(pdf, (str, Path)):
+            source = str(pdf)
+        elif isinstance(pdf, bytes):
+            source = pdf
+        else:
+            if pdf.seekable():
+                pdf.seek(0)
+            source = pdf.read()
+
+        try:
+            doc_reader = DocumentReader(BytesIO(source) if isinstance(source, bytes) else source)
+            num_pages = len(doc_reader.pages)
+        except PdfStreamError as e:
+            logger.error(f"Error reading PDF: {e}")
+            return
+
+        def make_documents(start: int, contents: List[str]) -> Iterator[Document]:
+            for page_number, content in enumerate(contents, start=start + 1):
+                document = Document(
+                    name=doc_name, id=f"{doc_name}_{page_number}", meta_data={"page": page_number}, content=content
+                )
+                if self.chunk:
+                    yield from self.chunk_document(document)
+                else:
+                    yield document
+
+        if not self.parallel or num_pages <= self.pages_per_task:
+            for index, page in enumerate(doc_reader.pages):
+                yield from make_documents(index, [_extract_page_content(page, read_images)])
+            return
+
+        def read_in_process(start: int, end: int) -> List[str]:
+            return [_extract_page_content(doc_reader.pages[index], read_images) for index in range(start, end)]
+
+        ranges = deque(
+            (start, min(start + self.pages_per_task, num_pages)) for start in range(0, num_pages, self.pages_per_task)
+        )
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_page_worker,
+            initargs=(source, self.max_memory_per_worker_mb),
+        ) as executor:
+            max_in_flight = 2 * (self.max_workers or os.cpu_count() or 1)
+            in_flight: Deque[Tuple[int, int, Future]] = deque()
+            # Set once a worker dies, e.g. aborted under the memory limit. The pool accepts no new tasks after that.
+            pool_broken = False
+            while ranges or in_flight:
+                while not pool_broken and ranges and len(in_flight) < max_in_flight:
+                    start, end = ranges[0]
+                    try:
+                        in_flight.append((start, end, executor.submit(_read_page_range, start, end, read_images)))
+                    except BrokenProcessPool:
+                        log_warning("A PDF worker process died, reading the remaining pages here instead")
+                        pool_broken = True
+                        break
+                    ranges.popleft()
+
+                if not in_flight:
+                    # The pool is broken, read the remaining ranges here
+                    start, end = ranges.popleft()
+                    yield from make_documents(start, read_in_process(start, end))
+                    continue
+
+                start, end, future = in_flight.popleft()
+                try:
+                    contents = future.result()
+                except Exception as e:
+                    if isinstance(e, BrokenProcessPool):
+                        if not pool_broken:
+                            log_warning("A PDF worker process died, reading the remaining pages here instead")
+                        pool_broken = True
+                    log_warning(f"Failed to read pages {start + 1}-{end} in a worker, reading them here instead: {e}")
+                    contents = read_in_process(start, end)
+                yield from make_documents(start, contents)
+
+    async def _astream_documents(
+        self, pdf: Union[str, Path, bytes, IO[Any]], doc_name: str, read_images: bool = False
+    ) -> List[Document]:
+        """Run _stream_documents in a thread so the event loop is not blocked while the pool works."""
+        return await asyncio.to_thread(lambda: list(self._stream_documents(pdf, doc_name, read_images)))
+
 
 class PDFReader(BasePDFReader):
     """Reader for PDF files"""
 
+    def read_stream(self, pdf: Union[str, Path, IO[Any]]) -> Iterator[Document]:
+        """Yield documents in page order as pages are read, instead of returning them all at the end."""
+        doc_name = self._get_pdf_name(pdf)
+        log_info(f"Reading: {doc_name}")
+        return self._stream_documents(pdf, doc_name)
+
     def read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
+        if self.parallel:
+            return list(self.read_stream(pdf))
+
         try:
             if isinstance(pdf, str):
                 doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
@@ -125,6 +276,11 @@ class PDFReader(BasePDFReader):
         return documents
 
     async def async_read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
+        if self.parallel:
+            doc_name = self._get_pdf_name(pdf)
+            log_info(f"Reading: {doc_name}")
+            return await self._astream_documents(pdf, doc_name)
+
         try:
             if isinstance(pdf, str):
                 doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
@@ -169,8 +325,6 @@ class PDFUrlReader(BasePDFReader):
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         import httpx
 
         log_info(f"Reading: {url}")
@@ -194,6 +348,8 @@ class PDFUrlReader(BasePDFReader):
             raise
 
         doc_name = url.split("/")[-1].split(".")[0].replace("/", "_").replace(" ", "_")
+        if self.parallel:
+            return list(self._stream_documents(response.content, doc_name))
         doc_reader = DocumentReader(BytesIO(response.content))
 
         documents = []
@@ -214,8 +370,6 @@ class PDFUrlReader(BasePDFReader):
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         try:
             import httpx
         except ImportError:
@@ -244,6 +398,8 @@ class PDFUrlReader(BasePDFReader):
                 raise
 
         doc_name = url.split("/")[-1].split(".")[0].replace("/", "_").replace(" ", "_")
+        if self.parallel:
+            return await self._astream_documents(response.content, doc_name)
         doc_reader = DocumentReader(BytesIO(response.content))
 
         async def _process_document(doc_name: str, page_number: int, page: Any) -> Document:
@@ -270,9 +426,20 @@ class PDFUrlReader(BasePDFReader):
 class PDFImageReader(BasePDFReader):
     """Reader for PDF files with text and images extraction"""
 
+    def read_stream(self, pdf: Union[str, Path, IO[Any]]) -> Iterator[Document]:
+        """Yield documents in page order as pages are read, instead of returning them all at the end."""
+        if not pdf:
+            raise ValueError("No pdf provided")
+
+        doc_name = self._get_pdf_name(pdf)
+        log_info(f"Reading: {doc_name}")
+        return self._stream_documents(pdf, doc_name, read_images=True)
+
     def read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
         if not pdf:
             raise ValueError("No pdf provided")
+        if self.parallel:
+            return list(self.read_stream(pdf))
 
         try:
             if isinstance(pdf, str):
@@ -297,6 +464,10 @@ class PDFImageReader(BasePDFReader):
     async def async_read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
         if not pdf:
             raise ValueError("No pdf provided")
+        if self.parallel:
+            doc_name = self._get_pdf_name(pdf)
+            log_info(f"Reading: {doc_name}")
+            return await self._astream_documents(pdf, doc_name, read_images=True)
 
         try:
             if isinstance(pdf, str):
@@ -328,8 +499,6 @@ class PDFUrlImageReader(BasePDFReader):
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         import httpx
 
         # Read the PDF from the URL
@@ -337,6 +506,8 @@ class PDFUrlImageReader(BasePDFReader):
         response = httpx.get(url)
 
         doc_name = url.split("/")[-1].split(".")[0].replace(" ", "_")
+        if self.parallel:
+            return list(self._stream_documents(response.content, doc_name, read_images=True))
         doc_reader = DocumentReader(BytesIO(response.content))
 
         documents = []
@@ -353,8 +524,6 @@ class PDFUrlImageReader(BasePDFReader):
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         import httpx
 
         log_info(f"Reading: {url}")
@@ -364,6 +533,8 @@ class PDFUrlImageReader(BasePDFReader):
             response.raise_for_status()
 
         doc_name = url.split("/")[-1].split(".")[0].replace(" ", "_")
+        if self.parallel:
+            return await self._astream_documents(response.content, doc_name, read_images=True)
         doc_reader = DocumentReader(BytesIO(response.content))
 
         documents = await asyncio.gather(
@@ -1,8 +1,13 @@
 import asyncio
+import hashlib
+import json
+import queue
 import random
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Tuple
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
 from agno.document.base import Document
@@ -20,12 +25,53 @@ except ImportError:
     raise ImportError("`httpx` not installed. Please install it via `pip install httpx`.")
 
 
+class TokenBucket:
+    """Allows `rate` requests per second on average, with bursts of up to `capacity` requests."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
 @dataclass
 class WebsiteReader(Reader):
-    """Reader for Websites"""
+    """Reader for Websites
+
+    Args:
+        max_depth: Maximum link depth to follow from the starting URL.
+        max_links: Maximum number of pages with content to return.
+        max_concurrency: Number of pages fetched concurrently across all hosts.
+        max_concurrency_per_host: Number of pages fetched concurrently from a single host.
+        requests_per_second: Average request rate allowed per host. 0 disables rate limiting.
+        burst: Number of requests a host may receive back to back before the rate limit applies.
+        timeout: Request timeout in seconds.
+        cache_dir: Directory to cache pages in. Cached pages are revalidated with ETag/Last-Modified on re-crawls.
+    """
 
     max_depth: int = 3
     max_links: int = 10
+    max_concurrency: int = 8
+    max_concurrency_per_host: int = 2
+    requests_per_second: float = 2.0
+    burst: int = 4
+    timeout: float = 10.0
+    cache_dir: Optional[str] = None
 
     _visited: Set[str] = field(default_factory=set)
     _urls_to_crawl: List[Tuple[str, int]] = field(default_factory=list)
@@ -81,6 +127,182 @@ class WebsiteReader(Reader):
 
         return ""
 
+    def _get_cache_path(self, url: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return Path(self.cache_dir).joinpath(f"{hashlib.sha256(url.encode()).hexdigest()}.json")
+
+    def _load_cached_page(self, url: str) -> Optional[Dict[str, Any]]:
+        cache_path = self._get_cache_path(url)
+        if cache_path is None or not cache_path.exists():
+            return None
+        try:
+            return json.loads(cache_path.read_text())
+        except Exception as e:
+            log_debug(f"Ignoring unreadable cache entry for {url}: {e}")
+            return None
+
+    def _save_cached_page(self, url: str, response: httpx.Response, content: str, links: List[str]) -> None:
+        cache_path = self._get_cache_path(url)
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        # Without a validator the page could never be revalidated, so there is no point caching it
+        if cache_path is None or (etag is None and last_modified is None):
+            return
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps({"etag": etag, "last_modified": last_modified, "content": content, "links": links})
+        )
+
+    def _extract_links(self, url: str, soup: BeautifulSoup, primary_domain: str) -> List[str]:
+        links: List[str] = []
+        for link in soup.find_all("a", href=True):
+            if not isinstance(link, Tag):
+                continue
+
+            full_url = urljoin(url, str(link["href"]))
+            if not isinstance(full_url, str):
+                continue
+
+            parsed_url = urlparse(full_url)
+            if parsed_url.netloc.endswith(primary_domain) and not any(
+                parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
+            ):
+                links.append(full_url)
+        return links
+
+    def _parse_page(self, url: str, html: bytes, primary_domain: str) -> Tuple[str, List[str]]:
+        soup = BeautifulSoup(html, "html.parser")
+        return self._extract_main_content(soup), self._extract_links(url, soup, primary_domain)
+
+    async def _fetch_page(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        primary_domain: str,
+        host_limits: Dict[str, Tuple[asyncio.Semaphore, TokenBucket]],
+    ) -> Tuple[str, List[str]]:
+        """Fetch a page and return its main content and links, revalidating a cached copy if there is one."""
+        headers: Dict[str, str] = {}
+        cached = self._load_cached_page(url)
+        if cached is not None:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        host = urlparse(url).netloc
+        if host not in host_limits:
+            host_limits[host] = (
+                asyncio.Semaphore(self.max_concurrency_per_host),
+                TokenBucket(rate=self.requests_per_second, capacity=self.burst),
+            )
+        semaphore, bucket = host_limits[host]
+        async with semaphore:
+            await bucket.acquire()
+            log_debug(f"Crawling asynchronously: {url}")
+            response = await client.get(url, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            log_debug(f"Not modified: {url}")
+            return cached["content"], cached["links"]
+        response.raise_for_status()
+
+        # Parsing is CPU bound, keep it off the event loop so other fetches make progress
+        content, links = await asyncio.to_thread(self._parse_page, url, response.content, primary_domain)
+        self._save_cached_page(url, response, content, links)
+        return content, links
+
+    async def async_crawl_stream(self, url: str, starting_depth: int = 1) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Asynchronously crawls a website, yielding (url, main content) pairs as pages are fetched.
+
+        URLs wait in a frontier queue that `max_concurrency` workers consume. Requests to a host are limited to
+        `max_concurrency_per_host` at a time and paced by a token bucket refilled at `requests_per_second`.
+        All requests share one pooled client. With `cache_dir` set, pages are revalidated with conditional GETs
+        on re-crawls and served from the cache when unchanged.
+        """
+        primary_domain = self._get_primary_domain(url)
+        self._visited = set()
+
+        frontier: asyncio.Queue = asyncio.Queue()
+        results: asyncio.Queue = asyncio.Queue()
+        seen: Set[str] = {url}
+        host_limits: Dict[str, Tuple[asyncio.Semaphore, TokenBucket]] = {}
+        frontier.put_nowait((url, starting_depth))
+
+        async def worker(client: httpx.AsyncClient) -> None:
+            while True:
+                current_url, current_depth = await frontier.get()
+                try:
+                    if current_depth > self.max_depth or not urlparse(current_url).netloc.endswith(primary_domain):
+                        continue
+                    self._visited.add(current_url)
+                    content, links = await self._fetch_page(client, current_url, primary_domain, host_limits)
+                    for link in links:
+                        if link not in seen and current_depth + 1 <= self.max_depth:
+                            seen.add(link)
+                            frontier.put_nowait((link, current_depth + 1))
+                    if content:
+                        await results.put((current_url, content))
+                except Exception as e:
+                    logger.warning(f"Failed to crawl asynchronously: {current_url}: {e}")
+                finally:
+                    frontier.task_done()
+
+        async def signal_done() -> None:
+            await frontier.join()
+            await results.put(None)
+
+        limits = httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency)
+        async with httpx.AsyncClient(limits=limits, timeout=self.timeout, follow_redirects=True) as client:
+            tasks = [asyncio.create_task(worker(client)) for _ in range(self.max_concurrency)]
+            tasks.append(asyncio.create_task(signal_done()))
+            try:
+                num_links = 0
+                while num_links < self.max_links:
+                    result = await results.get()
+                    if result is None:
+                        break
+                    num_links += 1
+                    yield result
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    def crawl_stream(self, url: str, starting_depth: int = 1) -> Iterator[Tuple[str, str]]:
+        """Synchronous version of async_crawl_stream. The crawl runs on an event loop in a background thread."""
+        items: queue.Queue = queue.Queue()
+        stop = threading.Event()
+        done = object()
+
+        async def produce() -> None:
+            async for item in self.async_crawl_stream(url, starting_depth):
+                items.put(item)
+                if stop.is_set():
+                    break
+
+        def run() -> None:
+            try:
+                asyncio.run(produce())
+            except Exception as e:
+                items.put(e)
+            finally:
+                items.put(done)
+
+        threading.Thread(target=run, daemon=True).start()
+        try:
+            while True:
+                item = items.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
     def crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
         """
         Crawls a website and returns a dictionary of URLs and their corresponding content.
@@ -99,71 +321,7 @@ class WebsiteReader(Reader):
         The crawler will also respect the `max_depth` attribute of the WebCrawler class, ensuring it does not
         crawl deeper than the specified depth.
         """
-        num_links = 0
-        crawler_result: Dict[str, str] = {}
-        primary_domain = self._get_primary_domain(url)
-        # Add starting URL with its depth to the global list
-        self._urls_to_crawl.append((url, starting_depth))
-        while self._urls_to_crawl:
-            # Unpack URL and depth from the global list
-            current_url, current_depth = self._urls_to_crawl.pop(0)
-
-            # Skip if
-            # - URL is already visited
-            # - does not end with the primary domain,
-            # - exceeds max depth
-            # - exceeds max links
-            if (
-                current_url in self._visited
-                or not urlparse(current_url).netloc.endswith(primary_domain)
-                or current_depth > self.max_depth
-                or num_links >= self.max_links
-            ):
-                continue
-
-            self._visited.add(current_url)
-            self.delay()
-
-            try:
-                log_debug(f"Crawling: {current_url}")
-                response = httpx.get(current_url, timeout=10)
-
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, "html.parser")
-
-                # Extract main content
-                main_content = self._extract_main_content(soup)
-                if main_content:
-                    crawler_result[current_url] = main_content
-                    num_links += 1
-
-                # Add found URLs to the global list, with incremented depth
-                for link in soup.find_all("a", href=True):
-                    if not isinstance(link, Tag):
-                        continue
-
-                    href_str = str(link["href"])
-                    full_url = urljoin(current_url, href_str)
-
-                    if not isinstance(full_url, str):
-                        continue
-
-                    parsed_url = urlparse(full_url)
-                    if parsed_url.netloc.endswith(primary_domain) and not any(
-                        parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
-                    ):
-                        full_url_str = str(full_url)
-                        if (
-                            full_url_str not in self._visited
-                            and (full_url_str, current_depth + 1) not in self._urls_to_crawl
-                        ):
-                            self._urls_to_crawl.append((full_url_str, current_depth + 1))
-
-            except Exception as e:
-                logger.warning(f"Failed to crawl: {current_url}: {e}")
-                pass
-
-        return crawler_result
+        return dict(self.crawl_stream(url, starting_depth))
 
     async def async_crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
         """
@@ -177,68 +335,26 @@ class WebsiteReader(Reader):
         - Dict[str, str]: A dictionary where each key is a URL and the corresponding value is the main
                         content extracted from that URL.
         """
-        num_links = 0
-        crawler_result: Dict[str, str] = {}
-        primary_domain = self._get_primary_domain(url)
-
-        # Clear previously visited URLs and URLs to crawl
-        self._visited = set()
-        self._urls_to_crawl = [(url, starting_depth)]
-
-        async with httpx.AsyncClient() as client:
-            while self._urls_to_crawl and num_links < self.max_links:
-                current_url, current_depth = self._urls_to_crawl.pop(0)
+        return {crawled_url: content async for crawled_url, content in self.async_crawl_stream(url, starting_depth)}
 
-                if (
-                    current_url in self._visited
-                    or not urlparse(current_url).netloc.endswith(primary_domain)
-                    or current_depth > self.max_depth
-                    or num_links >= self.max_links
-                ):
-                    continue
+    def _build_documents(self, url: str, crawled_url: str, crawled_content: str) -> List[Document]:
+        document = Document(name=url, id=str(crawled_url), meta_data={"url": str(crawled_url)}, content=crawled_content)
+        if self.chunk:
+            return self.chunk_document(document)
+        return [document]
 
-                self._visited.add(current_url)
-                await self.async_delay()
-
-                try:
-                    log_debug(f"Crawling asynchronously: {current_url}")
-                    response = await client.get(current_url, timeout=10, follow_redirects=True)
-                    response.raise_for_status()
-
-                    soup = BeautifulSoup(response.content, "html.parser")
-
-                    # Extract main content
-                    main_content = self._extract_main_content(soup)
-                    if main_content:
-                        crawler_result[current_url] = main_content
-                        num_links += 1
-
-                    # Add found URLs to the list, with incremented depth
-                    for link in soup.find_all("a", href=True):
-                        if not isinstance(link, Tag):
-                            continue
-
-                        href_str = str(link["href"])
-                        full_url = urljoin(current_url, href_str)
-
-                        if not isinstance(full_url, str):
-                            continue
-
-                        parsed_url = urlparse(full_url)
-                        if parsed_url.netloc.endswith(primary_domain) and not any(
-                            parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
-                        ):
-                            full_url_str = str(full_url)
-                            if (
-                                full_url_str not in self._visited
-                                and (full_url_str, current_depth + 1) not in self._urls_to_crawl
-                            ):
-                                self._urls_to_crawl.append((full_url_str, current_depth + 1))
-
-                except Exception as e:
-                    logger.warning(f"Failed to crawl asynchronously: {current_url}: {e}")
+    def read_stream(self, url: str) -> Iterator[Document]:
+        """Yield documents as pages are crawled, chunking each page as soon as it arrives."""
+        log_debug(f"Reading: {url}")
+        for crawled_url, crawled_content in self.crawl_stream(url):
+            yield from self._build_documents(url, crawled_url, crawled_content)
 
-        return crawler_result
+    async def async_read_stream(self, url: str) -> AsyncIterator[Document]:
+        """Asynchronously yield documents as pages are crawled, chunking each page as soon as it arrives."""
+        log_debug(f"Reading asynchronously: {url}")
+        async for crawled_url, crawled_content in self.async_crawl_stream(url):
+            for document in await asyncio.to_thread(self._build_documents, url, crawled_url, crawled_content):
+                yield document
 
     def read(self, url: str) -> List[Document]:
         """
@@ -255,23 +371,7 @@ class WebsiteReader(Reader):
         crawler_result = self.crawl(url)
         documents = []
         for crawled_url, crawled_content in crawler_result.items():
-            if self.chunk:
-                documents.extend(
-                    self.chunk_document(
-                        Document(
-                            name=url, id=str(crawled_url), meta_data={"url": str(crawled_url)}, content=crawled_content
-                        )
-                    )
-                )
-            else:
-                documents.append(
-                    Document(
-                        name=url,
-                        id=str(crawled_url),
-                        meta_data={"url": str(crawled_url)},
-                        content=crawled_content,
-                    )
-                )
+            documents.extend(self._build_documents(url, crawled_url, crawled_content))
         return documents
 
     async def async_read(self, url: str) -> List[Document]:
@@ -288,26 +388,10 @@ class WebsiteReader(Reader):
         crawler_result = await self.async_crawl(url)
         documents = []
 
-        # Process documents in parallel
-        async def process_document(crawled_url, crawled_content):
-            if self.chunk:
-                doc = Document(
-                    name=url, id=str(crawled_url), meta_data={"url": str(crawled_url)}, content=crawled_content
-                )
-                return self.chunk_document(doc)
-            else:
-                return [
-                    Document(
-                        name=url,
-                        id=str(crawled_url),
-                        meta_data={"url": str(crawled_url)},
-                        content=crawled_content,
-                    )
-                ]
-
-        # Use asyncio.gather to process all documents in parallel
+        # Chunk documents in parallel
         tasks = [
-            process_document(crawled_url, crawled_content) for crawled_url, crawled_content in crawler_result.items()
+            asyncio.to_thread(self._build_documents, url, crawled_url, crawled_content)
+            for crawled_url, crawled_content in crawler_result.items()
         ]
         results = await asyncio.gather(*tasks)
 
@@ -210,7 +210,7 @@ class AccuracyEval:
             evaluator_context += "\n"
 
         return Agent(
-            model=OpenAIChat(id="gpt-4o-mini"),
+            model=model,
             description=f"""\
 You are an Agent Evaluator tasked with assessing the accuracy of an AI Agent's answer compared to an expected answer for a given question.
 Your task is to provide a detailed analysis and assign a score on a scale of 1 to 10, where 10 indicates a perfect match to the expected answer.
@@ -356,6 +356,46 @@ Your evaluation should be objective, thorough, and well-reasoned. Provide specif
             logger.error(f"Failed to get expected answer to evaluate: {e}")
         return None
 
+    def evaluate_answer(
+        self, question: str, answer: str, expected_answer: str, evaluator_agent: Optional[Agent] = None
+    ) -> Optional[AccuracyEvaluation]:
+        """Score one answer with the evaluator agent. Returns None if the evaluator returns an invalid response."""
+        if evaluator_agent is None:
+            evaluator_agent = self.get_evaluator_agent(question=question, expected_answer=expected_answer)
+
+        accuracy_agent_response = evaluator_agent.run(answer).content
+        if accuracy_agent_response is None or not isinstance(accuracy_agent_response, AccuracyAgentResponse):
+            logger.error("Evaluator Agent returned an invalid response")
+            return None
+
+        return AccuracyEvaluation(
+            question=question,
+            answer=answer,
+            expected_answer=expected_answer,
+            score=accuracy_agent_response.accuracy_score,
+            reason=accuracy_agent_response.accuracy_reason,
+        )
+
+    async def aevaluate_answer(
+        self, question: str, answer: str, expected_answer: str, evaluator_agent: Optional[Agent] = None
+    ) -> Optional[AccuracyEvaluation]:
+        """Async version of evaluate_answer."""
+        if evaluator_agent is None:
+            evaluator_agent = self.get_evaluator_agent(question=question, expected_answer=expected_answer)
+
+        accuracy_agent_response = (await evaluator_agent.arun(answer)).content
+        if accuracy_agent_response is None or not isinstance(accuracy_agent_response, AccuracyAgentResponse):
+            logger.error("Evaluator Agent returned an invalid response")
+            return None
+
+        return AccuracyEvaluation(
+            question=question,
+            answer=answer,
+            expected_answer=expected_answer,
+            score=accuracy_agent_response.accuracy_score,
+            reason=accuracy_agent_response.accuracy_reason,
+        )
+
     def run(
         self,
         *,
@@ -412,20 +452,15 @@ Your evaluation should be objective, thorough, and well-reasoned. Provide specif
 
                 try:
                     logger.debug(f"Answer #{i + 1}: {answer_to_evaluate.content}")
-                    accuracy_agent_response = evaluator_agent.run(answer_to_evaluate.content).content
-                    if accuracy_agent_response is None or not isinstance(
-                        accuracy_agent_response, AccuracyAgentResponse
-                    ):
-                        logger.error("Evaluator Agent returned an invalid response")
-                        continue
-
-                    accuracy_evaluation = AccuracyEvaluation(
+                    accuracy_evaluation = self.evaluate_answer(
                         question=question_to_evaluate,
                         answer=answer_to_evaluate.content,  # type: ignore
                         expected_answer=expected_answer_to_evaluate,
-                        score=accuracy_agent_response.accuracy_score,
-                        reason=accuracy_agent_response.accuracy_reason,
+                        evaluator_agent=evaluator_agent,
                     )
+                    if accuracy_evaluation is None:
+                        continue
+
                     if self.print_results:
                         accuracy_evaluation.print_eval(console)
                     self.result.results.append(accuracy_evaluation)
@@ -0,0 +1,534 @@
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from os import getenv
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, TypeVar, Union
+from uuid import uuid4
+
+from agno.agent import Agent, RunResponse
+from agno.eval.accuracy import AccuracyEval, AccuracyEvaluation
+from agno.eval.reliability import ReliabilityEval
+from agno.exceptions import ModelProviderError, ModelRateLimitError
+from agno.models.base import Model
+from agno.utils.log import logger, set_log_level_to_debug, set_log_level_to_info
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+T = TypeVar("T")
+
+
+@dataclass
+class EvalCase:
+    """A question of the dataset and what is expected from the Agent."""
+
+    question: str
+    # Expected answer, scored by the evaluator agent. If None, the accuracy is not evaluated.
+    expected_answer: Optional[str] = None
+    # Tools the Agent is allowed to call. If None, the reliability is not evaluated.
+    expected_tool_calls: Optional[List[str]] = None
+    # Identifies the case in the results file. Defaults to a hash of the question and the expected answer.
+    id: Optional[str] = None
+
+    def __post_init__(self):
+        if self.id is None:
+            key = f"{self.question}\n{self.expected_answer or ''}"
+            self.id = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class EvalCaseResult:
+    case_id: str
+    question: str
+    expected_answer: Optional[str] = None
+    answer: Optional[str] = None
+    # Accuracy score between 1 and 10 and the reason given by the evaluator agent
+    score: Optional[int] = None
+    reason: Optional[str] = None
+    # Tool calls that were not expected
+    failed_tool_calls: Optional[List[str]] = None
+    passed: bool = False
+    error: Optional[str] = None
+    # Seconds taken by the Agent to answer and by the evaluator agent to score the answer
+    latency: float = 0.0
+    eval_latency: float = 0.0
+    # Tokens used by the Agent to answer
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    # Tokens used by the evaluator agent
+    eval_total_tokens: int = 0
+    # Number of retries after a rate limit error
+    num_retries: int = 0
+
+
+@dataclass
+class DatasetEvalResult:
+    results: List[EvalCaseResult] = field(default_factory=list)
+    # Wall time of the evaluation in seconds
+    duration: float = 0.0
+
+    num_cases: int = field(init=False)
+    num_passed: int = field(init=False)
+    num_errors: int = field(init=False)
+    # Fraction of the cases that passed
+    accuracy: float = field(init=False)
+
+    avg_score: float = field(init=False)
+    std_dev_score: float = field(init=False)
+
+    avg_latency: float = field(init=False)
+    median_latency: float = field(init=False)
+    p95_latency: float = field(init=False)
+    max_latency: float = field(init=False)
+
+    total_input_tokens: int = field(init=False)
+    total_output_tokens: int = field(init=False)
+    total_tokens: int = field(init=False)
+    avg_total_tokens: float = field(init=False)
+    eval_total_tokens: int = field(init=False)
+    num_retries: int = field(init=False)
+
+    def __post_init__(self):
+        self.compute_stats()
+
+    def compute_stats(self):
+        import statistics
+
+        self.num_cases = len(self.results)
+        self.num_passed = sum(1 for r in self.results if r.passed)
+        self.num_errors = sum(1 for r in self.results if r.error is not None)
+        self.accuracy = self.num_passed / self.num_cases if self.num_cases > 0 else 0
+
+        scores = [r.score for r in self.results if r.score is not None]
+        self.avg_score = statistics.mean(scores) if scores else 0
+        self.std_dev_score = statistics.stdev(scores) if len(scores) > 1 else 0
+
+        latencies = sorted(r.latency for r in self.results if r.error is None)
+        if latencies:
+            self.avg_latency = statistics.mean(latencies)
+            self.median_latency = statistics.median(latencies)
+            self.p95_latency = statistics.quantiles(latencies, n=100)[94] if len(latencies) > 1 else latencies[0]
+            self.max_latency = latencies[-1]
+        else:
+            self.avg_latency = 0
+            self.median_latency = 0
+            self.p95_latency = 0
+            self.max_latency = 0
+
+        self.total_input_tokens = sum(r.input_tokens for r in self.results)
+        self.total_output_tokens = sum(r.output_tokens for r in self.results)
+        self.total_tokens = sum(r.total_tokens for r in self.results)
+        self.avg_total_tokens = self.total_tokens / self.num_cases if self.num_cases > 0 else 0
+        self.eval_total_tokens = sum(r.eval_total_tokens for r in self.results)
+        self.num_retries = sum(r.num_retries for r in self.results)
+
+    def print_summary(self, console: Optional["Console"] = None):
+        from rich.box import ROUNDED
+        from rich.console import Console
+        from rich.table import Table
+
+        if console is None:
+            console = Console()
+
+        summary_table = Table(
+            box=ROUNDED,
+            border_style="blue",
+            show_header=False,
+            title="[ Dataset Evaluation Summary ]",
+            title_style="bold sky_blue1",
+            title_justify="center",
+        )
+        summary_table.add_row("Number of Cases", f"{self.num_cases}")
+        summary_table.add_row("Passed", f"{self.num_passed} ({self.accuracy:.1%})")
+        summary_table.add_row("Errors", f"{self.num_errors}")
+        summary_table.add_row("Average Score", f"{self.avg_score:.2f}")
+        summary_table.add_row("Standard Deviation", f"{self.std_dev_score:.2f}")
+        summary_table.add_row("Average Latency", f"{self.avg_latency:.2f}s")
+        summary_table.add_row("Median Latency", f"{self.median_latency:.2f}s")
+        summary_table.add_row("95th %ile Latency", f"{self.p95_latency:.2f}s")
+        summary_table.add_row("Maximum Latency", f"{self.max_latency:.2f}s")
+        summary_table.add_row("Input Tokens", f"{self.total_input_tokens}")
+        summary_table.add_row("Output Tokens", f"{self.total_output_tokens}")
+        summary_table.add_row("Average Tokens per Case", f"{self.avg_total_tokens:.0f}")
+        summary_table.add_row("Evaluator Tokens", f"{self.eval_total_tokens}")
+        summary_table.add_row("Rate Limit Retries", f"{self.num_retries}")
+        summary_table.add_row("Duration", f"{self.duration:.2f}s")
+        console.print(summary_table)
+
+
+def is_rate_limit_error(error: ModelProviderError) -> bool:
+    """ModelRateLimitError, or a ModelProviderError with status 429, e.g. from OpenAIChat."""
+    return isinstance(error, ModelRateLimitError) or error.status_code == 429
+
+
+class RateLimiter:
+    """Spaces agent runs to runs_per_minute and pauses every worker after a rate limit error."""
+
+    def __init__(self, runs_per_minute: Optional[float] = None):
+        self.interval = 60 / runs_per_minute if runs_per_minute else 0.0
+        self._lock = threading.Lock()
+        self._next_run_at = 0.0
+        self._resume_at = 0.0
+
+    def reserve(self) -> float:
+        """Reserves the next slot and returns the seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_run_at, self._resume_at)
+            self._next_run_at = start + self.interval
+            return start - now
+
+    def wait(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def await_slot(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, delay: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+
+@dataclass
+class DatasetEval:
+    """Evaluate an Agent on a dataset of questions, running the cases concurrently.
+
+    Every case gets its own copy of the Agent, made with copy_for_session, so runs do not share session state but
+    do share the model clients. Each answer is scored by the evaluator agent of AccuracyEval if the case has an
+    expected answer, and its tool calls are checked by ReliabilityEval if the case has expected tool calls.
+
+    Rate limit errors pause all workers and the failed run is retried with exponential backoff.
+    Results are appended to results_file as JSON lines as soon as each case finishes. When the
+    evaluation is run again with the same results_file, cases that already finished are not run again.
+    """
+
+    # Evaluation name
+    name: Optional[str] = None
+    # Evaluation UUID (autogenerated if not set)
+    eval_id: Optional[str] = None
+
+    # Agent to evaluate, copied for every case
+    agent: Optional[Agent] = None
+    # Creates the Agent for every case, instead of copying agent
+    agent_factory: Optional[Callable[[], Agent]] = None
+    # Cases to evaluate, as EvalCase or dicts with the EvalCase fields
+    cases: List[Union[EvalCase, Dict[str, Any]]] = field(default_factory=list)
+
+    # Model used to evaluate the answers
+    model: Optional[Model] = None
+    # Guidelines for the evaluator agent
+    evaluator_guidelines: Optional[List[str]] = None
+    # Additional context to the evaluator agent
+    evaluator_context: Optional[str] = None
+    # Minimum accuracy score for a case to pass
+    passing_score: int = 7
+
+    # Number of cases evaluated at the same time
+    max_concurrency: int = 4
+    # Maximum number of agent runs started per minute, including the evaluator agent runs
+    runs_per_minute: Optional[float] = None
+    # Retries of a run after a rate limit error
+    max_retries: int = 5
+    # Seconds to wait after the first rate limit error, doubled on every retry
+    retry_delay: float = 1.0
+    max_retry_delay: float = 60.0
+
+    # Append the result of every case to this file, formatted with name.
+    # It is not formatted with eval_id, which changes on every evaluation and would prevent resuming.
+    results_file: Optional[str] = None
+    # Skip the cases already in results_file. If False, results_file is overwritten.
+    resume: bool = True
+
+    # Result of the evaluation
+    result: Optional[DatasetEvalResult] = None
+
+    # Print summary of results
+    print_summary: bool = False
+
+    # debug_mode=True enables debug logs
+    debug_mode: bool = False
+
+    def __post_init__(self):
+        self._file_lock = threading.Lock()
+        self._rate_limiter = RateLimiter(self.runs_per_minute)
+
+    def set_eval_id(self) -> str:
+        if self.eval_id is None:
+            self.eval_id = str(uuid4())
+        logger.debug(f"*********** Evaluation ID: {self.eval_id} ***********")
+        return self.eval_id
+
+    def set_debug_mode(self) -> None:
+        if self.debug_mode or getenv("AGNO_DEBUG", "false").lower() == "true":
+            self.debug_mode = True
+            set_log_level_to_debug()
+            logger.debug("Debug logs enabled")
+        else:
+            set_log_level_to_info()
+
+    def get_cases(self) -> List[EvalCase]:
+        return [case if isinstance(case, EvalCase) else EvalCase(**case) for case in self.cases]
+
+    def get_agent(self) -> Agent:
+        if self.agent_factory is not None:
+            return self.agent_factory()
+        if self.agent is None:
+            raise ValueError("DatasetEval needs an agent or an agent_factory")
+        return self.agent.copy_for_session()
+
+    def get_accuracy_eval(self) -> AccuracyEval:
+        return AccuracyEval(
+            model=self.model.copy_for_session() if self.model is not None else None,
+            evaluator_guidelines=self.evaluator_guidelines,
+            evaluator_context=self.evaluator_context,
+        )
+
+    # -*- Results file
+    def get_results_file_path(self) -> Optional[Path]:
+        if self.results_file is None:
+            return None
+        try:
+            return Path(self.results_file.format(name=self.name))
+        except (KeyError, IndexError) as e:
+            raise ValueError(f"results_file can only be formatted with name, got {self.results_file}") from e
+
+    def read_results_file(self) -> Dict[str, EvalCaseResult]:
+        """Returns the finished cases of the results file, by case id. Cases that failed with an error are run again."""
+        fn_path = self.get_results_file_path()
+        if fn_path is None or not fn_path.exists():
+            return {}
+
+        finished: Dict[str, EvalCaseResult] = {}
+        for line in fn_path.read_text().splitlines():
+            if not line.strip():
+                continue
+            try:
+                case_result = EvalCaseResult(**json.loads(line))
+            except Exception as e:
+                logger.warning(f"Skipping invalid line in {fn_path}: {e}")
+                continue
+            if case_result.error is None:
+                finished[case_result.case_id] = case_result
+            else:
+                finished.pop(case_result.case_id, None)
+        return finished
+
+    def reset_results_file(self) -> None:
+        fn_path = self.get_results_file_path()
+        if fn_path is None:
+            return
+        fn_path.parent.mkdir(parents=True, exist_ok=True)
+        fn_path.write_text("")
+
+    def write_case_result(self, case_result: EvalCaseResult) -> None:
+        fn_path = self.get_results_file_path()
+        if fn_path is None:
+            return
+        try:
+            with self._file_lock:
+                fn_path.parent.mkdir(parents=True, exist_ok=True)
+                with fn_path.open("a") as f:
+                    f.write(json.dumps(asdict(case_result)) + "\n")
+        except Exception as e:
+            logger.warning(f"Failed to save result to file: {e}")
+
+    # -*- Rate limits
+    def get_retry_delay(self, attempt: int) -> float:
+        delay = min(self.retry_delay * 2**attempt, self.max_retry_delay)
+        return delay * (1 + random.uniform(0, 0.25))
+
+    def call_with_retries(self, fn: Callable[[], T], case_result: EvalCaseResult) -> T:
+        while True:
+            self._rate_limiter.wait()
+            try:
+                return fn()
+            except ModelProviderError as e:
+                if not is_rate_limit_error(e) or case_result.num_retries >= self.max_retries:
+                    raise
+                delay = self.get_retry_delay(case_result.num_retries)
+                logger.warning(f"Rate limited, retrying in {delay:.1f}s: {e}")
+                self._rate_limiter.pause(delay)
+                case_result.num_retries += 1
+
+    async def acall_with_retries(self, fn: Callable[[], Awaitable[T]], case_result: EvalCaseResult) -> T:
+        while True:
+            await self._rate_limiter.await_slot()
+            try:
+                return await fn()
+            except ModelProviderError as e:
+                if not is_rate_limit_error(e) or case_result.num_retries >= self.max_retries:
+                    raise
+                delay = self.get_retry_delay(case_result.num_retries)
+                logger.warning(f"Rate limited, retrying in {delay:.1f}s: {e}")
+                self._rate_limiter.pause(delay)
+                case_result.num_retries += 1
+
+    # -*- Evaluate a case
+    def add_response_to_case_result(self, case: EvalCase, response: RunResponse, case_result: EvalCaseResult) -> None:
+        case_result.answer = response.get_content_as_string() if response.content is not None else None
+        metrics = response.metrics or {}
+        case_result.input_tokens = sum(metrics.get("input_tokens", []))
+        case_result.output_tokens = sum(metrics.get("output_tokens", []))
+        case_result.total_tokens = sum(metrics.get("total_tokens", []))
+
+        case_result.passed = True
+        if case.expected_tool_calls is not None:
+            reliability_result = ReliabilityEval().evaluate_response(
+                agent_response=response, expected_tool_calls=case.expected_tool_calls
+            )
+            case_result.failed_tool_calls = reliability_result.failed_tool_calls
+            case_result.passed = reliability_result.eval_status == "PASSED"
+
+    def add_evaluation_to_case_result(
+        self, evaluation: Optional[AccuracyEvaluation], evaluator_agent: Agent, case_result: EvalCaseResult
+    ) -> None:
+        if evaluator_agent.run_response is not None and evaluator_agent.run_response.metrics:
+            case_result.eval_total_tokens = sum(evaluator_agent.run_response.metrics.get("total_tokens", []))
+        if evaluation is None:
+            case_result.passed = False
+            case_result.error = "Evaluator Agent returned an invalid response"
+            return
+        case_result.score = evaluation.score
+        case_result.reason = evaluation.reason
+        case_result.passed = case_result.passed and evaluation.score >= self.passing_score
+
+    def evaluate_case(self, case: EvalCase) -> EvalCaseResult:
+        case_result = EvalCaseResult(case_id=case.id, question=case.question, expected_answer=case.expected_answer)  # type: ignore
+        try:
+            agent = self.get_agent()
+            start = time.perf_counter()
+            response = self.call_with_retries(lambda: agent.run(case.question), case_result)
+            case_result.latency = time.perf_counter() - start
+            self.add_response_to_case_result(case, response, case_result)
+
+            if case.expected_answer is not None:
+                accuracy_eval = self.get_accuracy_eval()
+                evaluator_agent = accuracy_eval.get_evaluator_agent(
+                    question=case.question, expected_answer=case.expected_answer
+                )
+                start = time.perf_counter()
+                evaluation = self.call_with_retries(
+                    lambda: accuracy_eval.evaluate_answer(
+                        question=case.question,
+                        answer=case_result.answer or "",
+                        expected_answer=case.expected_answer,  # type: ignore
+                        evaluator_agent=evaluator_agent,
+                    ),
+                    case_result,
+                )
+                case_result.eval_latency = time.perf_counter() - start
+                self.add_evaluation_to_case_result(evaluation, evaluator_agent, case_result)
+        except Exception as e:
+            logger.warning(f"Failed to evaluate case {case.id}: {e}")
+            case_result.passed = False
+            case_result.error = str(e) or e.__class__.__name__
+        return case_result
+
+    async def aevaluate_case(self, case: EvalCase) -> EvalCaseResult:
+        case_result = EvalCaseResult(case_id=case.id, question=case.question, expected_answer=case.expected_answer)  # type: ignore
+        try:
+            agent = self.get_agent()
+            start = time.perf_counter()
+            response = await self.acall_with_retries(lambda: agent.arun(case.question), case_result)
+            case_result.latency = time.perf_counter() - start
+            self.add_response_to_case_result(case, response, case_result)
+
+            if case.expected_answer is not None:
+                accuracy_eval = self.get_accuracy_eval()
+                evaluator_agent = accuracy_eval.get_evaluator_agent(
+                    question=case.question, expected_answer=case.expected_answer
+                )
+                start = time.perf_counter()
+                evaluation = await self.acall_with_retries(
+                    lambda: accuracy_eval.aevaluate_answer(
+                        question=case.question,
+                        answer=case_result.answer or "",
+                        expected_answer=case.expected_answer,  # type: ignore
+                        evaluator_agent=evaluator_agent,
+                    ),
+                    case_result,
+                )
+                case_result.eval_latency = time.perf_counter() - start
+                self.add_evaluation_to_case_result(evaluation, evaluator_agent, case_result)
+        except Exception as e:
+            logger.warning(f"Failed to evaluate case {case.id}: {e}")
+            case_result.passed = False
+            case_result.error = str(e) or e.__class__.__name__
+        return case_result
+
+    # -*- Run the evaluation
+    def get_pending_cases(self) -> List[EvalCase]:
+        """Returns the cases still to evaluate and adds the finished cases of the results file to the result."""
+        self.result = DatasetEvalResult()
+        cases = self.get_cases()
+        if not self.resume:
+            self.reset_results_file()
+            return cases
+
+        finished = self.read_results_file()
+        pending: List[EvalCase] = []
+        for case in cases:
+            if case.id in finished:
+                self.result.results.append(finished[case.id])
+            else:
+                pending.append(case)
+        if finished:
+            logger.info(f"Resuming evaluation: {len(cases) - len(pending)} of {len(cases)} cases already evaluated")
+        return pending
+
+    def add_case_result(self, case_result: EvalCaseResult) -> None:
+        self.write_case_result(case_result)
+        self.result.results.append(case_result)  # type: ignore
+
+    def finish(self, start: float) -> DatasetEvalResult:
+        self.result.duration = time.perf_counter() - start  # type: ignore
+        self.result.compute_stats()  # type: ignore
+        if self.print_summary:
+            self.result.print_summary()  # type: ignore
+        logger.debug(f"*********** Evaluation End: {self.eval_id} ***********")
+        return self.result  # type: ignore
+
+    def run(self, *, print_summary: bool = True) -> DatasetEvalResult:
+        """Evaluate the cases in a pool of max_concurrency threads."""
+        self.set_eval_id()
+        self.set_debug_mode()
+        self.print_summary = print_summary
+
+        start = time.perf_counter()
+        pending = self.get_pending_cases()
+        with ThreadPoolExecutor(max_workers=max(self.max_concurrency, 1)) as executor:
+            futures = [executor.submit(self.evaluate_case, case) for case in pending]
+            for future in as_completed(futures):
+                self.add_case_result(future.result())
+                logger.debug(f"Evaluated {len(self.result.results)}/{len(self.cases)} cases")  # type: ignore
+        return self.finish(start)
+
+    async def arun(self, *, print_summary: bool = True) -> DatasetEvalResult:
+        """Evaluate the cases concurrently, with at most max_concurrency cases at a time."""
+        self.set_eval_id()
+        self.set_debug_mode()
+        self.print_summary = print_summary
+
+        start = time.perf_counter()
+        pending = self.get_pending_cases()
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+
+        async def evaluate(case: EvalCase) -> None:
+            async with semaphore:
+                case_result = await self.aevaluate_case(case)
+            self.add_case_result(case_result)
+            logger.debug(f"Evaluated {len(self.result.results)}/{len(self.cases)} cases")  # type: ignore
+
+        await asyncio.gather(*(evaluate(case) for case in pending))
+        return self.finish(start)
@@ -77,6 +77,27 @@ class ReliabilityEval:
         else:
             set_log_level_to_info()
 
+    def evaluate_response(
+        self, agent_response: Optional[RunResponse], expected_tool_calls: Optional[List[str]]
+    ) -> ReliabilityResult:
+        """Check that every tool called in the agent response is one of the expected tool calls."""
+        failed_tool_calls = []
+        passed_tool_calls = []
+        if agent_response is not None and agent_response.messages is not None:
+            for message in agent_response.messages:
+                for tool_call in message.tool_calls or []:
+                    tool_name = tool_call.get("function", {}).get("name")
+                    if expected_tool_calls is None or tool_name not in expected_tool_calls:
+                        failed_tool_calls.append(tool_name)
+                    else:
+                        passed_tool_calls.append(tool_name)
+
+        return ReliabilityResult(
+            eval_status="PASSED" if len(failed_tool_calls) == 0 else "FAILED",
+            failed_tool_calls=failed_tool_calls,
+            passed_tool_calls=passed_tool_calls,
+        )
+
     def run(self, *, print_summary: bool = False, print_results: bool = False) -> Optional[ReliabilityResult]:
         from rich.console import Console
         from rich.live import Live
@@ -93,27 +114,8 @@ class ReliabilityEval:
             status = Status("Running evaluation...", spinner="dots", speed=1.0, refresh_per_second=10)
             live_log.update(status)
 
-            actual_tool_calls = None
-            if self.agent_response is not None:
-                for message in reversed(self.agent_response.messages):  # type: ignore
-                    if message.tool_calls:
-                        if actual_tool_calls is None:
-                            actual_tool_calls = message.tool_calls
-                        else:
-                            actual_tool_calls.append(message.tool_calls[0])  # type: ignore
-
-            failed_tool_calls = []
-            passed_tool_calls = []
-            for tool_call in actual_tool_calls:  # type: ignore
-                if tool_call.get("function", {}).get("name") not in self.expected_tool_calls:  # type: ignore
-                    failed_tool_calls.append(tool_call.get("function", {}).get("name"))
-                else:
-                    passed_tool_calls.append(tool_call.get("function", {}).get("name"))
-
-            self.result = ReliabilityResult(
-                eval_status="PASSED" if len(failed_tool_calls) == 0 else "FAILED",
-                failed_tool_calls=failed_tool_calls,
-                passed_tool_calls=passed_tool_calls,
+            self.result = self.evaluate_response(
+                agent_response=self.agent_response, expected_tool_calls=self.expected_tool_calls
             )
 
         # -*- Save result to file if save_result_to_file is set
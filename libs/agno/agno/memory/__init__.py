@@ -1,4 +1,5 @@
 from agno.memory.agent import AgentMemory
 from agno.memory.memory import Memory
+from agno.memory.pipeline import MemoryPipeline
 from agno.memory.row import MemoryRow
 from agno.memory.team import TeamMemory
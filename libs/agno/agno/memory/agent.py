@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from threading import Thread
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from agno.memory.classifier import MemoryClassifier
 from agno.memory.db import MemoryDb
 from agno.memory.manager import MemoryManager
 from agno.memory.memory import Memory, MemoryRetrieval
+from agno.memory.pipeline import MemoryPipeline
 from agno.memory.summarizer import MemorySummarizer
 from agno.memory.summary import SessionSummary
 from agno.models.message import Message
 from agno.run.response import RunResponse
+from agno.tracing import traced
 from agno.utils.log import log_debug, log_info, logger
 
 
@@ -46,6 +49,15 @@ class AgentMemory(BaseModel):
     update_session_summary_after_run: bool = True
     # Summarizer to generate session summaries
     summarizer: Optional[MemorySummarizer] = None
+    # Update the summary once this many runs happened since the last summary
+    summary_every_n_runs: Optional[int] = 1
+    # Update the summary once the runs since the last summary reach about this many tokens.
+    # Used together with summary_every_n_runs, whichever is reached first.
+    summary_token_threshold: Optional[int] = None
+    # Update the summary in a background thread, the next runs use the previous summary until it is done
+    summary_in_background: bool = False
+    # Number of runs included in the summary. Only the runs after it are sent to the summarizer.
+    summarized_runs: int = 0
 
     # Create and store personalized memories for this user
     create_user_memories: bool = False
@@ -61,12 +73,18 @@ class AgentMemory(BaseModel):
     num_memories: Optional[int] = None
     classifier: Optional[MemoryClassifier] = None
     manager: Optional[MemoryManager] = None
+    # Extract user memories in the background instead of during the run
+    memory_pipeline: Optional[MemoryPipeline] = None
+    # Seconds load_user_memories() waits for the memory_pipeline to process the previous runs of the user
+    memory_pipeline_timeout: Optional[float] = 30
 
     # True when memory is being updated
     updating_memory: bool = False
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    _summary_thread: Optional[Thread] = PrivateAttr(default=None)
+
     def to_dict(self) -> Dict[str, Any]:
         _memory_dict = self.model_dump(
             exclude_none=True,
@@ -74,6 +92,7 @@ class AgentMemory(BaseModel):
                 "update_system_message_on_change",
                 "create_session_summary",
                 "update_session_summary_after_run",
+                "summarized_runs",
                 "create_user_memories",
                 "update_user_memories_after_run",
                 "user_id",
@@ -143,16 +162,26 @@ class AgentMemory(BaseModel):
         Returns:
             A list of Messages from the specified runs, excluding history messages.
         """
+        messages_from_history = [
+            message for run_messages in self.get_messages_by_run(last_n, skip_role) for message in run_messages
+        ]
+
+        log_debug(f"Getting messages from previous runs: {len(messages_from_history)}")
+        return messages_from_history
+
+    def get_messages_by_run(self, last_n: Optional[int] = None, skip_role: Optional[str] = None) -> List[List[Message]]:
+        """Returns the messages from the last_n runs grouped per run, excluding previously tagged history messages."""
         if not self.runs:
             return []
 
         runs_to_process = self.runs if last_n is None else self.runs[-last_n:]
-        messages_from_history = []
+        messages_by_run: List[List[Message]] = []
 
         for run in runs_to_process:
             if not (run.response and run.response.messages):
                 continue
 
+            run_messages: List[Message] = []
             for message in run.response.messages:
                 # Skip messages with specified role
                 if skip_role and message.role == skip_role:
@@ -161,21 +190,26 @@ class AgentMemory(BaseModel):
                 if hasattr(message, "from_history") and message.from_history:
                     continue
 
-                messages_from_history.append(message)
+                run_messages.append(message)
+            if len(run_messages) > 0:
+                messages_by_run.append(run_messages)
 
-        log_debug(f"Getting messages from previous runs: {len(messages_from_history)}")
-        return messages_from_history
+        return messages_by_run
 
     def get_message_pairs(
-        self, user_role: str = "user", assistant_role: Optional[List[str]] = None
+        self,
+        user_role: str = "user",
+        assistant_role: Optional[List[str]] = None,
+        start_run: int = 0,
+        end_run: Optional[int] = None,
     ) -> List[Tuple[Message, Message]]:
-        """Returns a list of tuples of (user message, assistant response)."""
+        """Returns a list of tuples of (user message, assistant response), for the runs from start_run to end_run."""
 
         if assistant_role is None:
             assistant_role = ["assistant", "model", "CHATBOT"]
 
         runs_as_message_pairs: List[Tuple[Message, Message]] = []
-        for run in self.runs:
+        for run in self.runs[start_run:end_run]:
             if run.response and run.response.messages:
                 user_messages_from_run = None
                 assistant_messages_from_run = None
@@ -218,6 +252,11 @@ class AgentMemory(BaseModel):
         if self.db is None:
             return
 
+        # Wait for the memories of the previous runs of this user
+        if self.memory_pipeline is not None and self.memory_pipeline.has_pending(self.user_id):
+            if not self.memory_pipeline.wait_for_user(self.user_id, timeout=self.memory_pipeline_timeout):
+                logger.warning("Timed out waiting for user memories to be updated")
+
         try:
             if self.retrieval in (MemoryRetrieval.last_n, MemoryRetrieval.first_n):
                 memory_rows = self.db.read_memories(
@@ -271,6 +310,7 @@ class AgentMemory(BaseModel):
             return True
         return False
 
+    @traced("memory.update_memory")
     def update_memory(self, input: str, force: bool = False) -> Optional[str]:
         """Creates a memory from a message and adds it to the memory db."""
         from agno.memory.manager import MemoryManager
@@ -304,6 +344,7 @@ class AgentMemory(BaseModel):
         self.updating_memory = False
         return response
 
+    @traced("memory.update_memory")
     async def aupdate_memory(self, input: str, force: bool = False) -> Optional[str]:
         """Creates a memory from a message and adds it to the memory db."""
         from agno.memory.manager import MemoryManager
@@ -337,29 +378,151 @@ class AgentMemory(BaseModel):
         self.updating_memory = False
         return response
 
-    def update_summary(self) -> Optional[SessionSummary]:
-        """Creates a summary of the session"""
-        from agno.memory.summarizer import MemorySummarizer
+    def update_memories(self, inputs: List[str]) -> None:
+        """Updates the user memories from the messages of a run, in the background if a memory_pipeline is set."""
+        if self.memory_pipeline is not None and self.db is not None:
+            self.memory_pipeline.submit(user_id=self.user_id, inputs=inputs, db=self.db)
+            return
+        for input in inputs:
+            self.update_memory(input=input)
+
+    async def aupdate_memories(self, inputs: List[str]) -> None:
+        """Updates the user memories from the messages of a run, in the background if a memory_pipeline is set."""
+        if self.memory_pipeline is not None and self.db is not None:
+            self.memory_pipeline.submit(user_id=self.user_id, inputs=inputs, db=self.db)
+            return
+        for input in inputs:
+            await self.aupdate_memory(input=input)
+
+    def should_update_summary(self) -> bool:
+        """Returns True if the runs since the last summary reach summary_every_n_runs or summary_token_threshold"""
+        new_runs = len(self.runs) - self.summarized_runs
+        if new_runs < 0:
+            # The runs were cleared or replaced, the summary is rebuilt from the remaining runs
+            return len(self.runs) > 0
+        if new_runs == 0:
+            return False
+        if self.summary_every_n_runs is not None and new_runs >= self.summary_every_n_runs:
+            return True
+        if self.summary_token_threshold is not None:
+            # About 4 characters per token
+            num_chars = sum(
+                len(user_message.get_content_string()) + len(assistant_message.get_content_string())
+                for user_message, assistant_message in self.get_message_pairs(start_run=self.summarized_runs)
+            )
+            return num_chars // 4 >= self.summary_token_threshold
+        return False
+
+    def _get_summary_input(self) -> Tuple[List[Tuple[Message, Message]], Optional[SessionSummary], int]:
+        """Returns the message pairs since the last summary, the summary to extend and the new watermark"""
+        if self.summarized_runs > len(self.runs):
+            self.summarized_runs = 0
+            self.summary = None
+        end_run = len(self.runs)
+        return self.get_message_pairs(start_run=self.summarized_runs, end_run=end_run), self.summary, end_run
+
+    def _set_summary(self, summary: Optional[SessionSummary], end_run: int) -> None:
+        # Keep the previous summary if the summarizer failed, the runs are sent again with the next update
+        if summary is not None:
+            self.summary = summary
+            self.summarized_runs = end_run
+
+    def _update_summary_in_background(self, on_update: Optional[Callable[[AgentMemory], None]] = None) -> bool:
+        """Starts a summary update in a background thread. Returns False if an update is still in progress.
+
+        The session is usually saved before the thread is done, on_update is called from the thread
+        once the new summary is set so it can be saved as well.
+        """
+        if self._summary_thread is not None and self._summary_thread.is_alive():
+            log_debug("Session summary update already in progress")
+            return False
+
+        message_pairs, previous_summary, end_run = self._get_summary_input()
+        if len(message_pairs) == 0:
+            self.summarized_runs = end_run
+            return True
+        summarizer = self.summarizer or MemorySummarizer()
+        self.summarizer = summarizer
+
+        def update() -> None:
+            try:
+                summary = summarizer.run(message_pairs, previous_summary=previous_summary)
+                self._set_summary(summary, end_run)
+                if summary is not None and on_update is not None:
+                    on_update(self)
+            except Exception as e:
+                logger.warning(f"Error updating session summary: {e}")
+
+        self._summary_thread = Thread(target=update, name="agno-session-summary", daemon=True)
+        self._summary_thread.start()
+        return True
+
+    def wait_for_summary(self, timeout: Optional[float] = None) -> bool:
+        """Block until a background summary update is done. Returns False on timeout.
+
+        Without an on_update callback, the summary is only stored with the next save of the session.
+        """
+        if self._summary_thread is None:
+            return True
+        self._summary_thread.join(timeout)
+        return not self._summary_thread.is_alive()
+
+    @traced("memory.update_summary")
+    def update_summary(
+        self, force: bool = False, on_update: Optional[Callable[[AgentMemory], None]] = None
+    ) -> Optional[SessionSummary]:
+        """Extends the session summary with the runs since the last summary.
+
+        Args:
+            force: Update the summary even if summary_every_n_runs or summary_token_threshold is not reached.
+            on_update: Called with the memory once a background update is done, e.g. to save the session.
+        """
+        if not force and not self.should_update_summary():
+            return self.summary
+        if self.summary_in_background:
+            self._update_summary_in_background(on_update)
+            return self.summary
 
         self.updating_memory = True
 
         if self.summarizer is None:
             self.summarizer = MemorySummarizer()
 
-        self.summary = self.summarizer.run(self.get_message_pairs())
+        message_pairs, previous_summary, end_run = self._get_summary_input()
+        if len(message_pairs) == 0:
+            self.summarized_runs = end_run
+        else:
+            self._set_summary(self.summarizer.run(message_pairs, previous_summary=previous_summary), end_run)
         self.updating_memory = False
         return self.summary
 
-    async def aupdate_summary(self) -> Optional[SessionSummary]:
-        """Creates a summary of the session"""
-        from agno.memory.summarizer import MemorySummarizer
+    @traced("memory.update_summary")
+    async def aupdate_summary(
+        self, force: bool = False, on_update: Optional[Callable[[AgentMemory], None]] = None
+    ) -> Optional[SessionSummary]:
+        """Extends the session summary with the runs since the last summary.
+
+        Args:
+            force: Update the summary even if summary_every_n_runs or summary_token_threshold is not reached.
+            on_update: Called with the memory once a background update is done, e.g. to save the session.
+        """
+        if not force and not self.should_update_summary():
+            return self.summary
+        if self.summary_in_background:
+            # A thread instead of a task, so the update is not cancelled when the event loop of the run closes
+            self._update_summary_in_background(on_update)
+            return self.summary
 
         self.updating_memory = True
 
         if self.summarizer is None:
             self.summarizer = MemorySummarizer()
 
-        self.summary = await self.summarizer.arun(self.get_message_pairs())
+        message_pairs, previous_summary, end_run = self._get_summary_input()
+        if len(message_pairs) == 0:
+            self.summarized_runs = end_run
+        else:
+            self._set_summary(await self.summarizer.arun(message_pairs, previous_summary=previous_summary), end_run)
         self.updating_memory = False
         return self.summary
 
@@ -369,6 +532,7 @@ class AgentMemory(BaseModel):
         self.runs = []
         self.messages = []
         self.summary = None
+        self.summarized_runs = 0
         self.memories = None
 
     def deep_copy(self) -> "AgentMemory":
@@ -379,7 +543,7 @@ class AgentMemory(BaseModel):
 
         # Manually deepcopy fields that are known to be safe
         for field_name, field_value in self.__dict__.items():
-            if field_name not in ["db", "classifier", "manager", "summarizer"]:
+            if field_name not in ["db", "classifier", "manager", "summarizer", "memory_pipeline"]:
                 try:
                     setattr(copied_obj, field_name, deepcopy(field_value))
                 except Exception as e:
@@ -390,5 +554,6 @@ class AgentMemory(BaseModel):
         copied_obj.classifier = self.classifier
         copied_obj.manager = self.manager
         copied_obj.summarizer = self.summarizer
+        copied_obj.memory_pipeline = self.memory_pipeline
 
         return copied_obj
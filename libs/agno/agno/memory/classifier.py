@@ -1,3 +1,4 @@
+import re
 from typing import Any, List, Optional, cast
 
 from pydantic import BaseModel
@@ -7,6 +8,15 @@ from agno.models.base import Model
 from agno.models.message import Message
 from agno.utils.log import log_debug, logger
 
+MEMORY_CRITERIA = (
+    "This includes details that could personalize ongoing interactions with the user, such as:\n"
+    "  - Personal facts: name, age, occupation, location, interests, preferences, etc.\n"
+    "  - Significant life events or experiences shared by the user\n"
+    "  - Important context about the user's current situation, challenges or goals\n"
+    "  - What the user likes or dislikes, their opinions, beliefs, values, etc.\n"
+    "  - Any other details that provide valuable insights into the user's personality, perspective or needs"
+)
+
 
 class MemoryClassifier(BaseModel):
     model: Optional[Model] = None
@@ -32,12 +42,7 @@ class MemoryClassifier(BaseModel):
         # -*- Return a system message for classification
         system_prompt_lines = [
             "Your task is to identify if the user's message contains information that is worth remembering for future conversations.",
-            "This includes details that could personalize ongoing interactions with the user, such as:\n"
-            "  - Personal facts: name, age, occupation, location, interests, preferences, etc.\n"
-            "  - Significant life events or experiences shared by the user\n"
-            "  - Important context about the user's current situation, challenges or goals\n"
-            "  - What the user likes or dislikes, their opinions, beliefs, values, etc.\n"
-            "  - Any other details that provide valuable insights into the user's personality, perspective or needs",
+            MEMORY_CRITERIA,
             "Your task is to decide whether the user input contains any of the above information worth remembering.",
             "If the user input contains any information worth remembering for future conversations, respond with 'yes'.",
             "If the input does not contain any important details worth saving, respond with 'no' to disregard it.",
@@ -46,17 +51,64 @@ class MemoryClassifier(BaseModel):
             "If a memory exists that needs to be updated or deleted, respond with 'yes' to update/delete it.",
             "You must only respond with 'yes' or 'no'. Nothing else will be considered as a valid response.",
         ]
-        if self.existing_memories and len(self.existing_memories) > 0:
-            system_prompt_lines.extend(
-                [
-                    "\nExisting memories:",
-                    "<existing_memories>\n"
-                    + "\n".join([f"  - {m.memory}" for m in self.existing_memories])
-                    + "\n</existing_memories>",
-                ]
-            )
+        system_prompt_lines.extend(self.get_existing_memories_lines())
+        return Message(role="system", content="\n".join(system_prompt_lines))
+
+    def get_existing_memories_lines(self) -> List[str]:
+        if not self.existing_memories:
+            return []
+        return [
+            "\nExisting memories:",
+            "<existing_memories>\n"
+            + "\n".join([f"  - {m.memory}" for m in self.existing_memories])
+            + "\n</existing_memories>",
+        ]
+
+    def get_batch_system_message(self) -> Message:
+        # -*- Return a system message for classifying several messages at once
+        system_prompt_lines = [
+            "Your task is to identify which of the user's messages contain information that is worth remembering for future conversations.",
+            MEMORY_CRITERIA,
+            "You will be given a numbered list of messages.",
+            "Respond with the numbers of the messages worth remembering, separated by commas, e.g. '1, 3'.",
+            "A message that only repeats an existing memory is not worth remembering, "
+            "but a message that updates or contradicts one is.",
+            "If no message is worth remembering, respond with 'none'. Nothing else will be considered as a valid response.",
+        ]
+        system_prompt_lines.extend(self.get_existing_memories_lines())
         return Message(role="system", content="\n".join(system_prompt_lines))
 
+    def get_batch_user_message(self, messages: List[str]) -> Message:
+        return Message(role="user", content="\n".join(f"{i}. {message}" for i, message in enumerate(messages, start=1)))
+
+    @staticmethod
+    def parse_batch_response(content: Optional[str], num_messages: int) -> List[bool]:
+        """Parse the numbers of the messages worth remembering.
+
+        If the response can not be parsed every message is selected, the MemoryManager still decides what to store.
+        """
+        content = (content or "").strip().lower()
+        if content in ("none", "no", "none."):
+            return [False] * num_messages
+        selected = {int(number) for number in re.findall(r"\d+", content)}
+        if not selected:
+            return [True] * num_messages
+        return [i in selected for i in range(1, num_messages + 1)]
+
+    def classify_batch(self, messages: List[str]) -> List[bool]:
+        """Classify several messages with one model call. Returns True for every message worth remembering."""
+        if len(messages) == 0:
+            return []
+
+        log_debug("*********** MemoryClassifier Batch Start ***********")
+        self.update_model()
+        self.model = cast(Model, self.model)
+        response = self.model.response(
+            messages=[self.get_batch_system_message(), self.get_batch_user_message(messages)]
+        )
+        log_debug("*********** MemoryClassifier Batch End ***********")
+        return self.parse_batch_response(response.content, len(messages))
+
     def run(
         self,
         message: Optional[str] = None,
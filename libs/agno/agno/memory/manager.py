@@ -11,6 +11,10 @@ from agno.tools.function import Function
 from agno.utils.log import log_debug, logger
 
 
+def normalize_memory(memory: str) -> str:
+    return " ".join(memory.lower().split()).rstrip(".")
+
+
 class MemoryManager(BaseModel):
     model: Optional[Model] = None
     user_id: Optional[str] = None
@@ -19,6 +23,8 @@ class MemoryManager(BaseModel):
     system_prompt: Optional[str] = None
     # Memory Database
     db: Optional[MemoryDb] = None
+    # Do not add a memory if the user already has a memory with the same text
+    skip_duplicate_memories: bool = True
 
     # Do not set the input message here, it will be set by the run method
     input_message: Optional[str] = None
@@ -75,6 +81,14 @@ class MemoryManager(BaseModel):
 
         return self.db.read_memories(user_id=self.user_id, limit=self.limit)
 
+    def is_duplicate_memory(self, memory: str) -> bool:
+        """Returns True if the user already has a memory with the same text, ignoring case and whitespace."""
+        existing_memories = self.get_existing_memories()
+        if not existing_memories:
+            return False
+        normalized_memory = normalize_memory(memory)
+        return any(normalize_memory(row.memory.get("memory", "")) == normalized_memory for row in existing_memories)
+
     def add_memory(self, memory: str) -> str:
         """Use this function to add a memory to the database.
         Args:
@@ -84,6 +98,9 @@ class MemoryManager(BaseModel):
         """
         try:
             if self.db:
+                if self.skip_duplicate_memories and self.is_duplicate_memory(memory):
+                    log_debug(f"Skipping duplicate memory: {memory}")
+                    return "Memory already exists"
                 self.db.upsert_memory(
                     MemoryRow(user_id=self.user_id, memory=Memory(memory=memory, input=self.input_message).to_dict())
                 )
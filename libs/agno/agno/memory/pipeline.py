@@ -0,0 +1,160 @@
+from dataclasses import dataclass
+from queue import Empty, Queue
+from threading import Condition, Lock, Thread
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
+
+from agno.memory.classifier import MemoryClassifier
+from agno.memory.db import MemoryDb
+from agno.memory.manager import MemoryManager, normalize_memory
+from agno.memory.memory import Memory
+from agno.utils.log import log_debug, logger
+
+
+@dataclass
+class MemoryJob:
+    """Messages of one run to extract user memories from"""
+
+    user_id: Optional[str]
+    inputs: List[str]
+    db: MemoryDb
+
+
+class MemoryPipeline:
+    """Extracts user memories in a background thread, so runs do not wait for the MemoryClassifier and MemoryManager.
+
+    Queued messages are grouped per user. Each group is classified with one model call, duplicates and messages that
+    already produced a memory are skipped, and the selected messages are sent to the MemoryManager one at a time,
+    so every memory keeps the message it was created from.
+    AgentMemory.load_user_memories() waits until the pending messages of its user are processed,
+    so the next run of a user sees the memories from the previous run.
+
+    Args:
+        classifier: Selects the messages worth remembering. Defaults to MemoryClassifier().
+            The pipeline works on a copy, so the classifier can also be used by an AgentMemory.
+        manager: Writes the memories. Defaults to MemoryManager(). The pipeline works on a copy as well.
+        max_batch_size: Maximum number of messages classified in one model call.
+        batch_wait: Seconds to wait for more messages before processing a batch.
+    """
+
+    def __init__(
+        self,
+        classifier: Optional[MemoryClassifier] = None,
+        manager: Optional[MemoryManager] = None,
+        max_batch_size: int = 20,
+        batch_wait: float = 0.5,
+    ):
+        # The background thread sets the existing memories, user and db, which must not change the instances passed in
+        self.classifier = classifier.model_copy() if classifier is not None else MemoryClassifier()
+        self.manager = manager.model_copy() if manager is not None else MemoryManager()
+        # The copied functions are bound to the manager passed in
+        self.manager._tools_for_model = None
+        self.manager._functions_for_model = None
+        self.max_batch_size = max_batch_size
+        self.batch_wait = batch_wait
+
+        self._queue: "Queue[MemoryJob]" = Queue()
+        # Number of queued or in-progress jobs per user
+        self._pending: Dict[Optional[str], int] = {}
+        self._condition = Condition()
+        self._start_lock = Lock()
+        self._thread: Optional[Thread] = None
+
+    def submit(self, user_id: Optional[str], inputs: List[str], db: MemoryDb) -> None:
+        """Queue the messages of a run, returns immediately."""
+        inputs = [i for i in inputs if isinstance(i, str) and i.strip()]
+        if not inputs:
+            return
+        with self._condition:
+            self._pending[user_id] = self._pending.get(user_id, 0) + 1
+        self._queue.put(MemoryJob(user_id=user_id, inputs=inputs, db=db))
+        self._ensure_started()
+
+    def has_pending(self, user_id: Optional[str]) -> bool:
+        with self._condition:
+            return self._pending.get(user_id, 0) > 0
+
+    def wait_for_user(self, user_id: Optional[str], timeout: Optional[float] = None) -> bool:
+        """Block until the queued messages of this user are processed. Returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending.get(user_id, 0) == 0, timeout)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued message is processed. Returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: not any(self._pending.values()), timeout)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="agno-memory-pipeline", daemon=True)
+                self._thread.start()
+
+    def _next_batch(self) -> List[MemoryJob]:
+        """Wait for a job, then collect more jobs for up to batch_wait seconds."""
+        batch = [self._queue.get()]
+        num_inputs = len(batch[0].inputs)
+        deadline = monotonic() + self.batch_wait
+        while num_inputs < self.max_batch_size:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            try:
+                job = self._queue.get(timeout=remaining)
+            except Empty:
+                break
+            batch.append(job)
+            num_inputs += len(job.inputs)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            groups: Dict[Tuple[Optional[str], int], List[MemoryJob]] = {}
+            for job in batch:
+                groups.setdefault((job.user_id, id(job.db)), []).append(job)
+
+            for jobs in groups.values():
+                try:
+                    self.process(user_id=jobs[0].user_id, inputs=[i for job in jobs for i in job.inputs], db=jobs[0].db)
+                except Exception as e:
+                    logger.warning(f"Error updating memories for user {jobs[0].user_id}: {e}")
+                finally:
+                    with self._condition:
+                        self._pending[jobs[0].user_id] -= len(jobs)
+                        if self._pending[jobs[0].user_id] <= 0:
+                            del self._pending[jobs[0].user_id]
+                        self._condition.notify_all()
+
+    def process(self, user_id: Optional[str], inputs: List[str], db: MemoryDb) -> Optional[str]:
+        """Classify the messages of a user and store the memories. Runs in the background thread."""
+        existing_rows = db.read_memories(user_id=user_id)
+        # Skip repeated messages and messages that already produced a memory
+        seen = {normalize_memory(row.memory["input"]) for row in existing_rows if row.memory.get("input")}
+        candidates: List[str] = []
+        for message in inputs:
+            normalized_message = normalize_memory(message)
+            if normalized_message not in seen:
+                seen.add(normalized_message)
+                candidates.append(message)
+        if not candidates:
+            log_debug("No new messages to extract memories from")
+            return None
+
+        selected: List[str] = []
+        self.classifier.existing_memories = [Memory.model_validate(row.memory) for row in existing_rows]
+        for start in range(0, len(candidates), self.max_batch_size):
+            chunk = candidates[start : start + self.max_batch_size]
+            selected.extend(m for m, keep in zip(chunk, self.classifier.classify_batch(chunk)) if keep)
+        log_debug(f"{len(selected)} of {len(candidates)} messages selected for user memories")
+        if not selected:
+            return None
+
+        self.manager.user_id = user_id
+        self.manager.db = db
+        response: Optional[str] = None
+        for message in selected:
+            response = self.manager.run(message)
+        return response
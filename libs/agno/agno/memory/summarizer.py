@@ -33,16 +33,36 @@ class MemorySummarizer(BaseModel):
         else:
             self.model.response_format = {"type": "json_object"}
 
-    def get_system_message(self, messages_for_summarization: List[Dict[str, str]]) -> Message:
+    def get_system_message(
+        self,
+        messages_for_summarization: List[Dict[str, str]],
+        previous_summary: Optional[SessionSummary] = None,
+    ) -> Message:
         # -*- Return a system message for summarization
-        system_prompt = dedent("""\
-        Analyze the following conversation between a user and an assistant, and extract the following details:
-          - Summary (str): Provide a concise summary of the session, focusing on important information that would be helpful for future interactions.
-          - Topics (Optional[List[str]]): List the topics discussed in the session.
-        Please ignore any frivolous information.
-
-        Conversation:
-        """)
+        if previous_summary is None:
+            system_prompt = dedent("""\
+            Analyze the following conversation between a user and an assistant, and extract the following details:
+              - Summary (str): Provide a concise summary of the session, focusing on important information that would be helpful for future interactions.
+              - Topics (Optional[List[str]]): List the topics discussed in the session.
+            Please ignore any frivolous information.
+
+            Conversation:
+            """)
+        else:
+            # Only the messages since the previous summary are sent, fold them into the previous summary
+            system_prompt = dedent("""\
+            Below is the summary of a session between a user and an assistant, followed by the conversation that happened since.
+            Update the summary with the new conversation and extract the following details:
+              - Summary (str): Provide a concise summary of the whole session, focusing on important information that would be helpful for future interactions.
+              - Topics (Optional[List[str]]): List the topics discussed in the whole session.
+            Keep the important information from the previous summary. Please ignore any frivolous information.
+
+            <previous_summary>
+            """)
+            system_prompt += previous_summary.summary
+            if previous_summary.topics:
+                system_prompt += f"\nTopics: {', '.join(previous_summary.topics)}"
+            system_prompt += "\n</previous_summary>\n\nNew conversation:\n"
         conversation = []
         for message_pair in messages_for_summarization:
             conversation.append(f"User: {message_pair['user']}")
@@ -84,6 +104,7 @@ class MemorySummarizer(BaseModel):
     def run(
         self,
         message_pairs: List[Tuple[Message, Message]],
+        previous_summary: Optional[SessionSummary] = None,
         **kwargs: Any,
     ) -> Optional[SessionSummary]:
         log_debug("*********** MemorySummarizer Start ***********")
@@ -108,7 +129,7 @@ class MemorySummarizer(BaseModel):
 
         # Prepare the List of messages to send to the Model
         messages_for_model: List[Message] = [
-            self.get_system_message(messages_for_summarization),
+            self.get_system_message(messages_for_summarization, previous_summary=previous_summary),
             # For models that require a non-system message
             Message(role="user", content="Provide the summary of the conversation."),
         ]
@@ -144,6 +165,7 @@ class MemorySummarizer(BaseModel):
     async def arun(
         self,
         message_pairs: List[Tuple[Message, Message]],
+        previous_summary: Optional[SessionSummary] = None,
         **kwargs: Any,
     ) -> Optional[SessionSummary]:
         log_debug("*********** Async MemorySummarizer Start ***********")
@@ -168,7 +190,7 @@ class MemorySummarizer(BaseModel):
 
         # Prepare the List of messages to send to the Model
         messages_for_model: List[Message] = [
-            self.get_system_message(messages_for_summarization),
+            self.get_system_message(messages_for_summarization, previous_summary=previous_summary),
             # For models that require a non-system message
             Message(role="user", content="Provide the summary of the conversation."),
         ]
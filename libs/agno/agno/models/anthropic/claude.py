@@ -1,4 +1,5 @@
 import json
+import re
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from os import getenv
@@ -35,6 +36,9 @@ ROLE_MAP = {
     "tool": "user",
 }
 
+# The current time line that Agent and Team append to the system message
+_CURRENT_TIME = re.compile(r"\s+(The current time is [^\n]*)$")
+
 
 def _format_image_for_message(image: Image) -> Optional[Dict[str, Any]]:
     """
@@ -282,6 +286,16 @@ class Claude(Model):
     top_k: Optional[int] = None
     request_params: Optional[Dict[str, Any]] = None
 
+    # Prompt caching, see https://docs.anthropic.com/en/docs/build-with-claude/prompt-caching
+    # Add a cache breakpoint after the system prompt, caching the tools and the system prompt
+    cache_system_prompt: bool = False
+    # Add a cache breakpoint after the tools, for when the system prompt changes between requests
+    cache_tools: bool = False
+    # Add a cache breakpoint after the last message, so the next request reads the conversation from the cache
+    cache_messages: bool = False
+    # Lifetime of the cache entries: "5m" (the default) or "1h"
+    cache_ttl: Optional[str] = None
+
     # Client parameters
     api_key: Optional[str] = None
     client_params: Optional[Dict[str, Any]] = None
@@ -359,12 +373,63 @@ class Claude(Model):
             Dict[str, Any]: The request keyword arguments.
         """
         request_kwargs = self.request_kwargs.copy()
-        request_kwargs["system"] = system_message
+        if self.cache_system_prompt and system_message:
+            # The current time, added last by Agent and Team, changes on every request.
+            # It is sent in its own block after the breakpoint, so the rest of the system prompt is read from the cache.
+            current_time = _CURRENT_TIME.search(system_message)
+            stable_prefix = system_message[: current_time.start()] if current_time else system_message
+            request_kwargs["system"] = [{"type": "text", "text": stable_prefix, "cache_control": self.cache_control}]
+            if current_time is not None:
+                request_kwargs["system"].append({"type": "text", "text": current_time.group(1)})
+        else:
+            request_kwargs["system"] = system_message
 
         if self._tools:
-            request_kwargs["tools"] = self._format_tools_for_model()
+            tools = self._format_tools_for_model()
+            if self.cache_tools and tools:
+                tools[-1] = {**tools[-1], "cache_control": self.cache_control}
+            request_kwargs["tools"] = tools
         return request_kwargs
 
+    @property
+    def cache_control(self) -> Dict[str, str]:
+        cache_control = {"type": "ephemeral"}
+        if self.cache_ttl is not None:
+            cache_control["ttl"] = self.cache_ttl
+        return cache_control
+
+    def _add_cache_breakpoints(self, chat_messages: List[Dict[str, Any]]) -> None:
+        """
+        Add a cache breakpoint to the last content block of the conversation if cache_messages is True.
+        The next request reads the conversation up to this block from the cache.
+
+        Args:
+            chat_messages (List[Dict[str, Any]]): The formatted messages, the last message is updated in place.
+        """
+        if not self.cache_messages or len(chat_messages) == 0:
+            return
+
+        last_message = chat_messages[-1]
+        content = last_message["content"]
+        if isinstance(content, str):
+            if content:
+                last_message["content"] = [{"type": "text", "text": content, "cache_control": self.cache_control}]
+            return
+
+        # Thinking blocks cannot be cached directly, they are cached as part of the prefix
+        for index in range(len(content) - 1, -1, -1):
+            block = content[index]
+            block_type = block.get("type") if isinstance(block, dict) else getattr(block, "type", None)
+            if block_type in ("thinking", "redacted_thinking"):
+                continue
+            # Copy the block, it can be shared with the Message
+            if isinstance(block, dict):
+                block = {**block, "cache_control": self.cache_control}
+            else:
+                block = {**block.model_dump(exclude_none=True), "cache_control": self.cache_control}
+            last_message["content"] = [*content[:index], block, *content[index + 1 :]]
+            return
+
     def _format_tools_for_model(self) -> Optional[List[Dict[str, Any]]]:
         """
         Transforms function definitions into a format accepted by the Anthropic API.
@@ -427,6 +492,7 @@ class Claude(Model):
         """
         try:
             chat_messages, system_message = _format_messages(messages)
+            self._add_cache_breakpoints(chat_messages)
             request_kwargs = self._prepare_request_kwargs(system_message)
 
             return self.get_client().messages.create(
@@ -460,6 +526,7 @@ class Claude(Model):
             Any: The streamed response from the model.
         """
         chat_messages, system_message = _format_messages(messages)
+        self._add_cache_breakpoints(chat_messages)
         request_kwargs = self._prepare_request_kwargs(system_message)
 
         try:
@@ -504,6 +571,7 @@ class Claude(Model):
         """
         try:
             chat_messages, system_message = _format_messages(messages)
+            self._add_cache_breakpoints(chat_messages)
             request_kwargs = self._prepare_request_kwargs(system_message)
 
             return await self.get_async_client().messages.create(
@@ -538,6 +606,7 @@ class Claude(Model):
         """
         try:
             chat_messages, system_message = _format_messages(messages)
+            self._add_cache_breakpoints(chat_messages)
             request_kwargs = self._prepare_request_kwargs(system_message)
             async with self.get_async_client().messages.stream(
                 model=self.id,
@@ -343,6 +343,8 @@ class AwsBedrock(Model):
                 "input_tokens": response["usage"]["inputTokens"],
                 "output_tokens": response["usage"]["outputTokens"],
                 "total_tokens": response["usage"]["totalTokens"],
+                "cache_read_input_tokens": response["usage"].get("cacheReadInputTokens", 0),
+                "cache_creation_input_tokens": response["usage"].get("cacheWriteInputTokens", 0),
             }
 
         return model_response
@@ -409,6 +411,8 @@ class AwsBedrock(Model):
                         "input_tokens": usage.get("inputTokens", 0),
                         "output_tokens": usage.get("outputTokens", 0),
                         "total_tokens": usage.get("totalTokens", 0),
+                        "cache_read_input_tokens": usage.get("cacheReadInputTokens", 0),
+                        "cache_creation_input_tokens": usage.get("cacheWriteInputTokens", 0),
                     }
 
             # Update metrics
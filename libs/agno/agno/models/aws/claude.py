@@ -326,6 +326,7 @@ class Claude(AnthropicClaude):
 
         try:
             chat_messages, system_message = _format_messages(messages)
+            self._add_cache_breakpoints(chat_messages)
             request_kwargs = self._prepare_request_kwargs(system_message)
 
             return self.get_client().messages.create(
@@ -360,6 +361,7 @@ class Claude(AnthropicClaude):
         """
 
         chat_messages, system_message = _format_messages(messages)
+        self._add_cache_breakpoints(chat_messages)
         request_kwargs = self._prepare_request_kwargs(system_message)
 
         try:
@@ -405,6 +407,7 @@ class Claude(AnthropicClaude):
 
         try:
             chat_messages, system_message = _format_messages(messages)
+            self._add_cache_breakpoints(chat_messages)
             request_kwargs = self._prepare_request_kwargs(system_message)
 
             return await self.get_async_client().messages.create(
@@ -440,6 +443,7 @@ class Claude(AnthropicClaude):
 
         try:
             chat_messages, system_message = _format_messages(messages)
+            self._add_cache_breakpoints(chat_messages)
             request_kwargs = self._prepare_request_kwargs(system_message)
             async with self.get_async_client().messages.stream(
                 model=self.id,
@@ -11,7 +11,8 @@ from agno.media import AudioResponse, ImageArtifact
 from agno.models.message import Citations, Message, MessageMetrics
 from agno.models.response import ModelResponse, ModelResponseEvent
 from agno.tools.function import Function, FunctionCall
-from agno.utils.log import log_debug, log_error, log_warning
+from agno.tracing import get_current_span, start_span, traced
+from agno.utils.log import is_log_level_enabled, log_debug, log_error, log_warning
 from agno.utils.timer import Timer
 from agno.utils.tools import get_function_call_for_tool_call
 
@@ -34,6 +35,10 @@ class MessageData:
     extra: Optional[Dict[str, Any]] = None
 
 
+def _get_model_span_attributes(model: "Model", *args, **kwargs) -> Dict[str, Any]:
+    return {"model": model.id, "provider": model.get_provider()}
+
+
 @dataclass
 class Model(ABC):
     # ID of the model to use.
@@ -155,6 +160,7 @@ class Model(ABC):
         if len(functions) > 0:
             self._functions = functions
 
+    @traced("model.response", _get_model_span_attributes)
     def response(self, messages: List[Message]) -> ModelResponse:
         """
         Generate a response from the model.
@@ -166,8 +172,8 @@ class Model(ABC):
             ModelResponse: The model's response
         """
 
-        log_debug(f"{self.get_provider()} Response Start", center=True, symbol="-")
-        log_debug(f"Model: {self.id}", center=True, symbol="-")
+        log_debug("%s Response Start", self.get_provider(), center=True, symbol="-")
+        log_debug("Model: %s", self.id, center=True, symbol="-")
 
         self._log_messages(messages)
         model_response = ModelResponse()
@@ -222,9 +228,10 @@ class Model(ABC):
             # No tool calls or finished processing them
             break
 
-        log_debug(f"{self.get_provider()} Response End", center=True, symbol="-")
+        log_debug("%s Response End", self.get_provider(), center=True, symbol="-")
         return model_response
 
+    @traced("model.response", _get_model_span_attributes)
     async def aresponse(self, messages: List[Message]) -> ModelResponse:
         """
         Generate an asynchronous response from the model.
@@ -236,8 +243,8 @@ class Model(ABC):
             ModelResponse: The model's response
         """
 
-        log_debug(f"{self.get_provider()} Async Response Start", center=True, symbol="-")
-        log_debug(f"Model: {self.id}", center=True, symbol="-")
+        log_debug("%s Async Response Start", self.get_provider(), center=True, symbol="-")
+        log_debug("Model: %s", self.id, center=True, symbol="-")
         self._log_messages(messages)
         model_response = ModelResponse()
 
@@ -291,9 +298,10 @@ class Model(ABC):
             # No tool calls or finished processing them
             break
 
-        log_debug(f"{self.get_provider()} Async Response End", center=True, symbol="-")
+        log_debug("%s Async Response End", self.get_provider(), center=True, symbol="-")
         return model_response
 
+    @traced("model.invoke", _get_model_span_attributes)
     def _process_model_response(
         self,
         messages: List[Message],
@@ -322,6 +330,7 @@ class Model(ABC):
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
+        self._add_metrics_to_current_span(assistant_message)
 
         # Add assistant message to messages
         messages.append(assistant_message)
@@ -352,6 +361,7 @@ class Model(ABC):
 
         return assistant_message, bool(assistant_message.tool_calls)
 
+    @traced("model.invoke", _get_model_span_attributes)
     async def _aprocess_model_response(
         self,
         messages: List[Message],
@@ -380,6 +390,7 @@ class Model(ABC):
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
+        self._add_metrics_to_current_span(assistant_message)
 
         # Add assistant message to messages
         messages.append(assistant_message)
@@ -473,6 +484,7 @@ class Model(ABC):
 
         return assistant_message
 
+    @traced("model.invoke", _get_model_span_attributes)
     def process_response_stream(
         self, messages: List[Message], assistant_message: Message, stream_data: MessageData
     ) -> Iterator[ModelResponse]:
@@ -484,7 +496,9 @@ class Model(ABC):
             yield from self._populate_stream_data_and_assistant_message(
                 stream_data=stream_data, assistant_message=assistant_message, model_response=model_response_delta
             )
+        self._add_metrics_to_current_span(assistant_message)
 
+    @traced("model.response", _get_model_span_attributes)
     def response_stream(self, messages: List[Message]) -> Iterator[ModelResponse]:
         """
         Generate a streaming response from the model.
@@ -496,8 +510,8 @@ class Model(ABC):
             Iterator[ModelResponse]: Iterator of model responses
         """
 
-        log_debug(f"{self.get_provider()} Response Stream Start", center=True, symbol="-")
-        log_debug(f"Model: {self.id}", center=True, symbol="-")
+        log_debug("%s Response Stream Start", self.get_provider(), center=True, symbol="-")
+        log_debug("Model: %s", self.id, center=True, symbol="-")
         self._log_messages(messages)
 
         while True:
@@ -565,8 +579,9 @@ class Model(ABC):
             # No tool calls or finished processing them
             break
 
-        log_debug(f"{self.get_provider()} Response Stream End", center=True, symbol="-")
+        log_debug("%s Response Stream End", self.get_provider(), center=True, symbol="-")
 
+    @traced("model.invoke", _get_model_span_attributes)
     async def aprocess_response_stream(
         self, messages: List[Message], assistant_message: Message, stream_data: MessageData
     ) -> AsyncIterator[ModelResponse]:
@@ -579,7 +594,9 @@ class Model(ABC):
                 stream_data=stream_data, assistant_message=assistant_message, model_response=model_response_delta
             ):
                 yield model_response
+        self._add_metrics_to_current_span(assistant_message)
 
+    @traced("model.response", _get_model_span_attributes)
     async def aresponse_stream(self, messages: List[Message]) -> AsyncIterator[ModelResponse]:
         """
         Generate an asynchronous streaming response from the model.
@@ -591,8 +608,8 @@ class Model(ABC):
             AsyncIterator[ModelResponse]: Async iterator of model responses
         """
 
-        log_debug(f"{self.get_provider()} Async Response Stream Start", center=True, symbol="-")
-        log_debug(f"Model: {self.id}", center=True, symbol="-")
+        log_debug("%s Async Response Stream Start", self.get_provider(), center=True, symbol="-")
+        log_debug("Model: %s", self.id, center=True, symbol="-")
         self._log_messages(messages)
 
         while True:
@@ -659,7 +676,7 @@ class Model(ABC):
             # No tool calls or finished processing them
             break
 
-        log_debug(f"{self.get_provider()} Async Response Stream End", center=True, symbol="-")
+        log_debug("%s Async Response Stream End", self.get_provider(), center=True, symbol="-")
 
     def _populate_stream_data_and_assistant_message(
         self, stream_data: MessageData, assistant_message: Message, model_response: ModelResponse
@@ -836,49 +853,54 @@ class Model(ABC):
             # Start function call
             function_call_timer = Timer()
             function_call_timer.start()
-            # Yield a tool_call_started event
-            yield ModelResponse(
-                content=fc.get_call_str(),
-                tool_calls=[
-                    {
-                        "role": self.tool_message_role,
-                        "tool_call_id": fc.call_id,
-                        "tool_name": fc.function.name,
-                        "tool_args": fc.arguments,
-                    }
-                ],
-                event=ModelResponseEvent.tool_call_started.value,
-            )
+            with start_span(
+                "tool.call", {"tool_name": fc.function.name, "tool_call_id": fc.call_id}
+            ) as function_call_span:
+                # Yield a tool_call_started event
+                yield ModelResponse(
+                    content=fc.get_call_str(),
+                    tool_calls=[
+                        {
+                            "role": self.tool_message_role,
+                            "tool_call_id": fc.call_id,
+                            "tool_name": fc.function.name,
+                            "tool_args": fc.arguments,
+                        }
+                    ],
+                    event=ModelResponseEvent.tool_call_started.value,
+                )
 
-            # Track if the function call was successful
-            function_call_success = False
-            # Run function calls sequentially
-            try:
-                function_call_success = fc.execute()
-            except AgentRunException as a_exc:
-                # Update additional messages from function call
-                self._handle_agent_exception(a_exc, additional_messages)
-                # Set function call success to False if an exception occurred
+                # Track if the function call was successful
                 function_call_success = False
-            except Exception as e:
-                log_error(f"Error executing function {fc.function.name}: {e}")
-                function_call_success = False
-                raise e
-
-            # Stop function call timer
-            function_call_timer.stop()
-
-            # Process function call output
-            function_call_output: Optional[Union[List[Any], str]] = ""
-            if isinstance(fc.result, (GeneratorType, collections.abc.Iterator)):
-                for item in fc.result:
-                    function_call_output += item
+                # Run function calls sequentially
+                try:
+                    function_call_success = fc.execute()
+                except AgentRunException as a_exc:
+                    # Update additional messages from function call
+                    self._handle_agent_exception(a_exc, additional_messages)
+                    # Set function call success to False if an exception occurred
+                    function_call_success = False
+                except Exception as e:
+                    log_error(f"Error executing function {fc.function.name}: {e}")
+                    function_call_success = False
+                    raise e
+
+                # Stop function call timer
+                function_call_timer.stop()
+
+                # Process function call output
+                function_call_output: Optional[Union[List[Any], str]] = ""
+                if isinstance(fc.result, (GeneratorType, collections.abc.Iterator)):
+                    for item in fc.result:
+                        function_call_output += item
+                        if fc.function.show_result:
+                            yield ModelResponse(content=item)
+                else:
+                    function_call_output = fc.result
                     if fc.function.show_result:
-                        yield ModelResponse(content=item)
-            else:
-                function_call_output = fc.result
-                if fc.function.show_result:
-                    yield ModelResponse(content=function_call_output)
+                        yield ModelResponse(content=function_call_output)
+                # The span includes consuming generator results, e.g. a member agent run in a team
+                function_call_span.set_attribute("success", function_call_success)
 
             # Create and yield function call result
             function_call_result = self._create_function_call_result(
@@ -913,21 +935,25 @@ class Model(ABC):
         function_call_timer = Timer()
         function_call_timer.start()
         success: Union[bool, AgentRunException] = False
-        try:
-            if (
-                iscoroutinefunction(function_call.function.entrypoint)
-                or isasyncgenfunction(function_call.function.entrypoint)
-                or iscoroutine(function_call.function.entrypoint)
-            ):
-                success = await function_call.aexecute()
-            else:
-                success = await asyncio.to_thread(function_call.execute)
-        except AgentRunException as e:
-            success = e  # Pass the exception through to be handled by caller
-        except Exception as e:
-            log_error(f"Error executing function {function_call.function.name}: {e}")
-            success = False
-            raise e
+        with start_span(
+            "tool.call", {"tool_name": function_call.function.name, "tool_call_id": function_call.call_id}
+        ) as function_call_span:
+            try:
+                if (
+                    iscoroutinefunction(function_call.function.entrypoint)
+                    or isasyncgenfunction(function_call.function.entrypoint)
+                    or iscoroutine(function_call.function.entrypoint)
+                ):
+                    success = await function_call.aexecute()
+                else:
+                    success = await asyncio.to_thread(function_call.execute)
+            except AgentRunException as e:
+                success = e  # Pass the exception through to be handled by caller
+            except Exception as e:
+                log_error(f"Error executing function {function_call.function.name}: {e}")
+                success = False
+                raise e
+            function_call_span.set_attribute("success", success is True)
 
         function_call_timer.stop()
         return success, function_call_timer, function_call
@@ -1112,10 +1138,35 @@ class Model(ABC):
                     response_usage.completion_tokens_details.model_dump(exclude_none=True)
                 )
 
+        # Prompt cache metrics (e.g., from Anthropic, AWS Bedrock and OpenAI)
+        if isinstance(response_usage, dict):
+            cache_read_tokens = response_usage.get("cache_read_input_tokens")
+            cache_write_tokens = response_usage.get("cache_creation_input_tokens")
+        else:
+            cache_read_tokens = getattr(response_usage, "cache_read_input_tokens", None)
+            cache_write_tokens = getattr(response_usage, "cache_creation_input_tokens", None)
+        if cache_read_tokens is None and assistant_message.metrics.prompt_tokens_details:
+            cache_read_tokens = assistant_message.metrics.prompt_tokens_details.get("cached_tokens")
+        if isinstance(cache_read_tokens, int):
+            assistant_message.metrics.cache_read_tokens = cache_read_tokens
+        if isinstance(cache_write_tokens, int):
+            assistant_message.metrics.cache_write_tokens = cache_write_tokens
+
+    def _add_metrics_to_current_span(self, assistant_message: Message) -> None:
+        """Add the token usage of a model request to the current trace span."""
+        get_current_span().set_attributes(
+            input_tokens=assistant_message.metrics.input_tokens,
+            output_tokens=assistant_message.metrics.output_tokens,
+            time_to_first_token=assistant_message.metrics.time_to_first_token,
+            tool_calls=len(assistant_message.tool_calls or []),
+        )
+
     def _log_messages(self, messages: List[Message]) -> None:
         """
         Log messages for debugging.
         """
+        if not is_log_level_enabled():
+            return
         for m in messages:
             # Don't log metrics for input messages
             m.log(metrics=False)
@@ -1133,6 +1184,18 @@ class Model(ABC):
         self._functions = None
         self._function_call_stack = None
 
+    def copy_for_session(self) -> "Model":
+        """Create a shallow copy of the Model for a new session.
+
+        Configuration and clients are shared with this Model, tools and function call state are not.
+        """
+        from copy import copy
+
+        new_model = copy(self)
+        new_model.clear()
+        new_model._tools = None
+        return new_model
+
     def __deepcopy__(self, memo):
         """Create a deep copy of the Model instance.
 
@@ -1,14 +1,18 @@
 import json
+import logging
 from dataclasses import asdict, dataclass
 from time import time
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from agno.media import Audio, AudioResponse, File, Image, ImageArtifact, Video
-from agno.utils.log import log_debug, log_error, log_info, log_warning
+from agno.utils.log import is_log_level_enabled, log_debug, log_error, log_info, log_warning
 from agno.utils.timer import Timer
 
+if TYPE_CHECKING:
+    from agno.utils.tokens import Tokenizer
+
 
 class MessageReferences(BaseModel):
     """References added to user message"""
@@ -57,6 +61,9 @@ class MessageMetrics:
 
     prompt_tokens: int = 0
     completion_tokens: int = 0
+    # Input tokens read from and written to the provider's prompt cache
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
     prompt_tokens_details: Optional[dict] = None
     completion_tokens_details: Optional[dict] = None
 
@@ -100,6 +107,8 @@ class MessageMetrics:
             total_tokens=self.total_tokens + other.total_tokens,
             prompt_tokens=self.prompt_tokens + other.prompt_tokens,
             completion_tokens=self.completion_tokens + other.completion_tokens,
+            cache_read_tokens=self.cache_read_tokens + other.cache_read_tokens,
+            cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
         )
 
         # Handle prompt_tokens_details
@@ -209,6 +218,27 @@ class Message(BaseModel):
 
     model_config = ConfigDict(extra="allow", populate_by_name=True, arbitrary_types_allowed=True)
 
+    # Token counts per tokenizer name, with the content and tool calls they were counted for.
+    # Shared with the history views of this message.
+    _token_counts: Dict[str, Tuple[Any, Any, int]] = PrivateAttr(default_factory=dict)
+
+    def count_tokens(self, tokenizer: "Tokenizer") -> int:
+        """Returns the number of tokens of the message, cached until the content or tool calls are replaced."""
+        cached = self._token_counts.get(tokenizer.name)
+        if cached is not None and cached[0] is self.content and cached[1] is self.tool_calls:
+            return cached[2]
+        num_tokens = tokenizer.count_message(self)
+        self._token_counts[tokenizer.name] = (self.content, self.tool_calls, num_tokens)
+        return num_tokens
+
+    def history_view(self) -> "Message":
+        """Returns a copy of the message tagged as coming from history, without copying its payload.
+
+        The content, media, tool calls and metrics are shared with this message. Setting an attribute on the copy,
+        e.g. when a Model formats it, does not change this message, but values must not be modified in place.
+        """
+        return self.model_copy(update={"from_history": True})
+
     def get_content_string(self) -> str:
         """Returns the content as a string."""
         if isinstance(self.content, str):
@@ -282,12 +312,17 @@ class Message(BaseModel):
                 Defaults to debug.
         """
         _logger = log_debug
+        _level = logging.DEBUG
         if level == "info":
-            _logger = log_info
+            _logger, _level = log_info, logging.INFO
         elif level == "warning":
-            _logger = log_warning
+            _logger, _level = log_warning, logging.WARNING
         elif level == "error":
-            _logger = log_error
+            _logger, _level = log_error, logging.ERROR
+
+        # Skip formatting the message when it would not be logged
+        if not is_log_level_enabled(_level):
+            return
 
         try:
             import shutil
@@ -63,6 +63,8 @@ class OpenAIChat(Model):
     stop: Optional[Union[str, List[str]]] = None
     temperature: Optional[float] = None
     user: Optional[str] = None
+    # Requests with the same key and prefix are routed to the same prompt cache, improving cache hits
+    prompt_cache_key: Optional[str] = None
     top_p: Optional[float] = None
     extra_headers: Optional[Any] = None
     extra_query: Optional[Any] = None
@@ -184,6 +186,7 @@ class OpenAIChat(Model):
             "stop": self.stop,
             "temperature": self.temperature,
             "user": self.user,
+            "prompt_cache_key": self.prompt_cache_key,
             "top_p": self.top_p,
             "extra_headers": self.extra_headers,
             "extra_query": self.extra_query,
@@ -233,6 +236,7 @@ class OpenAIChat(Model):
                 "temperature": self.temperature,
                 "top_p": self.top_p,
                 "user": self.user,
+                "prompt_cache_key": self.prompt_cache_key,
                 "extra_headers": self.extra_headers,
                 "extra_query": self.extra_query,
             }
@@ -0,0 +1 @@
+from agno.models.stub.stub import LatencyProfile, StubModel, StubResponse, StubToolCall
@@ -0,0 +1,253 @@
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+from uuid import uuid4
+
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+
+
+@dataclass
+class StubToolCall:
+    """A tool call the StubModel makes"""
+
+    name: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+    id: Optional[str] = None
+
+
+@dataclass
+class StubResponse:
+    """A scripted StubModel response: content, tool calls or both"""
+
+    content: Optional[str] = None
+    tool_calls: List[StubToolCall] = field(default_factory=list)
+    thinking: Optional[str] = None
+
+
+@dataclass
+class LatencyProfile:
+    """Simulated provider latency.
+
+    Args:
+        time_to_first_token: Seconds before the first token is returned.
+        tokens_per_second: Output speed after the first token. None returns all tokens at once.
+        jitter: Random variation applied to every delay, as a fraction of the delay (0.1 = +/-10%).
+    """
+
+    time_to_first_token: float = 0.0
+    tokens_per_second: Optional[float] = None
+    jitter: float = 0.0
+
+    def first_token_delay(self, rng: random.Random) -> float:
+        return self._apply_jitter(self.time_to_first_token, rng)
+
+    def token_delay(self, num_tokens: int, rng: random.Random) -> float:
+        if not self.tokens_per_second or num_tokens <= 0:
+            return 0.0
+        return self._apply_jitter(num_tokens / self.tokens_per_second, rng)
+
+    def _apply_jitter(self, delay: float, rng: random.Random) -> float:
+        if delay <= 0 or self.jitter <= 0:
+            return max(delay, 0.0)
+        return max(delay * (1 + rng.uniform(-self.jitter, self.jitter)), 0.0)
+
+
+@dataclass
+class StubModel(Model):
+    """
+    A deterministic, offline Model that replays scripted responses.
+
+    Responses are returned in order, one per model request, and the script restarts once exhausted
+    (see `cycle`). A script of [StubResponse(tool_calls=[...]), "Done"] makes every run call a tool and then answer.
+    Raw responses are shaped like an OpenAI chat completion and go through parse_provider_response and
+    parse_provider_response_delta, so runs exercise the same code paths as a real provider.
+    Usage metrics are synthetic: tokens are estimated from the number of characters.
+
+    Useful to test agents, teams and workflows without a network, and to measure the framework overhead
+    separately from the provider latency.
+    """
+
+    id: str = "stub"
+    name: str = "StubModel"
+    provider: str = "Stub"
+
+    # Scripted responses, a str is a response with that content
+    responses: List[Union[str, StubResponse]] = field(default_factory=lambda: ["This is a stub response."])
+    # Restart the script once exhausted. If False, the last response is repeated.
+    cycle: bool = True
+    latency: LatencyProfile = field(default_factory=LatencyProfile)
+    # Characters per synthetic token, used for usage metrics, streaming and latency
+    chars_per_token: int = 4
+    # Number of tokens per streamed content delta
+    tokens_per_chunk: int = 1
+    # Seed for the latency jitter
+    seed: Optional[int] = 0
+
+    # Number of requests made to this model
+    request_count: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._rng = random.Random(self.seed)
+
+    def _next_response(self) -> StubResponse:
+        if not self.responses:
+            return StubResponse(content="")
+        if self.cycle:
+            response = self.responses[self.request_count % len(self.responses)]
+        else:
+            response = self.responses[min(self.request_count, len(self.responses) - 1)]
+        self.request_count += 1
+        if isinstance(response, str):
+            return StubResponse(content=response)
+        return response
+
+    def count_tokens(self, text: Optional[str]) -> int:
+        if not text:
+            return 0
+        return max(1, -(-len(text) // self.chars_per_token))
+
+    def _get_usage(self, messages: List[Message], response: StubResponse) -> Dict[str, int]:
+        prompt_tokens = sum(self.count_tokens(message.get_content_string()) for message in messages)
+        completion_tokens = self.count_tokens(response.content) + sum(
+            self.count_tokens(json.dumps(tool_call.arguments)) for tool_call in response.tool_calls
+        )
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    def _format_tool_calls(self, response: StubResponse) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": tool_call.id or f"call_{uuid4().hex[:24]}",
+                "type": "function",
+                "function": {"name": tool_call.name, "arguments": json.dumps(tool_call.arguments)},
+            }
+            for tool_call in response.tool_calls
+        ]
+
+    def _build_completion(self, messages: List[Message], response: StubResponse) -> Dict[str, Any]:
+        message: Dict[str, Any] = {"role": "assistant", "content": response.content}
+        if response.thinking is not None:
+            message["reasoning_content"] = response.thinking
+        if response.tool_calls:
+            message["tool_calls"] = self._format_tool_calls(response)
+        return {
+            "id": f"stub-{uuid4().hex}",
+            "model": self.id,
+            "choices": [{"index": 0, "message": message}],
+            "usage": self._get_usage(messages, response),
+        }
+
+    def _build_chunks(self, messages: List[Message], response: StubResponse) -> Iterator[Dict[str, Any]]:
+        """Split a response into stream chunks, the usage is sent with the last chunk."""
+        if response.thinking:
+            yield {"choices": [{"index": 0, "delta": {"reasoning_content": response.thinking}}]}
+        if response.content:
+            chunk_size = self.chars_per_token * max(self.tokens_per_chunk, 1)
+            for start in range(0, len(response.content), chunk_size):
+                content = response.content[start : start + chunk_size]
+                yield {"choices": [{"index": 0, "delta": {"content": content}}]}
+        if response.tool_calls:
+            yield {"choices": [{"index": 0, "delta": {"tool_calls": self._format_tool_calls(response)}}]}
+        yield {"choices": [], "usage": self._get_usage(messages, response)}
+
+    def _chunk_tokens(self, chunk: Dict[str, Any]) -> int:
+        if not chunk["choices"]:
+            return 0
+        delta = chunk["choices"][0]["delta"]
+        return self.count_tokens(delta.get("content") or delta.get("reasoning_content")) + sum(
+            self.count_tokens(tool_call["function"]["arguments"]) for tool_call in delta.get("tool_calls", [])
+        )
+
+    def invoke(self, messages: List[Message]) -> Dict[str, Any]:
+        response = self._next_response()
+        completion = self._build_completion(messages, response)
+        delay = self.latency.first_token_delay(self._rng) + self.latency.token_delay(
+            completion["usage"]["completion_tokens"], self._rng
+        )
+        if delay > 0:
+            time.sleep(delay)
+        return completion
+
+    async def ainvoke(self, messages: List[Message]) -> Dict[str, Any]:
+        response = self._next_response()
+        completion = self._build_completion(messages, response)
+        delay = self.latency.first_token_delay(self._rng) + self.latency.token_delay(
+            completion["usage"]["completion_tokens"], self._rng
+        )
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return completion
+
+    def invoke_stream(self, messages: List[Message]) -> Iterator[Dict[str, Any]]:
+        response = self._next_response()
+        delay = self.latency.first_token_delay(self._rng)
+        for chunk in self._build_chunks(messages, response):
+            delay += self.latency.token_delay(self._chunk_tokens(chunk), self._rng)
+            if delay > 0:
+                time.sleep(delay)
+            delay = 0.0
+            yield chunk
+
+    async def ainvoke_stream(self, messages: List[Message]) -> AsyncIterator[Dict[str, Any]]:  # type: ignore
+        response = self._next_response()
+        delay = self.latency.first_token_delay(self._rng)
+        for chunk in self._build_chunks(messages, response):
+            delay += self.latency.token_delay(self._chunk_tokens(chunk), self._rng)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            delay = 0.0
+            yield chunk
+
+    def parse_provider_response(self, response: Dict[str, Any]) -> ModelResponse:
+        """
+        Parse a stub chat completion into a ModelResponse.
+
+        Args:
+            response (Dict[str, Any]): The completion returned by invoke or ainvoke.
+
+        Returns:
+            ModelResponse: Parsed response data
+        """
+        model_response = ModelResponse()
+        message = response["choices"][0]["message"]
+
+        model_response.role = message.get("role")
+        model_response.content = message.get("content")
+        if message.get("reasoning_content") is not None:
+            model_response.thinking = message["reasoning_content"]
+        if message.get("tool_calls"):
+            model_response.tool_calls = message["tool_calls"]
+        if response.get("usage") is not None:
+            model_response.response_usage = response["usage"]
+        return model_response
+
+    def parse_provider_response_delta(self, response: Dict[str, Any]) -> ModelResponse:
+        """
+        Parse a stub chat completion chunk into a ModelResponse.
+
+        Args:
+            response (Dict[str, Any]): A chunk yielded by invoke_stream or ainvoke_stream.
+
+        Returns:
+            ModelResponse: Parsed response delta
+        """
+        model_response = ModelResponse()
+        if response["choices"]:
+            delta = response["choices"][0]["delta"]
+            model_response.content = delta.get("content")
+            if delta.get("reasoning_content") is not None:
+                model_response.thinking = delta["reasoning_content"]
+            if delta.get("tool_calls"):
+                model_response.tool_calls = delta["tool_calls"]
+        if response.get("usage") is not None:
+            model_response.response_usage = response["usage"]
+        return model_response
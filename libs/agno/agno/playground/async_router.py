@@ -3,12 +3,13 @@ from dataclasses import asdict
 from io import BytesIO
 from typing import AsyncGenerator, List, Optional, cast
 
-from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Query, Response, UploadFile
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from agno.agent.agent import Agent, RunResponse
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
+from agno.playground.instance_pool import InstancePool
 from agno.playground.operator import (
     format_tools,
     get_agent_by_id,
@@ -50,6 +51,9 @@ def get_async_playground_router(
     if agents is None and workflows is None and teams is None:
         raise ValueError("Either agents, teams or workflows must be provided.")
 
+    # Session-bound agent and team instances, shared by all runs served by this router
+    instance_pool = InstancePool()
+
     @playground_router.get("/status")
     async def playground_status():
         return {"playground": "available"}
@@ -128,6 +132,8 @@ def get_async_playground_router(
             )
             yield error_response.to_json()
             return
+        finally:
+            instance_pool.release_agent(agent)
 
     async def team_chat_response_streamer(
         team: Team,
@@ -195,6 +201,7 @@ def get_async_playground_router(
     @playground_router.post("/agents/{agent_id}/runs")
     async def create_agent_run(
         agent_id: str,
+        response: Response,
         message: str = Form(...),
         stream: bool = Form(True),
         monitor: bool = Form(False),
@@ -212,134 +219,147 @@ def get_async_playground_router(
         else:
             logger.debug("Creating new session")
 
-        # Create a new instance of this agent
-        new_agent_instance = agent.deep_copy(update={"session_id": session_id})
-        new_agent_instance.session_name = None
-        if user_id is not None:
-            new_agent_instance.user_id = user_id
-
-        if monitor:
-            new_agent_instance.monitoring = True
-        else:
-            new_agent_instance.monitoring = False
-
-        base64_images: List[Image] = []
-        base64_audios: List[Audio] = []
-        base64_videos: List[Video] = []
+        # Bind an instance of this agent to the session
+        new_agent_instance, bind_time_ms = instance_pool.acquire_agent(agent, update={"session_id": session_id})
+        streaming = False
+        try:
+            server_timing = {"Server-Timing": f"bind;dur={bind_time_ms:.3f}"}
+            new_agent_instance.session_name = None
+            if user_id is not None:
+                new_agent_instance.user_id = user_id
 
-        if files:
-            for file in files:
-                logger.info(f"Processing file: {file.content_type}")
-                if file.content_type in ["image/png", "image/jpeg", "image/jpg", "image/webp"]:
-                    try:
-                        base64_image = await process_image(file)
-                        base64_images.append(base64_image)
-                    except Exception as e:
-                        logger.error(f"Error processing image {file.filename}: {e}")
-                        continue
-                elif file.content_type in ["audio/wav", "audio/mp3", "audio/mpeg"]:
-                    try:
-                        base64_audio = await process_audio(file)
-                        base64_audios.append(base64_audio)
-                    except Exception as e:
-                        logger.error(f"Error processing audio {file.filename}: {e}")
-                        continue
-                elif file.content_type in [
-                    "video/x-flv",
-                    "video/quicktime",
-                    "video/mpeg",
-                    "video/mpegs",
-                    "video/mpgs",
-                    "video/mpg",
-                    "video/mpg",
-                    "video/mp4",
-                    "video/webm",
-                    "video/wmv",
-                    "video/3gpp",
-                ]:
-                    try:
-                        base64_video = await process_video(file)
-                        base64_videos.append(base64_video)
-                    except Exception as e:
-                        logger.error(f"Error processing video {file.filename}: {e}")
-                        continue
-                else:
-                    # Check for knowledge base before processing documents
-                    if new_agent_instance.knowledge is None:
-                        raise HTTPException(status_code=404, detail="KnowledgeBase not found")
-
-                    if file.content_type == "application/pdf":
-                        from agno.document.reader.pdf_reader import PDFReader
-
-                        contents = await file.read()
-                        pdf_file = BytesIO(contents)
-                        pdf_file.name = file.filename
-                        file_content = PDFReader().read(pdf_file)
-                        if new_agent_instance.knowledge is not None:
-                            new_agent_instance.knowledge.load_documents(file_content)
-                    elif file.content_type == "text/csv":
-                        from agno.document.reader.csv_reader import CSVReader
-
-                        contents = await file.read()
-                        csv_file = BytesIO(contents)
-                        csv_file.name = file.filename
-                        file_content = CSVReader().read(csv_file)
-                        if new_agent_instance.knowledge is not None:
-                            new_agent_instance.knowledge.load_documents(file_content)
-                    elif file.content_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                        from agno.document.reader.docx_reader import DocxReader
-
-                        contents = await file.read()
-                        docx_file = BytesIO(contents)
-                        docx_file.name = file.filename
-                        file_content = DocxReader().read(docx_file)
-                        if new_agent_instance.knowledge is not None:
-                            new_agent_instance.knowledge.load_documents(file_content)
-                    elif file.content_type == "text/plain":
-                        from agno.document.reader.text_reader import TextReader
-
-                        contents = await file.read()
-                        text_file = BytesIO(contents)
-                        text_file.name = file.filename
-                        file_content = TextReader().read(text_file)
-                        if new_agent_instance.knowledge is not None:
-                            new_agent_instance.knowledge.load_documents(file_content)
-
-                    elif file.content_type == "application/json":
-                        from agno.document.reader.json_reader import JSONReader
-
-                        contents = await file.read()
-                        json_file = BytesIO(contents)
-                        json_file.name = file.filename
-                        file_content = JSONReader().read(json_file)
-                        if new_agent_instance.knowledge is not None:
-                            new_agent_instance.knowledge.load_documents(file_content)
+            if monitor:
+                new_agent_instance.monitoring = True
+            else:
+                new_agent_instance.monitoring = False
+
+            base64_images: List[Image] = []
+            base64_audios: List[Audio] = []
+            base64_videos: List[Video] = []
+
+            if files:
+                for file in files:
+                    logger.info(f"Processing file: {file.content_type}")
+                    if file.content_type in ["image/png", "image/jpeg", "image/jpg", "image/webp"]:
+                        try:
+                            base64_image = await process_image(file)
+                            base64_images.append(base64_image)
+                        except Exception as e:
+                            logger.error(f"Error processing image {file.filename}: {e}")
+                            continue
+                    elif file.content_type in ["audio/wav", "audio/mp3", "audio/mpeg"]:
+                        try:
+                            base64_audio = await process_audio(file)
+                            base64_audios.append(base64_audio)
+                        except Exception as e:
+                            logger.error(f"Error processing audio {file.filename}: {e}")
+                            continue
+                    elif file.content_type in [
+                        "video/x-flv",
+                        "video/quicktime",
+                        "video/mpeg",
+                        "video/mpegs",
+                        "video/mpgs",
+                        "video/mpg",
+                        "video/mpg",
+                        "video/mp4",
+                        "video/webm",
+                        "video/wmv",
+                        "video/3gpp",
+                    ]:
+                        try:
+                            base64_video = await process_video(file)
+                            base64_videos.append(base64_video)
+                        except Exception as e:
+                            logger.error(f"Error processing video {file.filename}: {e}")
+                            continue
                     else:
-                        raise HTTPException(status_code=400, detail="Unsupported file type")
-
-        if stream:
-            return StreamingResponse(
-                chat_response_streamer(
-                    new_agent_instance,
-                    message,
-                    images=base64_images if base64_images else None,
-                    audio=base64_audios if base64_audios else None,
-                    videos=base64_videos if base64_videos else None,
-                ),
-                media_type="text/event-stream",
-            )
-        else:
-            run_response = cast(
-                RunResponse,
-                await new_agent_instance.arun(
-                    message=message,
-                    images=base64_images if base64_images else None,
-                    audio=base64_audios if base64_audios else None,
-                    videos=base64_videos if base64_videos else None,
-                    stream=False,
-                ),
-            )
-            return run_response.to_dict()
+                        # Check for knowledge base before processing documents
+                        if new_agent_instance.knowledge is None:
+                            raise HTTPException(status_code=404, detail="KnowledgeBase not found")
+
+                        if file.content_type == "application/pdf":
+                            from agno.document.reader.pdf_reader import PDFReader
+
+                            contents = await file.read()
+                            pdf_file = BytesIO(contents)
+                            pdf_file.name = file.filename
+                            file_content = PDFReader().read(pdf_file)
+                            if new_agent_instance.knowledge is not None:
+                                new_agent_instance.knowledge.load_documents(file_content)
+                        elif file.content_type == "text/csv":
+                            from agno.document.reader.csv_reader import CSVReader
+
+                            contents = await file.read()
+                            csv_file = BytesIO(contents)
+                            csv_file.name = file.filename
+                            file_content = CSVReader().read(csv_file)
+                            if new_agent_instance.knowledge is not None:
+                                new_agent_instance.knowledge.load_documents(file_content)
+                        elif (
+                            file.content_type
+                            == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+                        ):
+                            from agno.document.reader.docx_reader import DocxReader
+
+                            contents = await file.read()
+                            docx_file = BytesIO(contents)
+                            docx_file.name = file.filename
+                            file_content = DocxReader().read(docx_file)
+                            if new_agent_instance.knowledge is not None:
+                                new_agent_instance.knowledge.load_documents(file_content)
+                        elif file.content_type == "text/plain":
+                            from agno.document.reader.text_reader import TextReader
+
+                            contents = await file.read()
+                            text_file = BytesIO(contents)
+                            text_file.name = file.filename
+                            file_content = TextReader().read(text_file)
+                            if new_agent_instance.knowledge is not None:
+                                new_agent_instance.knowledge.load_documents(file_content)
+
+                        elif file.content_type == "application/json":
+                            from agno.document.reader.json_reader import JSONReader
+
+                            contents = await file.read()
+                            json_file = BytesIO(contents)
+                            json_file.name = file.filename
+                            file_content = JSONReader().read(json_file)
+                            if new_agent_instance.knowledge is not None:
+                                new_agent_instance.knowledge.load_documents(file_content)
+                        else:
+                            raise HTTPException(status_code=400, detail="Unsupported file type")
+
+            if stream:
+                # The stream releases the instance once it is complete
+                streaming = True
+                return StreamingResponse(
+                    chat_response_streamer(
+                        new_agent_instance,
+                        message,
+                        images=base64_images if base64_images else None,
+                        audio=base64_audios if base64_audios else None,
+                        videos=base64_videos if base64_videos else None,
+                    ),
+                    media_type="text/event-stream",
+                    headers=server_timing,
+                )
+            else:
+                run_response = cast(
+                    RunResponse,
+                    await new_agent_instance.arun(
+                        message=message,
+                        images=base64_images if base64_images else None,
+                        audio=base64_audios if base64_audios else None,
+                        videos=base64_videos if base64_videos else None,
+                        stream=False,
+                    ),
+                )
+                response.headers.update(server_timing)
+                return run_response.to_dict()
+        finally:
+            if not streaming:
+                instance_pool.release_agent(new_agent_instance)
 
     @playground_router.get("/agents/{agent_id}/sessions")
     async def get_all_agent_sessions(agent_id: str, user_id: Optional[str] = Query(None, min_length=1)):
@@ -567,6 +587,7 @@ def get_async_playground_router(
     @playground_router.post("/teams/{team_id}/runs")
     async def create_team_run(
         team_id: str,
+        response: Response,
         message: str = Form(...),
         stream: bool = Form(True),
         monitor: bool = Form(True),
@@ -584,11 +605,14 @@ def get_async_playground_router(
         else:
             logger.debug("Creating new session")
 
-        new_team_instance = team.deep_copy(update={"team_id": team_id, "session_id": session_id})
+        new_team_instance, bind_time_ms = instance_pool.acquire_team(
+            team, update={"team_id": team_id, "session_id": session_id}
+        )
         new_team_instance.session_name = None
+        server_timing = {"Server-Timing": f"bind;dur={bind_time_ms:.3f}"}
 
         if user_id is not None:
-            team.user_id = user_id
+            new_team_instance.user_id = user_id
 
         if monitor:
             new_team_instance.monitoring = True
@@ -659,9 +683,10 @@ def get_async_playground_router(
                     files=document_files if document_files else None,
                 ),
                 media_type="text/event-stream",
+                headers=server_timing,
             )
         else:
-            run_response = await team.arun(
+            run_response = await new_team_instance.arun(
                 message=message,
                 images=base64_images if base64_images else None,
                 audio=base64_audios if base64_audios else None,
@@ -669,6 +694,7 @@ def get_async_playground_router(
                 files=document_files if document_files else None,
                 stream=False,
             )
+            response.headers.update(server_timing)
             return run_response.to_dict()
 
     @playground_router.get("/teams/{team_id}/sessions", response_model=List[TeamSessionResponse])
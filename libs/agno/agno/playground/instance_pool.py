@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+from weakref import finalize, ref
+
+from agno.agent.agent import Agent
+from agno.team.team import Team
+from agno.utils.log import log_debug
+
+
+@dataclass
+class InstancePoolMetrics:
+    """Time spent binding agent and team instances to sessions"""
+
+    requests: int = 0
+    recycled: int = 0
+    total_bind_time_ms: float = 0.0
+    last_bind_time_ms: float = 0.0
+
+    @property
+    def average_bind_time_ms(self) -> float:
+        return self.total_bind_time_ms / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "recycled": self.recycled,
+            "average_bind_time_ms": self.average_bind_time_ms,
+            "last_bind_time_ms": self.last_bind_time_ms,
+        }
+
+
+class InstancePool:
+    """Pool of session-bound Agent and Team instances used to serve playground runs.
+
+    Each request gets an instance created with copy_for_session(), which shares the configured model client,
+    tools, knowledge and storage and only copies per-session state. Agent instances are returned to the pool
+    after the request and rebound to the next session, keeping their processed model and tools.
+    """
+
+    def __init__(self, max_idle_per_agent: int = 16):
+        self.max_idle_per_agent = max_idle_per_agent
+        self.metrics = InstancePoolMetrics()
+        self._idle: Dict[int, List[Agent]] = {}
+        # id of a leased instance -> a weak reference to the instance and the agent it was copied from.
+        # Entries are removed when the instance is garbage collected, e.g. if its request never released it.
+        self._leased: Dict[int, Tuple["ref[Agent]", Agent]] = {}
+        self._lock = Lock()
+
+    def _record(self, start: float, recycled: bool) -> float:
+        bind_time_ms = (perf_counter() - start) * 1000
+        with self._lock:
+            self.metrics.requests += 1
+            self.metrics.recycled += int(recycled)
+            self.metrics.total_bind_time_ms += bind_time_ms
+            self.metrics.last_bind_time_ms = bind_time_ms
+        return bind_time_ms
+
+    def acquire_agent(self, agent: Agent, update: Optional[Dict[str, Any]] = None) -> Tuple[Agent, float]:
+        """Get an instance of `agent` bound to a session, updated with `update`.
+
+        Returns:
+            Tuple[Agent, float]: The instance and the time it took to bind it, in milliseconds.
+        """
+        start = perf_counter()
+        with self._lock:
+            idle = self._idle.get(id(agent))
+            instance = idle.pop() if idle else None
+
+        recycled = instance is not None
+        if instance is not None:
+            instance.rebind_session(agent, update=update)
+        else:
+            instance = agent.copy_for_session(update=update)
+            finalize(instance, self._forget_lease, id(instance))
+
+        with self._lock:
+            self._leased[id(instance)] = (ref(instance), agent)
+        bind_time_ms = self._record(start, recycled)
+        log_debug(f"Bound agent instance in {bind_time_ms:.3f}ms ({'recycled' if recycled else 'new'})")
+        return instance, bind_time_ms
+
+    def release_agent(self, instance: Agent) -> None:
+        """Return an instance from acquire_agent to the pool once its request is complete.
+
+        Releasing an instance more than once has no effect.
+        """
+        with self._lock:
+            lease = self._leased.get(id(instance))
+            if lease is None or lease[0]() is not instance:
+                return
+            del self._leased[id(instance)]
+            agent = lease[1]
+            idle = self._idle.setdefault(id(agent), [])
+            if len(idle) < self.max_idle_per_agent:
+                idle.append(instance)
+
+    def _forget_lease(self, instance_id: int) -> None:
+        with self._lock:
+            lease = self._leased.get(instance_id)
+            # The id may already belong to a new instance
+            if lease is not None and lease[0]() is None:
+                del self._leased[instance_id]
+
+    def acquire_team(self, team: Team, update: Optional[Dict[str, Any]] = None) -> Tuple[Team, float]:
+        """Get an instance of `team` bound to a session, updated with `update`.
+
+        Teams rebuild their tools on every run, so their instances are not recycled.
+
+        Returns:
+            Tuple[Team, float]: The instance and the time it took to bind it, in milliseconds.
+        """
+        start = perf_counter()
+        instance = team.copy_for_session(update=update)
+        bind_time_ms = self._record(start, recycled=False)
+        log_debug(f"Bound team instance in {bind_time_ms:.3f}ms")
+        return instance, bind_time_ms
@@ -13,12 +13,14 @@ class RunMessages:
         system_message: The system message for this run
         user_message: The user message for this run
         extra_messages: Extra messages added after the system and user messages
+        prompt_tokens: Estimated number of tokens of the messages, counted when the Agent has a context_window
     """
 
     messages: List[Message] = field(default_factory=list)
     system_message: Optional[Message] = None
     user_message: Optional[Message] = None
     extra_messages: Optional[List[Message]] = None
+    prompt_tokens: Optional[int] = None
 
     def get_input_messages(self) -> List[Message]:
         """Get the input messages for the model."""
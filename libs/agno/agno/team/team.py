@@ -41,6 +41,7 @@ from agno.storage.base import Storage
 from agno.storage.session.team import TeamSession
 from agno.tools.function import Function, get_entrypoint_docstring
 from agno.tools.toolkit import Toolkit
+from agno.tracing import get_current_span, start_span, traced
 from agno.utils.log import (
     log_debug,
     log_error,
@@ -65,6 +66,16 @@ from agno.utils.string import parse_response_model_str
 from agno.utils.timer import Timer
 
 
+def _get_team_span_attributes(team: "Team", run_response: TeamRunResponse, *args, **kwargs) -> Dict[str, Any]:
+    return {
+        "team_id": team.team_id,
+        "team_name": team.name,
+        "mode": team.mode,
+        "run_id": run_response.run_id,
+        "session_id": run_response.session_id,
+    }
+
+
 @dataclass(init=False)
 class Team:
     """
@@ -382,8 +393,8 @@ class Team:
         # Set the session ID if not yet set
         self._set_session_id()
 
-        log_debug(f"Team ID: {self.team_id}", center=True)
-        log_debug(f"Session ID: {self.session_id}", center=True)
+        log_debug("Team ID: %s", self.team_id, center=True)
+        log_debug("Session ID: %s", self.session_id, center=True)
 
         # Initialize formatter
         if self._formatter is None:
@@ -472,8 +483,8 @@ class Team:
             run_id = str(uuid4())
             self.run_id = run_id
 
-            log_debug(f"Team Run Start: {self.run_id}", center=True)
-            log_debug(f"Mode: '{self.mode}'", center=True)
+            log_debug("Team Run Start: %s", self.run_id, center=True)
+            log_debug("Mode: '%s'", self.mode, center=True)
 
             # Set run_input
             if message is not None:
@@ -609,6 +620,7 @@ class Team:
         else:
             raise Exception(f"Failed after {num_attempts} attempts.")
 
+    @traced("team.run", attributes=_get_team_span_attributes)
     def _run(
         self,
         run_response: TeamRunResponse,
@@ -691,6 +703,7 @@ class Team:
         run_response.messages = messages_for_run_response
         # Update the TeamRunResponse metrics
         run_response.metrics = self._aggregate_metrics_from_messages(messages_for_run_response)
+        self._add_run_metrics_to_span(run_response)
 
         # 4. Update Team Memory
         # Add the system message to the memory
@@ -766,8 +779,9 @@ class Team:
         # 8. Log Team Run
         self._log_team_run()
 
-        log_debug(f"Team Run End: {self.run_id}", center=True, symbol="*")
+        log_debug("Team Run End: %s", self.run_id, center=True, symbol="*")
 
+    @traced("team.run", attributes=_get_team_span_attributes)
     def _run_stream(
         self,
         run_response: TeamRunResponse,
@@ -931,6 +945,7 @@ class Team:
         run_response.messages = messages_for_run_response
         # Update the TeamRunResponse metrics
         run_response.metrics = self._aggregate_metrics_from_messages(messages_for_run_response)
+        self._add_run_metrics_to_span(run_response)
 
         # 4. Update Team Memory
         # Add the system message to the memory
@@ -978,7 +993,7 @@ class Team:
                 event=RunEvent.run_completed,
             )
 
-        log_debug(f"Team Run End: {self.run_id}", center=True, symbol="*")
+        log_debug("Team Run End: %s", self.run_id, center=True, symbol="*")
 
     @overload
     async def arun(
@@ -1060,8 +1075,8 @@ class Team:
             run_id = str(uuid4())
             self.run_id = run_id
 
-            log_debug(f"Team Run Start: {self.run_id}", center=True)
-            log_debug(f"Mode: '{self.mode}'", center=True)
+            log_debug("Team Run Start: %s", self.run_id, center=True)
+            log_debug("Mode: '%s'", self.mode, center=True)
 
             # Set run_input
             if message is not None:
@@ -1197,6 +1212,7 @@ class Team:
         else:
             raise Exception(f"Failed after {num_attempts} attempts.")
 
+    @traced("team.run", attributes=_get_team_span_attributes)
     async def _arun(
         self,
         run_response: TeamRunResponse,
@@ -1280,6 +1296,7 @@ class Team:
         run_response.messages = messages_for_run_response
         # Update the TeamRunResponse metrics
         run_response.metrics = self._aggregate_metrics_from_messages(messages_for_run_response)
+        self._add_run_metrics_to_span(run_response)
 
         # 4. Update Team Memory
         # Add the system message to the memory
@@ -1355,8 +1372,9 @@ class Team:
         # 8. Log Team Run
         await self._alog_team_run()
 
-        log_debug(f"Team Run End: {self.run_id}", center=True, symbol="*")
+        log_debug("Team Run End: %s", self.run_id, center=True, symbol="*")
 
+    @traced("team.run", attributes=_get_team_span_attributes)
     async def _arun_stream(
         self,
         run_response: TeamRunResponse,
@@ -1527,6 +1545,7 @@ class Team:
         run_response.messages = messages_for_run_response
         # Update the TeamRunResponse metrics
         run_response.metrics = self._aggregate_metrics_from_messages(messages_for_run_response)
+        self._add_run_metrics_to_span(run_response)
 
         # 4. Update Team Memory
         # Add the system message to the memory
@@ -1575,7 +1594,7 @@ class Team:
                 event=RunEvent.run_completed,
             )
 
-        log_debug(f"Team Run End: {self.run_id}", center=True, symbol="*")
+        log_debug("Team Run End: %s", self.run_id, center=True, symbol="*")
 
     ###########################################################################
     # Print Response
@@ -3218,6 +3237,16 @@ class Team:
                         current_session_metrics += m.metrics
         return current_session_metrics
 
+    def _add_run_metrics_to_span(self, run_response: TeamRunResponse) -> None:
+        span = get_current_span()
+        if not span.is_recording or not run_response.metrics:
+            return
+        span.set_attributes(
+            input_tokens=sum(run_response.metrics.get("input_tokens", [])),
+            output_tokens=sum(run_response.metrics.get("output_tokens", [])),
+            total_tokens=sum(run_response.metrics.get("total_tokens", [])),
+        )
+
     def _aggregate_metrics_from_messages(self, messages: List[Message]) -> Dict[str, Any]:
         aggregated_metrics: Dict[str, Any] = defaultdict(list)
         assistant_message_role = self.model.assistant_message_role if self.model is not None else "assistant"
@@ -3830,11 +3859,6 @@ class Team:
         # 1.3.1 Add instructions for using markdown
         if self.markdown and self.response_model is None:
             additional_information.append("Use markdown to format your answers.")
-        # 1.3.2 Add the current datetime
-        if self.add_datetime_to_instructions:
-            from datetime import datetime
-
-            additional_information.append(f"The current time is {datetime.now()}")
 
         # 2 Build the default system message for the Agent.
         system_message_content: str = ""
@@ -3940,6 +3964,12 @@ class Team:
         ):
             system_message_content += f"{self._get_json_output_prompt()}"
 
+        # Add the current datetime last, so the rest of the system message is a stable prefix for prompt caching
+        if self.add_datetime_to_instructions:
+            from datetime import datetime
+
+            system_message_content += f"\n\nThe current time is {datetime.now()}"
+
         return Message(role="system", content=system_message_content.strip())
 
     def get_run_messages(
@@ -3976,18 +4006,12 @@ class Team:
 
         # 2. Add history to run_messages
         if self.enable_team_history:
-            from copy import deepcopy
-
             history: List[Message] = self.memory.get_messages_from_last_n_runs(
                 last_n=self.num_of_interactions_from_history, skip_role="system"
             )
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
-
-                # Tag each message as coming from history
-                for _msg in history_copy:
-                    _msg.from_history = True
+                # Tag each message as coming from history, using copies that share the payload of the original messages
+                history_copy = [msg.history_view() for msg in history]
 
                 log_debug(f"Adding {len(history_copy)} messages from history")
 
@@ -4299,52 +4323,53 @@ class Team:
             member_agent_task += f"\n\n<task>\n{task_description}\n</task>"
 
             for member_agent_index, member_agent in enumerate(self.members):
-                if stream:
-                    member_agent_run_response_stream = member_agent.run(
-                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=True
-                    )
-                    for member_agent_run_response_chunk in member_agent_run_response_stream:
-                        check_if_run_cancelled(member_agent_run_response_chunk)
-                        yield member_agent_run_response_chunk.content or ""
-                else:
-                    member_agent_run_response = member_agent.run(
-                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
-                    )
-
-                    check_if_run_cancelled(member_agent_run_response)
-
-                    if member_agent_run_response.content is None:
-                        yield "No response from the member agent."
-                    elif isinstance(member_agent_run_response.content, str):
-                        yield member_agent_run_response.content
-                    elif issubclass(type(member_agent_run_response.content), BaseModel):
-                        try:
-                            yield member_agent_run_response.content.model_dump_json(indent=2)  # type: ignore
-                        except Exception as e:
-                            yield str(e)
+                with start_span("team.delegate", {"member_name": member_agent.name, "mode": "collaborate"}):
+                    if stream:
+                        member_agent_run_response_stream = member_agent.run(
+                            member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=True
+                        )
+                        for member_agent_run_response_chunk in member_agent_run_response_stream:
+                            check_if_run_cancelled(member_agent_run_response_chunk)
+                            yield member_agent_run_response_chunk.content or ""
                     else:
-                        try:
-                            import json
-
-                            yield json.dumps(member_agent_run_response.content, indent=2)
-                        except Exception as e:
-                            yield str(e)
+                        member_agent_run_response = member_agent.run(
+                            member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
+                        )
 
-                # Update the memory
-                member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-                self.memory = cast(TeamMemory, self.memory)
-                self.memory.add_interaction_to_team_context(
-                    member_name=member_name,
-                    task=task_description,
-                    run_response=member_agent.run_response,  # type: ignore
-                )
+                        check_if_run_cancelled(member_agent_run_response)
+
+                        if member_agent_run_response.content is None:
+                            yield "No response from the member agent."
+                        elif isinstance(member_agent_run_response.content, str):
+                            yield member_agent_run_response.content
+                        elif issubclass(type(member_agent_run_response.content), BaseModel):
+                            try:
+                                yield member_agent_run_response.content.model_dump_json(indent=2)  # type: ignore
+                            except Exception as e:
+                                yield str(e)
+                        else:
+                            try:
+                                import json
+
+                                yield json.dumps(member_agent_run_response.content, indent=2)
+                            except Exception as e:
+                                yield str(e)
+
+                    # Update the memory
+                    member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
+                    self.memory = cast(TeamMemory, self.memory)
+                    self.memory.add_interaction_to_team_context(
+                        member_name=member_name,
+                        task=task_description,
+                        run_response=member_agent.run_response,  # type: ignore
+                    )
 
-                # Add the member run to the team run response
-                self.run_response = cast(TeamRunResponse, self.run_response)
-                self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+                    # Add the member run to the team run response
+                    self.run_response = cast(TeamRunResponse, self.run_response)
+                    self.run_response.add_member_run(member_agent.run_response)  # type: ignore
 
-                # Update the team state
-                self._update_team_state(member_agent.run_response)  # type: ignore
+                    # Update the team state
+                    self._update_team_state(member_agent.run_response)  # type: ignore
 
             # Afterward, switch back to the team logger
             use_team_logger()
@@ -4402,23 +4427,24 @@ class Team:
                 current_index = member_agent_index  # Create a reference to the current index
 
                 async def run_member_agent(agent=current_agent, idx=current_index) -> str:
-                    response = await agent.arun(
-                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
-                    )
-                    check_if_run_cancelled(response)
+                    with start_span("team.delegate", {"member_name": agent.name, "mode": "collaborate"}):
+                        response = await agent.arun(
+                            member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
+                        )
+                        check_if_run_cancelled(response)
 
-                    member_name = agent.name if agent.name else f"agent_{idx}"
-                    self.memory = cast(TeamMemory, self.memory)
-                    self.memory.add_interaction_to_team_context(
-                        member_name=member_name, task=task_description, run_response=agent.run_response
-                    )
+                        member_name = agent.name if agent.name else f"agent_{idx}"
+                        self.memory = cast(TeamMemory, self.memory)
+                        self.memory.add_interaction_to_team_context(
+                            member_name=member_name, task=task_description, run_response=agent.run_response
+                        )
 
-                    # Add the member run to the team run response
-                    self.run_response = cast(TeamRunResponse, self.run_response)
-                    self.run_response.add_member_run(agent.run_response)
+                        # Add the member run to the team run response
+                        self.run_response = cast(TeamRunResponse, self.run_response)
+                        self.run_response.add_member_run(agent.run_response)
 
-                    # Update the team state
-                    self._update_team_state(agent.run_response)
+                        # Update the team state
+                        self._update_team_state(agent.run_response)
 
                     if response.content is None:
                         return f"Agent {member_name}: No response from the member agent."
@@ -4521,56 +4547,56 @@ class Team:
 
             # Make sure for the member agent, we are using the agent logger
             use_agent_logger()
+            with start_span("team.delegate", {"member_name": member_agent.name, "mode": "coordinate"}):
+                if stream:
+                    member_agent_run_response_stream = member_agent.run(
+                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=True
+                    )
+                    for member_agent_run_response_chunk in member_agent_run_response_stream:
+                        check_if_run_cancelled(member_agent_run_response_chunk)
+                        yield member_agent_run_response_chunk.content or ""
+                else:
+                    member_agent_run_response = member_agent.run(
+                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
+                    )
 
-            if stream:
-                member_agent_run_response_stream = member_agent.run(
-                    member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=True
-                )
-                for member_agent_run_response_chunk in member_agent_run_response_stream:
-                    check_if_run_cancelled(member_agent_run_response_chunk)
-                    yield member_agent_run_response_chunk.content or ""
-            else:
-                member_agent_run_response = member_agent.run(
-                    member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
-                )
-
-                check_if_run_cancelled(member_agent_run_response)
+                    check_if_run_cancelled(member_agent_run_response)
 
-                if member_agent_run_response.content is None:
-                    yield "No response from the member agent."
-                elif isinstance(member_agent_run_response.content, str):
-                    yield member_agent_run_response.content
-                elif issubclass(type(member_agent_run_response.content), BaseModel):
-                    try:
-                        yield member_agent_run_response.content.model_dump_json(indent=2)
-                    except Exception as e:
-                        yield str(e)
-                else:
-                    try:
-                        import json
+                    if member_agent_run_response.content is None:
+                        yield "No response from the member agent."
+                    elif isinstance(member_agent_run_response.content, str):
+                        yield member_agent_run_response.content
+                    elif issubclass(type(member_agent_run_response.content), BaseModel):
+                        try:
+                            yield member_agent_run_response.content.model_dump_json(indent=2)
+                        except Exception as e:
+                            yield str(e)
+                    else:
+                        try:
+                            import json
 
-                        yield json.dumps(member_agent_run_response.content, indent=2)
-                    except Exception as e:
-                        yield str(e)
+                            yield json.dumps(member_agent_run_response.content, indent=2)
+                        except Exception as e:
+                            yield str(e)
 
-            # Afterward, switch back to the team logger
-            use_team_logger()
+                # Afterward, switch back to the team logger
+                use_team_logger()
 
-            # Update the memory
-            member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-            self.memory = cast(TeamMemory, self.memory)
-            self.memory.add_interaction_to_team_context(
-                member_name=member_name,
-                task=task_description,
-                run_response=member_agent.run_response,  # type: ignore
-            )
+                # Update the memory
+                member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
+                self.memory = cast(TeamMemory, self.memory)
+                self.memory.add_interaction_to_team_context(
+                    member_name=member_name,
+                    task=task_description,
+                    run_response=member_agent.run_response,  # type: ignore
+                )
 
-            # Add the member run to the team run response
-            self.run_response = cast(TeamRunResponse, self.run_response)
-            self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+                # Add the member run to the team run response
+                self.run_response = cast(TeamRunResponse, self.run_response)
+                self.run_response.add_member_run(member_agent.run_response)  # type: ignore
 
-            # Update the team state
-            self._update_team_state(member_agent.run_response)  # type: ignore
+                # Update the team state
+                self._update_team_state(member_agent.run_response)  # type: ignore
 
         async def atransfer_task_to_member(
             agent_name: str, task_description: str, expected_output: str
@@ -4621,53 +4647,53 @@ class Team:
 
             # Make sure for the member agent, we are using the agent logger
             use_agent_logger()
-
-            if stream:
-                member_agent_run_response_stream = await member_agent.arun(
-                    member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=True
-                )
-                async for member_agent_run_response_chunk in member_agent_run_response_stream:
-                    check_if_run_cancelled(member_agent_run_response_chunk)
-                    yield member_agent_run_response_chunk.content or ""
-            else:
-                member_agent_run_response = await member_agent.arun(
-                    member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
-                )
-                check_if_run_cancelled(member_agent_run_response)
-                if member_agent_run_response.content is None:
-                    yield "No response from the member agent."
-                elif isinstance(member_agent_run_response.content, str):
-                    yield member_agent_run_response.content
-                elif issubclass(type(member_agent_run_response.content), BaseModel):
-                    try:
-                        yield member_agent_run_response.content.model_dump_json(indent=2)
-                    except Exception as e:
-                        yield str(e)
+            with start_span("team.delegate", {"member_name": member_agent.name, "mode": "coordinate"}):
+                if stream:
+                    member_agent_run_response_stream = await member_agent.arun(
+                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=True
+                    )
+                    async for member_agent_run_response_chunk in member_agent_run_response_stream:
+                        check_if_run_cancelled(member_agent_run_response_chunk)
+                        yield member_agent_run_response_chunk.content or ""
                 else:
-                    try:
-                        import json
+                    member_agent_run_response = await member_agent.arun(
+                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
+                    )
+                    check_if_run_cancelled(member_agent_run_response)
+                    if member_agent_run_response.content is None:
+                        yield "No response from the member agent."
+                    elif isinstance(member_agent_run_response.content, str):
+                        yield member_agent_run_response.content
+                    elif issubclass(type(member_agent_run_response.content), BaseModel):
+                        try:
+                            yield member_agent_run_response.content.model_dump_json(indent=2)
+                        except Exception as e:
+                            yield str(e)
+                    else:
+                        try:
+                            import json
 
-                        yield json.dumps(member_agent_run_response.content, indent=2)
-                    except Exception as e:
-                        yield str(e)
+                            yield json.dumps(member_agent_run_response.content, indent=2)
+                        except Exception as e:
+                            yield str(e)
 
-            # Afterward, switch back to the team logger
-            use_team_logger()
+                # Afterward, switch back to the team logger
+                use_team_logger()
 
-            # Update the memory
-            member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-            self.memory.add_interaction_to_team_context(
-                member_name=member_name,
-                task=task_description,
-                run_response=member_agent.run_response,  # type: ignore
-            )
+                # Update the memory
+                member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
+                self.memory.add_interaction_to_team_context(
+                    member_name=member_name,
+                    task=task_description,
+                    run_response=member_agent.run_response,  # type: ignore
+                )
 
-            # Add the member run to the team run response
-            self.run_response = cast(TeamRunResponse, self.run_response)
-            self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+                # Add the member run to the team run response
+                self.run_response = cast(TeamRunResponse, self.run_response)
+                self.run_response.add_member_run(member_agent.run_response)  # type: ignore
 
-            # Update the team state
-            self._update_team_state(member_agent.run_response)  # type: ignore
+                # Update the team state
+                self._update_team_state(member_agent.run_response)  # type: ignore
 
         if async_mode:
             transfer_function = atransfer_task_to_member  # type: ignore
@@ -4750,60 +4776,60 @@ class Team:
 
             # Make sure for the member agent, we are using the agent logger
             use_agent_logger()
+            with start_span("team.delegate", {"member_name": member_agent.name, "mode": "route"}):
+                # If found in subteam, include the path in the task description
+                member_agent_task = message.get_content_string()
 
-            # If found in subteam, include the path in the task description
-            member_agent_task = message.get_content_string()
-
-            if expected_output:
-                member_agent_task += f"\n\n<expected_output>\n{expected_output}\n</expected_output>"
-
-            # 2. Get the response from the member agent
-            if stream:
-                member_agent_run_response_stream = member_agent.run(
-                    member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=True
-                )
-                for member_agent_run_response_chunk in member_agent_run_response_stream:
-                    yield member_agent_run_response_chunk.content or ""
-            else:
-                member_agent_run_response = member_agent.run(
-                    member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
-                )
+                if expected_output:
+                    member_agent_task += f"\n\n<expected_output>\n{expected_output}\n</expected_output>"
 
-                if member_agent_run_response.content is None:
-                    yield "No response from the member agent."
-                elif isinstance(member_agent_run_response.content, str):
-                    yield member_agent_run_response.content
-                elif issubclass(type(member_agent_run_response.content), BaseModel):
-                    try:
-                        yield member_agent_run_response.content.model_dump_json(indent=2)
-                    except Exception as e:
-                        yield str(e)
+                # 2. Get the response from the member agent
+                if stream:
+                    member_agent_run_response_stream = member_agent.run(
+                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=True
+                    )
+                    for member_agent_run_response_chunk in member_agent_run_response_stream:
+                        yield member_agent_run_response_chunk.content or ""
                 else:
-                    try:
-                        import json
+                    member_agent_run_response = member_agent.run(
+                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
+                    )
 
-                        yield json.dumps(member_agent_run_response.content, indent=2)
-                    except Exception as e:
-                        yield str(e)
+                    if member_agent_run_response.content is None:
+                        yield "No response from the member agent."
+                    elif isinstance(member_agent_run_response.content, str):
+                        yield member_agent_run_response.content
+                    elif issubclass(type(member_agent_run_response.content), BaseModel):
+                        try:
+                            yield member_agent_run_response.content.model_dump_json(indent=2)
+                        except Exception as e:
+                            yield str(e)
+                    else:
+                        try:
+                            import json
 
-            # Afterward, switch back to the team logger
-            use_team_logger()
+                            yield json.dumps(member_agent_run_response.content, indent=2)
+                        except Exception as e:
+                            yield str(e)
 
-            # Update the memory
-            member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-            self.memory = cast(TeamMemory, self.memory)
-            self.memory.add_interaction_to_team_context(
-                member_name=member_name,
-                task=message.get_content_string(),
-                run_response=member_agent.run_response,  # type: ignore
-            )
+                # Afterward, switch back to the team logger
+                use_team_logger()
 
-            # Add the member run to the team run response
-            self.run_response = cast(TeamRunResponse, self.run_response)
-            self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+                # Update the memory
+                member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
+                self.memory = cast(TeamMemory, self.memory)
+                self.memory.add_interaction_to_team_context(
+                    member_name=member_name,
+                    task=message.get_content_string(),
+                    run_response=member_agent.run_response,  # type: ignore
+                )
 
-            # Update the team state
-            self._update_team_state(member_agent.run_response)  # type: ignore
+                # Add the member run to the team run response
+                self.run_response = cast(TeamRunResponse, self.run_response)
+                self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+
+                # Update the team state
+                self._update_team_state(member_agent.run_response)  # type: ignore
 
         async def aforward_task_to_member(agent_name: str, expected_output: Optional[str] = None) -> AsyncIterator[str]:
             """
@@ -4833,61 +4859,61 @@ class Team:
 
             # Make sure for the member agent, we are using the agent logger
             use_agent_logger()
+            with start_span("team.delegate", {"member_name": member_agent.name, "mode": "route"}):
+                # If found in subteam, include the path in the task description
+                member_agent_task = message.get_content_string()
 
-            # If found in subteam, include the path in the task description
-            member_agent_task = message.get_content_string()
+                if expected_output:
+                    member_agent_task += f"\n\n<expected_output>\n{expected_output}\n</expected_output>"
 
-            if expected_output:
-                member_agent_task += f"\n\n<expected_output>\n{expected_output}\n</expected_output>"
-
-            # 2. Get the response from the member agent
-            if stream:
-                member_agent_run_response_stream = await member_agent.arun(
-                    member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=True
-                )
-                async for member_agent_run_response_chunk in member_agent_run_response_stream:
-                    check_if_run_cancelled(member_agent_run_response_chunk)
-                    yield member_agent_run_response_chunk.content or ""
-            else:
-                member_agent_run_response = await member_agent.arun(
-                    member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
-                )
-
-                if member_agent_run_response.content is None:
-                    yield "No response from the member agent."
-                elif isinstance(member_agent_run_response.content, str):
-                    yield member_agent_run_response.content
-                elif issubclass(type(member_agent_run_response.content), BaseModel):
-                    try:
-                        yield member_agent_run_response.content.model_dump_json(indent=2)
-                    except Exception as e:
-                        yield str(e)
+                # 2. Get the response from the member agent
+                if stream:
+                    member_agent_run_response_stream = await member_agent.arun(
+                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=True
+                    )
+                    async for member_agent_run_response_chunk in member_agent_run_response_stream:
+                        check_if_run_cancelled(member_agent_run_response_chunk)
+                        yield member_agent_run_response_chunk.content or ""
                 else:
-                    try:
-                        import json
+                    member_agent_run_response = await member_agent.arun(
+                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
+                    )
 
-                        yield json.dumps(member_agent_run_response.content, indent=2)
-                    except Exception as e:
-                        yield str(e)
+                    if member_agent_run_response.content is None:
+                        yield "No response from the member agent."
+                    elif isinstance(member_agent_run_response.content, str):
+                        yield member_agent_run_response.content
+                    elif issubclass(type(member_agent_run_response.content), BaseModel):
+                        try:
+                            yield member_agent_run_response.content.model_dump_json(indent=2)
+                        except Exception as e:
+                            yield str(e)
+                    else:
+                        try:
+                            import json
 
-            # Afterward, switch back to the team logger
-            use_team_logger()
+                            yield json.dumps(member_agent_run_response.content, indent=2)
+                        except Exception as e:
+                            yield str(e)
 
-            # Update the memory
-            member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-            self.memory = cast(TeamMemory, self.memory)
-            self.memory.add_interaction_to_team_context(
-                member_name=member_name,
-                task=message.get_content_string(),
-                run_response=member_agent.run_response,  # type: ignore
-            )
+                # Afterward, switch back to the team logger
+                use_team_logger()
 
-            # Add the member run to the team run response
-            self.run_response = cast(TeamRunResponse, self.run_response)
-            self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+                # Update the memory
+                member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
+                self.memory = cast(TeamMemory, self.memory)
+                self.memory.add_interaction_to_team_context(
+                    member_name=member_name,
+                    task=message.get_content_string(),
+                    run_response=member_agent.run_response,  # type: ignore
+                )
 
-            # Update the team state
-            self._update_team_state(member_agent.run_response)  # type: ignore
+                # Add the member run to the team run response
+                self.run_response = cast(TeamRunResponse, self.run_response)
+                self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+
+                # Update the team state
+                self._update_team_state(member_agent.run_response)  # type: ignore
 
         if async_mode:
             forward_function = aforward_task_to_member  # type: ignore
@@ -4930,6 +4956,7 @@ class Team:
             self.load_user_memories()
         return self.team_session
 
+    @traced("team.storage.write")
     def write_to_storage(self) -> Optional[TeamSession]:
         """Save the TeamSession to storage
 
@@ -5139,6 +5166,7 @@ class Team:
             created_at=int(time()),
         )
 
+    @traced("team.telemetry")
     def _log_team_run(self) -> None:
         if not self.telemetry and not self.monitoring:
             return
@@ -5162,6 +5190,7 @@ class Team:
         except Exception as e:
             log_debug(f"Could not create team event: {e}")
 
+    @traced("team.telemetry")
     async def _alog_team_run(self) -> None:
         if not self.telemetry and not self.monitoring:
             return
@@ -5231,6 +5260,76 @@ class Team:
 
         return team_copy
 
+    def copy_for_session(self, *, update: Optional[Dict[str, Any]] = None) -> "Team":
+        """Create a copy of the Team to serve a single session, with optional updates.
+        Configuration and shared resources (knowledge, storage, model clients, tool entrypoints) are shared with
+        this Team. Only the state a session mutates (memory, session state, members, model and tool bindings) is copied.
+        Args:
+            update: Optional dictionary of attributes to update in the copy
+        Returns:
+            A new Team instance
+        """
+        excluded_fields = ["team_session", "session_name", "_functions_for_model"]
+        copied_attributes = {}
+        for field_name, field_value in self.__dict__.items():
+            if field_name in excluded_fields:
+                continue
+            copied_attributes[field_name] = self._copy_field_for_session(field_name, field_value)
+
+        team_copy = Team.__new__(Team)
+        team_copy.__dict__ = copied_attributes
+
+        if update:
+            for key, value in update.items():
+                setattr(team_copy, key, value)
+
+        return team_copy
+
+    def _copy_field_for_session(self, field_name: str, field_value: Any) -> Any:
+        """Copy a single field for a new session, sharing everything a session does not mutate.
+        Args:
+            field_name: Name of the field being copied
+            field_value: Value to copy
+        Returns:
+            Copied or shared value
+        """
+        from copy import copy, deepcopy
+
+        if field_value is None:
+            return None
+
+        if field_name == "members":
+            return [member.copy_for_session() for member in field_value]
+
+        if field_name == "memory":
+            return field_value.deep_copy()
+
+        elif field_name in ("model", "reasoning_model"):
+            return field_value.copy_for_session()
+
+        elif field_name == "tools":
+            return [
+                tool.copy_for_session()
+                if isinstance(tool, Toolkit)
+                else tool.model_copy()
+                if isinstance(tool, Function)
+                else tool
+                for tool in field_value
+            ]
+
+        elif isinstance(field_value, (list, dict, set)):
+            try:
+                return deepcopy(field_value)
+            except Exception:
+                try:
+                    return copy(field_value)
+                except Exception as e:
+                    log_warning(f"Failed to copy field: {field_name} - {e}")
+                    return field_value
+
+        # Storage, knowledge and any other object are shared
+        return field_value
+
     def _deep_copy_field(self, field_name: str, field_value: Any) -> Any:
         """Deep copy a single field value.
         Args:
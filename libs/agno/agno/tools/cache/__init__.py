@@ -0,0 +1,4 @@
+from agno.tools.cache.base import ToolCache, ToolCacheEntry, ToolCacheMetrics, get_tool_cache_key
+from agno.tools.cache.memory import InMemoryToolCache
+from agno.tools.cache.sqlite import SqliteToolCache
+from agno.tools.cache.tiered import TieredToolCache, get_default_tool_cache
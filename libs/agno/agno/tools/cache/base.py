@@ -0,0 +1,267 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from hashlib import sha256
+from threading import Event, Lock
+from time import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from agno.utils.log import log_debug, log_warning
+
+
+@dataclass
+class ToolCacheEntry:
+    """A serialized tool result stored in a ToolCache."""
+
+    # The JSON encoded result
+    value: str
+    # Unix timestamp after which the entry is expired. None means the entry never expires.
+    expires_at: Optional[float] = None
+
+    @property
+    def is_expired(self) -> bool:
+        return self.expires_at is not None and time() > self.expires_at
+
+    @property
+    def size(self) -> int:
+        return len(self.value)
+
+
+@dataclass
+class ToolCacheMetrics:
+    """Cache metrics for a single function."""
+
+    # Results served from the cache
+    hits: int = 0
+    # Results computed by calling the function
+    misses: int = 0
+    # Results shared with a concurrent identical call that was already running
+    coalesced: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / total if total > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "coalesced": self.coalesced, "hit_rate": self.hit_rate}
+
+
+class _Flight:
+    """A function call in progress, shared by all identical concurrent calls."""
+
+    def __init__(self):
+        self.done = Event()
+        self.result: Any = None
+        self.failed: bool = False
+
+
+def get_tool_cache_key(
+    function_name: str, arguments: Optional[Dict[str, Any]] = None, namespace: Optional[str] = None
+) -> str:
+    """Hash the canonical JSON form of a function call, so argument order does not change the key.
+
+    The namespace separates functions with the same name, e.g. the same toolkit configured with different API keys.
+    """
+    call: Dict[str, Any] = {"function": function_name, "arguments": arguments or {}}
+    if namespace is not None:
+        call["namespace"] = namespace
+    canonical = json.dumps(
+        call,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def is_cacheable_result(result: Any) -> bool:
+    from inspect import isasyncgen, isgenerator
+
+    return result is not None and not (isgenerator(result) or isasyncgen(result))
+
+
+class ToolCache(ABC):
+    """Base class for tool result caches.
+
+    Backends only store and return serialized entries. Key generation, (de)serialization,
+    single-flight deduplication of concurrent identical calls and hit-rate metrics are handled here.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, ToolCacheMetrics] = {}
+        self._metrics_lock = Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._flights_lock = Lock()
+        self._async_flights: Dict[Tuple[int, str], "asyncio.Future[Any]"] = {}
+
+    @abstractmethod
+    def get_entry(self, key: str) -> Optional[ToolCacheEntry]:
+        """Return the entry for a key, or None if it is missing or expired."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_entry(self, key: str, entry: ToolCacheEntry, function_name: Optional[str] = None) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ToolCache":
+        # Caches are shared by every copy of a toolkit, e.g. the per-request agent copies in the playground
+        return self
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.get_entry(key)
+        if entry is None:
+            return None
+        try:
+            return json.loads(entry.value)
+        except Exception as e:
+            log_warning(f"Error reading tool cache entry: {e}")
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, function_name: Optional[str] = None) -> None:
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            log_debug(f"Result of {function_name} is not JSON serializable, skipping cache: {e}")
+            return
+        expires_at = time() + ttl if ttl is not None else None
+        self.set_entry(key, ToolCacheEntry(value=serialized, expires_at=expires_at), function_name=function_name)
+
+    def get_metrics(self, function_name: str) -> ToolCacheMetrics:
+        with self._metrics_lock:
+            if function_name not in self._metrics:
+                self._metrics[function_name] = ToolCacheMetrics()
+            return self._metrics[function_name]
+
+    def get_all_metrics(self) -> Dict[str, ToolCacheMetrics]:
+        with self._metrics_lock:
+            return dict(self._metrics)
+
+    def _record(self, function_name: str, event: str) -> None:
+        metrics = self.get_metrics(function_name)
+        with self._metrics_lock:
+            setattr(metrics, event, getattr(metrics, event) + 1)
+
+    def get_or_call(
+        self,
+        function_name: str,
+        arguments: Optional[Dict[str, Any]],
+        call: Callable[[], Any],
+        ttl: Optional[int] = None,
+        namespace: Optional[str] = None,
+    ) -> Tuple[Any, bool]:
+        """Return the cached result of a function call, or run it exactly once across concurrent identical calls.
+
+        Returns:
+            Tuple[Any, bool]: The result and whether it came from the cache (or a concurrent identical call).
+        """
+        key = get_tool_cache_key(function_name, arguments, namespace)
+        cached = self.get(key)
+        if cached is not None:
+            self._record(function_name, "hits")
+            return cached, True
+
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if flight is None:
+                flight = _Flight()
+                self._flights[key] = flight
+
+        if not is_leader:
+            flight.done.wait()
+            if not flight.failed and is_cacheable_result(flight.result):
+                self._record(function_name, "coalesced")
+                return flight.result, True
+            # The shared call failed or returned a result that can not be shared, run the function ourselves
+            result = call()
+            self._record(function_name, "misses")
+            return result, False
+
+        try:
+            # Another call may have stored the result between the cache lookup and becoming the leader
+            cached = self.get(key)
+            if cached is not None:
+                flight.result = cached
+                self._record(function_name, "hits")
+                return cached, True
+
+            result = call()
+            flight.result = result
+            if is_cacheable_result(result):
+                self.set(key, result, ttl=ttl, function_name=function_name)
+            self._record(function_name, "misses")
+            return result, False
+        except BaseException:
+            flight.failed = True
+            raise
+        finally:
+            with self._flights_lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    async def aget_or_call(
+        self,
+        function_name: str,
+        arguments: Optional[Dict[str, Any]],
+        call: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        namespace: Optional[str] = None,
+    ) -> Tuple[Any, bool]:
+        """Async version of get_or_call. Concurrent identical calls on the same event loop share one execution."""
+        key = get_tool_cache_key(function_name, arguments, namespace)
+        cached = self.get(key)
+        if cached is not None:
+            self._record(function_name, "hits")
+            return cached, True
+
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        flight = self._async_flights.get(flight_key)
+        if flight is not None:
+            try:
+                result = await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                # Only swallow the cancellation of the shared call, not of this call
+                if not flight.cancelled():
+                    raise
+                result = None
+            except Exception:
+                result = None
+            if is_cacheable_result(result):
+                self._record(function_name, "coalesced")
+                return result, True
+            result = await call()
+            self._record(function_name, "misses")
+            return result, False
+
+        flight = loop.create_future()
+        self._async_flights[flight_key] = flight
+        try:
+            result = await call()
+            if is_cacheable_result(result):
+                self.set(key, result, ttl=ttl, function_name=function_name)
+            self._record(function_name, "misses")
+            flight.set_result(result)
+            return result, False
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            # Mark the exception as retrieved, waiters run the function themselves
+            flight.exception()
+            raise
+        finally:
+            self._async_flights.pop(flight_key, None)
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+from agno.tools.cache.base import ToolCache, ToolCacheEntry
+
+
+class InMemoryToolCache(ToolCache):
+    def __init__(self, max_entries: int = 1024, max_size_bytes: int = 64 * 1024 * 1024):
+        """
+        A process-local LRU cache for tool results.
+
+        Args:
+            max_entries: The maximum number of entries kept in memory.
+            max_size_bytes: The maximum total size of the serialized results kept in memory.
+        """
+        super().__init__()
+        self.max_entries: int = max_entries
+        self.max_size_bytes: int = max_size_bytes
+        self._entries: "OrderedDict[str, ToolCacheEntry]" = OrderedDict()
+        self._size_bytes: int = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def get_entry(self, key: str) -> Optional[ToolCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.is_expired:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set_entry(self, key: str, entry: ToolCacheEntry, function_name: Optional[str] = None) -> None:
+        # Results larger than the whole cache are never stored
+        if entry.size > self.max_size_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._size_bytes += entry.size
+            while self._entries and (len(self._entries) > self.max_entries or self._size_bytes > self.max_size_bytes):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry.size
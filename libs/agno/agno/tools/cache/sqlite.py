@@ -0,0 +1,133 @@
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Optional
+
+from agno.tools.cache.base import ToolCache, ToolCacheEntry
+from agno.utils.log import log_debug, log_warning
+
+
+class SqliteToolCache(ToolCache):
+    def __init__(
+        self,
+        db_file: Optional[str] = None,
+        table_name: str = "tool_cache",
+        max_entries: int = 10_000,
+        max_size_bytes: int = 256 * 1024 * 1024,
+        timeout: float = 5.0,
+    ):
+        """
+        A tool result cache backed by a SQLite table, shared by every process using the same db_file.
+
+        Entries are evicted least recently used first when max_entries or max_size_bytes is exceeded.
+
+        Args:
+            db_file: The database file to use. Creates an in-memory database if not provided.
+            table_name: The name of the table to store results in.
+            max_entries: The maximum number of entries in the table.
+            max_size_bytes: The maximum total size of the serialized results in the table.
+            timeout: Seconds to wait for a lock held by another process.
+        """
+        super().__init__()
+        self.db_file: Optional[str] = db_file
+        self.table_name: str = table_name
+        self.max_entries: int = max_entries
+        self.max_size_bytes: int = max_size_bytes
+
+        if db_file is not None:
+            db_path = Path(db_file).resolve()
+            # Ensure the directory exists
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            database = str(db_path)
+        else:
+            database = ":memory:"
+
+        self._lock = Lock()
+        self._connection = sqlite3.connect(database, timeout=timeout, check_same_thread=False, isolation_level=None)
+        if db_file is not None:
+            # WAL lets readers in other processes proceed while one process writes
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self.create()
+
+    def create(self) -> None:
+        with self._lock:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+                "key TEXT PRIMARY KEY, "
+                "function_name TEXT, "
+                "value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "expires_at REAL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_accessed_at ON {self.table_name} (accessed_at)"
+            )
+
+    def get_entry(self, key: str) -> Optional[ToolCacheEntry]:
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    f"SELECT value, expires_at FROM {self.table_name} WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                entry = ToolCacheEntry(value=row[0], expires_at=row[1])
+                if entry.is_expired:
+                    self._connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+                    return None
+                self._connection.execute(f"UPDATE {self.table_name} SET accessed_at = ? WHERE key = ?", (time(), key))
+                return entry
+        except sqlite3.Error as e:
+            log_warning(f"Error reading tool cache: {e}")
+            return None
+
+    def set_entry(self, key: str, entry: ToolCacheEntry, function_name: Optional[str] = None) -> None:
+        # Results larger than the whole cache are never stored
+        if entry.size > self.max_size_bytes:
+            return
+        try:
+            with self._lock:
+                self._connection.execute(
+                    f"INSERT OR REPLACE INTO {self.table_name} "
+                    "(key, function_name, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, function_name, entry.value, entry.size, entry.expires_at, time()),
+                )
+                self._evict()
+        except sqlite3.Error as e:
+            log_warning(f"Error writing tool cache: {e}")
+
+    def _evict(self) -> None:
+        now = time()
+        self._connection.execute(
+            f"DELETE FROM {self.table_name} WHERE expires_at IS NOT NULL AND expires_at < ?", (now,)
+        )
+        num_entries, total_size = self._connection.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table_name}"
+        ).fetchone()
+        if num_entries <= self.max_entries and total_size <= self.max_size_bytes:
+            return
+
+        # Walk entries from least recently used and drop them until both limits are met
+        keys_to_delete = []
+        for key, size in self._connection.execute(f"SELECT key, size FROM {self.table_name} ORDER BY accessed_at ASC"):
+            if num_entries <= self.max_entries and total_size <= self.max_size_bytes:
+                break
+            keys_to_delete.append((key,))
+            num_entries -= 1
+            total_size -= size
+        self._connection.executemany(f"DELETE FROM {self.table_name} WHERE key = ?", keys_to_delete)
+        log_debug(f"Evicted {len(keys_to_delete)} entries from the tool cache")
+
+    def delete(self, key: str) -> None:
+        try:
+            with self._lock:
+                self._connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            log_warning(f"Error deleting from tool cache: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute(f"DELETE FROM {self.table_name}")
@@ -0,0 +1,66 @@
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional
+
+from agno.tools.cache.base import ToolCache, ToolCacheEntry
+from agno.tools.cache.memory import InMemoryToolCache
+from agno.tools.cache.sqlite import SqliteToolCache
+
+
+class TieredToolCache(ToolCache):
+    def __init__(self, memory: Optional[InMemoryToolCache] = None, shared: Optional[ToolCache] = None):
+        """
+        A two-tier tool result cache: an in-process LRU in front of a shared cache (e.g. SqliteToolCache).
+
+        Hits in the shared tier are promoted to the in-process tier.
+
+        Args:
+            memory: The in-process tier. Defaults to an InMemoryToolCache with default limits.
+            shared: The shared tier. If not provided, only the in-process tier is used.
+        """
+        super().__init__()
+        self.memory: InMemoryToolCache = memory or InMemoryToolCache()
+        self.shared: Optional[ToolCache] = shared
+
+    def get_entry(self, key: str) -> Optional[ToolCacheEntry]:
+        entry = self.memory.get_entry(key)
+        if entry is not None:
+            return entry
+        if self.shared is not None:
+            entry = self.shared.get_entry(key)
+            if entry is not None:
+                self.memory.set_entry(key, entry)
+        return entry
+
+    def set_entry(self, key: str, entry: ToolCacheEntry, function_name: Optional[str] = None) -> None:
+        self.memory.set_entry(key, entry, function_name=function_name)
+        if self.shared is not None:
+            self.shared.set_entry(key, entry, function_name=function_name)
+
+    def delete(self, key: str) -> None:
+        self.memory.delete(key)
+        if self.shared is not None:
+            self.shared.delete(key)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.shared is not None:
+            self.shared.clear()
+
+
+_default_tool_caches: Dict[Optional[str], ToolCache] = {}
+_default_tool_caches_lock = Lock()
+
+
+def get_default_tool_cache(cache_dir: Optional[str] = None) -> ToolCache:
+    """Return the process-wide tool cache for a cache directory, creating it on first use.
+
+    Without a cache_dir results are only kept in memory. With a cache_dir the cache keeps recent results
+    in memory and shares all results across processes through a SQLite database at `<cache_dir>/tool_cache.db`.
+    """
+    db_file = str((Path(cache_dir) / "tool_cache.db").resolve()) if cache_dir is not None else None
+    with _default_tool_caches_lock:
+        if db_file not in _default_tool_caches:
+            shared = SqliteToolCache(db_file=db_file) if db_file is not None else None
+            _default_tool_caches[db_file] = TieredToolCache(shared=shared)
+        return _default_tool_caches[db_file]
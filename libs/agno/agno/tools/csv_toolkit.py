@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, log_info, logger
+from agno.utils.query_result import QueryResultRenderer
 
 
 class CsvTools(Toolkit):
@@ -18,6 +19,11 @@ class CsvTools(Toolkit):
         read_column_names: bool = True,
         duckdb_connection: Optional[Any] = None,
         duckdb_kwargs: Optional[Dict[str, Any]] = None,
+        max_result_rows: Optional[int] = 100,
+        max_result_bytes: Optional[int] = 20_000,
+        max_result_tokens: Optional[int] = None,
+        result_format: str = "csv",
+        spill_dir: Optional[str] = None,
         **kwargs,
     ):
         super().__init__(name="csv_tools", **kwargs)
@@ -34,6 +40,14 @@ class CsvTools(Toolkit):
         self.row_limit = row_limit
         self.duckdb_connection: Optional[Any] = duckdb_connection
         self.duckdb_kwargs: Optional[Dict[str, Any]] = duckdb_kwargs
+        # Caps the query results sent to the model, truncated results are saved to Parquet in spill_dir
+        self.result_renderer = QueryResultRenderer(
+            max_rows=max_result_rows,
+            max_bytes=max_result_bytes,
+            max_tokens=max_result_tokens,
+            output_format=result_format,
+            spill_dir=spill_dir,
+        )
 
         if read_csvs:
             self.register(self.read_csv_file)
@@ -157,21 +171,10 @@ class CsvTools(Toolkit):
             # -*- Run the SQL Query
             log_info(f"Running query: {formatted_sql}")
             query_result = con.sql(formatted_sql)
-            result_output = "No output"
-            if query_result is not None:
-                try:
-                    results_as_python_objects = query_result.fetchall()
-                    result_rows = []
-                    for row in results_as_python_objects:
-                        if len(row) == 1:
-                            result_rows.append(str(row[0]))
-                        else:
-                            result_rows.append(",".join(str(x) for x in row))
-
-                    result_data = "\n".join(result_rows)
-                    result_output = ",".join(query_result.columns) + "\n" + result_data
-                except AttributeError:
-                    result_output = str(query_result)
+            try:
+                result_output = self.result_renderer.render_duckdb(query_result, con)
+            except AttributeError:
+                result_output = str(query_result)
 
             log_debug(f"Query result: {result_output}")
             return result_output
@@ -1,6 +1,7 @@
 from functools import update_wrapper, wraps
 from typing import Any, Callable, Dict, Optional, TypeVar, Union, overload
 
+from agno.tools.cache.base import ToolCache
 from agno.tools.function import Function
 from agno.utils.log import logger
 
@@ -27,6 +28,7 @@ def tool(
     cache_results: bool = False,
     cache_dir: Optional[str] = None,
     cache_ttl: int = 3600,
+    cache: Optional[ToolCache] = None,
 ) -> Callable[[F], Function]: ...
 
 
@@ -47,8 +49,9 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
         pre_hook: Optional[Callable] - Hook that runs before the function is executed.
         post_hook: Optional[Callable] - Hook that runs after the function is executed.
         cache_results: bool - If True, enable caching of function results
-        cache_dir: Optional[str] - Directory to store cache files
+        cache_dir: Optional[str] - Directory of a SQLite database sharing cached results, by default only in memory
         cache_ttl: int - Time-to-live for cached results in seconds
+        cache: Optional[ToolCache] - Cache backend for results, defaults to the shared cache for cache_dir
 
     Returns:
         Union[Function, Callable[[F], Function]]: Decorated function or decorator
@@ -80,6 +83,7 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
             "cache_results",
             "cache_dir",
             "cache_ttl",
+            "cache",
         }
     )
 
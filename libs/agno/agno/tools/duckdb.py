@@ -2,6 +2,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, log_info, logger
+from agno.utils.query_result import QueryResultRenderer
 
 try:
     import duckdb
@@ -22,6 +23,11 @@ class DuckDbTools(Toolkit):
         create_tables: bool = True,
         summarize_tables: bool = True,
         export_tables: bool = False,
+        max_result_rows: Optional[int] = 100,
+        max_result_bytes: Optional[int] = 20_000,
+        max_result_tokens: Optional[int] = None,
+        result_format: str = "csv",
+        spill_dir: Optional[str] = None,
         **kwargs,
     ):
         super().__init__(name="duckdb_tools", **kwargs)
@@ -31,6 +37,14 @@ class DuckDbTools(Toolkit):
         self.config: Optional[dict] = config
         self._connection: Optional[duckdb.DuckDBPyConnection] = connection
         self.init_commands: Optional[List] = init_commands
+        # Caps the query results sent to the model, truncated results are saved to Parquet in spill_dir
+        self.result_renderer = QueryResultRenderer(
+            max_rows=max_result_rows,
+            max_bytes=max_result_bytes,
+            max_tokens=max_result_tokens,
+            output_format=result_format,
+            spill_dir=spill_dir,
+        )
 
         self.register(self.show_tables)
         self.register(self.describe_table)
@@ -110,6 +124,7 @@ class DuckDbTools(Toolkit):
 
     def run_query(self, query: str) -> str:
         """Function that runs a query and returns the result.
+        Large results are truncated, use filters, aggregates or a LIMIT to get the rows you need.
 
         :param query: SQL query to run
         :return: Result of the query
@@ -125,21 +140,10 @@ class DuckDbTools(Toolkit):
             log_info(f"Running: {formatted_sql}")
 
             query_result = self.connection.sql(formatted_sql)
-            result_output = "No output"
-            if query_result is not None:
-                try:
-                    results_as_python_objects = query_result.fetchall()
-                    result_rows = []
-                    for row in results_as_python_objects:
-                        if len(row) == 1:
-                            result_rows.append(str(row[0]))
-                        else:
-                            result_rows.append(",".join(str(x) for x in row))
-
-                    result_data = "\n".join(result_rows)
-                    result_output = ",".join(query_result.columns) + "\n" + result_data
-                except AttributeError:
-                    result_output = str(query_result)
+            try:
+                result_output = self.result_renderer.render_duckdb(query_result, self.connection)
+            except AttributeError:
+                result_output = str(query_result)
 
             log_debug(f"Query result: {result_output}")
             return result_output
@@ -1,10 +1,58 @@
+import hashlib
+import json
+import random
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from os import getenv
-from typing import Any, Dict, Optional
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
 
-import requests
+import httpx
 
 from agno.tools import Toolkit
-from agno.utils.log import log_error
+from agno.utils.log import log_debug, log_error, log_warning
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+RESPONSE_CACHE_MAX_ENTRIES = 512
+
+# Connection pools shared by all toolkit instances, so agent copies reuse open connections
+_client: Optional[httpx.Client] = None
+_client_lock = Lock()
+
+
+@dataclass
+class _CachedResponse:
+    text: str
+    etag: Optional[str]
+    fetched_at: float
+
+
+_response_cache: "OrderedDict[str, _CachedResponse]" = OrderedDict()
+_response_cache_lock = Lock()
+
+
+def _get_client() -> httpx.Client:
+    global _client
+    with _client_lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(limits=httpx.Limits(max_connections=20, max_keepalive_connections=10))
+        return _client
+
+
+def close_client() -> None:
+    """Close the shared connection pool, a new one is created on the next request."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def clear_response_cache() -> None:
+    with _response_cache_lock:
+        _response_cache.clear()
 
 
 class FinancialDatasetsTools(Toolkit):
@@ -19,6 +67,11 @@ class FinancialDatasetsTools(Toolkit):
         enable_sec_filings: bool = True,
         enable_crypto: bool = True,
         enable_search: bool = True,
+        response_cache_ttl: Optional[float] = 0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        timeout: float = 30.0,
         **kwargs,
     ):
         """
@@ -34,6 +87,13 @@ class FinancialDatasetsTools(Toolkit):
             enable_sec_filings: Enable SEC filings related functions
             enable_crypto: Enable cryptocurrency related functions
             enable_search: Enable search related functions
+            response_cache_ttl: Seconds a response is served from the cache without asking the API. With 0, cached
+                responses are always revalidated with their ETag, so prices and news are never stale.
+                None disables caching.
+            max_retries: Retries for connection errors, rate limits (429) and server errors (5xx)
+            backoff_factor: Base delay in seconds for exponential backoff between retries
+            max_backoff: Upper bound in seconds for a single retry delay, including Retry-After
+            timeout: Request timeout in seconds
         """
         super().__init__(name="financial_datasets_tools", **kwargs)
 
@@ -44,6 +104,11 @@ class FinancialDatasetsTools(Toolkit):
             )
 
         self.base_url = "https://api.financialdatasets.ai"
+        self.response_cache_ttl = response_cache_ttl
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.timeout = timeout
 
         # Register functions based on feature flags
         if enable_financial_statements:
@@ -52,6 +117,7 @@ class FinancialDatasetsTools(Toolkit):
             self.register(self.get_cash_flow_statements)
             self.register(self.get_segmented_financials)
             self.register(self.get_financial_metrics)
+            self.register(self.get_financial_bundle)
 
         if enable_company_info:
             self.register(self.get_company_info)
@@ -76,6 +142,68 @@ class FinancialDatasetsTools(Toolkit):
         if enable_search:
             self.register(self.search_tickers)
 
+    def _prepare_request(
+        self, endpoint: str, params: Dict[str, Any]
+    ) -> Tuple[str, Dict[str, Any], Dict[str, str], str, Optional[_CachedResponse]]:
+        """Build the url, params, headers and cache key for a request and look up any cached response."""
+        headers = {"X-API-KEY": self.api_key or ""}
+        url = f"{self.base_url}/{endpoint}"
+        params = {k: v for k, v in params.items() if v is not None}
+        # Responses can depend on the API key (plan, tenant), so the cache is scoped to a hash of it
+        api_key_hash = hashlib.sha256((self.api_key or "").encode()).hexdigest()[:16]
+        cache_key = f"{api_key_hash}:{url}?{json.dumps(params, sort_keys=True, default=str)}"
+
+        cached: Optional[_CachedResponse] = None
+        if self.response_cache_ttl is not None:
+            with _response_cache_lock:
+                cached = _response_cache.get(cache_key)
+                if cached is not None:
+                    _response_cache.move_to_end(cache_key)
+            # Revalidate a stale response with its ETag, so an unchanged resource costs a 304 instead of the full body
+            if cached is not None and cached.etag is not None:
+                headers["If-None-Match"] = cached.etag
+        return url, params, headers, cache_key, cached
+
+    def _is_fresh(self, cached: Optional[_CachedResponse]) -> bool:
+        if cached is None or not self.response_cache_ttl:
+            return False
+        return time.time() - cached.fetched_at <= self.response_cache_ttl
+
+    def _handle_response(self, response: httpx.Response, cache_key: str, cached: Optional[_CachedResponse]) -> str:
+        if response.status_code == 304 and cached is not None:
+            log_debug(f"Not modified: {response.request.url}")
+            text = cached.text
+        else:
+            response.raise_for_status()
+            text = response.text
+
+        etag = response.headers.get("etag") or (cached.etag if cached else None)
+        # Without a TTL only responses that can be revalidated are worth keeping
+        if self.response_cache_ttl is not None and (self.response_cache_ttl > 0 or etag is not None):
+            with _response_cache_lock:
+                _response_cache[cache_key] = _CachedResponse(text=text, etag=etag, fetched_at=time.time())
+                _response_cache.move_to_end(cache_key)
+                while len(_response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+                    _response_cache.popitem(last=False)
+        return text
+
+    def _get_retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Honor the Retry-After header on rate limits, otherwise back off exponentially with jitter."""
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after is not None:
+                try:
+                    return min(float(retry_after), self.max_backoff)
+                except ValueError:
+                    pass
+        delay = self.backoff_factor * (2**attempt)
+        return min(delay + random.uniform(0, delay), self.max_backoff)
+
+    def _should_retry(self, attempt: int, response: Optional[httpx.Response] = None) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        return response is None or response.status_code in RETRY_STATUS_CODES
+
     def _make_request(self, endpoint: str, params: Dict[str, Any]) -> str:
         """
         Makes a request to the Financial Datasets API.
@@ -91,16 +219,72 @@ class FinancialDatasetsTools(Toolkit):
             log_error("No API key provided. Cannot make request.")
             return "API key not set"
 
-        headers = {"X-API-KEY": self.api_key}
-        url = f"{self.base_url}/{endpoint}"
+        url, params, headers, cache_key, cached = self._prepare_request(endpoint, params)
+        if self._is_fresh(cached):
+            log_debug(f"Using cached response for {cache_key}")
+            return cached.text  # type: ignore
+
+        attempt = 0
+        while True:
+            response: Optional[httpx.Response] = None
+            try:
+                response = _get_client().get(url, headers=headers, params=params, timeout=self.timeout)
+                if not self._should_retry(attempt, response):
+                    return self._handle_response(response, cache_key, cached)
+            except httpx.TransportError as e:
+                if not self._should_retry(attempt):
+                    log_error(f"Error making request to {url}: {str(e)}")
+                    return f"Error making request to {url}: {str(e)}"
+            except httpx.HTTPError as e:
+                log_error(f"Error making request to {url}: {str(e)}")
+                return f"Error making request to {url}: {str(e)}"
+
+            delay = self._get_retry_delay(attempt, response)
+            log_warning(f"Request to {url} failed, retrying in {delay:.2f}s")
+            time.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _bundle_statements(ticker: str, period: str, limit: int) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        params = {"ticker": ticker, "period": period, "limit": limit}
+        return {
+            "income_statements": ("financials/income-statements", params),
+            "balance_sheets": ("financials/balance-sheets", params),
+            "cash_flow_statements": ("financials/cash-flow-statements", params),
+        }
+
+    @staticmethod
+    def _merge_bundle(results: Dict[str, str]) -> str:
+        bundle: Dict[str, Any] = {}
+        for name, text in results.items():
+            try:
+                data = json.loads(text)
+                # Each endpoint wraps its statements in a key named after the statement type
+                bundle[name] = data.get(name, data) if isinstance(data, dict) else data
+            except ValueError:
+                bundle[name] = text
+        return json.dumps(bundle)
+
+    def get_financial_bundle(self, ticker: str, period: str = "annual", limit: int = 10) -> str:
+        """
+        Get income statements, balance sheets and cash flow statements for a ticker in one call.
+        Prefer this over calling the individual statement functions when more than one is needed.
 
-        try:
-            response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            return response.text
-        except requests.exceptions.RequestException as e:
-            log_error(f"Error making request to {url}: {str(e)}")
-            return f"Error making request to {url}: {str(e)}"
+        Args:
+            ticker: Stock ticker symbol
+            period: 'annual', 'quarterly', or 'ttm'
+            limit: Number of statements of each type to return
+
+        Returns:
+            JSON object with income_statements, balance_sheets and cash_flow_statements
+        """
+        statements = self._bundle_statements(ticker, period, limit)
+        with ThreadPoolExecutor(max_workers=len(statements)) as executor:
+            futures = {
+                name: executor.submit(self._make_request, endpoint, params)
+                for name, (endpoint, params) in statements.items()
+            }
+            return self._merge_bundle({name: future.result() for name, future in futures.items()})
 
     # Financial Statements
     def get_income_statements(self, ticker: str, period: str = "annual", limit: int = 10) -> str:
@@ -1,14 +1,25 @@
+from collections import OrderedDict
+from copy import deepcopy
 from functools import partial
-from typing import Any, Callable, Dict, Optional, Type, TypeVar, get_type_hints
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar, get_type_hints
 
 from docstring_parser import parse
-from pydantic import BaseModel, Field, validate_call
+from pydantic import BaseModel, ConfigDict, Field, validate_call
 
 from agno.exceptions import AgentRunException
-from agno.utils.log import log_debug, log_error, log_exception, log_warning
+from agno.tools.cache.base import ToolCache
+from agno.utils.log import log_debug, log_exception, log_warning
 
 T = TypeVar("T")
 
+# Process-wide cache of processed tool definitions.
+# Agents are deep-copied per request (e.g. in the playground), which would otherwise repeat the signature
+# inspection, docstring parsing, JSON schema generation and validate_call wrapping for every tool on every run.
+SCHEMA_CACHE_MAX_SIZE: int = 4096
+_schema_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+_schema_cache_lock = Lock()
+
 
 def get_entrypoint_docstring(entrypoint: Callable) -> str:
     from inspect import getdoc
@@ -32,9 +43,164 @@ def get_entrypoint_docstring(entrypoint: Callable) -> str:
     return "\n".join(lines)
 
 
+def get_schema_cache_key(
+    c: Callable, strict: bool = False, sanitize_arguments: bool = True
+) -> Optional[Tuple[Any, ...]]:
+    """Returns the key for a callable in the schema cache, or None if the callable can not be cached.
+
+    The key is built from the code objects along the __wrapped__ chain, so bound methods of deep-copied
+    toolkits and closures created per run (e.g. transfer functions) share a single entry. The name, docstring,
+    annotations and defaults are part of the key, as closures of the same code can set their own.
+    """
+    from inspect import ismethod
+
+    parts = []
+    func: Any = c
+    while func is not None:
+        if ismethod(func):
+            func = func.__func__
+        code = getattr(func, "__code__", None)
+        if code is None:
+            # partials and callable objects are not cached
+            return None
+        parts.append(
+            (
+                code,
+                getattr(func, "__name__", None),
+                getattr(func, "__doc__", None),
+                tuple((getattr(func, "__annotations__", None) or {}).items()),
+                getattr(func, "__defaults__", None),
+                tuple((getattr(func, "__kwdefaults__", None) or {}).items()),
+            )
+        )
+        func = getattr(func, "__wrapped__", None)
+    key = (tuple(parts), strict, sanitize_arguments)
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable defaults or annotations
+        return None
+    return key
+
+
+def clear_schema_cache() -> None:
+    """Clear the process-wide tool schema cache."""
+    with _schema_cache_lock:
+        _schema_cache.clear()
+
+
+def _get_schema_from_cache(key: Optional[Tuple[Any, ...]]) -> Optional[Dict[str, Any]]:
+    if key is None:
+        return None
+    with _schema_cache_lock:
+        entry = _schema_cache.get(key)
+        if entry is not None:
+            _schema_cache.move_to_end(key)
+        return entry
+
+
+def _add_schema_to_cache(key: Optional[Tuple[Any, ...]], entry: Dict[str, Any]) -> None:
+    if key is None:
+        return
+    with _schema_cache_lock:
+        _schema_cache[key] = entry
+        _schema_cache.move_to_end(key)
+        while len(_schema_cache) > SCHEMA_CACHE_MAX_SIZE:
+            _schema_cache.popitem(last=False)
+
+
+def _get_entrypoint_parameters(entrypoint: Callable, name: str, strict: bool = False) -> Dict[str, Any]:
+    """Build the JSON schema for the parameters of an entrypoint from its signature and docstring."""
+    from inspect import getdoc, signature
+
+    from agno.utils.json_schema import get_json_schema
+
+    parameters = {"type": "object", "properties": {}, "required": []}
+    try:
+        sig = signature(entrypoint)
+        type_hints = get_type_hints(entrypoint)
+
+        # If function has an the agent argument, remove the agent parameter from the type hints
+        if "agent" in sig.parameters:
+            del type_hints["agent"]
+        # log_info(f"Type hints for {name}: {type_hints}")
+
+        # Filter out return type and only process parameters
+        param_type_hints = {
+            name: type_hints.get(name) for name in sig.parameters if name != "return" and name != "agent"
+        }
+
+        # Parse docstring for parameters
+        param_descriptions = {}
+        if docstring := getdoc(entrypoint):
+            parsed_doc = parse(docstring)
+            param_docs = parsed_doc.params
+
+            if param_docs is not None:
+                for param in param_docs:
+                    param_name = param.arg_name
+                    param_type = param.type_name
+
+                    # TODO: We should use type hints first, then map param types in docs to json schema types.
+                    # This is temporary to not lose information
+                    param_descriptions[param_name] = f"({param_type}) {param.description}"
+
+        # Get JSON schema for parameters only
+        parameters = get_json_schema(type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict)
+
+        # If strict=True mark all fields as required
+        # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
+        if strict:
+            parameters["required"] = [name for name in parameters["properties"] if name != "agent"]
+        else:
+            # Mark a field as required if it has no default value
+            parameters["required"] = [
+                name
+                for name, param in sig.parameters.items()
+                if param.default == param.empty and name != "self" and name != "agent"
+            ]
+
+        # log_debug(f"JSON schema for {name}: {parameters}")
+    except Exception as e:
+        log_warning(f"Could not parse args for {name}: {e}", exc_info=True)
+    return parameters
+
+
+def _get_validated_entrypoint(entrypoint: Callable, entry: Dict[str, Any]) -> Callable:
+    """Wrap an entrypoint with validate_call, reusing the wrapper stored in a schema cache entry when possible."""
+    from inspect import ismethod
+    from types import MethodType
+    from weakref import ref
+
+    # Bound methods are validated unbound, so the wrapper can be re-bound to copies of the same toolkit
+    func = entrypoint.__func__ if ismethod(entrypoint) else entrypoint
+
+    # The function and its wrapper are stored and read as one tuple, as other closures of the same code
+    # can replace them concurrently
+    validated_func = None
+    validated = entry.get("validated")
+    if validated is not None:
+        func_ref, cached_validated_func = validated
+        if func_ref() is func:
+            validated_func = cached_validated_func
+
+    if validated_func is None:
+        validated_func = validate_call(func, config=dict(arbitrary_types_allowed=True))  # type: ignore
+        try:
+            entry["validated"] = (ref(func), validated_func)
+        except TypeError:
+            pass
+
+    if ismethod(entrypoint):
+        return MethodType(validated_func, entrypoint.__self__)
+    return validated_func
+
+
 class Function(BaseModel):
     """Model for storing functions that can be called by an agent."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     # The name of the function to be called.
     # Must be a-z, A-Z, 0-9, or contain underscores and dashes, with a maximum length of 64.
     name: str
@@ -69,6 +235,10 @@ class Function(BaseModel):
     cache_results: bool = False
     cache_dir: Optional[str] = None
     cache_ttl: int = 3600
+    # The cache backend to use. Defaults to the process-wide cache for cache_dir.
+    cache: Optional[ToolCache] = None
+    # Scopes the cached results, e.g. to a toolkit instance. Defaults to the module and name of the entrypoint.
+    cache_namespace: Optional[str] = None
 
     # --*-- FOR INTERNAL USE ONLY --*--
     # The agent that the function is associated with
@@ -79,77 +249,34 @@ class Function(BaseModel):
 
     @classmethod
     def from_callable(cls, c: Callable, strict: bool = False) -> "Function":
-        from inspect import getdoc, isasyncgenfunction, signature
-
-        from agno.utils.json_schema import get_json_schema
+        from inspect import isasyncgenfunction
 
         function_name = c.__name__
-        parameters = {"type": "object", "properties": {}, "required": []}
-        try:
-            sig = signature(c)
-            type_hints = get_type_hints(c)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            # log_info(f"Type hints for {function_name}: {type_hints}")
 
-            # Filter out return type and only process parameters
-            param_type_hints = {
-                name: type_hints.get(name) for name in sig.parameters if name != "return" and name != "agent"
+        cache_key = get_schema_cache_key(c, strict=strict)
+        entry = _get_schema_from_cache(cache_key)
+        if entry is None:
+            entry = {
+                "description": get_entrypoint_docstring(entrypoint=c),
+                "parameters": _get_entrypoint_parameters(c, name=function_name, strict=strict),
             }
-
-            # Parse docstring for parameters
-            param_descriptions = {}
-            if docstring := getdoc(c):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-
-                        param_descriptions[param_name] = f"({param_type}) {param.description}"
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
-
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [name for name in parameters["properties"] if name != "agent"]
-            else:
-                # Mark a field as required if it has no default value
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name != "agent"
-                ]
-
-            # log_debug(f"JSON schema for {function_name}: {parameters}")
-        except Exception as e:
-            log_warning(f"Could not parse args for {function_name}: {e}", exc_info=True)
+            _add_schema_to_cache(cache_key, entry)
 
         # Don't wrap async generator with validate_call
         if isasyncgenfunction(c):
             entrypoint = c
         else:
-            entrypoint = validate_call(c, config=dict(arbitrary_types_allowed=True))  # type: ignore
+            entrypoint = _get_validated_entrypoint(c, entry)
         return cls(
             name=function_name,
-            description=get_entrypoint_docstring(entrypoint=c),
-            parameters=parameters,
+            description=entry["description"],
+            parameters=deepcopy(entry["parameters"]),
             entrypoint=entrypoint,
         )
 
     def process_entrypoint(self, strict: bool = False):
         """Process the entrypoint and make it ready for use by an agent."""
-        from inspect import getdoc, isasyncgenfunction, signature
-
-        from agno.utils.json_schema import get_json_schema
+        from inspect import isasyncgenfunction
 
         if self.skip_entrypoint_processing:
             return
@@ -157,71 +284,28 @@ class Function(BaseModel):
         if self.entrypoint is None:
             return
 
-        parameters = {"type": "object", "properties": {}, "required": []}
-
         params_set_by_user = False
         # If the user set the parameters (i.e. they are different from the default), we should keep them
-        if self.parameters != parameters:
+        if self.parameters != {"type": "object", "properties": {}, "required": []}:
             params_set_by_user = True
 
-        try:
-            sig = signature(self.entrypoint)
-            type_hints = get_type_hints(self.entrypoint)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            # log_info(f"Type hints for {self.name}: {type_hints}")
-
-            # Filter out return type and only process parameters
-            param_type_hints = {
-                name: type_hints.get(name) for name in sig.parameters if name != "return" and name != "agent"
+        cache_key = get_schema_cache_key(self.entrypoint, strict=strict, sanitize_arguments=self.sanitize_arguments)
+        entry = _get_schema_from_cache(cache_key)
+        if entry is None:
+            entry = {
+                "description": get_entrypoint_docstring(self.entrypoint),
+                "parameters": _get_entrypoint_parameters(self.entrypoint, name=self.name, strict=strict),
             }
+            _add_schema_to_cache(cache_key, entry)
 
-            # Parse docstring for parameters
-            param_descriptions = {}
-            if docstring := getdoc(self.entrypoint):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-
-                        # TODO: We should use type hints first, then map param types in docs to json schema types.
-                        # This is temporary to not lose information
-                        param_descriptions[param_name] = f"({param_type}) {param.description}"
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
-
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [name for name in parameters["properties"] if name != "agent"]
-            else:
-                # Mark a field as required if it has no default value
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name != "agent"
-                ]
-
-            # log_debug(f"JSON schema for {self.name}: {parameters}")
-        except Exception as e:
-            log_warning(f"Could not parse args for {self.name}: {e}", exc_info=True)
-
-        self.description = self.description or get_entrypoint_docstring(self.entrypoint)
+        self.description = self.description or entry["description"]
         if not params_set_by_user:
-            self.parameters = parameters
+            self.parameters = deepcopy(entry["parameters"])
 
         try:
             # Don't wrap async generator with validate_call
             if not isasyncgenfunction(self.entrypoint):
-                self.entrypoint = validate_call(self.entrypoint, config=dict(arbitrary_types_allowed=True))  # type: ignore
+                self.entrypoint = _get_validated_entrypoint(self.entrypoint, entry)
         except Exception as e:
             log_warning(f"Failed to add validate decorator to entrypoint: {e}")
 
@@ -261,67 +345,21 @@ class Function(BaseModel):
             return json.dumps(function_info, indent=2)
         return None
 
-    def _get_cache_key(self, entrypoint_args: Dict[str, Any], call_args: Optional[Dict[str, Any]] = None) -> str:
-        """Generate a cache key based on function name and arguments."""
-        from hashlib import md5
-
-        copy_entrypoint_args = entrypoint_args.copy()
-        # Remove agent from entrypoint_args
-        if "agent" in copy_entrypoint_args:
-            del copy_entrypoint_args["agent"]
-        args_str = str(copy_entrypoint_args)
-
-        kwargs_str = str(sorted((call_args or {}).items()))
-        key_str = f"{self.name}:{args_str}:{kwargs_str}"
-        return md5(key_str.encode()).hexdigest()
+    def get_cache(self) -> ToolCache:
+        """Get the cache backend used for the results of this function."""
+        if self.cache is not None:
+            return self.cache
 
-    def _get_cache_file_path(self, cache_key: str) -> str:
-        """Get the full path for the cache file."""
-        from pathlib import Path
-        from tempfile import gettempdir
+        from agno.tools.cache.tiered import get_default_tool_cache
 
-        base_cache_dir = self.cache_dir or Path(gettempdir()) / "agno_cache"
-        func_cache_dir = Path(base_cache_dir) / "functions" / self.name
-        func_cache_dir.mkdir(parents=True, exist_ok=True)
-        return str(func_cache_dir / f"{cache_key}.json")
-
-    def _get_cached_result(self, cache_file: str) -> Optional[Any]:
-        """Retrieve cached result if valid."""
-        import json
-        from pathlib import Path
-        from time import time
+        return get_default_tool_cache(cache_dir=self.cache_dir)
 
-        cache_path = Path(cache_file)
-        if not cache_path.exists():
+    def get_cache_namespace(self) -> Optional[str]:
+        if self.cache_namespace is not None:
+            return self.cache_namespace
+        if self.entrypoint is None:
             return None
-
-        try:
-            with cache_path.open("r") as f:
-                cache_data = json.load(f)
-
-            timestamp = cache_data.get("timestamp", 0)
-            result = cache_data.get("result")
-
-            if time() - timestamp <= self.cache_ttl:
-                return result
-
-            # Remove expired entry
-            cache_path.unlink()
-        except Exception as e:
-            log_error(f"Error reading cache: {e}")
-
-        return None
-
-    def _save_to_cache(self, cache_file: str, result: Any):
-        """Save result to cache."""
-        import json
-        from time import time
-
-        try:
-            with open(cache_file, "w") as f:
-                json.dump({"timestamp": time(), "result": result}, f)
-        except Exception as e:
-            log_error(f"Error writing cache: {e}")
+        return f"{getattr(self.entrypoint, '__module__', None)}.{getattr(self.entrypoint, '__qualname__', self.name)}"
 
 
 class FunctionCall(BaseModel):
@@ -437,35 +475,28 @@ class FunctionCall(BaseModel):
 
         entrypoint_args = self._build_entrypoint_args()
 
-        # Check cache if enabled and not a generator function
-        if self.function.cache_results and not isgenerator(self.function.entrypoint):
-            cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
-
-            if cached_result is not None:
-                log_debug(f"Cache hit for: {self.get_call_str()}")
-                self.result = cached_result
-                function_call_success = True
-                return function_call_success
+        def call_entrypoint() -> Any:
+            if self.arguments == {} or self.arguments is None:
+                return self.function.entrypoint(**entrypoint_args)  # type: ignore
+            return self.function.entrypoint(**entrypoint_args, **self.arguments)  # type: ignore
 
         # Execute function
         try:
-            if self.arguments == {} or self.arguments is None:
-                result = self.function.entrypoint(**entrypoint_args)
+            # Use the cache if enabled and not a generator function. Generator results are never cached.
+            if self.function.cache_results and not isgenerator(self.function.entrypoint):
+                self.result, cache_hit = self.function.get_cache().get_or_call(
+                    function_name=self.function.name,
+                    arguments=self.arguments,
+                    call=call_entrypoint,
+                    ttl=self.function.cache_ttl,
+                    namespace=self.function.get_cache_namespace(),
+                )
+                if cache_hit:
+                    log_debug(f"Cache hit for: {self.get_call_str()}")
+                    function_call_success = True
+                    return function_call_success
             else:
-                result = self.function.entrypoint(**entrypoint_args, **self.arguments)
-
-            # Handle generator case
-            if isgenerator(result):
-                self.result = result  # Store generator directly, can't cache
-            else:
-                self.result = result
-                # Only cache non-generator results
-                if self.function.cache_results:
-                    cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                    cache_file = self.function._get_cache_file_path(cache_key)
-                    self.function._save_to_cache(cache_file, self.result)
+                self.result = call_entrypoint()
 
             function_call_success = True
 
@@ -548,39 +579,34 @@ class FunctionCall(BaseModel):
 
         entrypoint_args = self._build_entrypoint_args()
 
-        # Check cache if enabled and not a generator function
-        if self.function.cache_results and not (
-            isasyncgen(self.function.entrypoint) or isgenerator(self.function.entrypoint)
-        ):
-            cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
-            if cached_result is not None:
-                log_debug(f"Cache hit for: {self.get_call_str()}")
-                self.result = cached_result
-                function_call_success = True
-                return function_call_success
+        async def call_entrypoint() -> Any:
+            if self.arguments == {} or self.arguments is None:
+                result = self.function.entrypoint(**entrypoint_args)  # type: ignore
+            else:
+                result = self.function.entrypoint(**entrypoint_args, **self.arguments)  # type: ignore
+            if isasyncgen(self.function.entrypoint) or isasyncgenfunction(self.function.entrypoint):
+                return result  # Store async generator directly
+            return await result
 
         # Execute function
         try:
-            if self.arguments == {} or self.arguments is None:
-                result = self.function.entrypoint(**entrypoint_args)
-                if isasyncgen(self.function.entrypoint) or isasyncgenfunction(self.function.entrypoint):
-                    self.result = result  # Store async generator directly
-                else:
-                    self.result = await result
+            # Use the cache if enabled and not a generator function. Generator results are never cached.
+            if self.function.cache_results and not (
+                isasyncgen(self.function.entrypoint) or isgenerator(self.function.entrypoint)
+            ):
+                self.result, cache_hit = await self.function.get_cache().aget_or_call(
+                    function_name=self.function.name,
+                    arguments=self.arguments,
+                    call=call_entrypoint,
+                    ttl=self.function.cache_ttl,
+                    namespace=self.function.get_cache_namespace(),
+                )
+                if cache_hit:
+                    log_debug(f"Cache hit for: {self.get_call_str()}")
+                    function_call_success = True
+                    return function_call_success
             else:
-                result = self.function.entrypoint(**entrypoint_args, **self.arguments)
-                if isasyncgen(self.function.entrypoint) or isasyncgenfunction(self.function.entrypoint):
-                    self.result = result  # Store async generator directly
-                else:
-                    self.result = await result
-
-            # Only cache if not a generator
-            if self.function.cache_results and not (isgenerator(self.result) or isasyncgen(self.result)):
-                cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                cache_file = self.function._get_cache_file_path(cache_key)
-                self.function._save_to_cache(cache_file, self.result)
+                self.result = await call_entrypoint()
 
             function_call_success = True
 
@@ -1,12 +1,14 @@
+import asyncio
 from functools import partial
-from typing import Optional
+from time import monotonic
+from typing import Any, Dict, Optional
 from uuid import uuid4
 
 from agno.agent import Agent
 from agno.media import ImageArtifact
 from agno.tools import Toolkit
 from agno.tools.function import Function
-from agno.utils.log import log_debug, logger
+from agno.utils.log import log_debug, log_warning, logger
 
 try:
     from mcp import ClientSession, ListToolsResult, StdioServerParameters
@@ -22,9 +24,10 @@ class MCPTools(Toolkit):
     A toolkit for integrating Model Context Protocol (MCP) servers with Agno agents.
     This allows agents to access tools, resources, and prompts exposed by MCP servers.
 
-    Can be used in two ways:
+    Can be used in three ways:
     1. Direct initialization with a ClientSession
     2. As an async context manager with StdioServerParameters
+    3. With StdioServerParameters and an MCPSessionPool, to share a long-lived session across agent runs
     """
 
     def __init__(
@@ -34,6 +37,7 @@ class MCPTools(Toolkit):
         client=None,
         include_tools: Optional[list[str]] = None,
         exclude_tools: Optional[list[str]] = None,
+        pool: Optional["MCPSessionPool"] = None,
         **kwargs,
     ):
         """
@@ -45,11 +49,14 @@ class MCPTools(Toolkit):
             client: The underlying MCP client (optional, used to prevent garbage collection)
             include_tools: Optional list of tool names to include (if None, includes all)
             exclude_tools: Optional list of tool names to exclude (if None, excludes none)
+            pool: Optional MCPSessionPool that owns the session for server_params
         """
         super().__init__(name="MCPToolkit", **kwargs)
 
         if session is None and server_params is None:
             raise ValueError("Either session or server_params must be provided")
+        if pool is not None and server_params is None:
+            raise ValueError("server_params must be provided when using a pool")
 
         self.session: Optional[ClientSession] = session
         self.server_params: Optional[StdioServerParameters] = server_params
@@ -60,9 +67,16 @@ class MCPTools(Toolkit):
         self._initialized = False
         self.include_tools = include_tools
         self.exclude_tools = exclude_tools or []
+        self.pool: Optional[MCPSessionPool] = pool
 
     async def __aenter__(self) -> "MCPTools":
         """Enter the async context manager."""
+        if self.pool is not None:
+            # The pool owns the session, which stays open after the context manager exits
+            if not self._initialized:
+                await self.initialize()
+            return self
+
         if self.session is not None:
             # Already has a session, just initialize
             if not self._initialized:
@@ -102,14 +116,18 @@ class MCPTools(Toolkit):
             return
 
         try:
-            if self.session is None:
-                raise ValueError("Session is not available. Use as context manager or provide a session.")
+            if self.pool is not None:
+                # The pool starts the session if needed and caches the list of tools
+                self.available_tools = await self.pool.list_tools(self.server_params)  # type: ignore
+            else:
+                if self.session is None:
+                    raise ValueError("Session is not available. Use as context manager or provide a session.")
 
-            # Initialize the session if not already initialized
-            await self.session.initialize()
+                # Initialize the session if not already initialized
+                await self.session.initialize()
 
-            # Get the list of tools from the MCP server
-            self.available_tools = await self.session.list_tools()
+                # Get the list of tools from the MCP server
+                self.available_tools = await self.session.list_tools()
 
             # Filter tools based on include/exclude lists
             filtered_tools = []
@@ -129,7 +147,8 @@ class MCPTools(Toolkit):
                     f = Function(
                         name=tool.name,
                         description=tool.description,
-                        parameters=tool.inputSchema,
+                        # mcp>=2 renamed inputSchema to input_schema
+                        parameters=getattr(tool, "input_schema", None) or getattr(tool, "inputSchema", None),
                         entrypoint=entrypoint,
                         # Set skip_entrypoint_processing to True to avoid processing the entrypoint
                         skip_entrypoint_processing=True,
@@ -161,10 +180,14 @@ class MCPTools(Toolkit):
         async def call_tool(agent: Agent, tool_name: str, **kwargs) -> str:
             try:
                 log_debug(f"Calling MCP Tool '{tool_name}' with args: {kwargs}")
-                result: CallToolResult = await self.session.call_tool(tool_name, kwargs)  # type: ignore
+                result: CallToolResult
+                if self.pool is not None:
+                    result = await self.pool.call_tool(self.server_params, tool_name, kwargs)  # type: ignore
+                else:
+                    result = await self.session.call_tool(tool_name, kwargs)  # type: ignore
 
                 # Return an error if the tool call failed
-                if result.isError:
+                if getattr(result, "is_error", None) or getattr(result, "isError", None):
                     raise Exception(f"Error from MCP tool '{tool_name}': {result.content}")
 
                 # Process the result content
@@ -195,3 +218,202 @@ class MCPTools(Toolkit):
                 return f"Error: {e}"
 
         return partial(call_tool, tool_name=tool.name, tool_description=tool.description)
+
+
+class MCPConnection:
+    """A long-lived, initialized session with a stdio MCP server.
+
+    The server process and the ClientSession are owned by a background task, so the session outlives the
+    requests that use it. Concurrent calls are multiplexed over the session, up to max_concurrent_calls.
+    """
+
+    def __init__(self, server_params: StdioServerParameters, max_concurrent_calls: int = 16):
+        self.server_params: StdioServerParameters = server_params
+        self.session: Optional[ClientSession] = None
+        # Result of list_tools, fetched when the session starts
+        self.tools: Optional[ListToolsResult] = None
+        # monotonic() time of the last successful request
+        self.last_used_at: float = 0.0
+
+        self._semaphore = asyncio.Semaphore(max_concurrent_calls)
+        self._task: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._error: Optional[BaseException] = None
+
+    @property
+    def is_alive(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    async def _run(self) -> None:
+        try:
+            async with stdio_client(self.server_params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    self.tools = await session.list_tools()
+                    self.session = session
+                    self.last_used_at = monotonic()
+                    self._ready.set()
+                    await self._closing.wait()
+        except Exception as e:
+            self._error = e
+        finally:
+            self.session = None
+            self._ready.set()
+
+    async def start(self, timeout: Optional[float] = None) -> None:
+        """Start the server and initialize the session."""
+        log_debug(f"Starting MCP server: {self.server_params.command} {' '.join(self.server_params.args)}")
+        self._task = asyncio.create_task(self._run())
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except BaseException:
+            # Stop the server, nothing else holds the connection
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            raise
+        if self.session is None:
+            raise RuntimeError(f"Failed to start MCP server: {self._error}")
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Close the session and stop the server."""
+        self._closing.set()
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+
+    async def ping(self, timeout: float = 5.0) -> bool:
+        """Return True if the server answers a ping within timeout seconds."""
+        if not self.is_alive:
+            return False
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout)  # type: ignore
+            self.last_used_at = monotonic()
+            return True
+        except Exception as e:
+            log_debug(f"MCP server did not answer the ping: {e}")
+            return False
+
+    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> CallToolResult:
+        if self.session is None:
+            raise RuntimeError("MCP session is not running")
+        async with self._semaphore:
+            result = await self.session.call_tool(name, arguments)
+        self.last_used_at = monotonic()
+        return result
+
+
+class MCPSessionPool:
+    """Keeps one long-lived MCP session per server, shared by all agent runs.
+
+    Sessions start on first use and stay open until the pool is closed, so a run does not pay for the
+    server startup. The result of list_tools is cached per session.
+    A session unused for health_check_interval seconds is pinged before it is used again, and a session
+    that fails a ping, or fails a call and then a ping, is restarted.
+
+    The pool is bound to the event loop it is used on, e.g. the event loop of the server it runs in.
+
+    Args:
+        health_check_interval: Seconds a session may be idle before it is pinged on its next use.
+        ping_timeout: Seconds to wait for the answer to a ping.
+        start_timeout: Seconds to wait for a server to start.
+        max_concurrent_calls: Maximum number of tool calls in flight on a session.
+    """
+
+    def __init__(
+        self,
+        health_check_interval: Optional[float] = 30.0,
+        ping_timeout: float = 5.0,
+        start_timeout: Optional[float] = 30.0,
+        max_concurrent_calls: int = 16,
+    ):
+        self.health_check_interval: Optional[float] = health_check_interval
+        self.ping_timeout: float = ping_timeout
+        self.start_timeout: Optional[float] = start_timeout
+        self.max_concurrent_calls: int = max_concurrent_calls
+
+        self._connections: Dict[str, MCPConnection] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    @staticmethod
+    def get_key(server_params: StdioServerParameters) -> str:
+        return server_params.model_dump_json()
+
+    async def get_connection(self, server_params: StdioServerParameters) -> MCPConnection:
+        """Return a healthy session for the server, starting or restarting it if needed."""
+        key = self.get_key(server_params)
+        connection = self._connections.get(key)
+        if connection is not None and connection.is_alive and not self._needs_health_check(connection):
+            return connection
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            connection = self._connections.get(key)
+            if connection is not None and connection.is_alive:
+                if not self._needs_health_check(connection) or await connection.ping(self.ping_timeout):
+                    return connection
+                log_warning("MCP server failed the health check, restarting it")
+            return await self._start(key, server_params, connection)
+
+    async def _start(
+        self, key: str, server_params: StdioServerParameters, old_connection: Optional[MCPConnection] = None
+    ) -> MCPConnection:
+        if old_connection is not None:
+            await old_connection.close()
+        connection = MCPConnection(server_params, max_concurrent_calls=self.max_concurrent_calls)
+        await connection.start(timeout=self.start_timeout)
+        self._connections[key] = connection
+        return connection
+
+    def _needs_health_check(self, connection: MCPConnection) -> bool:
+        return (
+            self.health_check_interval is not None
+            and monotonic() - connection.last_used_at > self.health_check_interval
+        )
+
+    async def restart(self, server_params: StdioServerParameters) -> MCPConnection:
+        key = self.get_key(server_params)
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            return await self._start(key, server_params, self._connections.get(key))
+
+    async def list_tools(self, server_params: StdioServerParameters, refresh: bool = False) -> ListToolsResult:
+        """Return the tools of the server, cached for the lifetime of its session."""
+        connection = await self.get_connection(server_params)
+        if refresh or connection.tools is None:
+            connection.tools = await connection.session.list_tools()  # type: ignore
+        return connection.tools
+
+    async def call_tool(
+        self, server_params: StdioServerParameters, name: str, arguments: Optional[Dict[str, Any]] = None
+    ) -> CallToolResult:
+        """Call a tool, restarting the server and retrying once if the session is broken."""
+        connection = await self.get_connection(server_params)
+        try:
+            return await connection.call_tool(name, arguments)
+        except Exception as e:
+            if await connection.ping(self.ping_timeout):
+                raise
+            log_warning(f"MCP session failed ({e}), restarting the server")
+            key = self.get_key(server_params)
+            async with self._locks.setdefault(key, asyncio.Lock()):
+                # Another call may have restarted the server already
+                if self._connections.get(key) is connection:
+                    connection = await self._start(key, server_params, connection)
+                else:
+                    connection = self._connections[key]
+            return await connection.call_tool(name, arguments)
+
+    async def close(self) -> None:
+        """Close all sessions and stop their servers."""
+        connections = list(self._connections.values())
+        self._connections.clear()
+        await asyncio.gather(*[connection.close() for connection in connections])
+
+    async def __aenter__(self) -> "MCPSessionPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -1,11 +1,16 @@
 import json
-from typing import Any, Dict, List, Optional
+import re
+from contextlib import contextmanager
+from threading import Lock
+from time import monotonic, time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, cast
 
 from agno.tools import Toolkit
-from agno.utils.log import log_debug, logger
+from agno.tools.cache import InMemoryToolCache, ToolCache
+from agno.utils.log import log_debug, log_warning, logger
 
 try:
-    from sqlalchemy import Engine, create_engine
+    from sqlalchemy import CursorResult, Engine, create_engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, sessionmaker
     from sqlalchemy.sql.expression import text
@@ -28,19 +33,59 @@ class SQLTools(Toolkit):
         list_tables: bool = True,
         describe_table: bool = True,
         run_sql_query: bool = True,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        pool_timeout: Optional[float] = None,
+        pool_recycle: Optional[int] = None,
+        pool_pre_ping: bool = False,
+        engine_kwargs: Optional[Dict[str, Any]] = None,
+        max_rows: Optional[int] = 1000,
+        stream_results: bool = True,
+        statement_timeout: Optional[float] = None,
+        schema_cache_ttl: int = 300,
+        cache_queries: bool = False,
+        query_cache_ttl: int = 300,
+        query_cache: Optional[ToolCache] = None,
         **kwargs,
     ):
+        """
+        Args:
+            pool_size, max_overflow, pool_timeout, pool_recycle, pool_pre_ping: Connection pool settings,
+                used when the engine is created from db_url or the connection details.
+            engine_kwargs: Other arguments for sqlalchemy.create_engine.
+            max_rows: Maximum number of rows a query returns, also when no limit is given.
+            stream_results: Read rows with a server-side cursor where the database supports it,
+                so only the returned rows are fetched.
+            statement_timeout: Seconds after which a query is cancelled. Supported on PostgreSQL, MySQL and SQLite.
+            schema_cache_ttl: Seconds to reuse the list of tables and the table schemas. Set to 0 to disable.
+            cache_queries: Reuse the result of a read-only query run within query_cache_ttl seconds.
+                Queries are matched on their SQL with whitespace outside quotes normalized. Any other query run
+                by this toolkit clears the cache.
+            query_cache: Cache for query results. Defaults to an in-memory LRU for this toolkit.
+        """
         super().__init__(name="sql_tools", **kwargs)
 
         # Get the database engine
+        _engine_kwargs: Dict[str, Any] = dict(engine_kwargs or {})
+        for key, value in (
+            ("pool_size", pool_size),
+            ("max_overflow", max_overflow),
+            ("pool_timeout", pool_timeout),
+            ("pool_recycle", pool_recycle),
+        ):
+            if value is not None:
+                _engine_kwargs[key] = value
+        if pool_pre_ping:
+            _engine_kwargs["pool_pre_ping"] = True
+
         _engine: Optional[Engine] = db_engine
         if _engine is None and db_url is not None:
-            _engine = create_engine(db_url)
+            _engine = create_engine(db_url, **_engine_kwargs)
         elif user and password and host and port and dialect:
             if schema is not None:
-                _engine = create_engine(f"{dialect}://{user}:{password}@{host}:{port}/{schema}")
+                _engine = create_engine(f"{dialect}://{user}:{password}@{host}:{port}/{schema}", **_engine_kwargs)
             else:
-                _engine = create_engine(f"{dialect}://{user}:{password}@{host}:{port}")
+                _engine = create_engine(f"{dialect}://{user}:{password}@{host}:{port}", **_engine_kwargs)
 
         if _engine is None:
             raise ValueError("Could not build the database connection")
@@ -52,6 +97,23 @@ class SQLTools(Toolkit):
         # Tables this toolkit can access
         self.tables: Optional[Dict[str, Any]] = tables
 
+        # Query limits
+        self.max_rows: Optional[int] = max_rows
+        self.stream_results: bool = stream_results
+        self.statement_timeout: Optional[float] = statement_timeout
+
+        # Schema metadata, by key: (fetched_at, value)
+        self.schema_cache_ttl: int = schema_cache_ttl
+        self._schema_cache: Dict[str, Tuple[float, Any]] = {}
+        self._schema_cache_lock = Lock()
+
+        # Results of read-only queries
+        self.cache_queries: bool = cache_queries
+        self.query_cache_ttl: int = query_cache_ttl
+        self.query_cache: Optional[ToolCache] = query_cache
+        if cache_queries and self.query_cache is None:
+            self.query_cache = InMemoryToolCache(max_entries=256)
+
         # Register functions in the toolkit
         if list_tables:
             self.register(self.list_tables)
@@ -71,7 +133,7 @@ class SQLTools(Toolkit):
 
         try:
             log_debug("listing tables in the database")
-            table_names = inspect(self.db_engine).get_table_names()
+            table_names = self._get_schema("tables", lambda: inspect(self.db_engine).get_table_names())
             log_debug(f"table_names: {table_names}")
             return json.dumps(table_names)
         except Exception as e:
@@ -90,9 +152,11 @@ class SQLTools(Toolkit):
 
         try:
             log_debug(f"Describing table: {table_name}")
-            table_names = inspect(self.db_engine)
-            table_schema = table_names.get_columns(table_name)
-            return json.dumps([str(column) for column in table_schema])
+            table_schema = self._get_schema(
+                f"columns:{table_name}",
+                lambda: [str(column) for column in inspect(self.db_engine).get_columns(table_name)],
+            )
+            return json.dumps(table_schema)
         except Exception as e:
             logger.error(f"Error getting table schema: {e}")
             return f"Error getting table schema: {e}"
@@ -102,7 +166,8 @@ class SQLTools(Toolkit):
 
         Args:
             query (str): The query to run.
-            limit (int, optional): The number of rows to return. Defaults to 10. Use `None` to show all results.
+            limit (int, optional): The number of rows to return. Defaults to 10. Use `None` to show all results,
+                up to the maximum number of rows of the toolkit.
         Returns:
             str: Result of the SQL query.
         Notes:
@@ -110,7 +175,24 @@ class SQLTools(Toolkit):
         """
 
         try:
-            return json.dumps(self.run_sql(sql=query, limit=limit), default=str)
+            if self.query_cache is None:
+                return json.dumps(self.run_sql(sql=query, limit=limit), default=str)
+            if not self.is_read_only_query(query):
+                try:
+                    return json.dumps(self.run_sql(sql=query, limit=limit), default=str)
+                finally:
+                    # The query may have changed the data of cached results
+                    self.query_cache.clear()
+
+            result, cached = self.query_cache.get_or_call(
+                "run_sql_query",
+                {"sql": normalize_sql(query), "limit": limit},
+                lambda: json.dumps(self.run_sql(sql=query, limit=limit), default=str),
+                ttl=self.query_cache_ttl,
+            )
+            if cached:
+                log_debug("Using cached query result")
+            return result
         except Exception as e:
             logger.error(f"Error running query: {e}")
             return f"Error running query: {e}"
@@ -120,23 +202,105 @@ class SQLTools(Toolkit):
 
         Args:
             sql (str): The sql query to run.
-            limit (int, optional): The number of rows to return. Defaults to None.
+            limit (int, optional): The number of rows to return, capped at max_rows. Defaults to None.
 
         Returns:
             List[dict]: The result of the query.
         """
         log_debug(f"Running sql |\n{sql}")
 
-        with self.Session() as sess, sess.begin():
-            result = sess.execute(text(sql))
+        max_rows = limit or self.max_rows
+        if limit and self.max_rows:
+            max_rows = min(limit, self.max_rows)
+
+        statement = text(sql)
+        if self.stream_results:
+            statement = statement.execution_options(stream_results=True, max_row_buffer=max_rows or 1000)
+
+        with self.Session() as sess, sess.begin(), self._statement_timeout(sess):
+            result = cast(CursorResult, sess.execute(statement))
 
             # Check if the operation has returned rows.
+            if not result.returns_rows:
+                return []
             try:
-                if limit:
-                    rows = result.fetchmany(limit)
+                if max_rows:
+                    rows = result.mappings().fetchmany(max_rows)
                 else:
-                    rows = result.fetchall()
-                return [row._asdict() for row in rows]
-            except Exception as e:
-                logger.error(f"Error while executing SQL: {e}")
-                return []
+                    rows = result.mappings().fetchall()
+                return [dict(row) for row in rows]
+            finally:
+                result.close()
+
+    @contextmanager
+    def _statement_timeout(self, sess: Session) -> Iterator[None]:
+        """Cancel the statements run in the session after statement_timeout seconds."""
+        if self.statement_timeout is None:
+            yield
+            return
+
+        dialect = self.db_engine.dialect.name
+        timeout_ms = int(self.statement_timeout * 1000)
+        if dialect == "postgresql":
+            # Only applies to the current transaction
+            sess.execute(text(f"SET LOCAL statement_timeout = {timeout_ms}"))
+            yield
+        elif dialect in ("mysql", "mariadb"):
+            sess.execute(text(f"SET SESSION max_execution_time = {timeout_ms}"))
+            try:
+                yield
+            finally:
+                sess.execute(text("SET SESSION max_execution_time = 0"))
+        elif dialect == "sqlite":
+            # SQLite has no statement timeout, interrupt the query from its progress handler
+            dbapi_connection = sess.connection().connection.driver_connection
+            deadline = monotonic() + self.statement_timeout
+            dbapi_connection.set_progress_handler(lambda: monotonic() > deadline, 1000)  # type: ignore
+            try:
+                yield
+            finally:
+                dbapi_connection.set_progress_handler(None, 0)  # type: ignore
+        else:
+            log_warning(f"statement_timeout is not supported for {dialect}")
+            yield
+
+    def _get_schema(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Return schema metadata, reusing a fetch made within schema_cache_ttl seconds."""
+        now = time()
+        with self._schema_cache_lock:
+            cached = self._schema_cache.get(key)
+        if cached is not None and now - cached[0] <= self.schema_cache_ttl:
+            log_debug(f"Using cached schema for {key}")
+            return cached[1]
+
+        value = fetch()
+        if self.schema_cache_ttl > 0:
+            with self._schema_cache_lock:
+                self._schema_cache[key] = (now, value)
+        return value
+
+    def clear_schema_cache(self) -> None:
+        with self._schema_cache_lock:
+            self._schema_cache.clear()
+
+    def is_read_only_query(self, sql: str) -> bool:
+        if _READ_ONLY_QUERY.match(sql) is None:
+            return False
+        # e.g. WITH ... DELETE ... RETURNING or SELECT ... INTO
+        return _WRITE_KEYWORD.search(_SQL_QUOTED.sub("''", sql)) is None
+
+
+_READ_ONLY_QUERY = re.compile(r"^\s*(SELECT|WITH|SHOW|DESCRIBE|EXPLAIN|VALUES)\b", re.IGNORECASE)
+_WRITE_KEYWORD = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|MERGE|UPSERT|REPLACE|CREATE|DROP|ALTER|TRUNCATE|GRANT|REVOKE|COPY|CALL|INTO|LOCK)\b",
+    re.IGNORECASE,
+)
+# String literals and quoted identifiers
+_SQL_QUOTED = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|`[^`]*`")
+_SQL_TOKEN = re.compile(_SQL_QUOTED.pattern + r"|\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace outside quotes and remove trailing semicolons, so formatting does not change the cache key."""
+    normalized = _SQL_TOKEN.sub(lambda match: " " if match.group(0).isspace() else match.group(0), sql)
+    return normalized.strip().rstrip("; ")
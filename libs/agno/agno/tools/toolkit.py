@@ -1,6 +1,8 @@
 from collections import OrderedDict
 from typing import Any, Callable, Dict, Optional
+from uuid import uuid4
 
+from agno.tools.cache.base import ToolCache
 from agno.tools.function import Function
 from agno.utils.log import log_debug, logger
 
@@ -12,20 +14,33 @@ class Toolkit:
         cache_results: bool = False,
         cache_ttl: int = 3600,
         cache_dir: Optional[str] = None,
+        cache: Optional[ToolCache] = None,
+        cache_namespace: Optional[str] = None,
     ):
         """Initialize a new Toolkit.
 
         Args:
             name: A descriptive name for the toolkit
-            cache_results (bool): Enable in-memory caching of function results.
+            cache_results (bool): Enable caching of function results.
             cache_ttl (int): Time-to-live for cached results in seconds.
-            cache_dir (Optional[str]): Directory to store cache files. Defaults to system temp dir.
+            cache_dir (Optional[str]): Directory of a SQLite database that shares cached results across processes.
+                By default results are only cached in memory.
+            cache (Optional[ToolCache]): Cache backend for function results.
+                Defaults to an in-memory LRU, backed by a SQLite database if cache_dir is set.
+            cache_namespace (Optional[str]): Scopes the cached results of this toolkit. Defaults to a namespace unique
+                to this instance and shared by its copies. Set it to share results between identically configured
+                toolkits, e.g. across processes.
         """
         self.name: str = name
         self.functions: Dict[str, Function] = OrderedDict()
         self.cache_results: bool = cache_results
         self.cache_ttl: int = cache_ttl
         self.cache_dir: Optional[str] = cache_dir
+        self.cache: Optional[ToolCache] = cache
+        # Toolkits with the same function names but another configuration (API key, base URL) must not share results
+        self.cache_namespace: str = (
+            cache_namespace or f"{type(self).__module__}.{type(self).__qualname__}:{uuid4().hex}"
+        )
 
     def register(self, function: Callable[..., Any], sanitize_arguments: bool = True):
         """Register a function with the toolkit.
@@ -44,6 +59,8 @@ class Toolkit:
                 cache_results=self.cache_results,
                 cache_dir=self.cache_dir,
                 cache_ttl=self.cache_ttl,
+                cache=self.cache,
+                cache_namespace=self.cache_namespace,
             )
             self.functions[f.name] = f
             log_debug(f"Function: {f.name} registered with {self.name}")
@@ -54,6 +71,26 @@ class Toolkit:
     def instructions(self) -> str:
         return ""
 
+    def copy_for_session(self) -> "Toolkit":
+        """Create a shallow copy of the Toolkit for a new session.
+
+        Each Function is copied so it can be bound to the session's agent. Entrypoints that are methods of this
+        Toolkit are re-bound to the copy, other entrypoints and caches are shared.
+        """
+        from copy import copy
+        from inspect import ismethod
+        from types import MethodType
+
+        new_toolkit = copy(self)
+        new_toolkit.functions = OrderedDict()
+        for name, function in self.functions.items():
+            new_function = function.model_copy()
+            entrypoint = function.entrypoint
+            if ismethod(entrypoint) and entrypoint.__self__ is self:
+                new_function.entrypoint = MethodType(entrypoint.__func__, new_toolkit)
+            new_toolkit.functions[name] = new_function
+        return new_toolkit
+
     def __repr__(self):
         return f"<{self.__class__.__name__} name={self.name} functions={list(self.functions.keys())}>"
 
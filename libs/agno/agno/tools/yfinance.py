@@ -1,4 +1,8 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import time
+from typing import Any, Dict, List, Tuple
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug
@@ -8,6 +12,15 @@ try:
 except ImportError:
     raise ImportError("`yfinance` not installed. Please install using `pip install yfinance`.")
 
+# Ticker.info responses shared by all YFinanceTools instances (and their copies), keyed by symbol
+_info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_info_cache_lock = Lock()
+
+
+def clear_info_cache() -> None:
+    with _info_cache_lock:
+        _info_cache.clear()
+
 
 class YFinanceTools(Toolkit):
     """
@@ -22,7 +35,12 @@ class YFinanceTools(Toolkit):
         company_news (bool): Whether to get company news.
         technical_indicators (bool): Whether to get technical indicators.
         historical_prices (bool): Whether to get historical prices.
+        batch_stock_prices (bool): Whether to get current stock prices for many symbols at once.
+        batch_historical_prices (bool): Whether to get historical prices for many symbols at once.
+        batch_technical_indicators (bool): Whether to get technical indicators for many symbols at once.
         enable_all (bool): Whether to enable all tools.
+        info_cache_ttl (int): Seconds to reuse a fetched Ticker.info for a symbol. Set to 0 to disable.
+        max_workers (int): Maximum number of threads used to fetch data for many symbols.
     """
 
     def __init__(
@@ -36,11 +54,19 @@ class YFinanceTools(Toolkit):
         company_news: bool = False,
         technical_indicators: bool = False,
         historical_prices: bool = False,
+        batch_stock_prices: bool = False,
+        batch_historical_prices: bool = False,
+        batch_technical_indicators: bool = False,
         enable_all: bool = False,
+        info_cache_ttl: int = 300,
+        max_workers: int = 8,
         **kwargs,
     ):
         super().__init__(name="yfinance_tools", **kwargs)
 
+        self.info_cache_ttl: int = info_cache_ttl
+        self.max_workers: int = max_workers
+
         if stock_price or enable_all:
             self.register(self.get_current_stock_price)
         if company_info or enable_all:
@@ -59,6 +85,60 @@ class YFinanceTools(Toolkit):
             self.register(self.get_technical_indicators)
         if historical_prices or enable_all:
             self.register(self.get_historical_stock_prices)
+        if batch_stock_prices or enable_all:
+            self.register(self.get_current_stock_prices)
+        if batch_historical_prices or enable_all:
+            self.register(self.get_historical_stock_prices_batch)
+        if batch_technical_indicators or enable_all:
+            self.register(self.get_technical_indicators_batch)
+
+    def _get_info(self, symbol: str) -> Dict[str, Any]:
+        """Return Ticker.info for a symbol, reusing a fetch made within info_cache_ttl seconds."""
+        now = time()
+        with _info_cache_lock:
+            cached = _info_cache.get(symbol)
+        if cached is not None and now - cached[0] <= self.info_cache_ttl:
+            log_debug(f"Using cached info for {symbol}")
+            return cached[1]
+
+        info = yf.Ticker(symbol).info
+        if info and self.info_cache_ttl > 0:
+            with _info_cache_lock:
+                _info_cache[symbol] = (now, info)
+        return info
+
+    def _get_infos(self, symbols: List[str]) -> Dict[str, Any]:
+        """Fetch Ticker.info for many symbols in parallel. Failed fetches map to the exception."""
+
+        def fetch(symbol: str) -> Any:
+            try:
+                return self._get_info(symbol)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(symbols)))) as executor:
+            return dict(zip(symbols, executor.map(fetch, symbols)))
+
+    def _download(self, symbols: List[str], **kwargs) -> Dict[str, Any]:
+        """Download price history for many symbols in one threaded yf.download call, split per symbol.
+
+        Prices are adjusted for splits and dividends, like Ticker.history() used for a single symbol.
+        """
+        data = yf.download(tickers=symbols, group_by="ticker", threads=True, progress=False, auto_adjust=True, **kwargs)
+        frames: Dict[str, Any] = {}
+        if data is None or data.empty:
+            return frames
+        for symbol in symbols:
+            if data.columns.nlevels > 1:
+                if symbol not in data.columns.get_level_values(0):
+                    continue
+                frame = data[symbol]
+            else:
+                frame = data
+            frame = frame.dropna(how="all")
+            if not frame.empty:
+                frames[symbol] = frame
+        return frames
 
     def get_current_stock_price(self, symbol: str) -> str:
         """
@@ -72,13 +152,40 @@ class YFinanceTools(Toolkit):
         """
         try:
             log_debug(f"Fetching current price for {symbol}")
-            stock = yf.Ticker(symbol)
+            info = self._get_info(symbol)
             # Use "regularMarketPrice" for regular market hours, or "currentPrice" for pre/post market
-            current_price = stock.info.get("regularMarketPrice", stock.info.get("currentPrice"))
+            current_price = info.get("regularMarketPrice", info.get("currentPrice"))
             return f"{current_price:.4f}" if current_price else f"Could not fetch current price for {symbol}"
         except Exception as e:
             return f"Error fetching current price for {symbol}: {e}"
 
+    def get_current_stock_prices(self, symbols: List[str]) -> str:
+        """
+        Use this function to get the current stock prices for many symbols at once.
+        Prefer this over calling get_current_stock_price once per symbol.
+
+        Args:
+            symbols (List[str]): The stock symbols.
+
+        Returns:
+            str: JSON mapping each symbol to its current price or an error message.
+        """
+        try:
+            log_debug(f"Fetching current prices for {symbols}")
+            # Ticker.info fetched in parallel, the same price source as get_current_stock_price
+            prices: Dict[str, str] = {}
+            for symbol, info in self._get_infos(symbols).items():
+                if isinstance(info, Exception):
+                    prices[symbol] = f"Error fetching current price for {symbol}: {info}"
+                    continue
+                current_price = info.get("regularMarketPrice", info.get("currentPrice")) if info else None
+                prices[symbol] = (
+                    f"{current_price:.4f}" if current_price else f"Could not fetch current price for {symbol}"
+                )
+            return json.dumps(prices, indent=2)
+        except Exception as e:
+            return f"Error fetching current prices for {symbols}: {e}"
+
     def get_company_info(self, symbol: str) -> str:
         """Use this function to get company information and overview for a given stock symbol.
 
@@ -89,7 +196,7 @@ class YFinanceTools(Toolkit):
             str: JSON containing company profile and overview.
         """
         try:
-            company_info_full = yf.Ticker(symbol).info
+            company_info_full = self._get_info(symbol)
             if company_info_full is None:
                 return f"Could not fetch company info for {symbol}"
 
@@ -152,6 +259,34 @@ class YFinanceTools(Toolkit):
         except Exception as e:
             return f"Error fetching historical prices for {symbol}: {e}"
 
+    def get_historical_stock_prices_batch(self, symbols: List[str], period: str = "1mo", interval: str = "1d") -> str:
+        """
+        Use this function to get the historical stock prices for many symbols at once.
+        Prefer this over calling get_historical_stock_prices once per symbol.
+
+        Args:
+            symbols (List[str]): The stock symbols.
+            period (str): The period for which to retrieve historical prices. Defaults to "1mo".
+                        Valid periods: 1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max
+            interval (str): The interval between data points. Defaults to "1d".
+                        Valid intervals: 1d,5d,1wk,1mo,3mo
+
+        Returns:
+          str: JSON mapping each symbol to its historical prices or an error message.
+        """
+        try:
+            log_debug(f"Fetching historical prices for {symbols}")
+            frames = self._download(symbols, period=period, interval=interval)
+            historical_prices = {
+                symbol: json.loads(frames[symbol].to_json(orient="index"))
+                if symbol in frames
+                else f"Could not fetch historical prices for {symbol}"
+                for symbol in symbols
+            }
+            return json.dumps(historical_prices)
+        except Exception as e:
+            return f"Error fetching historical prices for {symbols}: {e}"
+
     def get_stock_fundamentals(self, symbol: str) -> str:
         """Use this function to get fundamental data for a given stock symbol yfinance API.
 
@@ -176,8 +311,7 @@ class YFinanceTools(Toolkit):
         """
         try:
             log_debug(f"Fetching fundamentals for {symbol}")
-            stock = yf.Ticker(symbol)
-            info = stock.info
+            info = self._get_info(symbol)
             fundamentals = {
                 "symbol": symbol,
                 "company_name": info.get("longName", ""),
@@ -224,8 +358,7 @@ class YFinanceTools(Toolkit):
         """
         try:
             log_debug(f"Fetching key financial ratios for {symbol}")
-            stock = yf.Ticker(symbol)
-            key_ratios = stock.info
+            key_ratios = self._get_info(symbol)
             return json.dumps(key_ratios, indent=2)
         except Exception as e:
             return f"Error fetching key financial ratios for {symbol}: {e}"
@@ -269,15 +402,55 @@ class YFinanceTools(Toolkit):
 
         Args:
             symbol (str): The stock symbol.
-            period (str): The time period for which to retrieve technical indicators.
-                Valid periods: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max. Defaults to 3mo.
+            period (str): The time period of price history used to compute the indicators.
+                Valid periods: 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max. Defaults to 3mo.
 
         Returns:
-            str: JSON containing technical indicators.
+            str: JSON containing the latest SMA, EMA, RSI, MACD, Bollinger bands, ATR, volatility and drawdown values.
         """
         try:
+            from agno.utils.technical_indicators import compute_technical_indicators, summarize_technical_indicators
+
             log_debug(f"Fetching technical indicators for {symbol}")
-            indicators = yf.Ticker(symbol).history(period=period)
-            return indicators.to_json(orient="index")
+            history = yf.Ticker(symbol).history(period=period)
+            if history.empty:
+                return f"Could not fetch price history for {symbol}"
+            indicators = compute_technical_indicators(
+                close=history["Close"].rename(symbol),
+                high=history["High"].rename(symbol),
+                low=history["Low"].rename(symbol),
+            )
+            return json.dumps(summarize_technical_indicators(indicators)[symbol], indent=2)
         except Exception as e:
             return f"Error fetching technical indicators for {symbol}: {e}"
+
+    def get_technical_indicators_batch(self, symbols: List[str], period: str = "3mo") -> str:
+        """Use this function to get technical indicators for many stock symbols at once.
+        Prefer this over calling get_technical_indicators once per symbol.
+
+        Args:
+            symbols (List[str]): The stock symbols.
+            period (str): The time period of price history used to compute the indicators.
+                Valid periods: 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max. Defaults to 3mo.
+
+        Returns:
+            str: JSON mapping each symbol to its latest technical indicator values or an error message.
+        """
+        try:
+            import pandas as pd
+
+            from agno.utils.technical_indicators import compute_technical_indicators, summarize_technical_indicators
+
+            log_debug(f"Fetching technical indicators for {symbols}")
+            frames = self._download(symbols, period=period, interval="1d")
+            summary: Dict[str, Any] = {}
+            if frames:
+                close = pd.DataFrame({symbol: frame["Close"] for symbol, frame in frames.items()})
+                high = pd.DataFrame({symbol: frame["High"] for symbol, frame in frames.items()})
+                low = pd.DataFrame({symbol: frame["Low"] for symbol, frame in frames.items()})
+                summary = summarize_technical_indicators(compute_technical_indicators(close=close, high=high, low=low))
+            return json.dumps(
+                {symbol: summary.get(symbol, f"Could not fetch price history for {symbol}") for symbol in symbols}
+            )
+        except Exception as e:
+            return f"Error fetching technical indicators for {symbols}: {e}"
@@ -0,0 +1,12 @@
+from agno.tracing.exporters import InMemorySpanExporter, JsonlSpanExporter, OtlpSpanExporter, SpanExporter
+from agno.tracing.span import NoopSpan, Span
+from agno.tracing.tracer import (
+    Tracer,
+    disable_tracing,
+    enable_tracing,
+    get_current_span,
+    get_tracer,
+    is_tracing_enabled,
+    start_span,
+    traced,
+)
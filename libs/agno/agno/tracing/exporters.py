@@ -0,0 +1,130 @@
+import json
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional, Union
+
+from agno.tracing.span import Span
+from agno.utils.log import log_warning
+
+
+class SpanExporter:
+    """Base class for span exporters. Spans are exported in batches, one batch per finished trace."""
+
+    def export(self, spans: List[Span]) -> None:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished spans in memory, useful in tests and notebooks"""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._lock = Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        with self._lock:
+            self.spans.extend(spans)
+
+    def get_spans(self, name: Optional[str] = None) -> List[Span]:
+        with self._lock:
+            return [span for span in self.spans if name is None or span.name == name]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+class JsonlSpanExporter(SpanExporter):
+    """Appends finished spans to a file, one JSON object per line"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(lines)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(v) for v in value]}}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items() if value is not None]
+
+
+class OtlpSpanExporter(SpanExporter):
+    """Sends finished spans to an OpenTelemetry collector using OTLP/HTTP with JSON encoding.
+
+    Args:
+        endpoint: The traces endpoint of the collector.
+        service_name: Reported as the service.name resource attribute.
+        headers: Extra headers, e.g. for authentication.
+        timeout: Request timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:4318/v1/traces",
+        service_name: str = "agno",
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 5.0,
+    ):
+        import httpx
+
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+        self._client = httpx.Client(headers={"Content-Type": "application/json", **(headers or {})}, timeout=timeout)
+
+    def to_otlp(self, spans: List[Span]) -> Dict[str, Any]:
+        otlp_spans = []
+        for span in spans:
+            otlp_span: Dict[str, Any] = {
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                # SPAN_KIND_INTERNAL
+                "kind": 1,
+                "startTimeUnixNano": str(span.start_time_ns),
+                "endTimeUnixNano": str(span.end_time_ns),
+                "attributes": _otlp_attributes(span.attributes),
+                # STATUS_CODE_OK or STATUS_CODE_ERROR
+                "status": {"code": 2, "message": span.error or ""} if span.status == "error" else {"code": 1},
+            }
+            if span.parent_id is not None:
+                otlp_span["parentSpanId"] = span.parent_id
+            otlp_spans.append(otlp_span)
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": _otlp_attributes({"service.name": self.service_name})},
+                    "scopeSpans": [{"scope": {"name": "agno"}, "spans": otlp_spans}],
+                }
+            ]
+        }
+
+    def export(self, spans: List[Span]) -> None:
+        try:
+            response = self._client.post(self.endpoint, content=json.dumps(self.to_otlp(spans), default=str))
+            response.raise_for_status()
+        except Exception as e:
+            log_warning(f"Could not export {len(spans)} spans to {self.endpoint}: {e}")
+
+    def shutdown(self) -> None:
+        self._client.close()
@@ -0,0 +1,128 @@
+from time import time_ns
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from agno.tracing.tracer import Tracer
+
+
+class Span:
+    """A timed operation in a trace, with attributes such as token or document counts"""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "parent",
+        "start_time_ns",
+        "end_time_ns",
+        "attributes",
+        "status",
+        "error",
+        "_tracer",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        span_id: str,
+        parent: Optional["Span"] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+        tracer: Optional["Tracer"] = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent = parent
+        self.parent_id: Optional[str] = parent.span_id if parent is not None else None
+        self.start_time_ns = time_ns()
+        self.end_time_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = attributes if attributes is not None else {}
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self._tracer = tracer
+
+    @property
+    def is_recording(self) -> bool:
+        return self.end_time_ns is None
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def set_error(self, error: BaseException) -> None:
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+
+    def end(self) -> None:
+        """End the span. Ending a span more than once has no effect."""
+        if self.end_time_ns is not None:
+            return
+        self.end_time_ns = time_ns()
+        if self._tracer is not None:
+            self._tracer.on_end(self)
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # A generator closed before it was exhausted is not an error
+        if exc_value is not None and not isinstance(exc_value, GeneratorExit):
+            self.set_error(exc_value)
+        self.end()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time_ns": self.start_time_ns,
+            "end_time_ns": self.end_time_ns,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "status": self.status,
+            "error": self.error,
+        }
+
+    def __repr__(self) -> str:
+        return f"Span(name={self.name!r}, duration_ms={self.duration_ms}, attributes={self.attributes})"
+
+
+class NoopSpan:
+    """Returned when tracing is disabled, every method does nothing"""
+
+    __slots__ = ()
+
+    is_recording = False
+    duration_ms = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+    def set_error(self, error: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+
+NOOP_SPAN = NoopSpan()
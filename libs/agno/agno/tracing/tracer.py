@@ -0,0 +1,217 @@
+from contextvars import ContextVar
+from functools import wraps
+from inspect import isasyncgenfunction, iscoroutinefunction, isgeneratorfunction
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from uuid import uuid4
+
+from agno.tracing.exporters import InMemorySpanExporter, SpanExporter
+from agno.tracing.span import NOOP_SPAN, NoopSpan, Span
+from agno.utils.log import log_debug, log_warning
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# The innermost open span in the current context
+_current_span: ContextVar[Optional[Span]] = ContextVar("agno_current_span", default=None)
+# The active tracer, None when tracing is disabled
+_tracer: Optional["Tracer"] = None
+
+
+class Tracer:
+    """Creates spans and exports them, one batch per trace, when the root span of the trace ends.
+
+    Args:
+        exporters: Where finished spans are sent.
+        max_spans_per_trace: Export a trace early once it has this many finished spans, to bound memory.
+    """
+
+    def __init__(self, exporters: List[SpanExporter], max_spans_per_trace: int = 10_000):
+        self.exporters = exporters
+        self.max_spans_per_trace = max_spans_per_trace
+        # trace_id -> finished spans waiting for the root span to end
+        self._pending: Dict[str, List[Span]] = {}
+        self._lock = Lock()
+
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Span:
+        parent = _current_span.get()
+        trace_id = parent.trace_id if parent is not None else uuid4().hex
+        span = Span(
+            name=name, trace_id=trace_id, span_id=uuid4().hex[:16], parent=parent, attributes=attributes, tracer=self
+        )
+        _current_span.set(span)
+        return span
+
+    def on_end(self, span: Span) -> None:
+        # Restore the parent as the current span, also if a child span was left open, e.g. after an exception
+        current = _current_span.get()
+        while current is not None:
+            if current is span:
+                _current_span.set(span.parent)
+                break
+            current = current.parent
+
+        root = span
+        while root.parent is not None:
+            root = root.parent
+
+        batch: Optional[List[Span]] = None
+        with self._lock:
+            pending = self._pending.setdefault(span.trace_id, [])
+            pending.append(span)
+            # Export when the root span ends, or right away if the span outlived its root
+            if root.end_time_ns is not None or len(pending) >= self.max_spans_per_trace:
+                batch = self._pending.pop(span.trace_id)
+        if batch:
+            self._export(batch)
+
+    def _export(self, spans: List[Span]) -> None:
+        for exporter in self.exporters:
+            try:
+                exporter.export(spans)
+            except Exception as e:
+                log_warning(f"Span exporter {exporter.__class__.__name__} failed: {e}")
+
+    def force_flush(self) -> None:
+        """Export the finished spans of traces whose root span has not ended yet."""
+        with self._lock:
+            batches = list(self._pending.values())
+            self._pending.clear()
+        for batch in batches:
+            self._export(batch)
+
+    def shutdown(self) -> None:
+        self.force_flush()
+        for exporter in self.exporters:
+            try:
+                exporter.shutdown()
+            except Exception as e:
+                log_warning(f"Span exporter {exporter.__class__.__name__} failed to shut down: {e}")
+
+
+def enable_tracing(exporters: Optional[Union[SpanExporter, List[SpanExporter]]] = None) -> Tracer:
+    """Start tracing agent, team and knowledge operations.
+
+    Args:
+        exporters: Where finished spans are sent. Defaults to an InMemorySpanExporter.
+
+    Returns:
+        Tracer: The active tracer.
+    """
+    global _tracer
+
+    if exporters is None:
+        exporters = [InMemorySpanExporter()]
+    elif isinstance(exporters, SpanExporter):
+        exporters = [exporters]
+    if _tracer is not None:
+        _tracer.shutdown()
+    _tracer = Tracer(exporters=exporters)
+    log_debug(f"Tracing enabled with {', '.join(e.__class__.__name__ for e in exporters)}")
+    return _tracer
+
+
+def disable_tracing() -> None:
+    """Stop tracing, exporting any pending spans."""
+    global _tracer
+
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.shutdown()
+    _current_span.set(None)
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def is_tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def start_span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Union[Span, NoopSpan]:
+    """Start a span, child of the current span. Use as a context manager or call end() on the returned span.
+
+    Returns a no-op span when tracing is disabled.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return NOOP_SPAN
+    return tracer.start_span(name, attributes)
+
+
+def get_current_span() -> Union[Span, NoopSpan]:
+    """The innermost open span, or a no-op span when tracing is disabled or no span is open."""
+    if _tracer is None:
+        return NOOP_SPAN
+    return _current_span.get() or NOOP_SPAN
+
+
+def traced(name: str, attributes: Optional[Callable[..., Dict[str, Any]]] = None) -> Callable[[F], F]:
+    """Decorator that runs a function, coroutine, generator or async generator in a span.
+
+    Args:
+        name: The span name.
+        attributes: Called with the arguments of the decorated function to get the initial span attributes.
+            Only called when tracing is enabled.
+    """
+
+    def get_attributes(args, kwargs) -> Optional[Dict[str, Any]]:
+        if attributes is None:
+            return None
+        try:
+            return attributes(*args, **kwargs)
+        except Exception as e:
+            log_debug(f"Could not get attributes for span {name}: {e}")
+            return None
+
+    def decorator(func: F) -> F:
+        if isasyncgenfunction(func):
+
+            async def traced_async_generator(*args, **kwargs):
+                with start_span(name, get_attributes(args, kwargs)):
+                    async for item in func(*args, **kwargs):
+                        yield item
+
+            @wraps(func)
+            def async_generator_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    return func(*args, **kwargs)
+                return traced_async_generator(*args, **kwargs)
+
+            return async_generator_wrapper  # type: ignore
+
+        if isgeneratorfunction(func):
+
+            def traced_generator(*args, **kwargs):
+                with start_span(name, get_attributes(args, kwargs)):
+                    return (yield from func(*args, **kwargs))
+
+            @wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    return func(*args, **kwargs)
+                return traced_generator(*args, **kwargs)
+
+            return generator_wrapper  # type: ignore
+
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def coroutine_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    return await func(*args, **kwargs)
+                with start_span(name, get_attributes(args, kwargs)):
+                    return await func(*args, **kwargs)
+
+            return coroutine_wrapper  # type: ignore
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with start_span(name, get_attributes(args, kwargs)):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorator
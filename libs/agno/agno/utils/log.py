@@ -1,6 +1,9 @@
+import json
 import logging
+import sys
+from datetime import datetime, timezone
 from os import getenv
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TextIO, Union, cast
 
 from rich.logging import RichHandler
 from rich.text import Text
@@ -39,31 +42,61 @@ class ColoredRichHandler(RichHandler):
         return super().get_level_text(record)
 
 
+# Attributes every LogRecord has, anything else was passed using `extra`
+_LOG_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class JsonLogFormatter(logging.Formatter):
+    """Formats log records as one JSON object per line, for log collectors in production"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_entry = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _LOG_RECORD_ATTRIBUTES and not key.startswith("_"):
+                log_entry[key] = value
+        if record.exc_info:
+            log_entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(log_entry, default=str)
+
+
+# A log message, or a callable returning the message that is only called if the message is logged
+LogMessage = Union[str, Any, Callable[[], Any]]
+
+
 class AgnoLogger(logging.Logger):
     def __init__(self, name: str, level: int = logging.NOTSET):
         super().__init__(name, level)
-
-    def debug(self, msg: str, center: bool = False, symbol: str = "*", *args, **kwargs):
-        if center:
-            msg = center_header(str(msg), symbol)
+        # Centered headers are only useful on a console
+        self.center_headers = True
+
+    def _render(self, msg: LogMessage, center: bool, symbol: str, args: tuple) -> tuple:
+        if callable(msg):
+            msg = msg()
+        if center and self.center_headers:
+            # Format the args first so the header is centered on the final message
+            msg = center_header(str(msg) % args if args else str(msg), symbol)
+            args = ()
+        return msg, args
+
+    def debug(self, msg: LogMessage, center: bool = False, symbol: str = "*", *args, **kwargs):
+        if not self.isEnabledFor(logging.DEBUG):
+            return
+        msg, args = self._render(msg, center, symbol, args)
         super().debug(msg, *args, **kwargs)
 
-    def info(self, msg: str, center: bool = False, symbol: str = "*", *args, **kwargs):
-        if center:
-            msg = center_header(str(msg), symbol)
+    def info(self, msg: LogMessage, center: bool = False, symbol: str = "*", *args, **kwargs):
+        if not self.isEnabledFor(logging.INFO):
+            return
+        msg, args = self._render(msg, center, symbol, args)
         super().info(msg, *args, **kwargs)
 
 
-def build_logger(logger_name: str, source_type: Optional[str] = None) -> Any:
-    # Set the custom logger class as the default for this logger
-    logging.setLoggerClass(AgnoLogger)
-
-    # Create logger with custom class
-    _logger = logging.getLogger(logger_name)
-
-    # Reset logger class to default to avoid affecting other loggers
-    logging.setLoggerClass(logging.Logger)
-
+def build_rich_handler(source_type: Optional[str] = None) -> logging.Handler:
     # https://rich.readthedocs.io/en/latest/reference/logging.html#rich.logging.RichHandler
     # https://rich.readthedocs.io/en/latest/logging.html#handle-exceptions
     rich_handler = ColoredRichHandler(
@@ -79,8 +112,31 @@ def build_logger(logger_name: str, source_type: Optional[str] = None) -> Any:
             datefmt="[%X]",
         )
     )
+    return rich_handler
+
 
-    _logger.addHandler(rich_handler)
+def build_json_handler(stream: Optional[TextIO] = None) -> logging.Handler:
+    json_handler = logging.StreamHandler(stream or sys.stderr)
+    json_handler.setFormatter(JsonLogFormatter())
+    return json_handler
+
+
+def build_logger(logger_name: str, source_type: Optional[str] = None) -> AgnoLogger:
+    # Set the custom logger class as the default for this logger
+    logging.setLoggerClass(AgnoLogger)
+
+    # Create logger with custom class
+    _logger = cast(AgnoLogger, logging.getLogger(logger_name))
+
+    # Reset logger class to default to avoid affecting other loggers
+    logging.setLoggerClass(logging.Logger)
+
+    # Set AGNO_LOG_FORMAT=json for structured logs without rich formatting
+    if getenv("AGNO_LOG_FORMAT", "").lower() == "json":
+        _logger.addHandler(build_json_handler())
+        _logger.center_headers = False
+    else:
+        _logger.addHandler(build_rich_handler(source_type))
     _logger.setLevel(logging.INFO)
     _logger.propagate = False
     return _logger
@@ -111,6 +167,33 @@ def set_log_level_to_info(source_type: Optional[str] = None):
     debug_on = False
 
 
+def set_log_format(log_format: str = "rich", stream: Optional[TextIO] = None) -> None:
+    """Replace the handlers of the agent and team loggers.
+
+    Args:
+        log_format: "rich" for the console, or "json" for one JSON object per line.
+        stream: The stream json logs are written to. Defaults to stderr.
+    """
+    if log_format not in ("rich", "json"):
+        raise ValueError(f"Unsupported log format: {log_format}")
+
+    for _logger, source_type in ((agent_logger, "agent"), (team_logger, "team")):
+        for handler in list(_logger.handlers):
+            _logger.removeHandler(handler)
+        if log_format == "json":
+            _logger.addHandler(build_json_handler(stream))
+        else:
+            _logger.addHandler(build_rich_handler(source_type))
+        _logger.center_headers = log_format != "json"
+
+
+def is_log_level_enabled(level: int = logging.DEBUG) -> bool:
+    """Whether a message at this level would be logged. Use it to skip building expensive log messages."""
+    if level <= logging.DEBUG and not debug_on:
+        return False
+    return logger.isEnabledFor(level)
+
+
 def center_header(message: str, symbol: str = "*") -> str:
     try:
         import shutil
@@ -135,14 +218,15 @@ def use_agent_logger():
     logger = agent_logger
 
 
-def log_debug(msg, center: bool = False, symbol: str = "*", *args, **kwargs):
+def log_debug(msg: LogMessage, *args, center: bool = False, symbol: str = "*", **kwargs):
+    """Log a debug message. Pass %-style args or a callable as msg to only build the message if it is logged."""
     global logger
     global debug_on
     if debug_on:
         logger.debug(msg, center, symbol, *args, **kwargs)
 
 
-def log_info(msg, center: bool = False, symbol: str = "*", *args, **kwargs):
+def log_info(msg: LogMessage, *args, center: bool = False, symbol: str = "*", **kwargs):
     global logger
     logger.info(msg, center, symbol, *args, **kwargs)
 
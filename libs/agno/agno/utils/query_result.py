@@ -0,0 +1,156 @@
+import csv
+import io
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+from uuid import uuid4
+
+from agno.utils.log import log_debug, logger
+from agno.utils.tokens import Tokenizer, get_tokenizer
+
+
+@dataclass
+class SpilledResult:
+    path: str
+    num_rows: Optional[int] = None
+
+
+@dataclass
+class RenderedResult:
+    lines: List[str]
+    num_rows: int
+    truncated: bool
+    spilled: Optional[SpilledResult] = None
+
+    def get_truncation_notice(self) -> str:
+        notice = f"[Result truncated: showing the first {self.num_rows} rows."
+        if self.spilled is None:
+            return notice + " Refine the query, e.g. with filters, aggregates or a LIMIT.]"
+        if self.spilled.num_rows is not None:
+            notice += f" The full result has {self.spilled.num_rows} rows and"
+        else:
+            notice += " The full result"
+        return notice + f" is saved to Parquet, query it with: SELECT * FROM read_parquet('{self.spilled.path}')]"
+
+    def to_string(self) -> str:
+        if self.truncated:
+            return "\n".join(self.lines) + "\n" + self.get_truncation_notice()
+        return "\n".join(self.lines)
+
+
+@dataclass
+class QueryResultRenderer:
+    """Renders a query result for a model, without loading more rows than it sends.
+
+    Rows are read in batches and rendering stops at the first cap reached: max_rows, max_bytes or max_tokens.
+    A truncated result ends with a notice. If spill_dir is set, the full result of a truncated DuckDB query
+    is saved to a Parquet file in spill_dir, and the notice tells the model how to query it.
+
+    Args:
+        max_rows: Maximum number of rows rendered.
+        max_bytes: Maximum size of the rendered result in bytes.
+        max_tokens: Maximum number of tokens of the rendered result, estimated with tokenizer.
+        output_format: "csv" or "markdown".
+        batch_size: Number of rows read at a time.
+        spill_dir: Directory for the Parquet files of truncated results.
+        tokenizer: Counts tokens for max_tokens. Defaults to an estimate from the number of characters.
+    """
+
+    max_rows: Optional[int] = 100
+    max_bytes: Optional[int] = 20_000
+    max_tokens: Optional[int] = None
+    output_format: str = "csv"
+    batch_size: int = 1024
+    spill_dir: Optional[str] = None
+    tokenizer: Optional[Tokenizer] = None
+
+    def __post_init__(self):
+        if self.output_format not in ("csv", "markdown"):
+            raise ValueError(f"Invalid output_format: {self.output_format}, use 'csv' or 'markdown'")
+
+    # -*- Rendering
+    def format_markdown_cell(self, value: Any) -> str:
+        if value is None:
+            return ""
+        return str(value).replace("|", "\\|").replace("\n", " ")
+
+    def format_row(self, row: Sequence[Any]) -> str:
+        if self.output_format == "markdown":
+            return "| " + " | ".join(self.format_markdown_cell(value) for value in row) + " |"
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerow(row)
+        return buffer.getvalue()[:-1]
+
+    def format_header(self, columns: Sequence[str]) -> str:
+        header = self.format_row(columns)
+        if self.output_format == "markdown":
+            header += "\n|" + "---|" * len(columns)
+        return header
+
+    def render_rows(self, columns: Sequence[str], batches: Iterable[Sequence[Sequence[Any]]]) -> RenderedResult:
+        """Render batches of rows until a cap is reached. Batches after the cap are not read."""
+        tokenizer = (self.tokenizer or get_tokenizer()) if self.max_tokens is not None else None
+        header = self.format_header(columns)
+        lines: List[str] = [header]
+        num_bytes = len(header.encode("utf-8"))
+        num_tokens = tokenizer.count(header) if tokenizer is not None else 0
+
+        for batch in batches:
+            for row in batch:
+                if self.max_rows is not None and len(lines) - 1 >= self.max_rows:
+                    return RenderedResult(lines=lines, num_rows=len(lines) - 1, truncated=True)
+                line = self.format_row(row)
+                num_bytes += len(line.encode("utf-8")) + 1
+                if tokenizer is not None:
+                    num_tokens += tokenizer.count(line)
+                if (self.max_bytes is not None and num_bytes > self.max_bytes) or (
+                    self.max_tokens is not None and num_tokens > self.max_tokens
+                ):
+                    return RenderedResult(lines=lines, num_rows=len(lines) - 1, truncated=True)
+                lines.append(line)
+        return RenderedResult(lines=lines, num_rows=len(lines) - 1, truncated=False)
+
+    # -*- DuckDB
+    def iter_duckdb_batches(self, relation: Any) -> Iterator[Sequence[Sequence[Any]]]:
+        """Read a DuckDB relation in Arrow record batches, or with fetchmany if pyarrow is not installed."""
+        try:
+            import pyarrow  # noqa: F401
+
+            use_arrow = True
+        except ImportError:
+            use_arrow = False
+
+        if use_arrow:
+            for record_batch in relation.fetch_record_batch(self.batch_size):
+                yield list(zip(*(column.to_pylist() for column in record_batch.columns)))
+            return
+
+        while True:
+            rows = relation.fetchmany(self.batch_size)
+            if not rows:
+                return
+            yield rows
+
+    def spill_to_parquet(self, relation: Any, connection: Any) -> Optional[SpilledResult]:
+        """Save the full result of a relation to a Parquet file in spill_dir."""
+        if self.spill_dir is None:
+            return None
+        try:
+            spill_path = Path(self.spill_dir) / f"query_result_{uuid4().hex[:12]}.parquet"
+            spill_path.parent.mkdir(parents=True, exist_ok=True)
+            relation.write_parquet(str(spill_path))
+            count = connection.sql(f"SELECT count(*) FROM read_parquet('{spill_path}')").fetchone()
+            log_debug(f"Saved the full query result to {spill_path}")
+            return SpilledResult(path=str(spill_path), num_rows=count[0] if count else None)
+        except Exception as e:
+            logger.warning(f"Failed to save the query result to Parquet: {e}")
+            return None
+
+    def render_duckdb(self, relation: Any, connection: Any) -> str:
+        """Render the result of DuckDBPyConnection.sql(). Statements without a result return "No output"."""
+        if relation is None:
+            return "No output"
+        rendered = self.render_rows(relation.columns, self.iter_duckdb_batches(relation))
+        if rendered.truncated:
+            rendered.spilled = self.spill_to_parquet(relation, connection)
+        return rendered.to_string()
@@ -0,0 +1,160 @@
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    raise ImportError("`pandas` not installed. Please install using `pip install pandas`.")
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def _as_frame(prices: Any) -> pd.DataFrame:
+    if isinstance(prices, pd.Series):
+        return prices.to_frame()
+    return prices
+
+
+def _last_window(frame: pd.DataFrame, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """The last `window` valid values of every column, NaN elsewhere, and whether each column has that many.
+
+    Columns of a multi-symbol frame are aligned on the union of dates, so gaps (e.g. a holiday on one exchange)
+    are skipped instead of voiding the window.
+    """
+    values = frame.to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    # Number of valid values at or after each row
+    remaining = np.cumsum(valid[::-1], axis=0)[::-1]
+    return np.where(valid & (remaining <= window), values, np.nan), valid.sum(axis=0) >= window
+
+
+def _window_mean(frame: pd.DataFrame, window: int) -> pd.Series:
+    # Same as column.dropna().rolling(window).mean().iloc[-1] for every column, without the full rolling series
+    tail, has_window = _last_window(frame, window)
+    means = np.where(has_window, np.nansum(tail, axis=0) / window, np.nan)
+    return pd.Series(means, index=frame.columns, dtype=float)
+
+
+def _window_std(frame: pd.DataFrame, window: int, ddof: int = 1) -> pd.Series:
+    tail, has_window = _last_window(frame, window)
+    means = np.nansum(tail, axis=0) / window
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variances = np.nansum((tail - means) ** 2, axis=0) / (window - ddof)
+    return pd.Series(np.where(has_window, np.sqrt(variances), np.nan), index=frame.columns, dtype=float)
+
+
+def true_range(high: pd.DataFrame, low: pd.DataFrame, close: pd.DataFrame) -> pd.DataFrame:
+    previous_close = close.shift(1)
+    # fmax ignores NaN, so the first row (no previous close) uses the high-low range
+    ranges = np.fmax(
+        (high - low).to_numpy(),
+        np.fmax((high - previous_close).abs().to_numpy(), (low - previous_close).abs().to_numpy()),
+    )
+    return pd.DataFrame(ranges, index=close.index, columns=close.columns)
+
+
+def compute_technical_indicators(
+    close: Any,
+    high: Optional[Any] = None,
+    low: Optional[Any] = None,
+    sma_windows: tuple = (20, 50, 200),
+    rsi_window: int = 14,
+    bollinger_window: int = 20,
+    bollinger_num_std: float = 2.0,
+    atr_window: int = 14,
+    volatility_window: int = 20,
+) -> pd.DataFrame:
+    """Compute the latest value of common technical indicators for one or many symbols.
+
+    Every indicator is computed column-wise over the full price history, so many symbols are handled in one pass.
+    Rolling indicators only evaluate their last window, as only the latest value is returned.
+
+    Args:
+        close: Close prices, a Series for one symbol or a DataFrame with one column per symbol, indexed by date.
+        high: High prices, same shape as close. ATR is skipped if high or low is not provided.
+        low: Low prices, same shape as close.
+
+    Returns:
+        pd.DataFrame: One row per symbol, one column per indicator.
+    """
+    close = _as_frame(close).astype(float)
+    indicators: Dict[str, pd.Series] = {}
+
+    # Last available close per symbol; symbols with a shorter history are padded, not dropped
+    last_close = close.ffill().iloc[-1]
+    indicators["as_of"] = close.notna().iloc[::-1].idxmax()
+    indicators["close"] = last_close
+
+    for window in sma_windows:
+        indicators[f"sma_{window}"] = _window_mean(close, window)
+
+    ema_12 = close.ewm(span=12, adjust=False).mean()
+    ema_26 = close.ewm(span=26, adjust=False).mean()
+    indicators["ema_12"] = ema_12.iloc[-1]
+    indicators["ema_26"] = ema_26.iloc[-1]
+
+    # RSI with Wilder's smoothing
+    delta = close.diff()
+    average_gain = delta.clip(lower=0).ewm(alpha=1 / rsi_window, adjust=False, min_periods=rsi_window).mean()
+    average_loss = (-delta.clip(upper=0)).ewm(alpha=1 / rsi_window, adjust=False, min_periods=rsi_window).mean()
+    last_gain = average_gain.iloc[-1]
+    last_loss = average_loss.iloc[-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - 100 / (1 + last_gain / last_loss)
+    indicators[f"rsi_{rsi_window}"] = rsi.where(last_loss != 0, 100.0).where(last_gain.notna())
+
+    macd = ema_12 - ema_26
+    macd_signal = macd.ewm(span=9, adjust=False).mean()
+    indicators["macd"] = macd.iloc[-1]
+    indicators["macd_signal"] = macd_signal.iloc[-1]
+    indicators["macd_histogram"] = macd.iloc[-1] - macd_signal.iloc[-1]
+
+    bollinger_middle = _window_mean(close, bollinger_window)
+    bollinger_std = _window_std(close, bollinger_window, ddof=0)
+    bollinger_upper = bollinger_middle + bollinger_num_std * bollinger_std
+    bollinger_lower = bollinger_middle - bollinger_num_std * bollinger_std
+    indicators["bollinger_upper"] = bollinger_upper
+    indicators["bollinger_middle"] = bollinger_middle
+    indicators["bollinger_lower"] = bollinger_lower
+    band_width = bollinger_upper - bollinger_lower
+    indicators["bollinger_percent_b"] = ((last_close - bollinger_lower) / band_width).where(band_width != 0)
+
+    if high is not None and low is not None:
+        high = _as_frame(high).astype(float)
+        low = _as_frame(low).astype(float)
+        atr = true_range(high, low, close).ewm(alpha=1 / atr_window, adjust=False, min_periods=atr_window).mean()
+        indicators[f"atr_{atr_window}"] = atr.iloc[-1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Returns from the previous valid close, so a gap in one column does not drop the return after it
+        log_returns = np.log(close / close.ffill().shift(1))
+    annualization = np.sqrt(TRADING_DAYS_PER_YEAR)
+    rolling_volatility = _window_std(log_returns, volatility_window)
+    indicators[f"volatility_{volatility_window}d_annualized"] = rolling_volatility * annualization
+    indicators["volatility_annualized"] = log_returns.std() * annualization
+
+    drawdown = close / close.cummax() - 1
+    indicators["drawdown"] = drawdown.ffill().iloc[-1]
+    indicators["max_drawdown"] = drawdown.min()
+    first_close = close.bfill().iloc[0]
+    indicators["period_return"] = last_close / first_close - 1
+
+    return pd.DataFrame(indicators)
+
+
+def summarize_technical_indicators(indicators: pd.DataFrame, decimals: int = 4) -> Dict[str, Dict[str, Any]]:
+    """Convert the output of compute_technical_indicators to a compact, JSON serializable dict keyed by symbol."""
+    summary: Dict[str, Dict[str, Any]] = {}
+    for symbol, row in indicators.iterrows():
+        values: Dict[str, Any] = {}
+        for name, value in row.items():
+            if value is None or (isinstance(value, float) and np.isnan(value)):
+                values[name] = None
+            elif isinstance(value, pd.Timestamp):
+                values[name] = value.strftime("%Y-%m-%d")
+            elif isinstance(value, (float, np.floating)):
+                values[name] = round(float(value), decimals)
+            else:
+                values[name] = value
+        summary[str(symbol)] = values
+    return summary
@@ -0,0 +1,131 @@
+import json
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from agno.models.base import Model
+    from agno.models.message import Message
+
+# Tokens added per message for the role and separators
+MESSAGE_OVERHEAD_TOKENS = 4
+# Tokens counted per image, per audio and per video attachment
+IMAGE_TOKENS = 765
+AUDIO_TOKENS = 500
+VIDEO_TOKENS = 2000
+
+# OpenAI models using the o200k_base encoding, older gpt models use cl100k_base
+O200K_MODEL_PREFIXES = ("gpt-4o", "gpt-4.1", "gpt-4.5", "chatgpt-4o", "o1", "o3", "o4")
+
+
+class Tokenizer(ABC):
+    """Counts tokens locally, without calling the provider"""
+
+    name: str = "tokenizer"
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        raise NotImplementedError
+
+    def count_message(self, message: "Message") -> int:
+        """Counts the text, tool calls and attachments of a message. Use Message.count_tokens() for cached counts."""
+        num_tokens = MESSAGE_OVERHEAD_TOKENS + self.count(message.get_content_string())
+        if message.tool_calls:
+            num_tokens += self.count(json.dumps(message.tool_calls, default=str))
+        if message.images:
+            num_tokens += IMAGE_TOKENS * len(message.images)
+        if message.audio:
+            num_tokens += AUDIO_TOKENS * len(message.audio)
+        if message.videos:
+            num_tokens += VIDEO_TOKENS * len(message.videos)
+        return num_tokens
+
+
+class ApproximateTokenizer(Tokenizer):
+    """Estimates tokens from the number of characters, for providers without a local tokenizer"""
+
+    def __init__(self, chars_per_token: float = 4.0):
+        self.chars_per_token = chars_per_token
+        self.name = f"approximate-{chars_per_token}"
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return int(len(text) / self.chars_per_token) + 1
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Counts tokens with a tiktoken encoding, as used by OpenAI models"""
+
+    def __init__(self, encoding_name: str = "o200k_base"):
+        try:
+            import tiktoken
+        except ImportError:
+            raise ImportError("`tiktoken` not installed. Please install using `pip install tiktoken`")
+
+        self.name = encoding_name
+        self.encoding = tiktoken.get_encoding(encoding_name)
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+
+_tokenizers: Dict[str, Tokenizer] = {}
+
+
+def get_tokenizer_family(model: Optional["Model"] = None) -> str:
+    """Returns the tokenizer family of a model: a tiktoken encoding name, "claude" or "approximate"."""
+    if model is None:
+        return "approximate"
+    model_id = (model.id or "").lower().split("/")[-1]
+    provider = (model.provider or "").lower()
+    if "claude" in model_id or "anthropic" in provider:
+        return "claude"
+    if model_id.startswith(O200K_MODEL_PREFIXES):
+        return "o200k_base"
+    if model_id.startswith("gpt-"):
+        return "cl100k_base"
+    return "approximate"
+
+
+def get_tokenizer(model: Optional["Model"] = None) -> Tokenizer:
+    """Returns a local tokenizer for the provider family of the model, created once per family.
+
+    OpenAI models use tiktoken if it is installed. Other providers, which do not ship local tokenizers,
+    use an estimate based on the number of characters.
+    """
+    family = get_tokenizer_family(model)
+    tokenizer = _tokenizers.get(family)
+    if tokenizer is not None:
+        return tokenizer
+
+    if family == "claude":
+        tokenizer = ApproximateTokenizer(chars_per_token=3.5)
+    elif family == "approximate":
+        tokenizer = ApproximateTokenizer()
+    else:
+        try:
+            tokenizer = TiktokenTokenizer(encoding_name=family)
+        except ImportError:
+            log_debug("tiktoken not installed, estimating tokens from the number of characters")
+            tokenizer = ApproximateTokenizer()
+        except Exception as e:
+            # tiktoken downloads the encoding on first use, which fails without network access
+            log_warning(f"Could not load the {family} encoding, estimating tokens from the number of characters: {e}")
+            tokenizer = ApproximateTokenizer()
+    _tokenizers[family] = tokenizer
+    return tokenizer
+
+
+def clear_tokenizer_cache() -> None:
+    _tokenizers.clear()
+
+
+def count_tokens(value: Any, tokenizer: Tokenizer) -> int:
+    """Counts the tokens of a string, or of any other value serialized to JSON."""
+    if isinstance(value, str):
+        return tokenizer.count(value)
+    return tokenizer.count(json.dumps(value, default=str))
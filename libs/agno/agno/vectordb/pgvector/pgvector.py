@@ -478,7 +478,7 @@ class PgVector(VectorDb):
             stmt = stmt.limit(limit)
 
             # Log the query for debugging
-            log_debug(f"Vector search query: {stmt}")
+            log_debug("Vector search query: %s", stmt)
 
             # Execute the query
             try:
@@ -579,7 +579,7 @@ class PgVector(VectorDb):
             stmt = stmt.limit(limit)
 
             # Log the query for debugging
-            log_debug(f"Keyword search query: {stmt}")
+            log_debug("Keyword search query: %s", stmt)
 
             # Execute the query
             try:
@@ -699,7 +699,7 @@ class PgVector(VectorDb):
             stmt = stmt.limit(limit)
 
             # Log the query for debugging
-            log_debug(f"Hybrid search query: {stmt}")
+            log_debug("Hybrid search query: %s", stmt)
 
             # Execute the query
             try:
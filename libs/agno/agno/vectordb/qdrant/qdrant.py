@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from qdrant_client import AsyncQdrantClient, QdrantClient  # noqa: F401
@@ -35,6 +35,9 @@ class Qdrant(VectorDb):
         host: Optional[str] = None,
         path: Optional[str] = None,
         reranker: Optional[Reranker] = None,
+        batch_size: int = 64,
+        embedding_parallelism: int = 8,
+        upload_parallelism: int = 4,
         **kwargs,
     ):
         # Collection attributes
@@ -74,6 +77,13 @@ class Qdrant(VectorDb):
         # Reranker instance
         self.reranker: Optional[Reranker] = reranker
 
+        # Number of points sent in each upsert request
+        self.batch_size: int = batch_size
+        # Number of documents embedded at the same time
+        self.embedding_parallelism: int = embedding_parallelism
+        # Number of upsert requests in flight at the same time
+        self.upload_parallelism: int = upload_parallelism
+
         # Qdrant client kwargs
         self.kwargs = kwargs
 
@@ -97,6 +107,11 @@ class Qdrant(VectorDb):
             )
         return self._client
 
+    @property
+    def is_local(self) -> bool:
+        """True if the client runs Qdrant in process (location=":memory:" or path), which is not thread-safe."""
+        return self.location == ":memory:" or self.path is not None
+
     @property
     def async_client(self) -> AsyncQdrantClient:
         """Get or create the async Qdrant client."""
@@ -218,66 +233,95 @@ class Qdrant(VectorDb):
             return len(scroll_result[0]) > 0
         return False
 
-    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None, batch_size: int = 10) -> None:
+    def get_point(self, document: Document) -> models.PointStruct:
+        """Embed a document and return it as a Qdrant point."""
+        document.embed(embedder=self.embedder)
+        cleaned_content = document.content.replace("\x00", "\ufffd")
+        doc_id = md5(cleaned_content.encode()).hexdigest()
+        return models.PointStruct(
+            id=doc_id,
+            vector=document.embedding,
+            payload={
+                "name": document.name,
+                "meta_data": document.meta_data,
+                "content": cleaned_content,
+                "usage": document.usage,
+            },
+        )
+
+    def insert(
+        self, documents: List[Document], filters: Optional[Dict[str, Any]] = None, batch_size: Optional[int] = None
+    ) -> None:
         """
         Insert documents into the database.
 
+        Documents are embedded embedding_parallelism at a time and sent in upserts of batch_size points.
+        While a batch is uploaded the next batch is embedded, with up to upload_parallelism upserts in flight.
+        The local client is not thread-safe, so its batches are upserted one at a time.
+
         Args:
             documents (List[Document]): List of documents to insert
             filters (Optional[Dict[str, Any]]): Filters to apply while inserting documents
-            batch_size (int): Batch size for inserting documents
+            batch_size (Optional[int]): Number of points per upsert. Defaults to self.batch_size.
         """
-        log_debug(f"Inserting {len(documents)} documents")
-        points = []
-        for document in documents:
-            document.embed(embedder=self.embedder)
-            cleaned_content = document.content.replace("\x00", "\ufffd")
-            doc_id = md5(cleaned_content.encode()).hexdigest()
-            points.append(
-                models.PointStruct(
-                    id=doc_id,
-                    vector=document.embedding,
-                    payload={
-                        "name": document.name,
-                        "meta_data": document.meta_data,
-                        "content": cleaned_content,
-                        "usage": document.usage,
-                    },
+        from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+        batch_size = batch_size or self.batch_size
+        log_debug(f"Inserting {len(documents)} documents in batches of {batch_size}")
+        embedding_pool = ThreadPoolExecutor(max_workers=self.embedding_parallelism)
+        upload_pool = ThreadPoolExecutor(max_workers=self.upload_parallelism)
+        try:
+            uploads: Set[Future] = set()
+            for i in range(0, len(documents), batch_size):
+                points = list(embedding_pool.map(self.get_point, documents[i : i + batch_size]))
+                log_debug("Upserting %d documents", len(points))
+                if self.is_local:
+                    self.client.upsert(collection_name=self.collection, wait=True, points=points)
+                    continue
+                if len(uploads) >= self.upload_parallelism:
+                    done, uploads = wait(uploads, return_when=FIRST_COMPLETED)
+                    for upload in done:
+                        upload.result()
+                uploads.add(
+                    upload_pool.submit(self.client.upsert, collection_name=self.collection, wait=False, points=points)
                 )
-            )
-            log_debug(f"Inserted document: {document.name} ({document.meta_data})")
-        if len(points) > 0:
-            self.client.upsert(collection_name=self.collection, wait=False, points=points)
-        log_debug(f"Upsert {len(points)} documents")
+            for upload in uploads:
+                upload.result()
+        finally:
+            embedding_pool.shutdown()
+            upload_pool.shutdown()
+        log_debug(f"Upserted {len(documents)} documents")
+
+    async def async_insert(
+        self, documents: List[Document], filters: Optional[Dict[str, Any]] = None, batch_size: Optional[int] = None
+    ) -> None:
+        """Insert documents asynchronously.
+
+        The embedder is synchronous, so documents are embedded in threads, embedding_parallelism at a time.
+        Batches of batch_size points are upserted as soon as they are embedded, up to upload_parallelism at a time,
+        or one at a time with the local client.
+        """
+        import asyncio
 
-    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Insert documents asynchronously."""
-        log_debug(f"Inserting {len(documents)} documents asynchronously")
+        batch_size = batch_size or self.batch_size
+        log_debug(f"Inserting {len(documents)} documents asynchronously in batches of {batch_size}")
+        embedding_semaphore = asyncio.Semaphore(self.embedding_parallelism)
+        upload_semaphore = asyncio.Semaphore(1 if self.is_local else self.upload_parallelism)
 
-        async def process_document(document):
-            document.embed(embedder=self.embedder)
-            cleaned_content = document.content.replace("\x00", "\ufffd")
-            doc_id = md5(cleaned_content.encode()).hexdigest()
-            log_debug(f"Inserted document asynchronously: {document.name} ({document.meta_data})")
-            return models.PointStruct(
-                id=doc_id,
-                vector=document.embedding,
-                payload={
-                    "name": document.name,
-                    "meta_data": document.meta_data,
-                    "content": cleaned_content,
-                    "usage": document.usage,
-                },
-            )
-
-        import asyncio
+        async def get_point(document: Document) -> models.PointStruct:
+            async with embedding_semaphore:
+                return await asyncio.to_thread(self.get_point, document)
 
-        # Process all documents in parallel
-        points = await asyncio.gather(*[process_document(doc) for doc in documents])
+        async def insert_batch(batch: List[Document]) -> None:
+            points = await asyncio.gather(*[get_point(document) for document in batch])
+            async with upload_semaphore:
+                await self.async_client.upsert(collection_name=self.collection, wait=False, points=points)
+            log_debug("Upserted %d documents asynchronously", len(points))
 
-        if len(points) > 0:
-            await self.async_client.upsert(collection_name=self.collection, wait=False, points=points)
-        log_debug(f"Upserted {len(points)} documents asynchronously")
+        await asyncio.gather(
+            *[insert_batch(documents[i : i + batch_size]) for i in range(0, len(documents), batch_size)]
+        )
+        log_debug(f"Upserted {len(documents)} documents asynchronously")
 
     def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -309,13 +353,13 @@ class Qdrant(VectorDb):
             logger.error(f"Error getting embedding for Query: {query}")
             return []
 
-        results = self.client.search(
+        results = self.client.query_points(
             collection_name=self.collection,
-            query_vector=query_embedding,
+            query=query_embedding,
             with_vectors=True,
             with_payload=True,
             limit=limit,
-        )
+        ).points
 
         # Build search results
         search_results: List[Document] = []
@@ -347,13 +391,15 @@ class Qdrant(VectorDb):
             logger.error(f"Error getting embedding for Query: {query}")
             return []
 
-        results = await self.async_client.search(
-            collection_name=self.collection,
-            query_vector=query_embedding,
-            with_vectors=True,
-            with_payload=True,
-            limit=limit,
-        )
+        results = (
+            await self.async_client.query_points(
+                collection_name=self.collection,
+                query=query_embedding,
+                with_vectors=True,
+                with_payload=True,
+                limit=limit,
+            )
+        ).points
 
         # Build search results
         search_results: List[Document] = []
@@ -297,7 +297,7 @@ class SingleStore(VectorDb):
             stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
 
         stmt = stmt.limit(limit=limit)
-        log_debug(f"Query: {stmt}")
+        log_debug("Query: %s", stmt)
 
         # Get neighbors
         # This will only work if embedding column is created with `vector` data type.
@@ -0,0 +1,106 @@
+from unittest.mock import patch
+
+from agno.agent import Agent, ContextWindow
+from agno.models.message import Message
+from agno.models.stub import StubModel
+from agno.utils.tokens import ApproximateTokenizer, clear_tokenizer_cache, get_tokenizer, get_tokenizer_family
+
+
+class CountingTokenizer(ApproximateTokenizer):
+    def __init__(self):
+        super().__init__(chars_per_token=4.0)
+        self.name = "counting"
+        self.num_messages_counted = 0
+
+    def count_message(self, message: Message) -> int:
+        self.num_messages_counted += 1
+        return super().count_message(message)
+
+
+def create_agent(context_window: ContextWindow, num_runs: int = 5) -> Agent:
+    agent = Agent(
+        model=StubModel(responses=["The price of NVDA went up 2% today. " * 5]),
+        add_history_to_messages=True,
+        num_history_runs=10,
+        context_window=context_window,
+        telemetry=False,
+    )
+    for i in range(num_runs):
+        agent.run(f"What happened in the market on day {i}? " * 5)
+    return agent
+
+
+def test_tokenizer_family():
+    assert get_tokenizer_family(StubModel(id="gpt-4o-mini")) == "o200k_base"
+    assert get_tokenizer_family(StubModel(id="gpt-4")) == "cl100k_base"
+    assert get_tokenizer_family(StubModel(id="claude-3-7-sonnet")) == "claude"
+    assert get_tokenizer_family(StubModel(id="llama3.1")) == "approximate"
+    assert get_tokenizer(StubModel(id="llama3.1")) is get_tokenizer(None)
+
+
+def test_token_counts_are_cached_on_the_message():
+    tokenizer = CountingTokenizer()
+    message = Message(role="user", content="What is the price of NVDA?")
+
+    num_tokens = message.count_tokens(tokenizer)
+    assert message.history_view().count_tokens(tokenizer) == num_tokens
+    assert tokenizer.num_messages_counted == 1
+
+    message.content = "What is the price of TSLA and AAPL?"
+    assert message.count_tokens(tokenizer) > num_tokens
+    assert tokenizer.num_messages_counted == 2
+
+
+def test_history_is_limited_to_the_budget():
+    tokenizer = CountingTokenizer()
+    agent = create_agent(ContextWindow(max_tokens=400, reserve_tokens=100, tokenizer=tokenizer))
+
+    run_messages = agent.get_run_messages(message="Summarize the week")
+    history = [m for m in run_messages.messages if m.from_history]
+
+    # Whole runs, the most recent first, within the budget
+    assert 0 < len(history) < 10
+    assert len(history) % 2 == 0
+    assert history[-1].content == agent.memory.runs[-1].response.messages[-1].content
+    assert run_messages.prompt_tokens <= 300
+    assert run_messages.messages[-1].content == "Summarize the week"
+
+    # History messages are counted once, only the new user message is counted again
+    num_messages_counted = tokenizer.num_messages_counted
+    agent.get_run_messages(message="Summarize the week")
+    assert tokenizer.num_messages_counted - num_messages_counted == 1
+
+
+def test_large_budget_keeps_num_history_runs():
+    agent = create_agent(ContextWindow(max_tokens=100_000))
+
+    run_messages = agent.get_run_messages(message="Summarize the week")
+
+    assert len([m for m in run_messages.messages if m.from_history]) == 10
+    assert run_messages.prompt_tokens == sum(m.count_tokens(get_tokenizer(agent.model)) for m in run_messages.messages)
+
+
+def test_references_are_limited_to_max_reference_tokens():
+    documents = [{"content": f"Document {i}. " * 40} for i in range(5)]
+    agent = Agent(
+        model=StubModel(),
+        add_references=True,
+        retriever=lambda agent, query, num_documents=None, **kwargs: documents,
+        context_window=ContextWindow(max_tokens=10_000, max_reference_tokens=300),
+        telemetry=False,
+    )
+
+    agent.run("What do the documents say?")
+
+    references = agent.run_response.extra_data.references[0].references
+    assert references == documents[:2]
+
+
+def test_tokenizer_falls_back_when_the_encoding_cannot_be_loaded():
+    clear_tokenizer_cache()
+    try:
+        with patch("agno.utils.tokens.TiktokenTokenizer", side_effect=OSError("network is unreachable")):
+            tokenizer = get_tokenizer(StubModel(id="gpt-4o"))
+        assert isinstance(tokenizer, ApproximateTokenizer)
+    finally:
+        clear_tokenizer_cache()
@@ -0,0 +1,117 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from agno.agent import Agent
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.models.stub import StubModel, StubResponse
+from agno.reasoning.default import get_default_reasoning_agent
+
+REASONING_STEPS = {
+    "reasoning_steps": [
+        {
+            "title": "Look up the price",
+            "action": "I will answer with the price",
+            "result": "NVDA is at 101.5",
+            "reasoning": "The price is known",
+            "next_action": "final_answer",
+            "confidence": 0.9,
+        }
+    ]
+}
+
+
+@dataclass
+class ReasoningStubModel(StubModel):
+    """Returns reasoning steps when a response format is requested and an answer otherwise"""
+
+    def _build_completion(self, messages: List[Message], response: StubResponse) -> Dict[str, Any]:
+        if self.response_format is not None:
+            response = StubResponse(content=json.dumps(REASONING_STEPS))
+        else:
+            response = StubResponse(content="NVDA is at 101.5")
+        return super()._build_completion(messages, response)
+
+
+def get_price(symbol: str) -> str:
+    """Get the price of a stock."""
+    return "101.5"
+
+
+def test_reasoning_agent_is_reused_across_runs():
+    agent = Agent(model=ReasoningStubModel(), reasoning=True, tools=[get_price])
+
+    with patch("agno.reasoning.default.get_default_reasoning_agent", wraps=get_default_reasoning_agent) as build:
+        first = agent.run("What is the price of NVDA?")
+        reasoning_agent = agent._reasoning_agents["default"][-1]
+        functions = reasoning_agent._functions_for_model
+        second = agent.run("What is the price of NVDA today?")
+
+    assert build.call_count == 1
+    assert agent._reasoning_agents["default"][-1] is reasoning_agent
+    # Tools are processed once
+    assert reasoning_agent._functions_for_model is functions
+    # Only the last run is kept by the reasoning agent
+    assert len(reasoning_agent.memory.runs) == 1
+    for response in (first, second):
+        assert response.content == "NVDA is at 101.5"
+        assert response.extra_data.reasoning_steps[0].title == "Look up the price"
+
+
+def test_reasoning_agent_is_rebuilt_when_the_model_changes():
+    agent = Agent(model=ReasoningStubModel(), reasoning=True)
+    agent.run("What is the price of NVDA?")
+    reasoning_agent = agent._reasoning_agents["default"][-1]
+
+    agent.run("What is the price of NVDA?")
+    assert agent._reasoning_agents["default"][-1] is reasoning_agent
+
+    agent.model = ReasoningStubModel()
+    agent.run("What is the price of NVDA?")
+    assert agent._reasoning_agents["default"][-1] is not reasoning_agent
+    assert agent._reasoning_agents["default"][-1].model is agent._get_reasoning_model()
+
+
+def test_reasoning_model_shares_the_model_client():
+    model = OpenAIChat(id="gpt-4o", api_key="test-key", temperature=0.2)
+    model.get_client()
+    agent = Agent(model=model, tool_choice="none")
+    agent.update_model()
+
+    reasoning_model = agent._get_reasoning_model()
+
+    assert reasoning_model is not model
+    assert reasoning_model is agent._get_reasoning_model()
+    assert reasoning_model.client is model.client
+    assert (reasoning_model.api_key, reasoning_model.temperature) == ("test-key", 0.2)
+    assert reasoning_model.tool_choice is None
+    assert model.tool_choice == "none"
+
+
+def test_reasoning_model_is_used_when_provided():
+    reasoning_model = ReasoningStubModel()
+    agent = Agent(model=ReasoningStubModel(), reasoning_model=reasoning_model)
+
+    agent.run("What is the price of NVDA?")
+
+    assert agent._get_reasoning_model() is reasoning_model
+    assert agent._reasoning_agents["default"][-1].model is reasoning_model
+
+
+def test_async_reasoning_agent_is_reused_across_runs():
+    agent = Agent(model=ReasoningStubModel(), reasoning=True)
+
+    async def run_twice():
+        await agent.arun("What is the price of NVDA?")
+        reasoning_agent = agent._reasoning_agents["default"][-1]
+        response = await agent.arun("What is the price of NVDA today?")
+        return reasoning_agent, response
+
+    reasoning_agent, response = asyncio.run(run_twice())
+
+    assert agent._reasoning_agents["default"][-1] is reasoning_agent
+    assert len(reasoning_agent.memory.runs) == 1
+    assert response.extra_data.reasoning_steps[0].title == "Look up the price"
@@ -0,0 +1,80 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from agno.agent import Agent
+from agno.models.stub import StubModel
+
+
+class StockReport(BaseModel):
+    symbol: str
+    price: float
+    highlights: List[str]
+
+
+def build_system_message_uncached(agent: Agent) -> str:
+    agent._system_message_segments = None
+    agent._json_output_prompt = None
+    return agent.get_system_message().content
+
+
+def test_static_segments_are_reused():
+    agent = Agent(
+        model=StubModel(),
+        description="You are a finance agent.",
+        instructions=["Use tables", "Be concise"],
+        expected_output="A short report",
+        markdown=True,
+    )
+
+    first = agent.get_system_message().content
+    segments = agent._system_message_segments
+
+    assert agent.get_system_message().content == first
+    assert agent._system_message_segments is segments
+    assert build_system_message_uncached(agent) == first
+
+
+def test_config_changes_rebuild_the_segments():
+    agent = Agent(model=StubModel(), description="You are a finance agent.", instructions=["Use tables"])
+    agent.get_system_message()
+
+    agent.instructions = ["Use bullet points"]
+    assert "Use bullet points" in agent.get_system_message().content
+
+    agent.description = "You are a research agent."
+    system_message = agent.get_system_message().content
+    assert system_message.startswith("You are a research agent.")
+    assert "Use tables" not in system_message
+
+
+def test_dynamic_parts_are_built_on_every_run():
+    agent = Agent(
+        model=StubModel(),
+        instructions=["The user is interested in {sector}"],
+        add_state_in_messages=True,
+        session_state={"sector": "energy"},
+    )
+    agent.initialize_agent()
+    assert "The user is interested in energy" in agent.get_system_message().content
+
+    agent.session_state["sector"] = "banking"
+    assert "The user is interested in banking" in agent.get_system_message().content
+
+    # Callable instructions are called on every run
+    calls = []
+    agent.instructions = lambda agent: calls.append(1) or ["Be concise"]
+    agent.get_system_message()
+    agent.get_system_message()
+    assert len(calls) == 2
+
+
+def test_json_output_prompt_is_cached_per_response_model():
+    agent = Agent(model=StubModel(), response_model=StockReport)
+
+    prompt = agent.get_json_output_prompt()
+    assert '"highlights"' in prompt
+    assert agent.get_json_output_prompt() is prompt
+
+    agent.response_model = ["symbol", "price"]
+    assert '["symbol", "price"]' in agent.get_json_output_prompt()
@@ -0,0 +1,117 @@
+import gzip
+import json
+from typing import List, Optional
+
+import pytest
+
+from agno.agent import Agent
+from agno.api.agent import AgentRunCreate, create_agent_run
+from agno.api.exporter import (
+    FileTelemetrySink,
+    TelemetryEvent,
+    TelemetryExporter,
+    TelemetrySink,
+    set_telemetry_exporter,
+)
+from agno.api.routes import ApiRoutes
+from agno.models.stub import StubModel
+
+
+class RecordingSink(TelemetrySink):
+    def __init__(self):
+        self.batches: List[List[TelemetryEvent]] = []
+        self.closed = False
+
+    def send(self, events: List[TelemetryEvent]) -> None:
+        self.batches.append(events)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def sink():
+    sink = RecordingSink()
+    set_telemetry_exporter(TelemetryExporter(sink=sink, flush_interval=60))
+    yield sink
+    set_telemetry_exporter(None)
+
+
+def test_events_are_batched():
+    sink = RecordingSink()
+    exporter = TelemetryExporter(sink=sink, max_batch_size=3, flush_interval=60)
+    for i in range(7):
+        exporter.submit("/route", {"run": {"run_id": str(i)}})
+    exporter.shutdown()
+
+    assert sum(len(batch) for batch in sink.batches) == 7
+    assert max(len(batch) for batch in sink.batches) <= 3
+    assert exporter.exported == 7
+    assert exporter.failed == 0
+    assert sink.closed
+
+
+class FailingSink(TelemetrySink):
+    """Sends the first event of each batch"""
+
+    def send(self, events: List[TelemetryEvent]) -> Optional[int]:
+        if len(events) > 1:
+            return 1
+        raise ConnectionError("API unavailable")
+
+
+def test_only_sent_events_are_counted():
+    exporter = TelemetryExporter(sink=FailingSink(), max_batch_size=3, flush_interval=60)
+    for i in range(4):
+        exporter.submit("/route", {"run": {"run_id": str(i)}})
+    exporter.shutdown()
+
+    # A batch of 3 with 1 sent, then a batch of 1 that raised
+    assert exporter.exported == 1
+    assert exporter.failed == 3
+
+
+def test_full_queue_drops_events():
+    sink = RecordingSink()
+    exporter = TelemetryExporter(sink=sink, max_queue_size=2, max_batch_size=10, flush_interval=60)
+
+    assert exporter.submit("/route", {"id": 1})
+    assert exporter.submit("/route", {"id": 2})
+    assert not exporter.submit("/route", {"id": 3})
+    exporter.shutdown()
+
+    assert exporter.dropped == 1
+    assert [event.payload["id"] for batch in sink.batches for event in batch] == [1, 2]
+    # Events submitted after shutdown are dropped
+    assert not exporter.submit("/route", {"id": 4})
+
+
+def test_file_sink_writes_compressed_batches(tmp_path):
+    path = tmp_path / "telemetry.jsonl.gz"
+    exporter = TelemetryExporter(sink=FileTelemetrySink(path), max_batch_size=2, flush_interval=60)
+    for i in range(3):
+        exporter.submit(ApiRoutes.AGENT_TELEMETRY_RUN_CREATE, {"run": {"run_id": str(i)}})
+    exporter.shutdown()
+
+    with gzip.open(path, "rt") as f:
+        events = [json.loads(line) for line in f]
+    assert [event["run"]["run_id"] for event in events] == ["0", "1", "2"]
+    assert events[0]["route"] == ApiRoutes.AGENT_TELEMETRY_RUN_CREATE
+
+
+def test_create_agent_run_is_queued(sink):
+    create_agent_run(run=AgentRunCreate(session_id="session-1", run_id="run-1"), monitor=True)
+    set_telemetry_exporter(None)
+
+    event = sink.batches[0][0]
+    assert event.route == ApiRoutes.AGENT_RUN_CREATE
+    assert event.payload == {"run": {"session_id": "session-1", "run_id": "run-1"}}
+
+
+def test_agent_run_telemetry_is_queued(sink):
+    agent = Agent(model=StubModel(), telemetry=True)
+    response = agent.run("Hi")
+    set_telemetry_exporter(None)
+
+    runs = [event.payload["run"] for batch in sink.batches for event in batch if "run" in event.payload]
+    assert runs[0]["run_id"] == response.run_id
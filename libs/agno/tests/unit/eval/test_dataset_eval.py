@@ -0,0 +1,228 @@
+import asyncio
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import pytest
+
+from agno.agent import Agent
+from agno.eval.dataset import DatasetEval, EvalCase
+from agno.exceptions import ModelProviderError, ModelRateLimitError
+from agno.models.message import Message
+from agno.models.stub import LatencyProfile, StubModel, StubResponse, StubToolCall
+
+ANSWERS = {
+    "What is the capital of France?": "Paris",
+    "What is the capital of Spain?": "Madrid",
+    "What is the capital of Italy?": "Milan",
+}
+
+CASES = [
+    EvalCase(question="What is the capital of France?", expected_answer="Paris"),
+    EvalCase(question="What is the capital of Spain?", expected_answer="Madrid"),
+    EvalCase(question="What is the capital of Italy?", expected_answer="Rome"),
+]
+
+
+@dataclass
+class AnswerModel(StubModel):
+    """Answers the questions in ANSWERS and logs them"""
+
+    questions: Any = None
+
+    def _build_completion(self, messages: List[Message], response: StubResponse) -> Dict[str, Any]:
+        question = messages[-1].get_content_string()
+        if self.questions is not None:
+            self.questions.append(question)
+        return super()._build_completion(messages, StubResponse(content=ANSWERS.get(question, "I don't know")))
+
+
+@dataclass
+class JudgeModel(StubModel):
+    """Scores 10 if the answer is the expected answer and 2 otherwise"""
+
+    def _build_completion(self, messages: List[Message], response: StubResponse) -> Dict[str, Any]:
+        expected_answer = re.search(r"## Expected Answer:\n(.*)\n", messages[0].get_content_string()).group(1)
+        score = 10 if messages[-1].get_content_string() == expected_answer else 2
+        content = json.dumps({"accuracy_score": score, "accuracy_reason": "Compared to the expected answer"})
+        return super()._build_completion(messages, StubResponse(content=content))
+
+
+def test_dataset_eval_scores_every_case():
+    result = DatasetEval(agent=Agent(model=AnswerModel()), model=JudgeModel(), cases=CASES).run(print_summary=False)
+
+    scores = {r.question: r.score for r in result.results}
+    assert scores == {
+        "What is the capital of France?": 10,
+        "What is the capital of Spain?": 10,
+        "What is the capital of Italy?": 2,
+    }
+    assert (result.num_cases, result.num_passed, result.num_errors) == (3, 2, 0)
+    assert result.accuracy == 2 / 3
+    assert result.total_tokens > 0
+    assert result.eval_total_tokens > 0
+    assert result.max_latency >= result.median_latency > 0
+
+
+def test_cases_run_concurrently():
+    cases = [{"question": f"Question {i}"} for i in range(8)]
+    agent = Agent(model=StubModel(latency=LatencyProfile(time_to_first_token=0.2)))
+
+    result = DatasetEval(agent=agent, cases=cases, max_concurrency=8).run(print_summary=False)
+
+    assert result.num_passed == 8
+    # Sequential runs would take 1.6s
+    assert result.duration < 1.0
+
+
+@dataclass
+class RateLimitedModel(AnswerModel):
+    """Raises a rate limit error while there are failures left"""
+
+    failures: Any = None
+
+    def invoke(self, messages: List[Message]) -> Dict[str, Any]:
+        if self.failures:
+            self.failures.pop()
+            raise ModelRateLimitError("Too many requests", model_name=self.name, model_id=self.id)
+        return super().invoke(messages)
+
+
+def test_rate_limited_runs_are_retried():
+    model = RateLimitedModel(failures=[1, 1])
+    # The agents of all cases share the model and its failures
+    dataset_eval = DatasetEval(
+        agent_factory=lambda: Agent(model=model), model=JudgeModel(), cases=CASES[:1], retry_delay=0.01
+    )
+
+    result = dataset_eval.run(print_summary=False)
+
+    assert result.results[0].score == 10
+    assert result.num_retries == 2
+
+
+@dataclass
+class OpenAIRateLimitedModel(AnswerModel):
+    """Raises a provider error with status 429, like OpenAIChat, while there are failures left"""
+
+    failures: Any = None
+
+    def invoke(self, messages: List[Message]) -> Dict[str, Any]:
+        if self.failures:
+            self.failures.pop()
+            raise ModelProviderError("Rate limit reached", status_code=429, model_name=self.name, model_id=self.id)
+        return super().invoke(messages)
+
+
+def test_provider_errors_with_status_429_are_retried():
+    model = OpenAIRateLimitedModel(failures=[1])
+    dataset_eval = DatasetEval(agent=Agent(model=model), model=JudgeModel(), cases=CASES[:1], retry_delay=0.01)
+
+    result = dataset_eval.run(print_summary=False)
+
+    assert result.results[0].score == 10
+    assert result.num_retries == 1
+
+
+def test_rate_limit_errors_after_max_retries():
+    model = RateLimitedModel(failures=[1, 1])
+    dataset_eval = DatasetEval(
+        agent_factory=lambda: Agent(model=model), cases=CASES[:1], max_retries=1, retry_delay=0.01
+    )
+
+    result = dataset_eval.run(print_summary=False)
+
+    assert result.num_errors == 1
+    assert result.results[0].passed is False
+    assert "Too many requests" in result.results[0].error
+
+
+def test_resume_from_results_file(tmp_path):
+    results_file = str(tmp_path / "results.jsonl")
+    questions: List[str] = []
+
+    def agent_factory():
+        return Agent(model=AnswerModel(questions=questions))
+
+    DatasetEval(agent_factory=agent_factory, model=JudgeModel(), cases=CASES[:2], results_file=results_file).run(
+        print_summary=False
+    )
+    assert len(questions) == 2
+
+    result = DatasetEval(agent_factory=agent_factory, model=JudgeModel(), cases=CASES, results_file=results_file).run(
+        print_summary=False
+    )
+
+    # Only the new case is run
+    assert questions[2:] == ["What is the capital of Italy?"]
+    assert result.num_cases == 3
+    assert result.num_passed == 2
+    with open(results_file) as f:
+        assert len(f.readlines()) == 3
+
+
+def test_expected_tool_calls_are_checked():
+    def get_capital(country: str) -> str:
+        """Get the capital of a country."""
+        return "Paris"
+
+    agent = Agent(
+        model=StubModel(
+            responses=[
+                StubResponse(tool_calls=[StubToolCall(name="get_capital", arguments={"country": "France"})]),
+                "Paris",
+            ]
+        ),
+        tools=[get_capital],
+    )
+    cases = [
+        EvalCase(question="Capital of France?", expected_tool_calls=["get_capital"]),
+        EvalCase(question="Capital of Germany?", expected_tool_calls=["search_web"]),
+    ]
+
+    result = DatasetEval(agent=agent, cases=cases).run(print_summary=False)
+
+    passed = {r.question: (r.passed, r.failed_tool_calls) for r in result.results}
+    assert passed == {
+        "Capital of France?": (True, []),
+        "Capital of Germany?": (False, ["get_capital"]),
+    }
+
+
+def test_async_dataset_eval():
+    dataset_eval = DatasetEval(agent=Agent(model=AnswerModel()), model=JudgeModel(), cases=CASES, max_concurrency=2)
+
+    result = asyncio.run(dataset_eval.arun(print_summary=False))
+
+    assert (result.num_cases, result.num_passed) == (3, 2)
+    assert result.total_tokens > 0
+
+
+def test_agent_is_copied_for_every_case():
+    questions: List[str] = []
+    agent = Agent(model=AnswerModel(questions=questions))
+
+    result = DatasetEval(agent=agent, model=JudgeModel(), cases=CASES).run(print_summary=False)
+
+    # The copies share the configuration of the model
+    assert sorted(questions) == sorted(case.question for case in CASES)
+    assert result.num_passed == 2
+    assert agent.run_response is None
+
+
+def test_results_file_is_formatted_with_name(tmp_path):
+    results_file = str(tmp_path / "{name}.jsonl")
+    DatasetEval(
+        name="capitals",
+        agent=Agent(model=AnswerModel()),
+        model=JudgeModel(),
+        cases=CASES[:1],
+        results_file=results_file,
+    ).run(print_summary=False)
+    assert (tmp_path / "capitals.jsonl").exists()
+
+    with pytest.raises(ValueError):
+        DatasetEval(
+            agent=Agent(model=AnswerModel()), cases=CASES[:1], results_file=str(tmp_path / "{eval_id}.jsonl")
+        ).run(print_summary=False)
@@ -0,0 +1,105 @@
+import pytest
+
+from agno.agent import Agent
+from agno.memory import AgentMemory, MemoryPipeline
+from agno.memory.classifier import MemoryClassifier
+from agno.memory.db.sqlite import SqliteMemoryDb
+from agno.memory.manager import MemoryManager
+from agno.models.stub import StubModel, StubResponse, StubToolCall
+
+
+def add_memory_response(memory: str) -> StubResponse:
+    return StubResponse(tool_calls=[StubToolCall(name="add_memory", arguments={"memory": memory})])
+
+
+@pytest.fixture
+def memory_db(tmp_path):
+    db = SqliteMemoryDb(db_file=str(tmp_path / "memory.db"))
+    db.create()
+    return db
+
+
+def test_parse_batch_response():
+    assert MemoryClassifier.parse_batch_response("1, 3", 3) == [True, False, True]
+    assert MemoryClassifier.parse_batch_response("none", 2) == [False, False]
+    # Unparseable responses select every message and leave the decision to the MemoryManager
+    assert MemoryClassifier.parse_batch_response("maybe", 2) == [True, True]
+
+
+def test_batch_classification_uses_one_model_call(memory_db):
+    classifier_model = StubModel(responses=["2"])
+    manager_model = StubModel(responses=[add_memory_response("User's name is Ana"), "Done"])
+    pipeline = MemoryPipeline(
+        classifier=MemoryClassifier(model=classifier_model), manager=MemoryManager(model=manager_model)
+    )
+
+    pipeline.process(user_id="ana", inputs=["What time is it?", "My name is Ana", "Thanks"], db=memory_db)
+
+    assert classifier_model.request_count == 1
+    assert manager_model.request_count == 2
+    assert [row.memory["memory"] for row in memory_db.read_memories(user_id="ana")] == ["User's name is Ana"]
+
+
+def test_repeated_messages_are_skipped(memory_db):
+    classifier_model = StubModel(responses=["1"])
+    manager_model = StubModel(responses=[add_memory_response("User's name is Ana"), "Done"])
+    pipeline = MemoryPipeline(
+        classifier=MemoryClassifier(model=classifier_model), manager=MemoryManager(model=manager_model)
+    )
+
+    pipeline.process(user_id="ana", inputs=["My name is Ana", "my name is  Ana"], db=memory_db)
+    # The message already produced a memory
+    pipeline.process(user_id="ana", inputs=["My name is Ana"], db=memory_db)
+
+    assert classifier_model.request_count == 1
+    assert len(memory_db.read_memories(user_id="ana")) == 1
+
+
+def test_duplicate_memories_are_not_added(memory_db):
+    manager = MemoryManager(user_id="ana", db=memory_db)
+
+    assert manager.add_memory("User's name is Ana") == "Memory added successfully"
+    assert manager.add_memory("user's name is ana.") == "Memory already exists"
+    assert len(memory_db.read_memories(user_id="ana")) == 1
+
+
+def test_agent_run_updates_memories_in_background(memory_db):
+    pipeline = MemoryPipeline(
+        classifier=MemoryClassifier(model=StubModel(responses=["1"])),
+        manager=MemoryManager(model=StubModel(responses=[add_memory_response("User likes tea"), "Done"])),
+        batch_wait=0,
+    )
+    memory = AgentMemory(db=memory_db, create_user_memories=True, memory_pipeline=pipeline)
+    agent = Agent(model=StubModel(), memory=memory, user_id="ana", telemetry=False)
+
+    agent.run("I like tea")
+    # The next run waits for the memories of the previous run
+    agent.run("What do I like?")
+
+    assert [m.memory for m in agent.memory.memories] == ["User likes tea"]
+    # The second message is still processed in the background
+    assert pipeline.flush(timeout=5)
+    assert not pipeline.has_pending("ana")
+
+
+def test_pipeline_does_not_change_the_classifier_and_manager_passed_in(memory_db):
+    classifier = MemoryClassifier(model=StubModel(responses=["1, 2"]))
+    manager = MemoryManager(
+        model=StubModel(
+            responses=[
+                add_memory_response("User's name is Ana"),
+                "Done",
+                add_memory_response("User lives in Lisbon"),
+                "Done",
+            ]
+        )
+    )
+    pipeline = MemoryPipeline(classifier=classifier, manager=manager)
+
+    pipeline.process(user_id="ana", inputs=["My name is Ana", "I live in Lisbon"], db=memory_db)
+
+    assert classifier.existing_memories is None
+    assert (manager.user_id, manager.db) == (None, None)
+    # Every memory keeps the message it was created from
+    memories = {row.memory["memory"]: row.memory["input"] for row in memory_db.read_memories(user_id="ana")}
+    assert memories == {"User's name is Ana": "My name is Ana", "User lives in Lisbon": "I live in Lisbon"}
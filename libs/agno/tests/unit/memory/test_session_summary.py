@@ -0,0 +1,158 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from agno.agent import Agent
+from agno.memory import AgentMemory
+from agno.memory.summarizer import MemorySummarizer
+from agno.memory.summary import SessionSummary
+from agno.models.message import Message
+from agno.models.stub import StubModel, StubResponse
+from agno.storage.json import JsonStorage
+
+
+@dataclass
+class RecordingStubModel(StubModel):
+    """Keeps the system message of every request"""
+
+    prompts: List[str] = field(default_factory=list, init=False)
+
+    def _build_completion(self, messages: List[Message], response: StubResponse) -> Dict[str, Any]:
+        self.prompts.append(messages[0].get_content_string())
+        return super()._build_completion(messages, response)
+
+
+@dataclass
+class SlowStubModel(RecordingStubModel):
+    """Answers after the run has saved the session"""
+
+    def _build_completion(self, messages: List[Message], response: StubResponse) -> Dict[str, Any]:
+        time.sleep(0.2)
+        return super()._build_completion(messages, response)
+
+
+def summary_response(summary: str) -> str:
+    return json.dumps({"summary": summary, "topics": ["greetings"]})
+
+
+def create_agent(summarizer_model: RecordingStubModel, **memory_kwargs) -> Agent:
+    return Agent(
+        model=StubModel(responses=["Hello!"]),
+        memory=AgentMemory(
+            create_session_summary=True,
+            summarizer=MemorySummarizer(model=summarizer_model),
+            **memory_kwargs,
+        ),
+    )
+
+
+def test_summary_only_includes_runs_since_the_last_summary():
+    summarizer_model = RecordingStubModel(responses=[summary_response("first"), summary_response("second")])
+    agent = create_agent(summarizer_model)
+
+    agent.run("My name is Ana")
+    assert agent.memory.summary == SessionSummary(summary="first", topics=["greetings"])
+    assert agent.memory.summarized_runs == 1
+
+    agent.run("I live in Lisbon")
+    assert agent.memory.summary.summary == "second"
+    assert agent.memory.summarized_runs == 2
+
+    second_prompt = summarizer_model.prompts[1]
+    assert "<previous_summary>\nfirst" in second_prompt
+    assert "I live in Lisbon" in second_prompt
+    assert "My name is Ana" not in second_prompt
+
+
+def test_summary_every_n_runs():
+    summarizer_model = RecordingStubModel(responses=[summary_response("summary")])
+    agent = create_agent(summarizer_model, summary_every_n_runs=3)
+
+    agent.run("one")
+    agent.run("two")
+    assert summarizer_model.request_count == 0
+    assert agent.memory.summary is None
+
+    agent.run("three")
+    assert summarizer_model.request_count == 1
+    assert agent.memory.summarized_runs == 3
+
+    # Forcing an update without new runs does not call the summarizer
+    agent.memory.update_summary(force=True)
+    assert summarizer_model.request_count == 1
+
+
+def test_summary_token_threshold():
+    summarizer_model = RecordingStubModel(responses=[summary_response("summary")])
+    agent = create_agent(summarizer_model, summary_every_n_runs=None, summary_token_threshold=15)
+
+    agent.run("hi")
+    assert summarizer_model.request_count == 0
+
+    agent.run("Please remember that my favourite stocks are NVDA, TSLA and AAPL")
+    assert summarizer_model.request_count == 1
+    assert agent.memory.summarized_runs == 2
+
+
+def test_failed_summary_keeps_the_watermark():
+    summarizer_model = RecordingStubModel(responses=[summary_response("first"), "not json", summary_response("third")])
+    agent = create_agent(summarizer_model)
+
+    agent.run("one")
+    agent.run("two")
+    assert agent.memory.summary.summary == "first"
+    assert agent.memory.summarized_runs == 1
+
+    agent.run("three")
+    assert agent.memory.summary.summary == "third"
+    assert agent.memory.summarized_runs == 3
+    # The run of the failed update is sent again
+    assert "two" in summarizer_model.prompts[2]
+
+
+def test_summary_in_background():
+    summarizer_model = RecordingStubModel(responses=[summary_response("background")])
+    agent = create_agent(summarizer_model, summary_in_background=True)
+
+    agent.run("My name is Ana")
+    assert agent.memory.wait_for_summary(timeout=5)
+    assert agent.memory.summary.summary == "background"
+    assert agent.memory.summarized_runs == 1
+
+
+def test_async_summary_is_incremental():
+    summarizer_model = RecordingStubModel(responses=[summary_response("first"), summary_response("second")])
+    agent = create_agent(summarizer_model)
+
+    async def run():
+        await agent.arun("My name is Ana")
+        await agent.arun("I live in Lisbon")
+
+    asyncio.run(run())
+
+    assert agent.memory.summary.summary == "second"
+    assert "My name is Ana" not in summarizer_model.prompts[1]
+
+
+def test_watermark_is_stored_in_the_session():
+    memory = AgentMemory(summary=SessionSummary(summary="first"), summarized_runs=4)
+    assert memory.to_dict()["summarized_runs"] == 4
+
+    memory.clear()
+    assert memory.summarized_runs == 0
+
+
+def test_background_summary_is_saved_to_storage(tmp_path):
+    summarizer_model = SlowStubModel(responses=[summary_response("background")])
+    agent = create_agent(summarizer_model, summary_in_background=True)
+    agent.storage = JsonStorage(dir_path=tmp_path)
+
+    agent.run("My name is Ana")
+    assert agent.memory.wait_for_summary(timeout=5)
+
+    session = agent.storage.read(session_id=agent.session_id)
+    assert session.memory["summary"]["summary"] == "background"
+    assert session.memory["summarized_runs"] == 1
+    assert len(session.memory["runs"]) == 1
@@ -0,0 +1,41 @@
+from agno.agent import Agent
+from agno.media import Image
+from agno.models.message import Message
+from agno.models.stub import StubModel
+
+
+def test_history_view_shares_the_payload():
+    image = Image(content=b"\x89PNG" * 1000)
+    message = Message(role="user", content="What is in this image?", images=[image])
+
+    view = message.history_view()
+
+    assert view is not message
+    assert view.from_history is True
+    assert message.from_history is False
+    assert view.images is message.images
+    assert view.metrics is message.metrics
+
+
+def test_setting_an_attribute_on_the_view_does_not_change_the_message():
+    message = Message(role="assistant", content="It is a cat", reasoning_content="Looking at the image")
+
+    view = message.history_view()
+    # e.g. Mistral sends assistant messages with reasoning as user messages
+    view.role = "user"
+
+    assert message.role == "assistant"
+
+
+def test_agent_history_is_not_copied():
+    image = Image(content=b"\x89PNG" * 1000)
+    agent = Agent(model=StubModel(responses=["A cat"]), add_history_to_messages=True, telemetry=False)
+    agent.run("What is in this image?", images=[image])
+
+    run_messages = agent.get_run_messages(message="And now?")
+    history = [m for m in run_messages.messages if m.from_history]
+    stored = agent.memory.get_messages_from_last_n_runs(skip_role="system")
+
+    assert [m.content for m in history] == [m.content for m in stored]
+    assert history[0].images is stored[0].images
+    assert not any(m.from_history for m in stored)
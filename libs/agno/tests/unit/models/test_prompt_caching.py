@@ -0,0 +1,116 @@
+from anthropic.types import Usage
+from openai.types.completion_usage import CompletionUsage, PromptTokensDetails
+
+from agno.agent import Agent
+from agno.models.anthropic.claude import Claude, _format_messages
+from agno.models.message import Message, MessageMetrics
+from agno.models.stub import StubModel
+from agno.tools.function import Function
+
+
+def get_price(symbol: str) -> str:
+    """Get the price of a stock."""
+    return "100"
+
+
+def test_claude_cache_breakpoints_on_system_and_tools():
+    model = Claude(cache_system_prompt=True, cache_tools=True, cache_ttl="1h")
+    model._tools = [{"type": "function"}]
+    model._functions = {"get_price": Function.from_callable(get_price)}
+
+    request_kwargs = model._prepare_request_kwargs("You are a finance agent.")
+
+    cache_control = {"type": "ephemeral", "ttl": "1h"}
+    assert request_kwargs["system"] == [
+        {"type": "text", "text": "You are a finance agent.", "cache_control": cache_control}
+    ]
+    assert request_kwargs["tools"][-1]["cache_control"] == cache_control
+
+
+def test_claude_without_caching_sends_a_plain_system_prompt():
+    model = Claude()
+    request_kwargs = model._prepare_request_kwargs("You are a finance agent.")
+    assert request_kwargs["system"] == "You are a finance agent."
+
+
+def test_claude_cache_breakpoint_on_the_last_message():
+    user_content = [{"type": "text", "text": "What is the price of NVDA?"}]
+    messages = [
+        Message(role="system", content="You are a finance agent."),
+        Message(role="user", content="Hi"),
+        Message(role="assistant", content="Hello!"),
+        Message(role="user", content=user_content),
+    ]
+    chat_messages, _ = _format_messages(messages)
+
+    Claude(cache_messages=True)._add_cache_breakpoints(chat_messages)
+
+    assert chat_messages[-1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in chat_messages[0]["content"][0]
+    # The content of the Message is not changed
+    assert "cache_control" not in user_content[0]
+
+
+def test_claude_cache_breakpoint_on_an_assistant_block():
+    chat_messages, _ = _format_messages([Message(role="assistant", content="The price is 100")])
+
+    Claude(cache_messages=True)._add_cache_breakpoints(chat_messages)
+
+    assert chat_messages[-1]["content"] == [
+        {"type": "text", "text": "The price is 100", "cache_control": {"type": "ephemeral"}}
+    ]
+
+
+def test_cache_tokens_from_anthropic_usage():
+    message = Message(role="assistant")
+    usage = Usage(input_tokens=10, output_tokens=5, cache_read_input_tokens=1200, cache_creation_input_tokens=300)
+
+    StubModel()._add_usage_metrics_to_assistant_message(message, usage)
+
+    assert message.metrics.cache_read_tokens == 1200
+    assert message.metrics.cache_write_tokens == 300
+
+
+def test_cache_tokens_from_openai_usage():
+    message = Message(role="assistant")
+    usage = CompletionUsage(
+        prompt_tokens=2000,
+        completion_tokens=10,
+        total_tokens=2010,
+        prompt_tokens_details=PromptTokensDetails(cached_tokens=1536),
+    )
+
+    StubModel()._add_usage_metrics_to_assistant_message(message, usage)
+
+    assert message.metrics.cache_read_tokens == 1536
+    assert message.metrics.cache_write_tokens == 0
+
+
+def test_cache_tokens_are_summed():
+    metrics = MessageMetrics(cache_read_tokens=100, cache_write_tokens=10) + MessageMetrics(cache_read_tokens=50)
+    assert (metrics.cache_read_tokens, metrics.cache_write_tokens) == (150, 10)
+
+
+def test_datetime_is_the_last_part_of_the_system_message():
+    agent = Agent(model=StubModel(), instructions=["Be concise"], markdown=True, add_datetime_to_instructions=True)
+
+    first = agent.get_system_message().content
+    second = agent.get_system_message().content
+
+    assert first.splitlines()[-1].startswith("The current time is ")
+    # Everything before the datetime is identical between runs
+    assert first.rsplit("\n", 1)[0] == second.rsplit("\n", 1)[0]
+
+
+def test_claude_current_time_is_sent_after_the_cache_breakpoint():
+    model = Claude(cache_system_prompt=True)
+    system_message = Agent(
+        model=model, description="You are a finance agent.", add_datetime_to_instructions=True
+    ).get_system_message()
+
+    request_kwargs = model._prepare_request_kwargs(system_message.content)
+
+    stable_block, time_block = request_kwargs["system"]
+    assert stable_block == {"type": "text", "text": "You are a finance agent.", "cache_control": {"type": "ephemeral"}}
+    assert time_block["text"].startswith("The current time is ")
+    assert "cache_control" not in time_block
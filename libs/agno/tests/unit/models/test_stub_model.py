@@ -0,0 +1,100 @@
+import time
+
+import pytest
+
+from agno.agent import Agent
+from agno.models.stub import LatencyProfile, StubModel, StubResponse, StubToolCall
+
+
+def get_weather(city: str) -> str:
+    """Get the weather for a city."""
+    return f"It is sunny in {city}"
+
+
+def make_tool_calling_model(**kwargs) -> StubModel:
+    return StubModel(
+        responses=[
+            StubResponse(tool_calls=[StubToolCall(name="get_weather", arguments={"city": "Tokyo"})]),
+            "It is sunny in Tokyo.",
+        ],
+        **kwargs,
+    )
+
+
+def test_replays_script_and_reports_usage():
+    agent = Agent(model=StubModel(responses=["First", "Second"]), telemetry=False)
+
+    assert agent.run("Hi").content == "First"
+    response = agent.run("Hi")
+
+    assert response.content == "Second"
+    assert agent.run("Hi").content == "First"
+    assert response.metrics["input_tokens"][0] > 0
+    assert response.metrics["output_tokens"] == [2]
+
+
+def test_repeats_last_response_without_cycle():
+    model = StubModel(responses=["First", "Second"], cycle=False)
+    agent = Agent(model=model, telemetry=False)
+
+    assert [agent.run("Hi").content for _ in range(3)] == ["First", "Second", "Second"]
+    assert model.request_count == 3
+
+
+def test_tool_calls():
+    agent = Agent(model=make_tool_calling_model(), tools=[get_weather], telemetry=False)
+
+    response = agent.run("What is the weather in Tokyo?")
+
+    assert response.content == "It is sunny in Tokyo."
+    assert [m.role for m in response.messages] == ["user", "assistant", "tool", "assistant"]
+    assert response.messages[2].content == "It is sunny in Tokyo"
+
+
+def test_stream_with_tool_calls():
+    agent = Agent(model=make_tool_calling_model(tokens_per_chunk=2), tools=[get_weather], telemetry=False)
+
+    chunks = [chunk.content for chunk in agent.run("What is the weather in Tokyo?", stream=True)]
+
+    # The answer is streamed 8 characters at a time
+    assert [c for c in chunks if isinstance(c, str) and c][-3:] == ["It is su", "nny in T", "okyo."]
+    assert agent.run_response.content == "It is sunny in Tokyo."
+    assert agent.run_response.messages[2].content == "It is sunny in Tokyo"
+
+
+@pytest.mark.asyncio
+async def test_async_stream():
+    agent = Agent(model=StubModel(responses=["Hello from the stub"]), telemetry=False)
+
+    chunks = [chunk.content async for chunk in await agent.arun("Hi", stream=True)]
+
+    assert "".join(c for c in chunks if isinstance(c, str)) == "Hello from the stub"
+
+
+def test_latency_profile():
+    model = StubModel(
+        responses=["x" * 40],
+        latency=LatencyProfile(time_to_first_token=0.02, tokens_per_second=500),
+    )
+    agent = Agent(model=model, telemetry=False)
+
+    start = time.perf_counter()
+    for _ in agent.run("Hi", stream=True):
+        pass
+    elapsed = time.perf_counter() - start
+
+    # 20ms to the first token, then 10 tokens at 500 tokens/s
+    assert elapsed >= 0.04
+    assert agent.run_response.metrics["time_to_first_token"][0] >= 0.02
+
+
+def test_jitter_is_deterministic():
+    profile = LatencyProfile(time_to_first_token=1.0, jitter=0.5)
+    first = StubModel(latency=profile, seed=1)
+    second = StubModel(latency=profile, seed=1)
+
+    delays = [first.latency.first_token_delay(first._rng) for _ in range(3)]
+
+    assert delays == [second.latency.first_token_delay(second._rng) for _ in range(3)]
+    assert all(0.5 <= delay <= 1.5 for delay in delays)
+    assert len(set(delays)) == 3
@@ -38,7 +38,7 @@ def mock_agent():
     mock_run = Mock(return_value=RunResponse(content="Mocked response"))
     agent.run = mock_run
 
-    # Create a copy of the agent that will be returned by deep_copy
+    # Create a copy of the agent that will be returned by copy_for_session
     copied_agent = Agent(
         name="Test Agent",
         agent_id="test-agent",
@@ -46,8 +46,8 @@ def mock_agent():
     )
     copied_agent.run = mock_run  # Use the same mock for the copy
 
-    # Mock deep_copy to return our prepared copy
-    agent.deep_copy = Mock(return_value=copied_agent)
+    # Mock copy_for_session to return our prepared copy
+    agent.copy_for_session = Mock(return_value=copied_agent)
 
     return agent
 
@@ -59,10 +59,10 @@ def mock_agent_with_knowledge(mock_agent):
     mock_agent.knowledge.load_documents = Mock()
 
     # Ensure the deep_copied agent also has knowledge
-    copied_agent = mock_agent.deep_copy()
+    copied_agent = mock_agent.copy_for_session()
     copied_agent.knowledge = Mock()
     copied_agent.knowledge.load_documents = Mock()
-    mock_agent.deep_copy.return_value = copied_agent
+    mock_agent.copy_for_session.return_value = copied_agent
 
     return mock_agent
 
@@ -137,7 +137,7 @@ def test_no_file_upload(test_app, mock_agent):
     assert response.status_code == 200
 
     # Get the copied agent that was actually used
-    copied_agent = mock_agent.deep_copy()
+    copied_agent = mock_agent.copy_for_session()
     # Verify agent.run was called with correct parameters
     copied_agent.run.assert_called_once_with(message="Hello", stream=False, images=None, audio=None, videos=None)
 
@@ -155,7 +155,7 @@ def test_single_image_upload(test_app, mock_agent, mock_image_file):
     assert response.status_code == 200
 
     # Get the copied agent that was actually used
-    copied_agent = mock_agent.deep_copy()
+    copied_agent = mock_agent.copy_for_session()
     # Verify agent.run was called with an image
     copied_agent.run.assert_called_once()
     call_args = copied_agent.run.call_args[1]
@@ -181,7 +181,7 @@ def test_multiple_image_upload(test_app, mock_agent, mock_image_file):
     assert response.status_code == 200
 
     # Get the copied agent that was actually used
-    copied_agent = mock_agent.deep_copy()
+    copied_agent = mock_agent.copy_for_session()
     # Verify agent.run was called with multiple images
     copied_agent.run.assert_called_once()
     call_args = copied_agent.run.call_args[1]
@@ -204,7 +204,7 @@ def test_pdf_upload_with_knowledge(test_app, mock_agent_with_knowledge, mock_pdf
     assert response.status_code == 200
 
     # Get the copied agent that was actually used
-    copied_agent = mock_agent_with_knowledge.deep_copy()
+    copied_agent = mock_agent_with_knowledge.copy_for_session()
     # Verify knowledge.load_documents was called
     copied_agent.knowledge.load_documents.assert_called_once_with(["This is mock PDF content"])
     # Verify agent.run was called without images
@@ -240,7 +240,7 @@ def test_mixed_file_upload(test_app, mock_agent_with_knowledge, mock_image_file,
     assert response.status_code == 200
 
     # Get the copied agent that was actually used
-    copied_agent = mock_agent_with_knowledge.deep_copy()
+    copied_agent = mock_agent_with_knowledge.copy_for_session()
     # Verify knowledge.load_documents was called for PDF
     copied_agent.knowledge.load_documents.assert_called_once_with(["This is mock PDF content"])
     # Verify agent.run was called with image
@@ -0,0 +1,139 @@
+import gc
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agno.agent import Agent
+from agno.memory.agent import AgentMemory, AgentRun
+from agno.models.openai import OpenAIChat
+from agno.playground import Playground
+from agno.playground.instance_pool import InstancePool
+from agno.run.response import RunResponse
+from agno.team.team import Team
+from agno.tools.yfinance import YFinanceTools
+
+
+@pytest.fixture
+def agent():
+    return Agent(
+        name="Finance Agent",
+        agent_id="finance-agent",
+        model=OpenAIChat(id="gpt-4o"),
+        tools=[YFinanceTools(stock_price=True)],
+        session_state={"watchlist": ["AAPL"]},
+        memory=AgentMemory(),
+    )
+
+
+def test_copy_for_session_shares_configuration(agent):
+    agent.knowledge = Mock()
+    agent.model.client = Mock()
+
+    copy = agent.copy_for_session(update={"session_id": "session-1"})
+
+    assert copy.session_id == "session-1"
+    assert copy.knowledge is agent.knowledge
+    assert copy.model is not agent.model
+    assert copy.model.client is agent.model.client
+    assert copy.tools[0] is not agent.tools[0]
+    assert copy.tools[0].functions["get_current_stock_price"].entrypoint.__func__ is (
+        agent.tools[0].functions["get_current_stock_price"].entrypoint.__func__
+    )
+    # Methods of the toolkit are bound to its copy
+    assert copy.tools[0].functions["get_current_stock_price"].entrypoint.__self__ is copy.tools[0]
+
+    copy.session_state["watchlist"].append("MSFT")
+    copy.update_model()
+    assert agent.session_state == {"watchlist": ["AAPL"]}
+    assert copy.tools[0].functions["get_current_stock_price"]._agent is copy
+    assert agent.tools[0].functions["get_current_stock_price"]._agent is None
+
+
+def test_rebind_session_keeps_processed_tools(agent):
+    copy = agent.copy_for_session(update={"session_id": "session-1"})
+    copy.update_model()
+    functions = copy._functions_for_model
+    copy.memory.add_run(AgentRun(response=RunResponse(content="hello")))
+    copy.session_state["watchlist"].append("MSFT")
+    copy.run_id = "run-1"
+
+    copy.rebind_session(agent, update={"session_id": "session-2"})
+
+    assert copy.session_id == "session-2"
+    assert copy.run_id is None
+    assert copy.memory.runs == []
+    assert copy.session_state == {"watchlist": ["AAPL"]}
+    assert copy._functions_for_model is functions
+
+
+def test_pool_recycles_released_agents(agent):
+    pool = InstancePool()
+    first, _ = pool.acquire_agent(agent, update={"session_id": "session-1"})
+    second, _ = pool.acquire_agent(agent, update={"session_id": "session-2"})
+    assert first is not second
+
+    pool.release_agent(first)
+    third, bind_time_ms = pool.acquire_agent(agent, update={"session_id": "session-3"})
+
+    assert third is first
+    assert third.session_id == "session-3"
+    assert bind_time_ms >= 0
+    assert pool.metrics.requests == 3
+    assert pool.metrics.recycled == 1
+
+
+def test_pool_copies_teams(agent):
+    team = Team(name="Team", team_id="team", members=[agent], model=OpenAIChat(id="gpt-4o"))
+    pool = InstancePool()
+
+    instance, _ = pool.acquire_team(team, update={"session_id": "session-1"})
+
+    assert instance is not team
+    assert instance.session_id == "session-1"
+    assert instance.members[0] is not agent
+    assert instance.members[0].tools[0] is not agent.tools[0]
+
+
+def test_playground_reports_bind_time(agent):
+    client = TestClient(Playground(agents=[agent]).get_app(use_async=False))
+
+    with patch.object(Agent, "run", return_value=RunResponse(content="Mocked response")):
+        response = client.post("/v1/playground/agents/finance-agent/runs", data={"message": "Hello", "stream": "false"})
+
+    assert response.status_code == 200
+    assert response.headers["Server-Timing"].startswith("bind;dur=")
+
+
+def test_released_twice_is_pooled_once(agent):
+    pool = InstancePool()
+    instance, _ = pool.acquire_agent(agent)
+
+    pool.release_agent(instance)
+    pool.release_agent(instance)
+
+    assert pool._idle[id(agent)] == [instance]
+
+
+def test_unreleased_leases_are_dropped_when_collected(agent):
+    pool = InstancePool()
+    instance, _ = pool.acquire_agent(agent)
+    assert len(pool._leased) == 1
+
+    del instance
+    gc.collect()
+
+    assert pool._leased == {}
+
+
+def test_playground_releases_the_agent_when_the_run_fails(agent):
+    client = TestClient(Playground(agents=[agent]).get_app(use_async=False), raise_server_exceptions=False)
+
+    with patch.object(Agent, "run", side_effect=RuntimeError("Model error")):
+        with patch.object(InstancePool, "release_agent", autospec=True) as release_agent:
+            response = client.post(
+                "/v1/playground/agents/finance-agent/runs", data={"message": "Hello", "stream": "false"}
+            )
+
+    assert response.status_code == 500
+    assert release_agent.call_count == 1
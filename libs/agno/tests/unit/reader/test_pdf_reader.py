@@ -1,15 +1,18 @@
 import asyncio
+import os
 from io import BytesIO
 from pathlib import Path
 
 import httpx
 import pytest
 
+from agno.document.reader import pdf_reader
 from agno.document.reader.pdf_reader import (
     PDFImageReader,
     PDFReader,
     PDFUrlImageReader,
     PDFUrlReader,
+    _read_page_range,
 )
 
 
@@ -156,3 +159,88 @@ def test_pdf_reader_empty_pdf():
     documents = reader.read(empty_pdf)
 
     assert len(documents) == 0
+
+
+def make_text_pdf(num_pages: int) -> bytes:
+    """Build a minimal PDF with one line of text per page."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", b"", b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for page_number in range(1, num_pages + 1):
+        stream = f"BT /F1 12 Tf 72 720 Td (Page {page_number} content) Tj ET".encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 3 0 R >> >> "
+            b"/Contents %d 0 R >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, num_pages)
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for object_id, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (object_id, body)
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return pdf
+
+
+@pytest.fixture
+def text_pdf_path(tmp_path) -> Path:
+    pdf_path = tmp_path / "report.pdf"
+    pdf_path.write_bytes(make_text_pdf(25))
+    return pdf_path
+
+
+def test_pdf_reader_parallel_matches_serial(text_pdf_path):
+    serial = PDFReader(chunk=False).read(str(text_pdf_path))
+    parallel = PDFReader(chunk=False, parallel=True, max_workers=2, pages_per_task=4).read(str(text_pdf_path))
+
+    assert len(parallel) == 25
+    assert [doc.id for doc in parallel] == [doc.id for doc in serial]
+    assert [doc.content for doc in parallel] == [doc.content for doc in serial]
+    assert parallel[9].content.strip() == "Page 10 content"
+
+
+def test_pdf_reader_read_stream_in_page_order(text_pdf_path):
+    reader = PDFReader(chunk=False, parallel=True, max_workers=3, pages_per_task=2)
+    with open(text_pdf_path, "rb") as pdf:
+        pages = [doc.meta_data["page"] for doc in reader.read_stream(pdf)]
+
+    assert pages == list(range(1, 26))
+
+
+def test_pdf_reader_parallel_falls_back_when_worker_fails(text_pdf_path):
+    # 1MB of address space is too small for a worker to run, so every range is read in process
+    reader = PDFReader(chunk=False, parallel=True, max_workers=2, pages_per_task=5, max_memory_per_worker_mb=1)
+    documents = reader.read(str(text_pdf_path))
+
+    assert [doc.meta_data["page"] for doc in documents] == list(range(1, 26))
+
+
+def _read_page_range_or_die(start: int, end: int, read_images: bool):
+    # Kill the worker on the second range, like a native abort under the memory limit
+    if start >= 5:
+        os._exit(1)
+    return _read_page_range(start, end, read_images)
+
+
+def test_pdf_reader_parallel_continues_when_a_worker_dies(text_pdf_path, monkeypatch):
+    monkeypatch.setattr(pdf_reader, "_read_page_range", _read_page_range_or_die)
+    reader = PDFReader(chunk=False, parallel=True, max_workers=1, pages_per_task=5)
+
+    documents = reader.read(str(text_pdf_path))
+
+    assert [doc.meta_data["page"] for doc in documents] == list(range(1, 26))
+    assert documents[24].content.strip() == "Page 25 content"
+
+
+@pytest.mark.asyncio
+async def test_pdf_reader_parallel_async_read(text_pdf_path):
+    reader = PDFReader(chunk=False, parallel=True, max_workers=2, pages_per_task=4)
+    documents = await reader.async_read(BytesIO(text_pdf_path.read_bytes()))
+
+    assert [doc.meta_data["page"] for doc in documents] == list(range(1, 26))
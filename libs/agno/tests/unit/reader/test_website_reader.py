@@ -1,9 +1,13 @@
+import asyncio
+import functools
+import time
 from unittest.mock import patch
 
+import httpx
 import pytest
 
 from agno.document.base import Document
-from agno.document.reader.website_reader import WebsiteReader
+from agno.document.reader.website_reader import TokenBucket, WebsiteReader
 
 
 @pytest.fixture
@@ -271,3 +275,103 @@ async def test_async_crawl_max_depth(mock_html_content, mock_html_content_with_a
         assert len(result) == 2
         assert "https://example.com" in result
         assert "https://example.com/page1" in result
+
+
+SITE = {
+    "https://example.com": '<main>Home</main><a href="/a">A</a><a href="/b">B</a><a href="https://other.com/x">X</a>',
+    "https://example.com/a": '<main>Page A</main><a href="/c">C</a><a href="/report.pdf">Report</a>',
+    "https://example.com/b": "<article>Page B</article>",
+    "https://example.com/c": "<main>Page C</main>",
+}
+
+
+@pytest.fixture
+def mock_site():
+    """Serve SITE through a mock transport and record every request."""
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        url = str(request.url).rstrip("/")
+        if url not in SITE:
+            return httpx.Response(404)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=SITE[url], headers={"ETag": '"v1"'})
+
+    client_class = functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+    with patch("agno.document.reader.website_reader.httpx.AsyncClient", client_class):
+        yield requests
+
+
+def test_crawl_follows_links_within_domain(mock_site):
+    reader = WebsiteReader(max_depth=3, max_links=10, requests_per_second=0)
+    result = reader.crawl("https://example.com")
+
+    assert result == {
+        "https://example.com": "Home",
+        "https://example.com/a": "Page A",
+        "https://example.com/b": "Page B",
+        "https://example.com/c": "Page C",
+    }
+    assert all(request.url.host == "example.com" for request in mock_site)
+
+
+def test_crawl_respects_max_depth_and_max_links(mock_site):
+    assert set(WebsiteReader(max_depth=2, requests_per_second=0).crawl("https://example.com")) == {
+        "https://example.com",
+        "https://example.com/a",
+        "https://example.com/b",
+    }
+    assert len(WebsiteReader(max_links=2, requests_per_second=0).crawl("https://example.com")) == 2
+
+
+def test_crawl_revalidates_cached_pages(mock_site, tmp_path):
+    reader = WebsiteReader(requests_per_second=0, cache_dir=str(tmp_path))
+    first = reader.crawl("https://example.com")
+    assert all("if-none-match" not in request.headers for request in mock_site)
+
+    mock_site.clear()
+    assert reader.crawl("https://example.com") == first
+    assert len(mock_site) == 4
+    assert all(request.headers["if-none-match"] == '"v1"' for request in mock_site)
+
+
+def test_read_stream_chunks_pages(mock_site):
+    reader = WebsiteReader(chunk=False, requests_per_second=0)
+    documents = list(reader.read_stream("https://example.com"))
+
+    assert {doc.content for doc in documents} == {"Home", "Page A", "Page B", "Page C"}
+    assert all(doc.name == "https://example.com" for doc in documents)
+
+
+@pytest.mark.asyncio
+async def test_async_crawl_limits_concurrency_per_host():
+    active, peak = 0, 0
+
+    async def handler(request):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        links = "".join(f'<a href="/page{i}">{i}</a>' for i in range(20))
+        return httpx.Response(200, text=f"<main>{request.url.path}</main>{links}")
+
+    client_class = functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+    reader = WebsiteReader(max_links=21, max_concurrency=8, max_concurrency_per_host=3, requests_per_second=0)
+    with patch("agno.document.reader.website_reader.httpx.AsyncClient", client_class):
+        documents = [doc async for doc in reader.async_read_stream("https://example.com")]
+
+    assert len(documents) == 21
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests():
+    bucket = TokenBucket(rate=20, capacity=1)
+    started = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+
+    assert time.monotonic() - started >= 0.14
@@ -1,9 +1,11 @@
+import json
 import os
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
-from agno.tools.financial_datasets import FinancialDatasetsTools
+from agno.tools.financial_datasets import FinancialDatasetsTools, _get_client, clear_response_cache, close_client
 
 
 @pytest.fixture
@@ -27,6 +29,17 @@ def mock_response():
     return response
 
 
+@pytest.fixture(autouse=True)
+def empty_response_cache():
+    clear_response_cache()
+    yield
+    clear_response_cache()
+
+
+def mock_client(handler, client_class=httpx.Client):
+    return client_class(transport=httpx.MockTransport(handler))
+
+
 # Initialization Tests
 
 
@@ -241,3 +254,117 @@ def test_get_segmented_financials(mock_make_request, financial_tools):
         "financials/segmented", {"ticker": "GOOG", "period": "quarterly", "limit": 4}
     )
     assert result == {"segmented_financials": []}
+
+
+# Transport Tests
+
+
+def test_make_request_uses_etag_revalidation(financial_tools):
+    """Test that fresh responses are served from the cache and stale ones are revalidated with the ETag."""
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(request.headers)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, text='{"company": {}}', headers={"ETag": '"v1"'})
+
+    financial_tools.response_cache_ttl = 300
+    with patch("agno.tools.financial_datasets._get_client", return_value=mock_client(handler)):
+        assert financial_tools._make_request("company", {"ticker": "AAPL"}) == '{"company": {}}'
+        assert financial_tools._make_request("company", {"ticker": "AAPL"}) == '{"company": {}}'
+        assert len(seen_headers) == 1
+
+        financial_tools.response_cache_ttl = 0.000001
+        assert financial_tools._make_request("company", {"ticker": "AAPL"}) == '{"company": {}}'
+        assert len(seen_headers) == 2
+        assert seen_headers[1]["if-none-match"] == '"v1"'
+        assert seen_headers[1]["x-api-key"] == "test_api_key"
+
+
+def test_response_cache_is_scoped_to_the_api_key():
+    """Test that a response fetched with one API key is not served to a toolkit using another key."""
+    handler = MagicMock(side_effect=lambda request: httpx.Response(200, text=request.headers["x-api-key"]))
+    tenant_a = FinancialDatasetsTools(api_key="key_a", response_cache_ttl=300)
+    tenant_b = FinancialDatasetsTools(api_key="key_b", response_cache_ttl=300)
+
+    with patch("agno.tools.financial_datasets._get_client", return_value=mock_client(handler)):
+        assert tenant_a._make_request("company", {"ticker": "AAPL"}) == "key_a"
+        assert tenant_b._make_request("company", {"ticker": "AAPL"}) == "key_b"
+        assert tenant_a._make_request("company", {"ticker": "AAPL"}) == "key_a"
+    assert handler.call_count == 2
+
+
+def test_responses_are_revalidated_by_default(financial_tools):
+    """Test that by default every request asks the API and unchanged responses are served from the cache."""
+    handler = MagicMock(
+        side_effect=lambda request: (
+            httpx.Response(304)
+            if request.headers.get("if-none-match") == '"v1"'
+            else httpx.Response(200, text='{"prices": []}', headers={"ETag": '"v1"'})
+        )
+    )
+
+    with patch("agno.tools.financial_datasets._get_client", return_value=mock_client(handler)):
+        assert financial_tools._make_request("prices", {"ticker": "AAPL"}) == '{"prices": []}'
+        assert financial_tools._make_request("prices", {"ticker": "AAPL"}) == '{"prices": []}'
+    assert handler.call_count == 2
+    assert handler.call_args.args[0].headers["if-none-match"] == '"v1"'
+
+
+@patch("agno.tools.financial_datasets.time.sleep")
+def test_make_request_retries_rate_limits(mock_sleep, financial_tools):
+    """Test that 429 responses are retried after the Retry-After delay."""
+    responses = iter([httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200, text="{}")])
+
+    with patch("agno.tools.financial_datasets._get_client", return_value=mock_client(lambda r: next(responses))):
+        assert financial_tools._make_request("prices", {"ticker": "AAPL"}) == "{}"
+    mock_sleep.assert_called_once_with(2.0)
+
+
+@patch("agno.tools.financial_datasets.time.sleep")
+def test_make_request_gives_up_after_max_retries(mock_sleep, api_key):
+    """Test that server errors are retried max_retries times and then reported."""
+    tools = FinancialDatasetsTools(api_key=api_key, max_retries=2)
+    handler = MagicMock(return_value=httpx.Response(503))
+
+    with patch("agno.tools.financial_datasets._get_client", return_value=mock_client(handler)):
+        result = tools._make_request("prices", {"ticker": "AAPL"})
+
+    assert result.startswith("Error making request to")
+    assert handler.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+def test_make_request_does_not_retry_client_errors(financial_tools):
+    """Test that 4xx errors other than 429 fail immediately and are not cached."""
+    handler = MagicMock(return_value=httpx.Response(404))
+
+    with patch("agno.tools.financial_datasets._get_client", return_value=mock_client(handler)):
+        assert financial_tools._make_request("company", {"ticker": "NOPE"}).startswith("Error making request to")
+        assert financial_tools._make_request("company", {"ticker": "NOPE"}).startswith("Error making request to")
+    assert handler.call_count == 2
+
+
+def handle_statements(request):
+    name = request.url.path.rsplit("/", 1)[-1].replace("-", "_")
+    return httpx.Response(200, json={name: [{"ticker": request.url.params["ticker"]}]})
+
+
+def test_get_financial_bundle(financial_tools):
+    """Test that the bundle fetches all statements and unwraps them."""
+    with patch("agno.tools.financial_datasets._get_client", return_value=mock_client(handle_statements)):
+        bundle = json.loads(financial_tools.get_financial_bundle("AAPL", period="quarterly"))
+
+    assert set(bundle) == {"income_statements", "balance_sheets", "cash_flow_statements"}
+    assert bundle["balance_sheets"] == [{"ticker": "AAPL"}]
+
+
+def test_close_client():
+    """Test that the shared connection pool is closed and recreated on the next request."""
+    client = _get_client()
+    close_client()
+
+    assert client.is_closed
+    assert _get_client() is not client
+    close_client()
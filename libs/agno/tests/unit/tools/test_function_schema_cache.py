@@ -0,0 +1,82 @@
+from copy import deepcopy
+
+from agno.tools.function import Function, clear_schema_cache, get_schema_cache_key
+from agno.tools.toolkit import Toolkit
+
+
+class DummyTools(Toolkit):
+    def __init__(self):
+        super().__init__(name="dummy_tools")
+        self.register(self.get_price)
+
+    def get_price(self, symbol: str, currency: str = "USD") -> str:
+        """Get the price for a symbol.
+
+        Args:
+            symbol (str): The stock symbol.
+            currency (str): The currency.
+        """
+        return f"{symbol}:{currency}"
+
+
+def make_tool(prefix: str):
+    def tool_fn(x: int) -> str:
+        """Prefix a number."""
+        return f"{prefix}{x}"
+
+    return tool_fn
+
+
+def test_schema_cache_key_shared_across_toolkit_copies():
+    tools = DummyTools()
+    tools_copy = deepcopy(tools)
+    key = get_schema_cache_key(tools.functions["get_price"].entrypoint)
+    assert key is not None
+    assert key == get_schema_cache_key(tools_copy.functions["get_price"].entrypoint)
+    assert key != get_schema_cache_key(tools.functions["get_price"].entrypoint, strict=True)
+
+
+def test_process_entrypoint_uses_cache_and_binds_to_copy():
+    clear_schema_cache()
+    tools = DummyTools()
+    func = tools.functions["get_price"]
+    func.process_entrypoint()
+
+    tools_copy = deepcopy(DummyTools())
+    func_copy = tools_copy.functions["get_price"]
+    func_copy.process_entrypoint()
+
+    assert func_copy.to_dict() == func.to_dict()
+    assert func.parameters["required"] == ["symbol"]
+    assert func_copy.parameters is not func.parameters
+    assert func_copy.entrypoint.__self__ is tools_copy
+    assert func_copy.entrypoint(symbol="AAPL") == "AAPL:USD"
+
+
+def test_from_callable_closures_keep_their_own_state():
+    clear_schema_cache()
+    first = Function.from_callable(make_tool("a"))
+    second = Function.from_callable(make_tool("b"), strict=False)
+    assert first.to_dict() == second.to_dict()
+    assert first.entrypoint(x=1) == "a1"
+    assert second.entrypoint(x="2") == "b2"
+
+
+def test_closures_with_their_own_docstrings_are_not_shared():
+    clear_schema_cache()
+    functions = []
+    for i in range(3):
+        tool_fn = make_tool(str(i))
+        tool_fn.__doc__ = f"Forecast #{i}"
+        functions.append(Function.from_callable(tool_fn))
+
+    assert [f.description for f in functions] == ["Forecast #0", "Forecast #1", "Forecast #2"]
+
+
+def test_closures_with_their_own_defaults_are_not_shared():
+    clear_schema_cache()
+    with_default = make_tool("a")
+    with_default.__defaults__ = (1,)
+
+    assert Function.from_callable(make_tool("a")).parameters["required"] == ["x"]
+    assert Function.from_callable(with_default).parameters["required"] == []
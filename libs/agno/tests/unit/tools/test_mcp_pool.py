@@ -0,0 +1,109 @@
+import asyncio
+import os
+import signal
+import sys
+
+import pytest
+from mcp import StdioServerParameters
+
+from agno.tools.mcp import MCPConnection, MCPSessionPool, MCPTools
+
+SERVER = """
+import os
+
+from mcp.server.mcpserver import MCPServer
+
+server = MCPServer("test")
+
+
+@server.tool()
+def add(a: int, b: int) -> str:
+    \"\"\"Add two numbers.\"\"\"
+    return str(a + b)
+
+
+@server.tool()
+def get_pid() -> str:
+    \"\"\"Get the process id of the server.\"\"\"
+    return str(os.getpid())
+
+
+if __name__ == "__main__":
+    server.run()
+"""
+
+
+@pytest.fixture
+def server_params(tmp_path):
+    server_path = tmp_path / "server.py"
+    server_path.write_text(SERVER)
+    return StdioServerParameters(command=sys.executable, args=[str(server_path)])
+
+
+async def get_pid(pool: MCPSessionPool, server_params: StdioServerParameters) -> int:
+    result = await pool.call_tool(server_params, "get_pid")
+    return int(result.content[0].text)
+
+
+def test_session_is_shared_across_runs(server_params):
+    async def run():
+        async with MCPSessionPool() as pool:
+            async with MCPTools(server_params=server_params, pool=pool) as tools:
+                assert set(tools.functions) == {"add", "get_pid"}
+                result = await tools.functions["add"].entrypoint(agent=None, a=1, b=2)
+                assert result == "3"
+            first_pid = await get_pid(pool, server_params)
+            connection = await pool.get_connection(server_params)
+
+            # A second run reuses the server and the cached list of tools
+            async with MCPTools(server_params=server_params, pool=pool) as tools:
+                assert tools.available_tools is connection.tools
+            assert await get_pid(pool, server_params) == first_pid
+
+    asyncio.run(run())
+
+
+def test_concurrent_calls_share_the_session(server_params):
+    async def run():
+        async with MCPSessionPool(max_concurrent_calls=4) as pool:
+            results = await asyncio.gather(*[pool.call_tool(server_params, "add", {"a": i, "b": 1}) for i in range(10)])
+            assert [result.content[0].text for result in results] == [str(i + 1) for i in range(10)]
+            assert len(pool._connections) == 1
+
+    asyncio.run(run())
+
+
+def test_failed_server_is_restarted(server_params):
+    async def run():
+        async with MCPSessionPool(health_check_interval=None) as pool:
+            first_pid = await get_pid(pool, server_params)
+            os.kill(first_pid, signal.SIGKILL)
+
+            # The call fails, the server is restarted and the call is retried
+            second_pid = await get_pid(pool, server_params)
+            assert second_pid != first_pid
+
+            os.kill(second_pid, signal.SIGKILL)
+            await asyncio.sleep(0.2)
+
+            # The health check restarts the server before it is used
+            pool.health_check_interval = 0
+            assert await get_pid(pool, server_params) not in (first_pid, second_pid)
+
+    asyncio.run(run())
+
+
+def test_server_is_stopped_when_the_start_times_out(tmp_path):
+    server_path = tmp_path / "server.py"
+    # Never answers the initialize request
+    server_path.write_text("import time\n\ntime.sleep(60)\n")
+    server_params = StdioServerParameters(command=sys.executable, args=[str(server_path)])
+
+    async def run():
+        connection = MCPConnection(server_params)
+        with pytest.raises(asyncio.TimeoutError):
+            await connection.start(timeout=1)
+        assert connection._task.done()
+        assert connection.session is None
+
+    asyncio.run(run())
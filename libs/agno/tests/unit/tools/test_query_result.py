@@ -0,0 +1,74 @@
+from agno.tools.csv_toolkit import CsvTools
+from agno.tools.duckdb import DuckDbTools
+from agno.utils.query_result import QueryResultRenderer
+
+
+def test_small_result_is_not_truncated():
+    tools = DuckDbTools()
+
+    result = tools.run_query("SELECT 'NVDA' AS symbol, 101.5 AS price UNION ALL SELECT 'A, B', NULL")
+
+    assert result == 'symbol,price\nNVDA,101.5\n"A, B",'
+
+
+def test_statement_without_result():
+    assert DuckDbTools().run_query("CREATE TABLE prices (symbol VARCHAR)") == "No output"
+
+
+def test_row_cap():
+    tools = DuckDbTools(max_result_rows=5)
+
+    result = tools.run_query("SELECT range AS i FROM range(10000000)")
+
+    lines = result.splitlines()
+    assert lines[:6] == ["i", "0", "1", "2", "3", "4"]
+    assert lines[-1].startswith("[Result truncated: showing the first 5 rows.")
+
+
+def test_byte_cap():
+    tools = DuckDbTools(max_result_rows=None, max_result_bytes=100)
+
+    result = tools.run_query("SELECT repeat('x', 30) AS text FROM range(100)")
+
+    assert len(result.split("\n[Result truncated")[0].encode()) <= 100
+    assert "showing the first 3 rows" in result
+
+
+def test_token_cap():
+    renderer = QueryResultRenderer(max_rows=None, max_bytes=None, max_tokens=20)
+
+    rendered = renderer.render_rows(["text"], [[("x" * 20,)] * 10])
+
+    assert rendered.truncated
+    assert rendered.num_rows == 3
+
+
+def test_markdown_format():
+    tools = DuckDbTools(result_format="markdown")
+
+    result = tools.run_query("SELECT 'a|b' AS name, 1 AS value")
+
+    assert result == "| name | value |\n|---|---|\n| a\\|b | 1 |"
+
+
+def test_truncated_result_is_spilled_to_parquet(tmp_path):
+    tools = DuckDbTools(max_result_rows=10, spill_dir=str(tmp_path))
+
+    result = tools.run_query("SELECT range AS i FROM range(1000)")
+
+    assert "The full result has 1000 rows" in result
+    parquet_files = list(tmp_path.glob("*.parquet"))
+    assert len(parquet_files) == 1
+    # The model can query the full result
+    assert tools.run_query(f"SELECT max(i) AS max_i FROM read_parquet('{parquet_files[0]}')") == "max_i\n999"
+
+
+def test_csv_query_is_capped(tmp_path):
+    csv_path = tmp_path / "prices.csv"
+    csv_path.write_text("symbol,price\n" + "\n".join(f"S{i},{i}" for i in range(500)))
+    tools = CsvTools(csvs=[csv_path], max_result_rows=3)
+
+    result = tools.query_csv_file("prices", "SELECT * FROM prices")
+
+    assert result.splitlines()[:4] == ["symbol,price", "S0,0", "S1,1", "S2,2"]
+    assert "[Result truncated: showing the first 3 rows." in result
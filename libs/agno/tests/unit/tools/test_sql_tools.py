@@ -0,0 +1,124 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.inspection import inspect as sqlalchemy_inspect
+from sqlalchemy.pool import StaticPool
+
+from agno.tools.sql import SQLTools, normalize_sql
+
+COUNT_FOREVER = "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) SELECT count(*) FROM c"
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE prices (symbol VARCHAR, price FLOAT)"))
+        connection.execute(
+            text("INSERT INTO prices VALUES (:symbol, :price)"),
+            [{"symbol": f"S{i}", "price": float(i)} for i in range(50)],
+        )
+    return engine
+
+
+def test_rows_are_capped(engine):
+    tools = SQLTools(db_engine=engine, max_rows=20)
+
+    assert len(tools.run_sql("SELECT * FROM prices")) == 20
+    assert len(tools.run_sql("SELECT * FROM prices", limit=5)) == 5
+    assert len(tools.run_sql("SELECT * FROM prices", limit=100)) == 20
+    assert tools.run_sql("SELECT * FROM prices", limit=1) == [{"symbol": "S0", "price": 0.0}]
+
+
+def test_statement_without_rows(engine):
+    tools = SQLTools(db_engine=engine)
+
+    assert tools.run_sql("UPDATE prices SET price = 1 WHERE symbol = 'S0'") == []
+
+
+def test_statement_timeout(engine):
+    tools = SQLTools(db_engine=engine, statement_timeout=0.1)
+
+    result = tools.run_sql_query(COUNT_FOREVER)
+
+    assert result.startswith("Error running query:")
+    assert "interrupted" in result
+    # The connection is usable after the timeout
+    assert json.loads(tools.run_sql_query("SELECT count(*) AS n FROM prices")) == [{"n": 50}]
+
+
+def test_schema_is_cached(engine):
+    tools = SQLTools(db_engine=engine)
+
+    with patch("agno.tools.sql.inspect", wraps=sqlalchemy_inspect) as inspect:
+        assert json.loads(tools.list_tables()) == ["prices"]
+        assert json.loads(tools.list_tables()) == ["prices"]
+        tools.describe_table("prices")
+        tools.describe_table("prices")
+        assert inspect.call_count == 2
+
+        tools.clear_schema_cache()
+        tools.list_tables()
+        assert inspect.call_count == 3
+
+
+def test_query_results_are_cached(engine):
+    tools = SQLTools(db_engine=engine, cache_queries=True)
+
+    first = tools.run_sql_query("SELECT count(*) AS n FROM prices")
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM prices"))
+    # The same query, formatted differently, is served from the cache
+    second = tools.run_sql_query("SELECT   count(*) AS n\nFROM prices;")
+
+    assert first == second == '[{"n": 50}]'
+    assert tools.query_cache.get_metrics("run_sql_query").hits == 1
+
+
+def test_write_queries_are_not_cached(engine):
+    tools = SQLTools(db_engine=engine, cache_queries=True)
+
+    tools.run_sql_query("DELETE FROM prices WHERE symbol = 'S0'")
+    tools.run_sql_query("DELETE FROM prices WHERE symbol = 'S1'")
+
+    assert tools.query_cache.get_metrics("run_sql_query").misses == 0
+    assert json.loads(tools.run_sql_query("SELECT count(*) AS n FROM prices")) == [{"n": 48}]
+
+
+def test_pool_settings():
+    tools = SQLTools(db_url="sqlite:///:memory:", pool_pre_ping=True, pool_recycle=60)
+
+    assert tools.db_engine.pool._pre_ping is True
+    assert tools.db_engine.pool._recycle == 60
+
+
+def test_writes_clear_the_query_cache(engine):
+    tools = SQLTools(db_engine=engine, cache_queries=True)
+
+    assert json.loads(tools.run_sql_query("SELECT count(*) AS n FROM prices")) == [{"n": 50}]
+    tools.run_sql_query("INSERT INTO prices VALUES ('S50', 50.0)")
+
+    assert json.loads(tools.run_sql_query("SELECT count(*) AS n FROM prices")) == [{"n": 51}]
+
+
+def test_string_literals_are_not_normalized(engine):
+    tools = SQLTools(db_engine=engine, cache_queries=True)
+
+    assert json.loads(tools.run_sql_query("SELECT 'a  b' AS s")) == [{"s": "a  b"}]
+    assert json.loads(tools.run_sql_query("SELECT 'a b' AS s")) == [{"s": "a b"}]
+
+
+def test_data_modifying_ctes_are_not_read_only(engine):
+    tools = SQLTools(db_engine=engine)
+
+    assert tools.is_read_only_query("WITH recent AS (SELECT * FROM prices) SELECT * FROM recent")
+    assert tools.is_read_only_query("SELECT 'delete' AS word")
+    assert not tools.is_read_only_query("WITH gone AS (DELETE FROM prices RETURNING *) SELECT count(*) FROM gone")
+    assert not tools.is_read_only_query("SELECT * INTO prices_copy FROM prices")
+
+
+def test_normalize_sql():
+    assert normalize_sql("  SELECT *\n  FROM prices ;") == "SELECT * FROM prices"
+    assert normalize_sql("SELECT  'a  b'\nFROM prices") == "SELECT 'a  b' FROM prices"
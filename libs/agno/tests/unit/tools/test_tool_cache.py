@@ -0,0 +1,143 @@
+import threading
+import time
+from copy import deepcopy
+
+import pytest
+
+from agno.tools.cache import (
+    InMemoryToolCache,
+    SqliteToolCache,
+    TieredToolCache,
+    get_default_tool_cache,
+    get_tool_cache_key,
+)
+from agno.tools.function import FunctionCall
+from agno.tools.toolkit import Toolkit
+
+
+class CountingTools(Toolkit):
+    def __init__(self, **kwargs):
+        super().__init__(name="counting_tools", **kwargs)
+        self.calls = 0
+        self.register(self.get_income_statements)
+
+    def get_income_statements(self, ticker: str, period: str = "annual") -> str:
+        self.calls += 1
+        time.sleep(0.05)
+        return f"{ticker}:{period}"
+
+
+def test_cache_key_is_canonical():
+    assert get_tool_cache_key("f", {"a": 1, "b": [1, 2]}) == get_tool_cache_key("f", {"b": [1, 2], "a": 1})
+    assert get_tool_cache_key("f", {"a": 1}) != get_tool_cache_key("g", {"a": 1})
+    assert get_tool_cache_key("f", None) == get_tool_cache_key("f", {})
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryToolCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_in_memory_cache_size_limit_and_ttl():
+    cache = InMemoryToolCache(max_size_bytes=10)
+    cache.set("big", "x" * 20)
+    assert cache.get("big") is None
+    cache.set("expired", "v", ttl=-1)
+    assert cache.get("expired") is None
+    assert cache.size_bytes == 0
+
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path):
+    db_file = str(tmp_path / "tool_cache.db")
+    SqliteToolCache(db_file=db_file).set("key", {"revenue": [1, 2]}, ttl=60)
+    assert SqliteToolCache(db_file=db_file).get("key") == {"revenue": [1, 2]}
+
+
+def test_sqlite_cache_eviction():
+    cache = SqliteToolCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("c") == 3
+
+
+def test_tiered_cache_promotes_shared_hits():
+    shared = SqliteToolCache()
+    cache = TieredToolCache(shared=shared)
+    shared.set("key", "value")
+    assert cache.memory.get("key") is None
+    assert cache.get("key") == "value"
+    assert cache.memory.get("key") == "value"
+
+
+def test_concurrent_identical_calls_run_once():
+    cache = InMemoryToolCache()
+    tools = CountingTools(cache_results=True, cache=cache)
+    function = tools.functions["get_income_statements"]
+    results = []
+
+    def call():
+        function_call = FunctionCall(function=function, arguments={"ticker": "AAPL"})
+        function_call.execute()
+        results.append(function_call.result)
+
+    threads = [threading.Thread(target=call) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tools.calls == 1
+    assert results == ["AAPL:annual"] * 5
+
+    call()
+    assert tools.calls == 1
+    metrics = cache.get_metrics("get_income_statements")
+    assert metrics.misses == 1
+    assert metrics.hits + metrics.coalesced == 5
+    assert metrics.hit_rate == pytest.approx(5 / 6)
+
+
+def test_cache_is_shared_by_toolkit_copies():
+    cache = InMemoryToolCache()
+    tools = CountingTools(cache_results=True, cache=cache)
+    tools_copy = deepcopy(tools)
+    assert tools_copy.functions["get_income_statements"].cache is cache
+
+
+def test_cache_is_scoped_to_the_toolkit_instance():
+    cache = InMemoryToolCache()
+    tools = CountingTools(cache_results=True, cache=cache)
+    other_tools = CountingTools(cache_results=True, cache=cache)
+    tools_copy = tools.copy_for_session()
+
+    for toolkit in (tools, tools_copy, other_tools):
+        FunctionCall(function=toolkit.functions["get_income_statements"], arguments={"ticker": "AAPL"}).execute()
+
+    # The copy shares the results of the toolkit, another instance (e.g. with another API key) does not
+    assert (tools.calls, other_tools.calls) == (1, 1)
+
+    # Identically configured toolkits can share results with an explicit namespace
+    shared = [CountingTools(cache_results=True, cache=cache, cache_namespace="counting") for _ in range(2)]
+    for toolkit in shared:
+        FunctionCall(function=toolkit.functions["get_income_statements"], arguments={"ticker": "AAPL"}).execute()
+    assert [toolkit.calls for toolkit in shared] == [1, 0]
+
+
+def test_default_cache_is_in_memory():
+    cache = get_default_tool_cache()
+    assert get_default_tool_cache() is cache
+    assert cache.shared is None
+
+
+def test_default_cache_per_cache_dir(tmp_path):
+    cache = get_default_tool_cache(cache_dir=str(tmp_path))
+    assert get_default_tool_cache(cache_dir=str(tmp_path)) is cache
+    assert (tmp_path / "tool_cache.db").exists()
@@ -0,0 +1,100 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from agno.tools.yfinance import YFinanceTools, clear_info_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_info_cache():
+    clear_info_cache()
+    yield
+    clear_info_cache()
+
+
+@pytest.fixture
+def mock_yf():
+    with patch("agno.tools.yfinance.yf") as mock:
+        yield mock
+
+
+def make_download(symbols, closes):
+    index = pd.date_range("2024-01-01", periods=len(closes), freq="D")
+    columns = pd.MultiIndex.from_product([symbols, ["Open", "Close"]])
+    data = []
+    for close in closes:
+        row = []
+        for _ in symbols:
+            row.extend([close - 1, close])
+        data.append(row)
+    return pd.DataFrame(data, index=index, columns=columns)
+
+
+def test_info_is_fetched_once_per_symbol(mock_yf):
+    ticker = MagicMock()
+    ticker.info = {"regularMarketPrice": 150.0, "longName": "Apple Inc.", "symbol": "AAPL"}
+    mock_yf.Ticker.return_value = ticker
+
+    tools = YFinanceTools(enable_all=True)
+    assert tools.get_current_stock_price("AAPL") == "150.0000"
+    assert json.loads(tools.get_stock_fundamentals("AAPL"))["company_name"] == "Apple Inc."
+    assert json.loads(tools.get_company_info("AAPL"))["Symbol"] == "AAPL"
+    assert json.loads(tools.get_key_financial_ratios("AAPL"))["regularMarketPrice"] == 150.0
+    mock_yf.Ticker.assert_called_once_with("AAPL")
+
+
+def test_info_cache_disabled(mock_yf):
+    mock_yf.Ticker.return_value.info = {"currentPrice": 10.0}
+    tools = YFinanceTools(info_cache_ttl=0)
+    tools.get_current_stock_price("MSFT")
+    tools.get_current_stock_price("MSFT")
+    assert mock_yf.Ticker.call_count == 2
+
+
+def test_get_current_stock_prices(mock_yf):
+    infos = {"AAPL": {"regularMarketPrice": 101.5}, "MSFT": {"currentPrice": 42.0}, "NVDA": {}}
+    mock_yf.Ticker.side_effect = lambda symbol: MagicMock(info=infos[symbol])
+
+    tools = YFinanceTools(batch_stock_prices=True)
+    assert "get_current_stock_prices" in tools.functions
+    prices = json.loads(tools.get_current_stock_prices(["AAPL", "MSFT", "NVDA"]))
+
+    assert prices == {"AAPL": "101.5000", "MSFT": "42.0000", "NVDA": "Could not fetch current price for NVDA"}
+    # Same price source as get_current_stock_price
+    assert prices["AAPL"] == tools.get_current_stock_price("AAPL")
+    mock_yf.download.assert_not_called()
+
+
+def test_get_historical_stock_prices_batch(mock_yf):
+    mock_yf.download.return_value = make_download(["AAPL", "MSFT"], [100.0, 101.5])
+
+    tools = YFinanceTools(batch_historical_prices=True)
+    result = json.loads(tools.get_historical_stock_prices_batch(["AAPL", "MSFT", "NVDA"], period="5d"))
+
+    assert len(result["AAPL"]) == 2
+    assert list(result["MSFT"].values())[-1]["Close"] == 101.5
+    assert result["NVDA"] == "Could not fetch historical prices for NVDA"
+    assert mock_yf.download.call_args.kwargs["period"] == "5d"
+    # Adjusted like Ticker.history() for a single symbol
+    assert mock_yf.download.call_args.kwargs["auto_adjust"] is True
+
+
+def test_get_technical_indicators_batch(mock_yf):
+    index = pd.bdate_range("2024-01-01", periods=60)
+    closes = [100.0 + i for i in range(60)]
+    columns = pd.MultiIndex.from_product([["AAPL", "MSFT"], ["High", "Low", "Close"]])
+    mock_yf.download.return_value = pd.DataFrame(
+        [[close + 1, close - 1, close] * 2 for close in closes], index=index, columns=columns
+    )
+
+    tools = YFinanceTools(batch_technical_indicators=True)
+    result = json.loads(tools.get_technical_indicators_batch(["AAPL", "MSFT", "NVDA"]))
+
+    assert result["AAPL"]["close"] == 159.0
+    assert result["AAPL"]["sma_20"] == 149.5
+    assert result["AAPL"]["sma_200"] is None
+    assert result["MSFT"]["rsi_14"] == 100.0
+    assert result["NVDA"] == "Could not fetch price history for NVDA"
+    mock_yf.download.assert_called_once()
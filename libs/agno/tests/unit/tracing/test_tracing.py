@@ -0,0 +1,229 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from agno.agent import Agent
+from agno.models.stub import StubModel, StubResponse, StubToolCall
+from agno.team import Team
+from agno.tracing import (
+    InMemorySpanExporter,
+    JsonlSpanExporter,
+    NoopSpan,
+    OtlpSpanExporter,
+    disable_tracing,
+    enable_tracing,
+    get_current_span,
+    start_span,
+    traced,
+)
+
+
+def get_weather(city: str) -> str:
+    """Get the weather for a city."""
+    return f"It is sunny in {city}"
+
+
+def make_agent(**kwargs) -> Agent:
+    model = StubModel(
+        responses=[
+            StubResponse(tool_calls=[StubToolCall(name="get_weather", arguments={"city": "Tokyo"})]),
+            "It is sunny in Tokyo.",
+        ]
+    )
+    return Agent(model=model, tools=[get_weather], telemetry=False, **kwargs)
+
+
+def get_parent_names(exporter: InMemorySpanExporter):
+    names = {span.span_id: span.name for span in exporter.spans}
+    return {(span.name, names.get(span.parent_id)) for span in exporter.spans}
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    enable_tracing(exporter)
+    yield exporter
+    disable_tracing()
+
+
+def test_disabled_tracing_returns_noop_span():
+    with start_span("test") as span:
+        assert isinstance(span, NoopSpan)
+        span.set_attribute("key", "value")
+
+
+def test_span_nesting_and_export_on_root_end(exporter):
+    with start_span("root") as root:
+        with start_span("child", {"key": "value"}) as child:
+            pass
+        # Children are exported together with the root span
+        assert exporter.spans == []
+
+    assert [span.name for span in exporter.spans] == ["child", "root"]
+    assert child.parent_id == root.span_id
+    assert child.trace_id == root.trace_id
+    assert child.attributes == {"key": "value"}
+    assert root.duration_ms >= child.duration_ms
+
+
+def test_span_records_errors(exporter):
+    with pytest.raises(ValueError):
+        with start_span("failing"):
+            raise ValueError("boom")
+
+    span = exporter.get_spans("failing")[0]
+    assert span.status == "error"
+    assert span.error == "ValueError: boom"
+
+
+def test_traced_decorator_wraps_functions_and_generators(exporter):
+    @traced("function", attributes=lambda value: {"value": value})
+    def function(value):
+        return value * 2
+
+    @traced("generator")
+    def generator(n):
+        yield from range(n)
+
+    @traced("coroutine")
+    async def coroutine():
+        return "done"
+
+    assert function(2) == 4
+    assert list(generator(3)) == [0, 1, 2]
+    assert asyncio.run(coroutine()) == "done"
+
+    assert exporter.get_spans("function")[0].attributes == {"value": 2}
+    assert len(exporter.get_spans("generator")) == 1
+    assert len(exporter.get_spans("coroutine")) == 1
+
+
+def test_agent_run_spans(exporter):
+    response = make_agent().run("What is the weather in Tokyo?")
+
+    assert response.content == "It is sunny in Tokyo."
+    assert {
+        ("model.response", "agent.run"),
+        ("model.invoke", "model.response"),
+        ("tool.call", "model.response"),
+        ("agent.storage.read", "agent.run"),
+        ("agent.storage.write", "agent.run"),
+        ("agent.run", None),
+    } <= get_parent_names(exporter)
+
+    run_span = exporter.get_spans("agent.run")[0]
+    assert run_span.attributes["run_id"] == response.run_id
+    assert run_span.attributes["input_tokens"] == sum(response.metrics["input_tokens"])
+    assert run_span.attributes["output_tokens"] == sum(response.metrics["output_tokens"])
+    assert run_span.attributes["num_model_requests"] == 2
+
+    tool_span = exporter.get_spans("tool.call")[0]
+    assert tool_span.attributes["tool_name"] == "get_weather"
+    assert tool_span.attributes["success"] is True
+    assert [span.attributes["tool_calls"] for span in exporter.get_spans("model.invoke")] == [1, 0]
+
+
+def test_agent_stream_and_async_run_spans(exporter):
+    list(make_agent().run("What is the weather in Tokyo?", stream=True))
+    asyncio.run(make_agent().arun("What is the weather in Tokyo?"))
+
+    run_spans = exporter.get_spans("agent.run")
+    assert [span.attributes["stream"] for span in run_spans] == [True, False]
+    assert all(span.parent_id is None for span in run_spans)
+    assert len(exporter.get_spans("tool.call")) == 2
+
+
+def test_team_delegation_spans(exporter):
+    member = Agent(name="Writer", model=StubModel(responses=["A short story."]), telemetry=False)
+    leader_model = StubModel(
+        responses=[
+            StubResponse(
+                tool_calls=[
+                    StubToolCall(
+                        name="transfer_task_to_member",
+                        arguments={"agent_name": "Writer", "task_description": "Write", "expected_output": "A story"},
+                    )
+                ]
+            ),
+            "Done.",
+        ]
+    )
+    team = Team(mode="coordinate", members=[member], model=leader_model, telemetry=False)
+
+    team.run("Write a story")
+
+    assert {
+        ("team.delegate", "tool.call"),
+        ("agent.run", "team.delegate"),
+        ("team.run", None),
+    } <= get_parent_names(exporter)
+    assert exporter.get_spans("team.delegate")[0].attributes == {"member_name": "Writer", "mode": "coordinate"}
+    assert len({span.trace_id for span in exporter.spans}) == 1
+
+
+def test_failed_delegation_ends_its_span(exporter):
+    member = Agent(name="Writer", model=StubModel(), telemetry=False)
+    leader_model = StubModel(
+        responses=[
+            StubResponse(
+                tool_calls=[
+                    StubToolCall(
+                        name="transfer_task_to_member",
+                        arguments={"agent_name": "Writer", "task_description": "Write", "expected_output": "A story"},
+                    )
+                ]
+            ),
+            "Done.",
+        ]
+    )
+    team = Team(mode="coordinate", members=[member], model=leader_model, telemetry=False)
+
+    with patch.object(Agent, "run", side_effect=RuntimeError("member failed")):
+        with pytest.raises(RuntimeError):
+            team.run("Write a story")
+
+    delegate_span = exporter.get_spans("team.delegate")[0]
+    assert (delegate_span.status, delegate_span.error) == ("error", "RuntimeError: member failed")
+    assert ("team.delegate", "tool.call") in get_parent_names(exporter)
+    # No span is left open as the current span
+    assert isinstance(get_current_span(), NoopSpan)
+
+
+def test_jsonl_exporter(tmp_path):
+    path = tmp_path / "traces" / "spans.jsonl"
+    enable_tracing(JsonlSpanExporter(path))
+    try:
+        make_agent().run("What is the weather in Tokyo?")
+    finally:
+        disable_tracing()
+
+    spans = [json.loads(line) for line in path.read_text().splitlines()]
+    assert spans[-1]["name"] == "agent.run"
+    assert all(span["trace_id"] == spans[-1]["trace_id"] for span in spans)
+
+
+def test_otlp_payload(exporter):
+    with start_span("root", {"count": 1, "ratio": 0.5, "ok": True, "name": "x"}):
+        with start_span("child") as child:
+            child.set_error(RuntimeError("failed"))
+
+    otlp_exporter = OtlpSpanExporter(service_name="test")
+    try:
+        payload = otlp_exporter.to_otlp(exporter.spans)
+    finally:
+        otlp_exporter.shutdown()
+
+    resource_spans = payload["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"] == [{"key": "service.name", "value": {"stringValue": "test"}}]
+    child_span, root_span = resource_spans["scopeSpans"][0]["spans"]
+    assert child_span["parentSpanId"] == root_span["spanId"]
+    assert child_span["status"] == {"code": 2, "message": "RuntimeError: failed"}
+    assert "parentSpanId" not in root_span
+    assert root_span["attributes"] == [
+        {"key": "count", "value": {"intValue": "1"}},
+        {"key": "ratio", "value": {"doubleValue": 0.5}},
+        {"key": "ok", "value": {"boolValue": True}},
+        {"key": "name", "value": {"stringValue": "x"}},
+    ]
@@ -0,0 +1,80 @@
+import io
+import json
+import logging
+
+import pytest
+
+from agno.models.message import Message
+from agno.utils.log import (
+    is_log_level_enabled,
+    log_debug,
+    log_info,
+    set_log_format,
+    set_log_level_to_debug,
+    set_log_level_to_info,
+    use_agent_logger,
+)
+
+
+@pytest.fixture
+def json_logs():
+    stream = io.StringIO()
+    use_agent_logger()
+    set_log_format("json", stream)
+    yield lambda: [json.loads(line) for line in stream.getvalue().splitlines()]
+    set_log_format("rich")
+    set_log_level_to_info()
+
+
+def test_lazy_messages_are_not_built_at_info_level(json_logs):
+    calls = []
+
+    def build_message():
+        calls.append(1)
+        return "expensive"
+
+    log_debug(build_message)
+    assert calls == []
+    assert not is_log_level_enabled(logging.DEBUG)
+    assert is_log_level_enabled(logging.INFO)
+
+    set_log_level_to_debug()
+    log_debug(build_message)
+
+    assert calls == [1]
+    assert json_logs()[0]["message"] == "expensive"
+
+
+def test_percent_style_args(json_logs):
+    set_log_level_to_debug()
+    log_debug("Run %s used %d tokens", "run-1", 42)
+    log_info("Agent Run Start: %s", "run-1", center=True)
+
+    messages = [log["message"] for log in json_logs()]
+    # Headers are not centered in json logs
+    assert messages == ["Run run-1 used 42 tokens", "Agent Run Start: run-1"]
+
+
+def test_json_log_format(json_logs):
+    log_info("Stored session", extra={"session_id": "session-1"})
+
+    log = json_logs()[0]
+    assert log["level"] == "INFO"
+    assert log["logger"] == "agno"
+    assert log["session_id"] == "session-1"
+    assert "timestamp" in log
+
+
+def test_message_log_is_skipped_at_info_level(json_logs):
+    message = Message(role="assistant", content="Hello")
+
+    message.log()
+    assert json_logs() == []
+
+    message.log(level="info")
+    assert any(log["message"] == "Hello" for log in json_logs())
+
+
+def test_unsupported_log_format():
+    with pytest.raises(ValueError):
+        set_log_format("xml")
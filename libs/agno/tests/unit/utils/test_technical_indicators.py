@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from agno.utils.technical_indicators import compute_technical_indicators, summarize_technical_indicators
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(42)
+    index = pd.bdate_range("2023-01-02", periods=300)
+    close = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.01, (300, 3)), axis=0)), index=index, columns=["AAA", "BBB", "CCC"]
+    )
+    return close, close * 1.01, close * 0.99
+
+
+def test_matches_rolling_reference(prices):
+    close, high, low = prices
+    indicators = compute_technical_indicators(close, high, low)
+
+    assert list(indicators.index) == ["AAA", "BBB", "CCC"]
+    for symbol in close.columns:
+        series = close[symbol]
+        row = indicators.loc[symbol]
+        assert row["sma_20"] == pytest.approx(series.rolling(20).mean().iloc[-1])
+        assert row["sma_200"] == pytest.approx(series.rolling(200).mean().iloc[-1])
+        assert row["ema_12"] == pytest.approx(series.ewm(span=12, adjust=False).mean().iloc[-1])
+        middle = series.rolling(20).mean().iloc[-1]
+        upper = middle + 2 * series.rolling(20).std(ddof=0).iloc[-1]
+        assert row["bollinger_upper"] == pytest.approx(upper)
+        assert row["max_drawdown"] == pytest.approx((series / series.cummax() - 1).min())
+        assert 0 <= row["rsi_14"] <= 100
+        assert row["atr_14"] > 0
+
+
+def test_short_and_ragged_histories(prices):
+    close, _, _ = prices
+    close = close.copy()
+    close.iloc[:280, 1] = np.nan
+    indicators = compute_technical_indicators(close.iloc[-160:])
+
+    assert np.isnan(indicators.loc["AAA", "sma_200"])
+    assert np.isnan(indicators.loc["BBB", "sma_50"])
+    assert not np.isnan(indicators.loc["BBB", "sma_20"])
+    assert "atr_14" not in indicators.columns
+    assert indicators.loc["BBB", "as_of"] == close.index[-1]
+
+
+def test_rsi_without_losses():
+    close = pd.Series(np.arange(1.0, 41.0), index=pd.bdate_range("2024-01-01", periods=40), name="UP")
+    indicators = compute_technical_indicators(close)
+    assert indicators.loc["UP", "rsi_14"] == 100.0
+    assert indicators.loc["UP", "drawdown"] == 0.0
+
+
+def test_summarize_is_json_friendly(prices):
+    close, high, low = prices
+    summary = summarize_technical_indicators(
+        compute_technical_indicators(close.iloc[-30:], high.iloc[-30:], low.iloc[-30:]), decimals=2
+    )
+
+    assert summary["AAA"]["as_of"] == close.index[-1].strftime("%Y-%m-%d")
+    assert summary["AAA"]["sma_200"] is None
+    assert summary["AAA"]["close"] == round(close["AAA"].iloc[-1], 2)
+
+
+def test_gaps_in_one_symbol_are_skipped(prices):
+    close, _, _ = prices
+    single = compute_technical_indicators(close["AAA"].drop(close.index[-5]))
+    # Aligned on the union of dates, AAA has a gap where BBB has a bar
+    close = close.copy()
+    close.iloc[-5, 0] = np.nan
+    batch = compute_technical_indicators(close)
+
+    for name in ["sma_20", "sma_50", "sma_200", "bollinger_upper", "bollinger_lower", "volatility_20d_annualized"]:
+        assert not np.isnan(batch.loc["AAA", name])
+        assert batch.loc["AAA", name] == pytest.approx(single.loc["AAA", name])
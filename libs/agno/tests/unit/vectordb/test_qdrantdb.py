@@ -1,5 +1,5 @@
 from typing import List
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -142,6 +142,18 @@ def test_insert_documents(qdrant_db, sample_documents, mock_qdrant_client):
         assert len(kwargs["points"]) == 3
 
 
+def test_insert_documents_in_batches(qdrant_db, mock_qdrant_client):
+    """Test that insert sends one upsert per batch"""
+    documents = [Document(content=f"Document {i}", name=f"doc_{i}") for i in range(25)]
+
+    qdrant_db.insert(documents, batch_size=10)
+
+    batch_sizes = [len(call.kwargs["points"]) for call in mock_qdrant_client.upsert.call_args_list]
+    assert sorted(batch_sizes) == [5, 10, 10]
+    point_ids = {point.id for call in mock_qdrant_client.upsert.call_args_list for point in call.kwargs["points"]}
+    assert len(point_ids) == 25
+
+
 def test_doc_exists(qdrant_db, sample_documents, mock_qdrant_client):
     """Test document existence check"""
     # Test when document exists
@@ -195,7 +207,7 @@ def test_search(qdrant_db, mock_qdrant_client):
         }
         result2.vector = [0.2] * 768
 
-        mock_qdrant_client.search.return_value = [result1, result2]
+        mock_qdrant_client.query_points.return_value = Mock(points=[result1, result2])
 
         # Test search
         results = qdrant_db.search("Thai food", limit=2)
@@ -204,10 +216,10 @@ def test_search(qdrant_db, mock_qdrant_client):
         assert results[1].name == "green_curry"
 
         # Verify search was called with correct parameters
-        mock_qdrant_client.search.assert_called_once()
-        args, kwargs = mock_qdrant_client.search.call_args
+        mock_qdrant_client.query_points.assert_called_once()
+        args, kwargs = mock_qdrant_client.query_points.call_args
         assert kwargs["collection_name"] == "test_collection"
-        assert kwargs["query_vector"] == [0.1] * 768
+        assert kwargs["query"] == [0.1] * 768
         assert kwargs["limit"] == 2
 
 
@@ -252,3 +264,29 @@ async def test_async_search(mock_embedder):
         results = await db.async_search("test query", limit=1)
         assert len(results) == 1
         assert results[0].name == "test_doc"
+
+
+@pytest.mark.asyncio
+async def test_async_insert_documents_in_batches(mock_embedder):
+    """Test that async_insert embeds in threads and sends one upsert per batch"""
+    db = Qdrant(embedder=mock_embedder, collection="test_collection", batch_size=4)
+    db._async_client = Mock(upsert=AsyncMock())
+    documents = [Document(content=f"Document {i}", name=f"doc_{i}") for i in range(10)]
+
+    await db.async_insert(documents)
+
+    batch_sizes = [len(call.kwargs["points"]) for call in db._async_client.upsert.call_args_list]
+    assert sorted(batch_sizes) == [2, 4, 4]
+    assert all(document.embedding is not None for document in documents)
+
+
+def test_insert_into_local_collection(mock_embedder):
+    """Test that batches inserted into an in-memory client are all searchable"""
+    db = Qdrant(embedder=mock_embedder, collection="local_collection", location=":memory:", batch_size=256)
+    db.create()
+    documents = [Document(content=f"Document {i}", name=f"doc_{i}") for i in range(2000)]
+
+    db.insert(documents)
+
+    assert db.get_count() == 2000
+    assert len(db.search("Document", limit=5)) == 5